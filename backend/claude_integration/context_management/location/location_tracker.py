@@ -5,6 +5,8 @@ from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
 
+from mcp_tools.geodesy import haversine_km
+
 @dataclass
 class LocationData:
     """Konum verisi sinifi"""
@@ -59,20 +61,7 @@ class LocationTracker:
     
     def calculate_distance(self, lat1: float, lng1: float, lat2: float, lng2: float) -> float:
         """Iki nokta arasindaki mesafeyi hesapla (km)"""
-        import math
-        
-        # Haversine formula
-        R = 6371  # Earth radius in km
-        
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lng = math.radians(lng2 - lng1)
-        
-        a = math.sin(delta_lat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lng/2)**2
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-        
-        return R * c
+        return haversine_km(lat1, lng1, lat2, lng2)
 
 # Global location trackers (production'da Redis kullanilacak)
 _location_trackers: Dict[str, LocationTracker] = {}
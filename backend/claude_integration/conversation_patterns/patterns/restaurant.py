@@ -34,6 +34,7 @@ RESTAURANT_PATTERN = ConversationPattern(
         "calculate_distance"
     ],
     fallback_actions=[
+        "search_nearest_knn",
         "expand_search_radius",
         "try_different_cuisine",
         "suggest_popular_alternatives",
@@ -3,7 +3,7 @@
 
 from .core_identity import SYDNEY_GUIDE_SYSTEM_PROMPT
 from .languages import LANGUAGE_SPECIFIC_PROMPTS, get_language_prompt
-from .scenarios import SCENARIO_PROMPTS, get_scenario_prompt
+from .scenarios import SCENARIO_PROMPTS, SCENARIO_RANKING_PROFILES, get_scenario_prompt, get_scenario_ranking_profile
 from .emergency import EMERGENCY_PROMPTS, get_emergency_prompt
 from .utils import (
     get_system_prompt,
@@ -22,10 +22,12 @@ __all__ = [
     'LANGUAGE_SPECIFIC_PROMPTS',
     'SCENARIO_PROMPTS', 
     'EMERGENCY_PROMPTS',
+    'SCENARIO_RANKING_PROFILES',
     
     # Getters
     'get_language_prompt',
     'get_scenario_prompt',
+    'get_scenario_ranking_profile',
     'get_emergency_prompt',
     
     # Main functions
@@ -1,11 +1,13 @@
 # Sydney Guide - Scenario-Specific Prompts Aggregator
 # Senaryo-spesifik prompt'lari toplayan modul
 
-from .first_time_visitor import FIRST_TIME_VISITOR_PROMPT
-from .food_explorer import FOOD_EXPLORER_PROMPT
-from .budget_traveler import BUDGET_TRAVELER_PROMPT
-from .family_with_kids import FAMILY_WITH_KIDS_PROMPT
-from .business_traveler import BUSINESS_TRAVELER_PROMPT
+from typing import Dict, Optional
+
+from .first_time_visitor import FIRST_TIME_VISITOR_PROMPT, FIRST_TIME_VISITOR_RANKING
+from .food_explorer import FOOD_EXPLORER_PROMPT, FOOD_EXPLORER_RANKING
+from .budget_traveler import BUDGET_TRAVELER_PROMPT, BUDGET_TRAVELER_RANKING
+from .family_with_kids import FAMILY_WITH_KIDS_PROMPT, FAMILY_WITH_KIDS_RANKING
+from .business_traveler import BUSINESS_TRAVELER_PROMPT, BUSINESS_TRAVELER_RANKING
 
 # Tum senaryo prompt'larini topla
 SCENARIO_PROMPTS = {
@@ -16,6 +18,15 @@ SCENARIO_PROMPTS = {
     "business_traveler": BUSINESS_TRAVELER_PROMPT
 }
 
+# Senaryo bazli mekan siralama profilleri (kriter -> agirlik)
+SCENARIO_RANKING_PROFILES = {
+    "first_time_visitor": FIRST_TIME_VISITOR_RANKING,
+    "food_explorer": FOOD_EXPLORER_RANKING,
+    "budget_traveler": BUDGET_TRAVELER_RANKING,
+    "family_with_kids": FAMILY_WITH_KIDS_RANKING,
+    "business_traveler": BUSINESS_TRAVELER_RANKING
+}
+
 def get_scenario_prompt(scenario: str) -> str:
     """
     Belirtilen senaryo icin prompt dondur
@@ -26,4 +37,16 @@ def get_scenario_prompt(scenario: str) -> str:
     Returns:
         str: Senaryo-spesifik prompt veya bos string
     """
-    return SCENARIO_PROMPTS.get(scenario, "") 
\ No newline at end of file
+    return SCENARIO_PROMPTS.get(scenario, "")
+
+def get_scenario_ranking_profile(scenario: str) -> Optional[Dict[str, float]]:
+    """
+    Belirtilen senaryo icin mekan siralama agirliklari
+    
+    Args:
+        scenario: Senaryo adi
+        
+    Returns:
+        Dict: Kriter agirliklari veya bilinmeyen senaryoda None
+    """
+    return SCENARIO_RANKING_PROFILES.get(scenario) 
\ No newline at end of file
@@ -8,4 +8,13 @@ BUDGET TRAVELER CONTEXT:
 - Mention happy hours and lunch specials
 - Recommend budget accommodation areas
 - Include free walking tours and beach activities
-""" 
\ No newline at end of file
+"""
+
+# Mekan siralama agirliklari - Ucuz olan kazanir, yurume mesafesi de onemli
+BUDGET_TRAVELER_RANKING = {
+    "distance": 0.30,
+    "rating": 0.20,
+    "popularity": 0.05,
+    "price": 0.40,
+    "open_now": 0.05
+}
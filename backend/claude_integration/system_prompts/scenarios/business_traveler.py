@@ -8,4 +8,13 @@ BUSINESS TRAVELER CONTEXT:
 - Mention co-working spaces and meeting venues
 - Prioritize time-efficient recommendations
 - Include after-work entertainment options
-""" 
\ No newline at end of file
+"""
+
+# Mekan siralama agirliklari - Zaman kisitli - en yakin ve acik yerler
+BUSINESS_TRAVELER_RANKING = {
+    "distance": 0.50,
+    "rating": 0.20,
+    "popularity": 0.05,
+    "price": 0.00,
+    "open_now": 0.25
+}
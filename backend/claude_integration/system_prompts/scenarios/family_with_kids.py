@@ -8,4 +8,13 @@ FAMILY CONTEXT:
 - Mention playgrounds and kid-friendly restaurants
 - Consider nap times and meal schedules
 - Include safety tips for families
-""" 
\ No newline at end of file
+"""
+
+# Mekan siralama agirliklari - Yakinlik ve su an acik olmak oncelikli
+FAMILY_WITH_KIDS_RANKING = {
+    "distance": 0.40,
+    "rating": 0.25,
+    "popularity": 0.10,
+    "price": 0.05,
+    "open_now": 0.20
+}
@@ -8,4 +8,13 @@ FIRST-TIME VISITOR CONTEXT:
 - Suggest 2-3 day itinerary options
 - Mention practical tips (weather, tipping, customs)
 - Be extra patient with navigation questions
-""" 
\ No newline at end of file
+"""
+
+# Mekan siralama agirliklari - Ikonik ve cok yorumlanan yerler one cikar
+FIRST_TIME_VISITOR_RANKING = {
+    "distance": 0.25,
+    "rating": 0.30,
+    "popularity": 0.35,
+    "price": 0.00,
+    "open_now": 0.10
+}
@@ -8,4 +8,13 @@ FOOD EXPLORER CONTEXT:
 - Suggest food tours and cooking classes
 - Include dietary restriction options
 - Recommend local specialties and hidden gems
-""" 
\ No newline at end of file
+"""
+
+# Mekan siralama agirliklari - Puan belirleyici, gizli kalmis yerler icin populerlik dusuk
+FOOD_EXPLORER_RANKING = {
+    "distance": 0.20,
+    "rating": 0.50,
+    "popularity": 0.10,
+    "price": 0.05,
+    "open_now": 0.15
+}
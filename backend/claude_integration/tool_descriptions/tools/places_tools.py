@@ -35,6 +35,30 @@ PLACES_TOOL_DESCRIPTIONS = {
                 "type": "integer", 
                 "default": 10,
                 "description": "Maximum results - use 5-10 for recommendations"
+            },
+            "fields": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Place fields to return - defaults to a summary (name, type, address, location, distance, rating, price, open_now); pass ['all'] for photos, phone, website"
+            },
+            "mode": {
+                "type": "string",
+                "enum": ["radius", "knn"],
+                "default": "radius",
+                "description": "'knn' returns the max_results closest matches regardless of radius - use for 'nearest X' questions"
+            },
+            "ranking": {
+                "type": "string",
+                "enum": ["default", "first_time_visitor", "food_explorer", "budget_traveler", "family_with_kids", "business_traveler"],
+                "description": "Rank by a weighted mix of distance, rating, popularity, price and open-now - pick the profile matching the user's scenario"
+            },
+            "ranking_weights": {
+                "type": "object",
+                "description": "Override single criteria on top of the profile (e.g., {'price': 0.6} when the user says 'cheap')"
+            },
+            "open_at": {
+                "type": "string",
+                "description": "Only places open at that Sydney time - 'now', '21:00' (today), 'fri 21:00' or ISO datetime (e.g., 'open at 9pm tonight' -> '21:00')"
             }
         },
         "response_format": {
@@ -49,10 +73,61 @@ PLACES_TOOL_DESCRIPTIONS = {
             "Use specific queries for better results ('Italian restaurant' not just 'food')",
             "Combine with user's current location for 'nearby' searches",
             "Filter by place_type when user specifies category",
+            "Use ranking for 'best' questions - distance-only order favours the closest, not the best",
             "Always mention ratings and distance in recommendations"
         ]
     },
 
+    "search_places_in_area": {
+        "name": "search_places_in_area",
+        "description": "Search for places inside a neighbourhood or any area given as a bounding box or GeoJSON polygon.",
+        "when_to_use": [
+            "User asks for places 'in Surry Hills', 'around The Rocks' or another named area",
+            "A centre point plus radius would spill into neighbouring suburbs",
+            "User draws or describes an area on a map"
+        ],
+        "parameters": {
+            "query": {
+                "type": "string",
+                "description": "Search terms (e.g., 'vegan restaurant', 'gallery')"
+            },
+            "bbox": {
+                "type": "array",
+                "items": {"type": "number"},
+                "description": "Bounding box [min_lng, min_lat, max_lng, max_lat] (e.g., Surry Hills: [151.205, -33.895, 151.220, -33.880])"
+            },
+            "polygon": {
+                "type": "object",
+                "description": "GeoJSON Polygon or MultiPolygon with [lng, lat] positions - more precise than bbox, takes precedence"
+            },
+            "place_type": {
+                "type": "string",
+                "enum": ["all", "restaurant", "tourist_attraction", "shopping_mall", "museum", "park", "transport"],
+                "default": "all",
+                "description": "Filter by place type"
+            },
+            "max_results": {"type": "integer", "default": 10, "description": "Maximum results"},
+            "fields": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Place fields to return - defaults to the same summary as search_places"
+            }
+        },
+        "response_format": {
+            "status": "success/error",
+            "data": {
+                "places": "array of place objects inside the area, best rated first",
+                "total_found": "integer - places inside the area",
+                "search_params": "object - includes the area type, bbox and cache key"
+            }
+        },
+        "usage_tips": [
+            "Coordinates are [lng, lat] as in GeoJSON - not [lat, lng]",
+            "Reuse the same polygon for follow-up questions about the same neighbourhood; it is cached",
+            "INVALID_AREA means the bbox or polygon could not be parsed - fix the coordinates and retry"
+        ]
+    },
+
     "get_place_details": {
         "name": "get_place_details",
         "description": "Get detailed information about a specific place.",
@@ -66,6 +141,11 @@ PLACES_TOOL_DESCRIPTIONS = {
             "place_id": {
                 "type": "string",
                 "description": "Place ID from search results (e.g., 'place_001')"
+            },
+            "fields": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Only these place fields (e.g., ['opening_hours', 'phone']) - defaults to all fields"
             }
         },
         "usage_tips": [
@@ -75,6 +155,32 @@ PLACES_TOOL_DESCRIPTIONS = {
         ]
     },
 
+    "get_places_details_batch": {
+        "name": "get_places_details_batch",
+        "description": "Get detailed information about several places in a single call.",
+        "when_to_use": [
+            "You have a shortlist of 2 or more places and need details for each",
+            "User wants to compare hours, contact info or features of recommended places",
+            "Instead of calling get_place_details repeatedly for the same answer"
+        ],
+        "parameters": {
+            "place_ids": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Place IDs from search results (e.g., ['place_001', 'place_002'], max 20)"
+            },
+            "fields": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Only these fields for every place - defaults to all fields"
+            }
+        },
+        "usage_tips": [
+            "Each result carries its own status - present the successful ones even if some failed",
+            "Prefer this over several get_place_details calls to save round trips"
+        ]
+    },
+
     "get_places_by_type": {
         "name": "get_places_by_type",
         "description": "List places of a specific type.",
@@ -90,7 +196,21 @@ PLACES_TOOL_DESCRIPTIONS = {
                 "enum": ["restaurant", "tourist_attraction", "shopping_mall", "museum", "park", "transport"],
                 "description": "Type of places to list"
             },
-            "limit": {"type": "integer", "default": 10, "description": "Maximum results"}
+            "limit": {"type": "integer", "default": 10, "description": "Maximum results"},
+            "fields": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Place fields to return - defaults to a summary (name, type, address, location, rating); pass ['all'] for every field"
+            },
+            "ranking": {
+                "type": "string",
+                "enum": ["default", "first_time_visitor", "food_explorer", "budget_traveler", "family_with_kids", "business_traveler"],
+                "description": "Rank by a weighted mix of rating, popularity, price and open-now instead of rating only"
+            },
+            "ranking_weights": {
+                "type": "object",
+                "description": "Override single criteria on top of the profile (rating, popularity, price, open_now)"
+            }
         }
     },
 
@@ -104,7 +224,39 @@ PLACES_TOOL_DESCRIPTIONS = {
             "When user asks for safe/reliable options"
         ],
         "parameters": {
-            "limit": {"type": "integer", "default": 5, "description": "Number of top places"}
+            "limit": {"type": "integer", "default": 5, "description": "Number of top places"},
+            "fields": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Place fields to return - defaults to a summary (name, type, address, location, rating); pass ['all'] for every field"
+            }
         }
+    },
+
+    "autocomplete_places": {
+        "name": "autocomplete_places",
+        "description": "Suggest place names and suburbs that start with what the user has typed.",
+        "when_to_use": [
+            "User types a partial or uncertain place name ('the opera something', 'surry')",
+            "You need the exact name or place_id before calling get_place_details",
+            "Offering 'did you mean' options for an ambiguous place or suburb"
+        ],
+        "parameters": {
+            "prefix": {
+                "type": "string",
+                "description": "Partial text - matches the start of any word in the name (e.g., 'opera h', 'surry')"
+            },
+            "limit": {"type": "integer", "default": 5, "description": "Maximum suggestions (max 10)"}
+        },
+        "response_format": {
+            "status": "success/error",
+            "data": {
+                "suggestions": "array of {type: place|suburb, label, place_id, address} - most popular first"
+            }
+        },
+        "usage_tips": [
+            "Suburb suggestions pair well with search_places_in_area",
+            "Confirm with the user when several suggestions fit equally well"
+        ]
     }
 } 
\ No newline at end of file
@@ -18,7 +18,7 @@ TRANSPORT_TOOL_DESCRIPTIONS = {
             "lng": {"type": "number", "description": "Search location longitude"},
             "transport_type": {
                 "type": "string",
-                "enum": ["all", "train", "bus", "ferry", "light_rail"],
+                "enum": ["all", "train", "metro", "bus", "ferry", "light_rail"],
                 "default": "all",
                 "description": "Type of transport to find"
             },
@@ -32,7 +32,8 @@ TRANSPORT_TOOL_DESCRIPTIONS = {
         "usage_tips": [
             "Use small radius (0.5-1km) for walking to transport",
             "Show multiple transport types when available",
-            "Include distance and walking time to stations"
+            "Include distance and walking time to stations",
+            "Each station lists the route names that serve it in 'services'"
         ]
     },
 
@@ -52,21 +53,22 @@ TRANSPORT_TOOL_DESCRIPTIONS = {
             "destination_lng": {"type": "number", "description": "Destination longitude"},
             "travel_modes": {
                 "type": "array",
-                "items": {"type": "string", "enum": ["walking", "transit", "bus", "train", "ferry"]},
+                "items": {"type": "string", "enum": ["walking", "transit", "bus", "train", "metro", "ferry", "light_rail"]},
                 "default": ["transit", "walking"],
                 "description": "Preferred transport modes"
             },
             "departure_time": {
                 "type": "string",
                 "default": "now",
-                "description": "Departure time (ISO format or 'now')"
+                "description": "Departure time: 'now', 'HH:MM', '<day> HH:MM' or ISO 8601 (Sydney time)"
             }
         },
         "usage_tips": [
             "Always provide step-by-step instructions",
             "Include total time, cost, and walking distances",
             "Mention any transfers or connections",
-            "Offer alternative routes when possible"
+            "Offer alternative routes when possible",
+            "data.journeys lists Pareto-optimal options (fewer transfers vs earlier arrival) - offer them as alternatives"
         ]
     },
 
@@ -80,11 +82,12 @@ TRANSPORT_TOOL_DESCRIPTIONS = {
             "When user is at a station and needs current info"
         ],
         "parameters": {
-            "stop_id": {"type": "string", "description": "Transport stop or station ID"},
+            "stop_id": {"type": "string", "description": "Transport stop or station ID (GTFS stop_id, e.g. from find_nearby_transport)"},
             "transport_type": {
                 "type": "string",
-                "enum": ["train", "bus", "ferry", "light_rail"],
-                "default": "train"
+                "enum": ["all", "train", "metro", "bus", "ferry", "light_rail"],
+                "default": "all",
+                "description": "Only list departures of this mode (default 'all' = every mode at the stop)"
             },
             "limit": {"type": "integer", "default": 5, "description": "Number of upcoming departures"}
         }
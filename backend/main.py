@@ -6,7 +6,8 @@ Official MCP Python SDK + FastMCP Integration + Claude Integration System
 
 import os
 import logging
-from typing import Dict, Any, List
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, List, Optional
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
@@ -20,16 +21,33 @@ from claude_integration.conversation_patterns import get_conversation_flow, form
 
 # Import all MCP tools
 from mcp_tools.location_tool import get_current_location, calculate_distance
-from mcp_tools.places_tool import search_places, get_place_details, get_places_by_type, get_popular_places
+from mcp_tools.places_tool import search_places, search_places_in_area, get_place_details, get_places_details_batch, get_places_by_type, get_popular_places, autocomplete_places
 from mcp_tools.transport_tool import find_nearby_transport, plan_route, get_transport_status
 from mcp_tools.notification_tool import send_notification, schedule_location_alerts, send_journey_reminders, start_journey_tracking, update_journey_location, stop_journey_tracking
+from mcp_tools.clients import close_google_maps_client, close_nsw_transport_client, get_google_maps_client, get_nsw_transport_client
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@asynccontextmanager
+async def http_clients_lifespan(server: FastMCP) -> AsyncIterator[Dict[str, Any]]:
+    """Paylasilan HTTP istemci havuzlari sunucu acilisinda kurulur, kapanista kapatilir"""
+    clients = {}
+    if os.getenv('MOCK_MODE', 'true').lower() == 'false':
+        if os.getenv('NSW_TRANSPORT_API_KEY'):
+            clients["nsw_transport"] = get_nsw_transport_client(os.getenv('NSW_TRANSPORT_API_KEY'))
+        if os.getenv('GOOGLE_MAPS_API_KEY'):
+            clients["google_maps"] = get_google_maps_client(os.getenv('GOOGLE_MAPS_API_KEY'))
+    try:
+        yield clients
+    finally:
+        await close_nsw_transport_client()
+        await close_google_maps_client()
+        logger.info("HTTP client pools closed")
+
 # Initialize FastMCP with Claude Integration
-mcp = FastMCP("Sydney Guide MCP Server")
+mcp = FastMCP("Sydney Guide MCP Server", lifespan=http_clients_lifespan)
 
 # Add system prompt configuration
 @mcp.prompt()
@@ -51,24 +69,48 @@ async def calculate_distance_mcp(start_lat: float, start_lng: float,
 
 @mcp.tool()
 async def search_places_mcp(query: str = "", lat: float = -33.8688, lng: float = 151.2093,
-                           place_type: str = "all", radius: float = 5.0, max_results: int = 10) -> Dict[str, Any]:
+                           place_type: str = "all", radius: float = 5.0, max_results: int = 10,
+                           fields: Optional[List[str]] = None, mode: str = "radius",
+                           ranking: Optional[str] = None,
+                           ranking_weights: Optional[Dict[str, float]] = None,
+                           open_at: Optional[str] = None) -> Dict[str, Any]:
     """Sydney'de yer ara - Claude Integration enabled"""
-    return await search_places(query, lat, lng, place_type, radius, max_results)
+    return await search_places(query, lat, lng, place_type, radius, max_results, fields, mode,
+                               ranking, ranking_weights, open_at)
+
+@mcp.tool()
+async def search_places_in_area_mcp(query: str = "", bbox: Optional[List[float]] = None,
+                                    polygon: Optional[Dict[str, Any]] = None, place_type: str = "all",
+                                    max_results: int = 10, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Bbox veya GeoJSON poligon (mahalle) icinde yer ara"""
+    return await search_places_in_area(query, bbox, polygon, place_type, max_results, fields)
 
 @mcp.tool()
-async def get_place_details_mcp(place_id: str) -> Dict[str, Any]:
+async def get_place_details_mcp(place_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """Yer detaylarini al"""
-    return await get_place_details(place_id)
+    return await get_place_details(place_id, fields)
 
 @mcp.tool()
-async def get_places_by_type_mcp(place_type: str, limit: int = 10) -> Dict[str, Any]:
+async def get_places_details_batch_mcp(place_ids: List[str], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Birden fazla yerin detaylarini tek cagrida al"""
+    return await get_places_details_batch(place_ids, fields)
+
+@mcp.tool()
+async def get_places_by_type_mcp(place_type: str, limit: int = 10,
+                                 fields: Optional[List[str]] = None, ranking: Optional[str] = None,
+                                 ranking_weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
     """Tip bazinda yer listesi al"""
-    return await get_places_by_type(place_type, limit)
+    return await get_places_by_type(place_type, limit, fields, ranking, ranking_weights)
 
 @mcp.tool()
-async def get_popular_places_mcp(limit: int = 5) -> Dict[str, Any]:
+async def get_popular_places_mcp(limit: int = 5, fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """Populer yerleri al"""
-    return await get_popular_places(limit)
+    return await get_popular_places(limit, fields)
+
+@mcp.tool()
+async def autocomplete_places_mcp(prefix: str, limit: int = 5) -> Dict[str, Any]:
+    """Yazilan onege gore yer ve semt onerileri"""
+    return await autocomplete_places(prefix, limit)
 
 @mcp.tool()
 async def find_nearby_transport_mcp(lat: float, lng: float, transport_type: str = "all",
@@ -83,7 +125,7 @@ async def plan_route_mcp(origin_lat: float, origin_lng: float, destination_lat:
     return await plan_route(origin_lat, origin_lng, destination_lat, destination_lng, travel_modes, departure_time)
 
 @mcp.tool()
-async def get_transport_status_mcp(stop_id: str, transport_type: str = "train", limit: int = 5) -> Dict[str, Any]:
+async def get_transport_status_mcp(stop_id: str, transport_type: str = "all", limit: int = 5) -> Dict[str, Any]:
     """Ulasim durum bilgisi al"""
     return await get_transport_status(stop_id, transport_type, limit)
 
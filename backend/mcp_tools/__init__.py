@@ -5,7 +5,7 @@
 from .location_tool import get_current_location, calculate_distance
 
 # Places tools  
-from .places_tool import search_places, get_place_details, get_places_by_type, get_popular_places
+from .places_tool import search_places, search_places_in_area, get_place_details, get_places_details_batch, get_places_by_type, get_popular_places, autocomplete_places
 
 # Transport tools
 from .transport_tool import find_nearby_transport, plan_route, get_transport_status
@@ -24,9 +24,12 @@ __all__ = [
     "get_current_location",
     "calculate_distance", 
     "search_places",
+    "search_places_in_area",
     "get_place_details",
+    "get_places_details_batch",
     "get_places_by_type",
     "get_popular_places",
+    "autocomplete_places",
     "find_nearby_transport",
     "plan_route", 
     "get_transport_status",
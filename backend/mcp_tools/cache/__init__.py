@@ -0,0 +1,13 @@
+# Sydney Guide - Cache Module
+# API yanitlari icin onbellek yapilari
+
+from .single_flight import SingleFlight, single_flight
+from .swr_cache import StaleWhileRevalidateCache
+from .ttl_cache import TTLCache
+
+__all__ = [
+    'SingleFlight',
+    'StaleWhileRevalidateCache',
+    'TTLCache',
+    'single_flight'
+]
@@ -0,0 +1,104 @@
+# Sydney Guide - Single-Flight Request Coalescing
+# Ayni anda gelen ozdes cagrilari tek bir upstream istegine indirger
+
+import asyncio
+import functools
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+class _InFlightCall:
+    """Devam eden tek bir cagri ve onu bekleyen cagiran sayisi"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future):
+        self.task = task
+        self.waiters = 0
+
+class SingleFlight:
+    """
+    Anahtar basina tek ucusta cagri grubu
+
+    Ayni anahtarla gelen ikinci ve sonraki cagiranlar yeni istek baslatmaz,
+    devam eden gorevin sonucunu paylasir. Hata tum bekleyenlere iletilir ve
+    girdi silinir; bir sonraki cagri yeniden dener. Bekleyen iptal edilirse
+    sadece kendi beklemesi biter - son bekleyen de ayrilirsa gorev iptal edilir.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _InFlightCall] = {}
+        self.leaders = 0
+        self.shared = 0
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Anahtar icin devam eden cagri varsa ona katil, yoksa fetch'i baslat"""
+        call = self._calls.get(key)
+        if call is None:
+            call = _InFlightCall(asyncio.ensure_future(fetch()))
+            self._calls[key] = call
+            call.task.add_done_callback(functools.partial(self._forget, key, call))
+            self.leaders += 1
+        else:
+            self.shared += 1
+
+        call.waiters += 1
+        try:
+            # shield: bir bekleyenin iptali diger bekleyenlerin gorevini iptal etmesin
+            return await asyncio.shield(call.task)
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                call.task.cancel()
+
+    def _forget(self, key: Hashable, call: _InFlightCall, task: asyncio.Future) -> None:
+        """Gorev bitince girdiyi sil"""
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        # Kimse beklemiyorsa "exception was never retrieved" uyarisini sustur
+        if not task.cancelled():
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        """Baslatilan ve paylasilan cagri sayilari"""
+        return {
+            "in_flight": len(self._calls),
+            "leaders": self.leaders,
+            "shared": self.shared
+        }
+
+def _freeze(value: Any) -> Hashable:
+    """Arguman degerini hashlenebilir anahtara cevir (list/dict/set dahil)"""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+def single_flight(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """
+    Async fonksiyon icin single-flight dekoratoru
+
+    Anahtar, varsayilanlar uygulanmis baglanmis argumanlardan uretilir;
+    boylece f(1) ile f(x=1) ayni cagri sayilir.
+    """
+    group = SingleFlight()
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        key = _freeze(bound.arguments)
+        return await group.do(key, lambda: func(*args, **kwargs))
+
+    wrapper.single_flight = group
+    return wrapper
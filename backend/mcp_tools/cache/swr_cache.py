@@ -0,0 +1,131 @@
+# Sydney Guide - Stale-While-Revalidate Cache
+# Eskimis girdiyi hemen donduren ve arka planda yenileyen onbellek
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+class StaleWhileRevalidateCache:
+    """
+    Yumusak/sert TTL'li async onbellek
+
+    - Yas < soft_ttl: girdi taze, dogrudan dondurulur
+    - soft_ttl <= yas < hard_ttl: eskimis girdi hemen dondurulur ve anahtar
+      basina tek bir arka plan yenilemesi baslatilir
+    - yas >= hard_ttl: girdi silinir, cagiran yeni veriyi bekler
+
+    Basarisiz yenileme eskimis girdiyi silmez; girdi sert TTL'e kadar
+    kullanilmaya devam eder.
+    """
+
+    def __init__(self, soft_ttl_seconds: float = 3600, hard_ttl_seconds: float = 86400,
+                 max_entries: int = 5000, clock: Callable[[], float] = time.monotonic):
+        self.soft_ttl_seconds = soft_ttl_seconds
+        self.hard_ttl_seconds = hard_ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        # anahtar -> (kayit zamani, deger)
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._refreshing: Dict[Hashable, asyncio.Task] = {}
+        # Arka plan gorevlerine guclu referans (GC tarafindan toplanmasin)
+        self._background_tasks: Set[asyncio.Task] = set()
+        self.fresh_hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: Hashable, value: Any) -> None:
+        """Girdiyi simdiki zamanla kaydet, kapasite asilirsa LRU girdiyi at"""
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+                           should_cache: Callable[[Any], bool] = lambda value: True) -> Any:
+        """
+        Anahtarin degerini dondur, gerekirse fetch ile getir
+
+        Args:
+            key: Onbellek anahtari
+            fetch: Degeri ureten async fonksiyon
+            should_cache: Sonucun saklanip saklanmayacagi (hata yanitlari icin False)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            stored_at, value = entry
+            age = self._clock() - stored_at
+
+            if age < self.soft_ttl_seconds:
+                self._entries.move_to_end(key)
+                self.fresh_hits += 1
+                return value
+
+            if age < self.hard_ttl_seconds:
+                self._entries.move_to_end(key)
+                self.stale_hits += 1
+                self._schedule_refresh(key, fetch, should_cache)
+                return value
+
+            # Sert TTL gecti - girdiyi at
+            del self._entries[key]
+
+        self.misses += 1
+        value = await fetch()
+        if should_cache(value):
+            self._store(key, value)
+        return value
+
+    def _schedule_refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+                          should_cache: Callable[[Any], bool]) -> None:
+        """Anahtar icin zaten calismiyorsa arka plan yenilemesi baslat"""
+        if key in self._refreshing:
+            return
+
+        task = asyncio.create_task(self._refresh(key, fetch, should_cache))
+        self._refreshing[key] = task
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _refresh(self, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+                       should_cache: Callable[[Any], bool]) -> None:
+        """Degeri yeniden getir - basarisizsa eskimis girdiye dokunma"""
+        try:
+            value = await fetch()
+            if should_cache(value):
+                self._store(key, value)
+                self.refreshes += 1
+            else:
+                self.refresh_failures += 1
+        except Exception as error:
+            self.refresh_failures += 1
+            logger.warning(f"Background refresh failed for {key!r}: {error}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Girdiyi sil"""
+        return self._entries.pop(key, None) is not None
+
+    def stats(self) -> Dict[str, Any]:
+        """Taze/eskimis isabet ve yenileme sayaclari"""
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "soft_ttl_seconds": self.soft_ttl_seconds,
+            "hard_ttl_seconds": self.hard_ttl_seconds,
+            "fresh_hits": self.fresh_hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "refreshing": len(self._refreshing)
+        }
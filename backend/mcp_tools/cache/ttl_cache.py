@@ -0,0 +1,80 @@
+# Sydney Guide - TTL + LRU Cache
+# Sure sinirli ve boyut sinirli yanit onbellegi
+
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+class TTLCache:
+    """
+    Sabit TTL'li, en az kullanilani (LRU) atan onbellek
+
+    Girdiler ekleme aninda son kullanma zamani alir; suresi dolan girdi
+    okunurken silinir. Kapasite dolunca en uzun sure kullanilmayan girdi
+    atilir, boylece bellek max_entries ile sinirli kalir.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 300,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Gecerli girdiyi dondur - yoksa veya suresi dolduysa None"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            self.misses += 1
+            return None
+
+        # En son kullanilan olarak isaretle
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Girdiyi ekle veya guncelle, kapasite asilirsa LRU girdiyi at"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Girdiyi sil"""
+        return self._entries.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Tum girdileri sil (sayaclar korunur)"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Isabet/iska sayaclari ve doluluk"""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
@@ -0,0 +1,45 @@
+# Sydney Guide - Place Catalog Module
+# Mekan katalogu ve arama indeksleri
+
+from .area import InvalidAreaError, PreparedArea, area_cache_stats, prepare_area
+from .opening_hours import (InvalidOpenAtError, ScheduleTable, is_open_at, parse_open_at,
+                            week_minute, weekly_intervals)
+from .prefix_index import PrefixIndex, normalize_label, suburb_of
+from .trigram_index import TrigramIndex, bounded_edit_distance, trigrams
+from .spatial_index import SpatialGridIndex
+from .text_index import TextIndex, tokenize
+from .compact_store import CompactPlaceCatalog, StringTable
+from .sqlite_store import SQLitePlaceStore
+from .hot_reload import (CatalogReloader, CatalogSource, CatalogVersion, FeedSource, JsonFileSource,
+                         SQLiteSnapshotSource)
+
+__all__ = [
+    'CatalogReloader',
+    'CatalogSource',
+    'CatalogVersion',
+    'CompactPlaceCatalog',
+    'FeedSource',
+    'InvalidAreaError',
+    'InvalidOpenAtError',
+    'JsonFileSource',
+    'PrefixIndex',
+    'PreparedArea',
+    'SQLitePlaceStore',
+    'SQLiteSnapshotSource',
+    'ScheduleTable',
+    'SpatialGridIndex',
+    'StringTable',
+    'TextIndex',
+    'TrigramIndex',
+    'area_cache_stats',
+    'bounded_edit_distance',
+    'is_open_at',
+    'normalize_label',
+    'parse_open_at',
+    'prepare_area',
+    'suburb_of',
+    'tokenize',
+    'trigrams',
+    'week_minute',
+    'weekly_intervals'
+]
@@ -0,0 +1,222 @@
+# Sydney Guide - Area Geometry
+# Bbox veya GeoJSON poligon alanlari icin hazirlanmis (onbellekli) nokta-icinde testi
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..geodesy import ArrayLike, as_coordinate_array, haversine_km
+
+# Hazirlanmis alan onbellegi - ayni mahalle sorgusu geometriyi yeniden hazirlamaz
+AREA_CACHE_MAX_ENTRIES = 256
+# Ray casting nokta x kenar matrisinin parca basina en fazla eleman sayisi
+_RAY_CAST_CHUNK_ELEMENTS = 1_000_000
+
+class InvalidAreaError(ValueError):
+    """Bbox veya GeoJSON poligon gecersiz"""
+
+class PreparedArea:
+    """
+    Nokta-icinde testine hazirlanmis alan
+
+    Tum halkalarin kenarlari (dis sinir + delikler, coklu poligonda tum
+    parcalar) tek dizide tutulur; cift-tek kurali delikleri ve parcalari
+    ayrica ele almadan dogru sonuc verir. Yatay kenarlar isini hic
+    kesmedigi icin hazirlikta atilir.
+    """
+
+    def __init__(self, key: str, kind: str, rings: List[np.ndarray]):
+        self.key = key
+        self.kind = kind
+        self.ring_count = len(rings)
+
+        points = np.concatenate(rings)
+        self.min_lng, self.min_lat = points.min(axis=0).tolist()
+        self.max_lng, self.max_lat = points.max(axis=0).tolist()
+
+        # Kenarlar: (lng1, lat1) -> (lng2, lat2), halkalar kapali
+        starts = np.concatenate([ring[:-1] for ring in rings])
+        ends = np.concatenate([ring[1:] for ring in rings])
+        sloped = starts[:, 1] != ends[:, 1]
+        starts, ends = starts[sloped], ends[sloped]
+
+        self._edge_lng = starts[:, 0]
+        self._edge_lat1 = starts[:, 1]
+        self._edge_lat2 = ends[:, 1]
+        # Kenar boyunca enlem basina boylam degisimi
+        self._edge_slope = (ends[:, 0] - starts[:, 0]) / (ends[:, 1] - starts[:, 1])
+        self.is_rectangle = kind == "bbox"
+
+    @property
+    def bbox(self) -> Tuple[float, float, float, float]:
+        """GeoJSON sirasiyla (bati, guney, dogu, kuzey)"""
+        return (self.min_lng, self.min_lat, self.max_lng, self.max_lat)
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        """Kutunun merkezi (lat, lng)"""
+        return ((self.min_lat + self.max_lat) / 2, (self.min_lng + self.max_lng) / 2)
+
+    def enclosing_radius_km(self) -> float:
+        """Merkezden kutu koselerine en buyuk mesafe - alani kapsayan daire"""
+        center_lat, center_lng = self.center
+        return max(haversine_km(center_lat, center_lng, lat, lng)
+                   for lat in (self.min_lat, self.max_lat)
+                   for lng in (self.min_lng, self.max_lng))
+
+    def contains(self, lats: ArrayLike, lngs: ArrayLike) -> np.ndarray:
+        """
+        Noktalar alanin icinde mi - bool maske, sekil (N,)
+
+        Once kutu disindakiler elenir; kalanlar icin her kenarla yatay isin
+        kesisimleri tek broadcast ile sayilir (parcalar halinde, bellek sinirli).
+        """
+        lats = as_coordinate_array(lats)
+        lngs = as_coordinate_array(lngs)
+        inside = ((lats >= self.min_lat) & (lats <= self.max_lat) &
+                  (lngs >= self.min_lng) & (lngs <= self.max_lng))
+        if self.is_rectangle:
+            return inside
+
+        candidates = np.flatnonzero(inside)
+        if candidates.size == 0:
+            return inside
+
+        chunk = max(_RAY_CAST_CHUNK_ELEMENTS // max(self._edge_lng.size, 1), 1)
+        for start in range(0, candidates.size, chunk):
+            rows = candidates[start:start + chunk]
+            point_lat = lats[rows][:, np.newaxis]
+            point_lng = lngs[rows][:, np.newaxis]
+            # Kenar noktanin enlemini kesiyor mu ve kesisim noktanin dogusunda mi
+            straddles = (self._edge_lat1 > point_lat) != (self._edge_lat2 > point_lat)
+            crossing_lng = self._edge_lng + (point_lat - self._edge_lat1) * self._edge_slope
+            crossings = np.count_nonzero(straddles & (point_lng < crossing_lng), axis=1)
+            inside[rows] = (crossings & 1).astype(bool)
+        return inside
+
+    def describe(self) -> Dict[str, Any]:
+        """Yanitta donen alan ozeti"""
+        return {"type": self.kind, "bbox": list(self.bbox), "rings": self.ring_count, "key": self.key}
+
+# =====================================
+# PARSING
+# =====================================
+
+def _check_position(lng: float, lat: float) -> None:
+    """Koordinat gecerli aralikta mi"""
+    if not (-180.0 <= lng <= 180.0 and -90.0 <= lat <= 90.0):
+        raise InvalidAreaError(f"Coordinate out of range: [{lng}, {lat}] (expected [lng, lat])")
+
+def _bbox_ring(bbox: Sequence[float]) -> np.ndarray:
+    """[bati, guney, dogu, kuzey] kutusunu kapali halkaya cevir"""
+    if len(bbox) != 4:
+        raise InvalidAreaError("bbox must be [min_lng, min_lat, max_lng, max_lat]")
+    try:
+        west, south, east, north = (float(value) for value in bbox)
+    except (TypeError, ValueError):
+        raise InvalidAreaError("bbox values must be numbers")
+    _check_position(west, south)
+    _check_position(east, north)
+    if west >= east or south >= north:
+        raise InvalidAreaError("bbox must satisfy min_lng < max_lng and min_lat < max_lat")
+    return np.array([[west, south], [east, south], [east, north], [west, north], [west, south]],
+                    dtype=np.float64)
+
+def _polygon_rings(coordinates: Any) -> List[np.ndarray]:
+    """GeoJSON Polygon koordinatlarini kapali (lng, lat) halkalarina cevir"""
+    if not isinstance(coordinates, list) or not coordinates:
+        raise InvalidAreaError("Polygon coordinates must be a non-empty list of rings")
+
+    rings = []
+    for ring in coordinates:
+        try:
+            ring_array = np.array(ring, dtype=np.float64)
+        except (TypeError, ValueError):
+            raise InvalidAreaError("Polygon ring positions must be [lng, lat] numbers")
+        if ring_array.ndim != 2 or ring_array.shape[1] < 2:
+            raise InvalidAreaError("Polygon ring positions must be [lng, lat] numbers")
+        ring_array = ring_array[:, :2]
+        for lng, lat in ring_array.tolist():
+            _check_position(lng, lat)
+        # Kapatilmamis halka kabul edilir, ilk nokta sona eklenir
+        if not np.array_equal(ring_array[0], ring_array[-1]):
+            ring_array = np.vstack((ring_array, ring_array[:1]))
+        if ring_array.shape[0] < 4:
+            raise InvalidAreaError("Polygon ring needs at least 3 distinct positions")
+        rings.append(ring_array)
+    return rings
+
+def _geometry_of(polygon: Dict[str, Any]) -> Dict[str, Any]:
+    """Feature veya FeatureCollection icinden geometriyi cikar"""
+    if not isinstance(polygon, dict):
+        raise InvalidAreaError("polygon must be a GeoJSON object")
+    if polygon.get("type") == "Feature":
+        return _geometry_of(polygon.get("geometry") or {})
+    if polygon.get("type") == "FeatureCollection":
+        features = polygon.get("features") or []
+        if len(features) != 1:
+            raise InvalidAreaError("FeatureCollection must contain exactly one feature")
+        return _geometry_of(features[0])
+    return polygon
+
+def area_key(bbox: Optional[Sequence[float]] = None,
+             polygon: Optional[Dict[str, Any]] = None) -> str:
+    """Alan tanimindan kararli onbellek anahtari (kanonik JSON'un SHA-1 ozeti)"""
+    canonical = json.dumps({"bbox": bbox, "polygon": polygon}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()
+
+# =====================================
+# CACHE
+# =====================================
+
+_prepared_areas: "OrderedDict[str, PreparedArea]" = OrderedDict()
+_area_cache_stats = {"hits": 0, "misses": 0}
+
+def prepare_area(bbox: Optional[Sequence[float]] = None,
+                 polygon: Optional[Dict[str, Any]] = None) -> PreparedArea:
+    """
+    Bbox veya GeoJSON Polygon/MultiPolygon'dan hazir alan (onbellekten)
+
+    Ikisi birden verilirse poligon kullanilir. Gecersiz giriste
+    InvalidAreaError firlatilir.
+    """
+    if polygon is None and bbox is None:
+        raise InvalidAreaError("Either bbox or polygon is required")
+    if polygon is not None:
+        bbox = None
+
+    key = area_key(bbox, polygon)
+    area = _prepared_areas.get(key)
+    if area is not None:
+        _prepared_areas.move_to_end(key)
+        _area_cache_stats["hits"] += 1
+        return area
+
+    _area_cache_stats["misses"] += 1
+    if polygon is None:
+        area = PreparedArea(key, "bbox", [_bbox_ring(bbox)])
+    else:
+        geometry = _geometry_of(polygon)
+        geometry_type = geometry.get("type")
+        if geometry_type == "Polygon":
+            rings = _polygon_rings(geometry.get("coordinates"))
+        elif geometry_type == "MultiPolygon":
+            parts = geometry.get("coordinates")
+            if not isinstance(parts, list) or not parts:
+                raise InvalidAreaError("MultiPolygon coordinates must be a non-empty list of polygons")
+            rings = [ring for part in parts for ring in _polygon_rings(part)]
+        else:
+            raise InvalidAreaError(f"Unsupported geometry type: {geometry_type} (expected Polygon or MultiPolygon)")
+        area = PreparedArea(key, geometry_type, rings)
+
+    _prepared_areas[key] = area
+    if len(_prepared_areas) > AREA_CACHE_MAX_ENTRIES:
+        _prepared_areas.popitem(last=False)
+    return area
+
+def area_cache_stats() -> Dict[str, int]:
+    """Hazirlanmis alan onbellegi isabet/iska sayilari"""
+    return dict(_area_cache_stats, size=len(_prepared_areas))
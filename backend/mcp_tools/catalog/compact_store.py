@@ -0,0 +1,701 @@
+# Sydney Guide - Compact Place Catalog
+# Sutun bazli (struct-of-arrays) bellek dostu mekan katalogu
+
+from typing import Any, Collection, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from ..geodesy import haversine_one_to_many
+from .area import PreparedArea
+from .opening_hours import ScheduleTable, weekly_intervals
+from .prefix_index import PrefixIndex, normalize_label, suburb_of
+from .trigram_index import TrigramIndex, window_edit_distance
+from .spatial_index import SpatialGridIndex
+from .text_index import TextIndex
+
+# Sutunlarda tutulan alanlar - kalanlar satir basina "extras" sozlugune duser
+_STRING_FIELDS = ("name", "description", "address")
+_MISSING_CODE = -1
+_MISSING_PRICE = -1
+
+# Metin eslesmesi bu sayidan az satir dondururse grid yerine dogrudan bunlar olculur
+TEXT_FIRST_THRESHOLD = 256
+
+# Bulanik arama - trigram ortaklik esigi (esigi gecen tum adaylar edit mesafesiyle elenir)
+FUZZY_MIN_OVERLAP = 0.5
+
+def _searchable_texts(place_data: Dict[str, Any]) -> Tuple[str, str]:
+    """Metin indeksine girecek alanlar"""
+    return place_data.get("name", ""), place_data.get("description", "")
+
+def _row_array(rows: Collection[int]) -> np.ndarray:
+    """Satir dizisi/kumesi -> intp dizi"""
+    if isinstance(rows, np.ndarray):
+        return rows.astype(np.intp, copy=False)
+    return np.fromiter(rows, dtype=np.intp, count=len(rows))
+
+def _grow(array: np.ndarray, capacity: int, fill: Any = 0) -> np.ndarray:
+    """Sutunu yeni kapasiteye buyut, yeni hucreleri fill ile doldur"""
+    grown = np.full(capacity, fill, dtype=array.dtype)
+    grown[:array.size] = array
+    return grown
+
+class StringTable:
+    """
+    UTF-8 metinleri tek bir bytearray icinde tutan string tablosu
+
+    Her metin bir int32 kod alir; kod ofset dizisindeki baslangic/bitis
+    araligini gosterir. Ayni metin ikinci kez eklenirse ayni kod doner
+    (intern). Tekrar kontrolu metnin hash'i ile yapilir, metin nesnesinin
+    kendisi saklanmaz.
+    """
+
+    def __init__(self):
+        self._blob = bytearray()
+        self._offsets = np.zeros(16, dtype=np.int64)
+        self._count = 0
+        self._codes_by_hash: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._blob) + self._offsets.nbytes
+
+    def append(self, value: str) -> int:
+        """Metni tekrar kontrolu yapmadan ekle (place_id gibi benzersiz degerler icin)"""
+        if self._count + 1 >= self._offsets.size:
+            self._offsets = _grow(self._offsets, self._offsets.size * 2)
+        code = self._count
+        self._blob += value.encode("utf-8")
+        self._offsets[code + 1] = len(self._blob)
+        self._count += 1
+        return code
+
+    def copy(self) -> "StringTable":
+        """Bagimsiz kopya - kodlar kopyada da gecerli"""
+        clone = StringTable()
+        clone._blob = bytearray(self._blob)
+        clone._offsets = self._offsets.copy()
+        clone._count = self._count
+        clone._codes_by_hash = dict(self._codes_by_hash)
+        return clone
+
+    def intern(self, value: str) -> int:
+        """Metnin kodunu dondur, yoksa ekle"""
+        value_hash = hash(value)
+        code = self._codes_by_hash.get(value_hash)
+        if code is not None and self[code] == value:
+            return code
+
+        code = self.append(value)
+        # Hash cakismasinda ilk kod kalir, yeni metin sadece eklenir
+        self._codes_by_hash.setdefault(value_hash, code)
+        return code
+
+    def __getitem__(self, code: int) -> str:
+        start, end = self._offsets[code], self._offsets[code + 1]
+        return self._blob[start:end].decode("utf-8")
+
+class CompactPlaceCatalog:
+    """
+    Mekanlari sozluk yerine tipli sutunlarda tutan katalog
+
+    - lat/lng: float64, rating: float32 (NaN = yok), price_level: int8 (-1 = yok)
+    - place_type: int16 kod (tip tablosuna indeks)
+    - name/description/address: StringTable kodlari (int32, -1 = yok)
+    - calisma saatleri: ScheduleTable kodu (int32, -1 = bilinmiyor)
+
+    Sutunlara sigmayan alanlar (foto, saatler vb.) sadece o alanlara sahip
+    satirlar icin ayri sozlukte tutulur. Sozluk sadece dondurulen satirlar
+    icin materialize() ile uretilir; her cagri yeni bir sozluk dondurur.
+    Tip basina rating sirasi ilk sorguda kurulur, sonra artimli tutulur:
+    degisiklikler biriktirilir ve sonraki sorguda mevcut siralara tek
+    seferde birlestirilir (bastan siralama yok).
+    """
+
+    def __init__(self, places: Optional[Dict[str, Dict[str, Any]]] = None,
+                 cell_size_km: float = 0.5):
+        capacity = max(len(places or {}), 16)
+        self._size = 0
+        self._lats = np.zeros(capacity, dtype=np.float64)
+        self._lngs = np.zeros(capacity, dtype=np.float64)
+        self._ratings = np.full(capacity, np.nan, dtype=np.float32)
+        self._price_levels = np.full(capacity, _MISSING_PRICE, dtype=np.int8)
+        self._type_codes = np.full(capacity, _MISSING_CODE, dtype=np.int16)
+        self._live = np.zeros(capacity, dtype=bool)
+        self._place_id_codes = np.full(capacity, _MISSING_CODE, dtype=np.int32)
+        self._string_codes = {
+            field: np.full(capacity, _MISSING_CODE, dtype=np.int32) for field in _STRING_FIELDS
+        }
+
+        self._schedule_codes = np.full(capacity, _MISSING_CODE, dtype=np.int32)
+        self._strings = StringTable()
+        self._schedules = ScheduleTable()
+        self._types: List[str] = []
+        self._type_code_by_name: Dict[str, int] = {}
+        self._row_by_id: Dict[str, int] = {}
+        self._extras: Dict[int, Dict[str, Any]] = {}
+
+        self._spatial_index = SpatialGridIndex(cell_size_km)
+        self._text_index = TextIndex()
+        # Tip kodu (None = tum katalog) -> rating'e gore sirali satirlar; diziler yerinde degismez
+        self._rating_order: Dict[Optional[int], np.ndarray] = {}
+        # Siralar kurulduktan sonra eklenen satirlar ve silme olup olmadigi - sonraki sorguda birlestirilir
+        self._rating_pending: List[int] = []
+        self._rating_removed = False
+        # Ad/semt onek indeksi - ilk autocomplete'te kurulur, degisiklikte silinir
+        self._prefix_index: Optional[PrefixIndex] = None
+        # Ad/adres trigram indeksi - ilk bulanik aramada kurulur, sonra artimli guncellenir
+        self._trigram_index: Optional[TrigramIndex] = None
+
+        for place_id, place_data in (places or {}).items():
+            self.add_place(place_data, place_id)
+        self.freeze()
+
+    def __len__(self) -> int:
+        return len(self._row_by_id)
+
+    def __contains__(self, place_id: str) -> bool:
+        return place_id in self._row_by_id
+
+    @property
+    def nbytes(self) -> int:
+        """Sutunlarin ve string tablosunun bayt boyutu (indeksler haric)"""
+        columns = [self._lats, self._lngs, self._ratings, self._price_levels,
+                   self._type_codes, self._live, self._place_id_codes, self._schedule_codes,
+                   *self._string_codes.values()]
+        return sum(column.nbytes for column in columns) + self._strings.nbytes + self._schedules.nbytes
+
+    @property
+    def index_nbytes(self) -> int:
+        """Mekansal ve metin indekslerinin donuk dizi boyutu (kelime listesi haric)"""
+        return self._spatial_index.nbytes + self._text_index.nbytes
+
+    @property
+    def dead_rows(self) -> int:
+        """Silinmis (bos isaretli) satir sayisi"""
+        return self._size - len(self._row_by_id)
+
+    def freeze(self) -> None:
+        """Indekslerde bekleyen degisiklikleri donuk dizilere birlestir (toplu yuklemeden sonra)"""
+        self._spatial_index.freeze()
+        self._text_index.freeze()
+
+    def copy(self) -> "CompactPlaceCatalog":
+        """
+        Bagimsiz kopya - artimli guncellemeyi yayindaki surume dokunmadan yapmak icin
+
+        Sutunlar kopyalanir; indekslerin donuk dizileri paylasilir, sadece
+        bekleyen degisiklikleri kopyalanir. Rating siralari paylasilir
+        (birlestirme yeni dizi uretir), kopyadaki degisiklikler onlara
+        artimli uygulanir. Okuma sirasinda tembel kurulan onek ve trigram
+        indeksleri kopyalanmaz, kopyada ilk ihtiyacta yeniden kurulur.
+        Kaynak okunurken degismemeli.
+        """
+        clone = CompactPlaceCatalog(cell_size_km=self._spatial_index.cell_size_km)
+        clone._size = self._size
+        for name in ("_lats", "_lngs", "_ratings", "_price_levels", "_type_codes", "_live",
+                     "_place_id_codes", "_schedule_codes"):
+            setattr(clone, name, getattr(self, name).copy())
+        clone._string_codes = {field: codes.copy() for field, codes in self._string_codes.items()}
+        clone._strings = self._strings.copy()
+        clone._schedules = self._schedules.copy()
+        clone._types = list(self._types)
+        clone._type_code_by_name = dict(self._type_code_by_name)
+        clone._row_by_id = dict(self._row_by_id)
+        # Ekstra sozlukler add_place'te yeni olusturulur, yerinde degismez - paylasilabilir
+        clone._extras = dict(self._extras)
+        clone._spatial_index = self._spatial_index.copy()
+        clone._text_index = self._text_index.copy()
+        clone._rating_order = dict(self._rating_order)
+        clone._rating_pending = list(self._rating_pending)
+        clone._rating_removed = self._rating_removed
+        return clone
+
+    # =====================================
+    # MUTATION
+    # =====================================
+
+    def _ensure_capacity(self) -> None:
+        """Sutunlar doluysa hepsini iki katina cikar"""
+        if self._size < self._lats.size:
+            return
+        capacity = self._lats.size * 2
+        self._lats = _grow(self._lats, capacity)
+        self._lngs = _grow(self._lngs, capacity)
+        self._ratings = _grow(self._ratings, capacity, np.nan)
+        self._price_levels = _grow(self._price_levels, capacity, _MISSING_PRICE)
+        self._type_codes = _grow(self._type_codes, capacity, _MISSING_CODE)
+        self._live = _grow(self._live, capacity, False)
+        self._place_id_codes = _grow(self._place_id_codes, capacity, _MISSING_CODE)
+        self._schedule_codes = _grow(self._schedule_codes, capacity, _MISSING_CODE)
+        for field in _STRING_FIELDS:
+            self._string_codes[field] = _grow(self._string_codes[field], capacity, _MISSING_CODE)
+
+    def _type_code(self, place_type: str) -> int:
+        """Tip adini kucuk tamsayi koduna cevir"""
+        code = self._type_code_by_name.get(place_type)
+        if code is None:
+            code = self._type_code_by_name[place_type] = len(self._types)
+            self._types.append(place_type)
+        return code
+
+    def add_place(self, place_data: Dict[str, Any], place_id: Optional[str] = None) -> None:
+        """Mekani kataloga ekle - ayni id varsa kaydi guncelle"""
+        place_id = place_id or place_data.get("place_id", "")
+        if place_id in self._row_by_id:
+            self.remove_place(place_id)
+
+        self._ensure_capacity()
+        row = self._size
+        self._size += 1
+
+        extras = {}
+        for field, value in place_data.items():
+            if field in ("place_id", "lat", "lng"):
+                continue
+            if field in _STRING_FIELDS and isinstance(value, str):
+                self._string_codes[field][row] = self._strings.intern(value)
+            elif field == "place_type" and isinstance(value, str):
+                self._type_codes[row] = self._type_code(value)
+            elif field == "rating" and isinstance(value, (int, float)) and not isinstance(value, bool):
+                self._ratings[row] = value
+            elif field == "price_level" and isinstance(value, int) and not isinstance(value, bool) \
+                    and 0 <= value <= 127:
+                self._price_levels[row] = value
+            else:
+                extras[field] = value
+        if extras:
+            self._extras[row] = extras
+        # opening_hours sozlugu extras'ta kalir; haftalik araliklar ayrica program koduna cevrilir
+        intervals = weekly_intervals(place_data.get("opening_hours"))
+        if intervals is not None:
+            self._schedule_codes[row] = self._schedules.intern(intervals)
+
+        lat, lng = place_data.get("lat", 0), place_data.get("lng", 0)
+        self._lats[row] = lat
+        self._lngs[row] = lng
+        self._place_id_codes[row] = self._strings.append(place_id)
+        self._live[row] = True
+        self._row_by_id[place_id] = row
+
+        self._spatial_index.insert(row, lat, lng)
+        self._text_index.add(row, _searchable_texts(place_data))
+        if self._trigram_index is not None:
+            self._trigram_index.add(row, (self._string(row, "name"), self._string(row, "address")))
+        if self._rating_order:
+            self._rating_pending.append(row)
+        self._prefix_index = None
+
+    def remove_place(self, place_id: str) -> bool:
+        """Mekani katalogdan cikar (satir bos isaretlenir)"""
+        row = self._row_by_id.pop(place_id, None)
+        if row is None:
+            return False
+
+        self._spatial_index.remove(row, self._lats[row], self._lngs[row])
+        self._text_index.remove(row, (self._string(row, "name"), self._string(row, "description")))
+        if self._trigram_index is not None:
+            self._trigram_index.remove(row, (self._string(row, "name"), self._string(row, "address")))
+        self._live[row] = False
+        self._extras.pop(row, None)
+        if self._rating_order:
+            self._rating_removed = True
+        self._prefix_index = None
+        return True
+
+    # =====================================
+    # MATERIALIZATION
+    # =====================================
+
+    def _string(self, row: int, field: str) -> str:
+        code = self._string_codes[field][row]
+        return self._strings[code] if code != _MISSING_CODE else ""
+
+    def materialize(self, row: int) -> Dict[str, Any]:
+        """Satirdan yeni bir mekan sozlugu uret (fixture kaydiyla ayni alanlar)"""
+        place_data: Dict[str, Any] = {"place_id": self._strings[self._place_id_codes[row]]}
+
+        name_code = self._string_codes["name"][row]
+        if name_code != _MISSING_CODE:
+            place_data["name"] = self._strings[name_code]
+        type_code = self._type_codes[row]
+        if type_code != _MISSING_CODE:
+            place_data["place_type"] = self._types[type_code]
+
+        place_data["lat"] = float(self._lats[row])
+        place_data["lng"] = float(self._lngs[row])
+
+        rating = self._ratings[row]
+        if not np.isnan(rating):
+            # float32 hassasiyeti - rating'ler en fazla iki ondalikli
+            place_data["rating"] = round(float(rating), 2)
+        price_level = self._price_levels[row]
+        if price_level != _MISSING_PRICE:
+            place_data["price_level"] = int(price_level)
+
+        for field in ("description", "address"):
+            code = self._string_codes[field][row]
+            if code != _MISSING_CODE:
+                place_data[field] = self._strings[code]
+
+        extras = self._extras.get(row)
+        if extras:
+            place_data.update(extras)
+        return place_data
+
+    def get_place(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """Mekan kaydini yeni sozluk olarak dondur"""
+        row = self._row_by_id.get(place_id)
+        return self.materialize(row) if row is not None else None
+
+    def iter_places(self) -> Iterator[Dict[str, Any]]:
+        """Katalogdaki tum mekanlari dolas (her biri yeni sozluk)"""
+        for row in np.flatnonzero(self._live[:self._size]).tolist():
+            yield self.materialize(row)
+
+    # =====================================
+    # QUERIES
+    # =====================================
+
+    def _type_mask(self, place_type: Optional[str]) -> Optional[np.ndarray]:
+        """Tipteki canli satirlar maskesi - None tum canli satirlar; bilinmeyen tip bos maske"""
+        live = self._live[:self._size]
+        if place_type is None:
+            return live
+        code = self._type_code_by_name.get(place_type)
+        if code is None:
+            return np.zeros(self._size, dtype=bool)
+        return live & (self._type_codes[:self._size] == code)
+
+    def _merge_rating_changes(self) -> None:
+        """
+        Biriken ekleme/silmeleri tum kurulu rating siralarina uygula
+
+        Silinen satirlar canli maskesiyle atilir. Yeni satirlar kendi
+        aralarinda siralanir ve searchsorted ile bulunan konumlara tek
+        np.insert ile yerlestirilir - O(n + k log k). Yeni satir numaralari
+        siradakilerin hepsinden buyuk oldugundan esit rating'de sona
+        (side="right") girer; esitlikte satir sirasi korunur.
+        """
+        pending = np.asarray(self._rating_pending, dtype=np.intp)
+        pending = pending[self._live[pending]]
+        pending_keys = -np.nan_to_num(self._ratings[pending], nan=0.0)
+        order = np.lexsort((pending, pending_keys))
+        pending, pending_keys = pending[order], pending_keys[order]
+
+        merged = {}
+        for key, rows in self._rating_order.items():
+            if self._rating_removed:
+                rows = rows[self._live[rows]]
+            selected = slice(None) if key is None else self._type_codes[pending] == key
+            added, added_keys = pending[selected], pending_keys[selected]
+            if added.size:
+                positions = np.searchsorted(-np.nan_to_num(self._ratings[rows], nan=0.0), added_keys, side="right")
+                rows = np.insert(rows, positions, added)
+            merged[key] = rows
+        self._rating_order = merged
+        self._rating_pending = []
+        self._rating_removed = False
+
+    def _rows_by_rating(self, place_type: Optional[str]) -> np.ndarray:
+        """Tipteki satirlar rating'e gore azalan sirada (esitlikte satir sirasi)"""
+        if self._rating_pending or self._rating_removed:
+            self._merge_rating_changes()
+        key = None if place_type is None else self._type_code_by_name.get(place_type)
+        if place_type is not None and key is None:
+            return np.empty(0, dtype=np.intp)
+        order = self._rating_order.get(key)
+        if order is None:
+            rows = np.flatnonzero(self._type_mask(place_type))
+            ratings = np.nan_to_num(self._ratings[rows], nan=0.0)
+            order = rows[np.lexsort((rows, -ratings))]
+            self._rating_order[key] = order
+        return order
+
+    def settle(self) -> None:
+        """
+        Yayinlamadan once: bekleyen rating degisikliklerini birlestir, her tipin sirasini kur
+
+        Sonrasinda top_rated/count_by_type/type_rows katalogu degistirmez;
+        yayindaki katalog baska is parcaciginda copy() ile okunurken
+        okuyucular rating durumunu yari yolda birakamaz.
+        """
+        for place_type in [None] + self._types:
+            self._rows_by_rating(place_type)
+
+    def type_rows(self, place_type: Optional[str] = None) -> np.ndarray:
+        """Tipteki tum satirlar (rating'e gore azalan) - place_type None ise tum katalog"""
+        return self._rows_by_rating(place_type)
+
+    def ranking_columns(self, rows: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Siralama kriterleri icin satirlarin sutun degerleri (eksikler NaN)
+
+        rating ve price_level sutunlardan dogrudan okunur; yorum sayisi ve
+        opening_hours.open_now sadece ekstra alani olan satirlar icin okunur.
+        """
+        price_levels = self._price_levels[rows].astype(np.float64)
+        price_levels[price_levels == _MISSING_PRICE] = np.nan
+        ratings_totals = np.full(rows.size, np.nan)
+        open_now = np.full(rows.size, np.nan)
+
+        for index, row in enumerate(rows.tolist()):
+            extras = self._extras.get(row)
+            if not extras:
+                continue
+            total = extras.get("user_ratings_total")
+            if isinstance(total, (int, float)) and not isinstance(total, bool):
+                ratings_totals[index] = total
+            opening_hours = extras.get("opening_hours")
+            if isinstance(opening_hours, dict) and isinstance(opening_hours.get("open_now"), bool):
+                open_now[index] = opening_hours["open_now"]
+
+        return {
+            "ratings": self._ratings[rows].astype(np.float64),
+            "ratings_totals": ratings_totals,
+            "price_levels": price_levels,
+            "open_now": open_now
+        }
+
+    def open_mask(self, rows: np.ndarray, minute: int) -> np.ndarray:
+        """
+        Satirlarin haftanin verilen dakikasinda acik olma durumu - 1 acik, 0 kapali, NaN bilinmiyor
+
+        Durum her farkli program icin bir kez (tek vektorel aralik
+        karsilastirmasi) hesaplanir, satirlara program koduyla dagitilir;
+        satir basina sozluk okunmaz.
+        """
+        codes = self._schedule_codes[rows]
+        known = codes != _MISSING_CODE
+        mask = np.full(rows.size, np.nan)
+        mask[known] = self._schedules.open_at(minute)[codes[known]]
+        return mask
+
+    def count_by_type(self, place_type: Optional[str] = None) -> int:
+        """Tipteki mekan sayisi - place_type None ise tum katalog"""
+        return int(self._rows_by_rating(place_type).size)
+
+    def top_rated(self, place_type: Optional[str] = None, limit: int = 10) -> List[Dict[str, Any]]:
+        """Rating'e gore en iyi mekanlar - sadece limit kadar satir materialize edilir"""
+        return [self.materialize(row) for row in self._rows_by_rating(place_type)[:limit].tolist()]
+
+    def search_rows(self, lat: float, lng: float, radius_km: float,
+                    query: str = "", place_type: str = "all",
+                    text_rows: Optional[Collection[int]] = None,
+                    open_at: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Metin, tip ve yaricap filtrelerini uygula, sozluk uretmeden dondur
+
+        text_rows verilirse metin eslesmesi yerine bu satirlar kullanilir
+        (ornegin fuzzy_rows sonucu). open_at (haftanin dakikasi) verilirse
+        sadece o anda acik oldugu bilinen satirlar kalir.
+
+        Returns:
+            Tuple: (satir numaralari, mesafe_km) dizileri
+        """
+        empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64))
+        if text_rows is None:
+            text_rows = self._text_index.match(query) if query else None
+        if text_rows is not None:
+            text_rows = _row_array(text_rows)
+            if text_rows.size == 0:
+                return empty
+
+        if text_rows is not None and text_rows.size <= TEXT_FIRST_THRESHOLD:
+            rows = text_rows
+        else:
+            rows = self._spatial_index.query_radius(lat, lng, radius_km).astype(np.intp)
+            if text_rows is not None and rows.size:
+                rows = rows[np.isin(rows, text_rows)]
+
+        if rows.size and place_type != "all":
+            code = self._type_code_by_name.get(place_type)
+            rows = rows[self._type_codes[rows] == code] if code is not None else rows[:0]
+        if rows.size and open_at is not None:
+            rows = rows[self.open_mask(rows, open_at) == 1]
+        if rows.size == 0:
+            return empty
+
+        # Tum aday kumesinin mesafesi tek vektorel cagriyla
+        distances = haversine_one_to_many(lat, lng, self._lats[rows], self._lngs[rows])
+        inside = distances <= radius_km
+        return rows[inside], distances[inside]
+
+    def nearest_rows(self, lat: float, lng: float, k: int, query: str = "",
+                     place_type: str = "all",
+                     text_rows: Optional[Collection[int]] = None,
+                     open_at: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Metin ve tip filtresine uyan en yakin k satir - yaricap siniri yok
+
+        Metin eslesmesi seciciyse sadece o satirlar olculur; degilse grid
+        halkalari yakindan uzaga gezilir ve k. en yakin mesafe siradaki
+        halkanin alt sinirindan kucukse durulur. text_rows ve open_at
+        search_rows'daki gibi.
+
+        Returns:
+            Tuple: mesafeye gore artan (satir numaralari, mesafe_km) dizileri
+        """
+        empty = (np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float64))
+        if k <= 0:
+            return empty
+
+        if text_rows is None:
+            text_rows = self._text_index.match(query) if query else None
+        if text_rows is not None:
+            text_rows = _row_array(text_rows)
+            if text_rows.size == 0:
+                return empty
+
+        type_code = None
+        if place_type != "all":
+            type_code = self._type_code_by_name.get(place_type)
+            if type_code is None:
+                return empty
+
+        def accept(rows: np.ndarray) -> np.ndarray:
+            if type_code is not None:
+                rows = rows[self._type_codes[rows] == type_code]
+            if text_rows is not None and rows.size:
+                rows = rows[np.isin(rows, text_rows)]
+            if open_at is not None and rows.size:
+                rows = rows[self.open_mask(rows, open_at) == 1]
+            return rows
+
+        if text_rows is not None and text_rows.size <= TEXT_FIRST_THRESHOLD:
+            candidate_rows = accept(text_rows)
+            candidate_distances = haversine_one_to_many(lat, lng, self._lats[candidate_rows],
+                                                        self._lngs[candidate_rows])
+        else:
+            # Best-first: halkalar yakindan uzaga, en iyi k aday tutulur
+            candidate_rows = np.empty(0, dtype=np.intp)
+            candidate_distances = np.empty(0, dtype=np.float64)
+            for lower_bound_km, ring_ids in self._spatial_index.iter_rings(lat, lng):
+                if candidate_rows.size >= k and candidate_distances.max() <= lower_bound_km:
+                    break
+                rows = accept(ring_ids.astype(np.intp))
+                if rows.size == 0:
+                    continue
+                distances = haversine_one_to_many(lat, lng, self._lats[rows], self._lngs[rows])
+                candidate_rows = np.concatenate((candidate_rows, rows))
+                candidate_distances = np.concatenate((candidate_distances, distances))
+                if candidate_rows.size > k:
+                    keep = np.argpartition(candidate_distances, k - 1)[:k]
+                    candidate_rows, candidate_distances = candidate_rows[keep], candidate_distances[keep]
+
+        order = np.lexsort((candidate_rows, candidate_distances))[:k]
+        return candidate_rows[order], candidate_distances[order]
+
+    def area_rows(self, area: PreparedArea, query: str = "", place_type: str = "all") -> np.ndarray:
+        """
+        Alan icindeki, metin ve tipe uyan satirlar - rating'e gore azalan sirada
+
+        Grid kutu sorgusu adaylari verir; kesin nokta-icinde testi hazir
+        alanin vektorel ray casting'i ile aday koordinatlari uzerinde yapilir.
+        """
+        empty = np.empty(0, dtype=np.intp)
+        text_rows = self._text_index.match(query) if query else None
+        if text_rows is not None and text_rows.size == 0:
+            return empty
+
+        if text_rows is not None and text_rows.size <= TEXT_FIRST_THRESHOLD:
+            rows = text_rows.astype(np.intp)
+        else:
+            rows = self._spatial_index.query_bbox(area.min_lat, area.min_lng,
+                                                  area.max_lat, area.max_lng).astype(np.intp)
+            if text_rows is not None and rows.size:
+                rows = rows[np.isin(rows, text_rows)]
+
+        if rows.size and place_type != "all":
+            code = self._type_code_by_name.get(place_type)
+            rows = rows[self._type_codes[rows] == code] if code is not None else rows[:0]
+        if rows.size == 0:
+            return empty
+
+        rows = rows[area.contains(self._lats[rows], self._lngs[rows])]
+        ratings = np.nan_to_num(self._ratings[rows], nan=0.0)
+        return rows[np.lexsort((rows, -ratings))]
+
+    def fuzzy_rows(self, query: str, limit: Optional[int] = None) -> List[int]:
+        """
+        Yazim hatali sorguya uyan satirlar - en iyi eslesme once
+
+        Adaylar trigram posting listelerinden gelir; her aday ad ve adresin
+        kelime pencereleriyle sinirli edit mesafesine gore yeniden siralanir
+        (sinir: normalize sorgu uzunlugunun dortte biri, en az 1). Siniri
+        asan adaylar elenir. Varsayilan olarak esigi gecen tum satirlar
+        doner - yaricap/tip filtresi kesilmemis kume uzerinde calismali,
+        sonuc sayisi ancak filtreden sonra sinirlanir.
+        """
+        if self._trigram_index is None:
+            self._trigram_index = TrigramIndex()
+            for row in np.flatnonzero(self._live[:self._size]).tolist():
+                self._trigram_index.add(row, (self._string(row, "name"), self._string(row, "address")))
+
+        bound = max(1, len(normalize_label(query)) // 4)
+        ranked = []
+        for row, overlap in self._trigram_index.candidates(query, FUZZY_MIN_OVERLAP):
+            distances = [distance for distance in (window_edit_distance(query, self._string(row, field), bound)
+                                                   for field in ("name", "address"))
+                         if distance is not None]
+            if distances:
+                ranked.append((min(distances), -overlap, row))
+        ranked.sort()
+        return [row for _, _, row in (ranked if limit is None else ranked[:limit])]
+
+    def prefix_index(self) -> PrefixIndex:
+        """
+        Mekan adlari ve adreslerden cikan semtler uzerinde onek indeksi
+
+        Populerlik: mekan icin yorum sayisi (esitlikte rating), semt icin
+        icindeki mekanlarin toplam yorum sayisi ve mekan sayisi.
+        """
+        if self._prefix_index is None:
+            items = []
+            suburbs: Dict[str, List[float]] = {}
+            for row in np.flatnonzero(self._live[:self._size]).tolist():
+                extras = self._extras.get(row) or {}
+                total = extras.get("user_ratings_total")
+                total = total if isinstance(total, (int, float)) and not isinstance(total, bool) else 0
+                rating = float(np.nan_to_num(self._ratings[row], nan=0.0))
+                place_type = self._types[self._type_codes[row]] if self._type_codes[row] != _MISSING_CODE else None
+                address = self._string(row, "address")
+
+                items.append((self._string(row, "name"), total + rating / 10, {
+                    "type": "place",
+                    "label": self._string(row, "name"),
+                    "place_id": self._strings[self._place_id_codes[row]],
+                    "place_type": place_type,
+                    "address": address,
+                    "rating": round(rating, 2) if rating else None
+                }))
+
+                suburb = suburb_of(address)
+                if suburb:
+                    stats = suburbs.setdefault(suburb, [0.0, 0])
+                    stats[0] += total
+                    stats[1] += 1
+
+            for suburb, (total, place_count) in suburbs.items():
+                items.append((suburb, total + place_count, {
+                    "type": "suburb",
+                    "label": suburb,
+                    "place_count": place_count
+                }))
+            self._prefix_index = PrefixIndex(items)
+        return self._prefix_index
+
+    def search(self, lat: float, lng: float, radius_km: float,
+               query: str = "", place_type: str = "all") -> List[Tuple[Dict[str, Any], float]]:
+        """Yaricap icindeki eslesmeler (mekan, mesafe_km) ciftleri olarak - tum eslesmeleri materialize eder"""
+        rows, distances = self.search_rows(lat, lng, radius_km, query, place_type)
+        return [(self.materialize(row), distance)
+                for row, distance in zip(rows.tolist(), distances.tolist())]
+
+    def places_within_radius(self, lat: float, lng: float,
+                             radius_km: float) -> List[Tuple[Dict[str, Any], float]]:
+        """Yaricap icindeki mekanlari (mekan, mesafe_km) ciftleri olarak dondur"""
+        return self.search(lat, lng, radius_km)
@@ -0,0 +1,273 @@
+# Sydney Guide - Catalog Hot Reload
+# Kaynak degisince katalogu artimli gunceller, yeni degismez surumu atomik referans degisimiyle yayinlar
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .compact_store import CompactPlaceCatalog
+from .sqlite_store import SQLitePlaceStore
+
+logger = logging.getLogger(__name__)
+
+# Silinmis satirlar canli satirlarin bu oranini gecerse artimli guncelleme yerine bastan kurulur
+COMPACTION_DEAD_RATIO = 0.5
+
+def _fingerprint(place_data: Dict[str, Any]) -> bytes:
+    """Kaydin icerik ozeti - degisen mekanlari bulmak icin"""
+    encoded = json.dumps(place_data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+def _stat_token(path: str) -> Hashable:
+    """Dosya degisiklik belirteci - (mtime_ns, boyut)"""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+class CatalogSource(ABC):
+    """
+    Katalog kaynagi
+
+    token() ucuz bir degisiklik belirteci dondurur (None = belirtec yok, her
+    kontrolde yuklenip fark alinir); load() tum mekanlari place_id -> veri
+    olarak dondurur. load() soyuttur - eksik kaynak arka plan yuklemesinde
+    degil, olusturulurken hata verir.
+    """
+
+    name = "source"
+
+    def token(self) -> Optional[Hashable]:
+        return None
+
+    @abstractmethod
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        """Tum mekanlar - place_id -> mekan verisi"""
+
+class JsonFileSource(CatalogSource):
+    """JSON dosyasi - {place_id: mekan} sozlugu veya place_id alanli mekan listesi"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = f"json:{path}"
+
+    def token(self) -> Hashable:
+        return _stat_token(self.path)
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        with open(self.path, encoding="utf-8") as source_file:
+            data = json.load(source_file)
+        if isinstance(data, list):
+            return {place["place_id"]: place for place in data}
+        return data
+
+class SQLiteSnapshotSource(CatalogSource):
+    """Yerel SQLite mekan katalogu - Google bicimli kayitlar katalog bicimine cevrilir"""
+
+    def __init__(self, store: SQLitePlaceStore):
+        self.store = store
+        self.name = "sqlite"
+
+    def token(self) -> Hashable:
+        return self.store.snapshot_token()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        places = {}
+        for place_id, place_data in self.store.export_places().items():
+            location = place_data.get("location") or {}
+            record = {key: value for key, value in place_data.items() if key != "location"}
+            record["lat"], record["lng"] = location.get("lat", 0), location.get("lng", 0)
+            places[place_id] = record
+        return places
+
+class FeedSource(CatalogSource):
+    """
+    Disaridan verilen yukleyici (fixture modulu, import akisi)
+
+    Degisiklik belirteci watch_path dosyasindan veya version() cagrisindan
+    okunur; biri zorunludur. Belirtecsiz kaynak her arka plan kontrolunde
+    tum akisi yukleyip her mekanin ozetini yeniden hesaplardi.
+    """
+
+    def __init__(self, loader: Callable[[], Dict[str, Dict[str, Any]]],
+                 watch_path: Optional[str] = None, version: Optional[Callable[[], Hashable]] = None,
+                 name: str = "feed"):
+        """
+        Args:
+            loader: Tum mekanlari place_id -> veri olarak dondurur
+            watch_path: Degisikligi (mtime, boyut) ile izlenen dosya
+            version: Ucuz surum belirteci (ornegin akisin surum numarasi)
+        """
+        if not watch_path and version is None:
+            raise ValueError(f"FeedSource {name} needs a watch_path or a version callable to detect changes")
+        self.loader = loader
+        self.watch_path = watch_path
+        self.version = version
+        self.name = name
+
+    def token(self) -> Hashable:
+        return _stat_token(self.watch_path) if self.watch_path else self.version()
+
+    def load(self) -> Dict[str, Dict[str, Any]]:
+        return self.loader()
+
+class CatalogVersion:
+    """
+    Yayinlanmis katalog surumu
+
+    Yayinlandiktan sonra catalog'a mekan eklenmez/silinmez ve okumalar onu
+    degistirmez (rating siralari yayindan once kurulur); yeni veri her
+    zaman yeni bir surumle gelir. Aramaya baslarken surumu alan cagri,
+    arada yeni surum yayinlansa bile tutarli eski surumu okumaya devam eder.
+    """
+
+    __slots__ = ("number", "catalog", "fingerprints", "token", "loaded_at", "changes")
+
+    def __init__(self, number: int, catalog: CompactPlaceCatalog, fingerprints: Dict[str, bytes],
+                 token: Optional[Hashable], changes: Dict[str, Any]):
+        self.number = number
+        self.catalog = catalog
+        self.fingerprints = fingerprints
+        self.token = token
+        self.loaded_at = time.time()
+        self.changes = changes
+
+class CatalogReloader:
+    """
+    Kaynagi izleyip katalogun yeni surumlerini yayinlayan yukleyici
+
+    Degisiklikte kaynak bastan okunur, kayit ozetleri onceki surumle
+    karsilastirilir ve sadece eklenen/degisen/silinen mekanlar yayindaki
+    katalogun kopyasina uygulanir (mekansal ve metin indeksleri artimli
+    guncellenir). Hazir olan kopya tek referans atamasiyla yayinlanir;
+    okuyucular hicbir zaman yari guncellenmis katalog gormez ve yeniden
+    kurulumu beklemez. Silinen satirlar birikirse katalog bastan kurulur.
+    """
+
+    def __init__(self, source: CatalogSource, cell_size_km: float = 0.5,
+                 check_interval_seconds: float = 0.0):
+        """
+        Args:
+            source: Izlenecek kaynak
+            cell_size_km: Mekansal grid hucre boyutu
+            check_interval_seconds: Arka plan kontrolleri arasi en az sure (0 = arka plan kontrolu yok)
+        """
+        self.source = source
+        self.cell_size_km = cell_size_km
+        self.check_interval_seconds = check_interval_seconds
+        self._current: Optional[CatalogVersion] = None
+        # Yeniden yuklemeler sirayla yapilir; okuyucular bu kilidi hic almaz
+        self._reload_lock = threading.Lock()
+        self._last_check = time.monotonic()
+        self._background_task: Optional[asyncio.Task] = None
+
+    @property
+    def current(self) -> CatalogVersion:
+        """Yayindaki surum - ilk cagrida kaynak yuklenip ilk surum kurulur"""
+        version = self._current
+        if version is None:
+            self.reload_now()
+            version = self._current
+        return version
+
+    def reload_now(self) -> Dict[str, Any]:
+        """
+        Kaynagi kontrol et, degistiyse yeni surumu kurup yayinla (bloklayan)
+
+        Returns:
+            Dict: Surum numarasi, uygulama bicimi ve eklenen/degisen/silinen sayilari
+        """
+        with self._reload_lock:
+            self._last_check = time.monotonic()
+            current = self._current
+            token = self.source.token()
+            if current is not None and token is not None and token == current.token:
+                return {"status": "unchanged", "version": current.number}
+
+            places = self.source.load()
+            fingerprints = {place_id: _fingerprint(place_data) for place_id, place_data in places.items()}
+
+            if current is None:
+                catalog = CompactPlaceCatalog(places, self.cell_size_km)
+                changes = {"mode": "full", "inserted": len(places), "updated": 0, "deleted": 0}
+            else:
+                previous = current.fingerprints
+                inserted = [place_id for place_id in fingerprints if place_id not in previous]
+                updated = [place_id for place_id, fingerprint in fingerprints.items()
+                           if place_id in previous and previous[place_id] != fingerprint]
+                deleted = [place_id for place_id in previous if place_id not in fingerprints]
+
+                if not (inserted or updated or deleted):
+                    # Icerik ayni - sadece belirtec guncellenir, katalog paylasilir
+                    self._current = CatalogVersion(current.number, current.catalog, previous, token,
+                                                   current.changes)
+                    return {"status": "unchanged", "version": current.number}
+
+                catalog = current.catalog.copy()
+                for place_id in deleted:
+                    catalog.remove_place(place_id)
+                for place_id in inserted + updated:
+                    catalog.add_place(places[place_id], place_id)
+                mode = "incremental"
+                if catalog.dead_rows > COMPACTION_DEAD_RATIO * max(len(catalog), 1):
+                    catalog = CompactPlaceCatalog(places, self.cell_size_km)
+                    mode = "full"
+                changes = {"mode": mode, "inserted": len(inserted), "updated": len(updated),
+                           "deleted": len(deleted)}
+
+            # Okuyucular yayindaki katalogu degistirmemeli - rating siralari simdi kurulur
+            catalog.settle()
+            version = CatalogVersion((current.number + 1) if current else 1, catalog, fingerprints,
+                                     token, changes)
+            # Atomik referans degisimi - eski surumu tutan okuyucular etkilenmez
+            self._current = version
+            logger.info(f"Place catalog v{version.number} published from {self.source.name}: {changes}")
+            return dict(changes, status="reloaded", version=version.number)
+
+    async def reload(self) -> Dict[str, Any]:
+        """reload_now'u is parcaciginda calistir - event loop kurulum sirasinda bloklanmaz"""
+        return await asyncio.to_thread(self.reload_now)
+
+    def maybe_reload_in_background(self) -> None:
+        """
+        Kontrol suresi geldiyse kaynagi arka planda kontrol et (beklemeden doner)
+
+        Calisan event loop yoksa veya onceki kontrol surerken hicbir sey yapilmaz.
+        Hata olursa loglanir, yayindaki surum kalir.
+        """
+        if self.check_interval_seconds <= 0 or self._current is None:
+            return
+        if time.monotonic() - self._last_check < self.check_interval_seconds:
+            return
+        if self._background_task is not None and not self._background_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        self._last_check = time.monotonic()
+        self._background_task = loop.create_task(self._background_reload())
+
+    async def _background_reload(self) -> None:
+        try:
+            await self.reload()
+        except Exception as error:
+            logger.warning(f"Place catalog reload from {self.source.name} failed, keeping v{self._current.number}: {error}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Yayindaki surum bilgisi"""
+        version = self._current
+        if version is None:
+            return {"version": 0, "source": self.source.name}
+        return {
+            "version": version.number,
+            "source": self.source.name,
+            "places": len(version.catalog),
+            "loaded_at": version.loaded_at,
+            "last_changes": version.changes
+        }
@@ -0,0 +1,218 @@
+# Sydney Guide - Opening Hours Index
+# Calisma saatlerini haftalik dakika araliklarina ceviren ve vektorel "acik mi" sorgulayan yardimcilar
+
+import re
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+# Hafta Google Places gibi pazar 00:00'da baslar (gun 0 = pazar)
+MINUTES_PER_DAY = 24 * 60
+MINUTES_PER_WEEK = 7 * MINUTES_PER_DAY
+
+# Saat bilgisi olmayan open_at degerleri Sydney yerel saati sayilir
+SYDNEY_TIMEZONE = ZoneInfo("Australia/Sydney")
+
+_DAY_NAMES = ("sun", "mon", "tue", "wed", "thu", "fri", "sat")
+_CLOCK_PATTERN = re.compile(r"^(?:([a-z]{3})[a-z]*\s+)?(\d{1,2}):(\d{2})$")
+
+WeeklyIntervals = Tuple[Tuple[int, int], ...]
+
+class InvalidOpenAtError(ValueError):
+    """open_at degeri okunamadi"""
+
+def _period_minute(point: Any) -> Optional[int]:
+    """Google period noktasi ({"day": 5, "time": "2130"}) -> haftanin dakikasi"""
+    if not isinstance(point, dict):
+        return None
+    day, clock = point.get("day"), point.get("time")
+    if not isinstance(day, int) or not 0 <= day <= 6 or not isinstance(clock, str) \
+            or len(clock) != 4 or not clock.isdigit():
+        return None
+    hours, minutes = int(clock[:2]), int(clock[2:])
+    if hours > 24 or minutes > 59:
+        return None
+    return day * MINUTES_PER_DAY + hours * 60 + minutes
+
+def _merge(intervals: List[Tuple[int, int]]) -> WeeklyIntervals:
+    """Sirala, ortusen/bitisik araliklari birlestir"""
+    merged: List[List[int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return tuple((start, end) for start, end in merged)
+
+def weekly_intervals(opening_hours: Any) -> Optional[WeeklyIntervals]:
+    """
+    Calisma saatlerini [baslangic, bitis) haftalik dakika araliklarina cevir
+
+    Hem Google "periods" listesi hem de kaydedilmis "weekly_minutes" bicimi
+    okunur. Haftayi asan aralik (cumartesi 22:00 - pazar 02:00) ikiye
+    bolunur; kapanisi olmayan tek period 7/24 acik demektir.
+
+    Returns:
+        Tuple: Sirali, ortusmeyen araliklar - saat bilgisi yoksa/bozuksa None
+    """
+    if not isinstance(opening_hours, dict):
+        return None
+
+    compact = opening_hours.get("weekly_minutes")
+    if isinstance(compact, (list, tuple)) and compact:
+        intervals = []
+        for interval in compact:
+            if not isinstance(interval, (list, tuple)) or len(interval) != 2 \
+                    or not all(isinstance(value, int) for value in interval) \
+                    or not 0 <= interval[0] < interval[1] <= MINUTES_PER_WEEK:
+                return None
+            intervals.append((interval[0], interval[1]))
+        return _merge(intervals)
+
+    periods = opening_hours.get("periods")
+    if not isinstance(periods, list) or not periods:
+        return None
+
+    intervals = []
+    for period in periods:
+        if not isinstance(period, dict):
+            return None
+        start = _period_minute(period.get("open"))
+        if start is None:
+            return None
+        if period.get("close") is None:
+            # Google 7/24 acik mekanlari kapanissiz tek period ile dondurur
+            return ((0, MINUTES_PER_WEEK),)
+        end = _period_minute(period["close"])
+        if end is None:
+            return None
+        if end <= start:
+            end += MINUTES_PER_WEEK
+        if end > MINUTES_PER_WEEK:
+            intervals.extend(((start, MINUTES_PER_WEEK), (0, end - MINUTES_PER_WEEK)))
+        else:
+            intervals.append((start, end))
+    return _merge(intervals)
+
+def is_open_at(intervals: Sequence[Tuple[int, int]], minute: int) -> bool:
+    """Haftanin dakikasi araliklardan birinin icinde mi"""
+    return any(start <= minute < end for start, end in intervals)
+
+def week_minute(moment: datetime) -> int:
+    """Zamanin Sydney yerel saatinde haftanin kacinci dakikasi oldugu (pazar 00:00 = 0)"""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(SYDNEY_TIMEZONE)
+    day = (moment.weekday() + 1) % 7
+    return day * MINUTES_PER_DAY + moment.hour * 60 + moment.minute
+
+def parse_open_at(value: str, now: Optional[datetime] = None) -> datetime:
+    """
+    open_at degerini Sydney yerel zamanina cevir
+
+    Kabul edilen bicimler: "now", "21:00" (bugun), "fri 21:00" (o gunun
+    ilk gelecek ornegi, bugun dahil) ve ISO 8601 ("2025-01-10T21:00",
+    saat dilimsizse Sydney saati).
+    """
+    now = now or datetime.now(SYDNEY_TIMEZONE)
+    if now.tzinfo is None:
+        now = now.replace(tzinfo=SYDNEY_TIMEZONE)
+    text = value.strip().lower() if isinstance(value, str) else ""
+    if not text:
+        raise InvalidOpenAtError("open_at must be 'now', 'HH:MM', '<day> HH:MM' or an ISO 8601 datetime")
+    if text == "now":
+        return now.astimezone(SYDNEY_TIMEZONE)
+
+    match = _CLOCK_PATTERN.match(text)
+    if match:
+        day_name, hours, minutes = match.group(1), int(match.group(2)), int(match.group(3))
+        if hours > 23 or minutes > 59:
+            raise InvalidOpenAtError(f"Invalid time of day: {value}")
+        local_now = now.astimezone(SYDNEY_TIMEZONE)
+        moment = local_now.replace(hour=hours, minute=minutes, second=0, microsecond=0)
+        if day_name is not None:
+            if day_name not in _DAY_NAMES:
+                raise InvalidOpenAtError(f"Unknown day: {match.group(1)} (expected one of {', '.join(_DAY_NAMES)})")
+            days_ahead = (_DAY_NAMES.index(day_name) - (local_now.weekday() + 1) % 7) % 7
+            moment += timedelta(days=days_ahead)
+        return moment
+
+    try:
+        moment = datetime.fromisoformat(value.strip())
+    except ValueError:
+        raise InvalidOpenAtError(f"Unrecognised open_at value: {value} "
+                                 "(expected 'now', 'HH:MM', '<day> HH:MM' or an ISO 8601 datetime)")
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=SYDNEY_TIMEZONE)
+    return moment.astimezone(SYDNEY_TIMEZONE)
+
+class ScheduleTable:
+    """
+    Haftalik calisma saatlerinin intern edilmis aralik tablosu
+
+    Her farkli program bir kod alir; araliklari duz int16 baslangic/bitis
+    dizilerinde, sahip program koduyla birlikte tutulur (program basina
+    ~30 bayt). Ayni saatlerle calisan mekanlar (ornegin hafta ici 9-17) ayni
+    kodu paylasir. Bir dakikadaki acik/kapali durumu tum programlar icin
+    tek vektorel karsilastirmayla bulunur.
+    """
+
+    def __init__(self):
+        self._starts = np.zeros(16, dtype=np.int16)
+        self._ends = np.zeros(16, dtype=np.int16)
+        self._owners = np.zeros(16, dtype=np.int32)
+        self._interval_count = 0
+        self._codes: Dict[WeeklyIntervals, int] = {}
+        self._intervals: List[WeeklyIntervals] = []
+
+    def __len__(self) -> int:
+        return len(self._intervals)
+
+    @property
+    def nbytes(self) -> int:
+        return self._starts.nbytes + self._ends.nbytes + self._owners.nbytes
+
+    def copy(self) -> "ScheduleTable":
+        """Bagimsiz kopya - programlar yalnizca eklenir, kodlar kopyada da gecerli"""
+        clone = ScheduleTable()
+        clone._starts, clone._ends, clone._owners = self._starts.copy(), self._ends.copy(), self._owners.copy()
+        clone._interval_count = self._interval_count
+        clone._codes = dict(self._codes)
+        clone._intervals = list(self._intervals)
+        return clone
+
+    def intern(self, intervals: WeeklyIntervals) -> int:
+        """Programin kodunu dondur, yoksa araliklarini ekle"""
+        code = self._codes.get(intervals)
+        if code is not None:
+            return code
+
+        needed = self._interval_count + len(intervals)
+        if needed > self._starts.size:
+            capacity = max(self._starts.size * 2, needed)
+            for name in ("_starts", "_ends", "_owners"):
+                column = getattr(self, name)
+                grown = np.zeros(capacity, dtype=column.dtype)
+                grown[:self._interval_count] = column[:self._interval_count]
+                setattr(self, name, grown)
+
+        code = self._codes[intervals] = len(self._intervals)
+        self._intervals.append(intervals)
+        for start, end in intervals:
+            index = self._interval_count
+            self._starts[index], self._ends[index], self._owners[index] = start, end, code
+            self._interval_count += 1
+        return code
+
+    def intervals(self, code: int) -> WeeklyIntervals:
+        return self._intervals[code]
+
+    def open_at(self, minute: int) -> np.ndarray:
+        """Tum programlarin verilen haftalik dakikadaki durumu - sekil (kod sayisi,) bool"""
+        minute %= MINUTES_PER_WEEK
+        count = self._interval_count
+        inside = (self._starts[:count] <= minute) & (self._ends[:count] > minute)
+        is_open = np.zeros(len(self._intervals), dtype=bool)
+        is_open[self._owners[:count][inside]] = True
+        return is_open
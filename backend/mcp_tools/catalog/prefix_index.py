@@ -0,0 +1,101 @@
+# Sydney Guide - Prefix Autocomplete Index
+# Mekan ve semt adlari icin sirali dizi tabanli onek indeksi (populerlige gore top-k)
+
+import math
+import re
+import unicodedata
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from ..cache import TTLCache
+
+# Bir ogenin en fazla kac kelime basindan eslesebilecegi ("opera" -> "Sydney Opera House")
+MAX_KEYS_PER_ITEM = 8
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+# NFKD ile ayrismayan harfler (Turkce noktasiz i vb.) - yoksa ascii'ye cevirirken duserler
+_FOLD_TABLE = str.maketrans({"\u0131": "i", "\u00df": "ss", "\u00f8": "o", "\u00e6": "ae", "\u0142": "l"})
+# Adresin "Surry Hills NSW 2010" kismindan semt adi
+_SUBURB_PATTERN = re.compile(r"([A-Za-z][A-Za-z' .-]*?)\s+(?:NSW|ACT|VIC|QLD)\s+\d{4}")
+
+def normalize_label(text: str) -> str:
+    """Kucuk harf, aksansiz, harf/rakam disi karakterler tek bosluk"""
+    folded = unicodedata.normalize("NFKD", text.lower().translate(_FOLD_TABLE))
+    return _NON_ALNUM.sub(" ", folded.encode("ascii", "ignore").decode("ascii")).strip()
+
+def suburb_of(address: str) -> str:
+    """Avustralya adresinden semt adi - bulunamazsa bos"""
+    match = _SUBURB_PATTERN.search(address or "")
+    return match.group(1).strip() if match else ""
+
+class PrefixIndex:
+    """
+    Degismez, sirali dizi tabanli onek indeksi
+
+    Her oge adinin her kelime basindan bir anahtar alir; anahtarlar sirali
+    listede tutulur, onek araligi iki bisect ile bulunur. Ogeler kurulusta
+    populerlige gore numaralanir (0 = en populer); aralikta sadece bu
+    siralar tutuldugundan top-k, aralik uzerinde np.partition ile secilir.
+    Sicak onekler icin (onek, k) sonucu LRU onbellekte tutulur.
+
+    Katalog degisince indeks yeniden kurulur (onbellek de onunla gider).
+    """
+
+    def __init__(self, items: Iterable[Tuple[str, float, Dict[str, Any]]], cache_size: int = 1024):
+        """
+        Args:
+            items: (etiket, populerlik, sonuc sozlugu) uclusu - populerlik buyuk olan once
+            cache_size: Onbellekte tutulacak en fazla onek
+        """
+        items = [item for item in items if normalize_label(item[0])]
+        # Populerlik azalan, esitlikte etiket artan
+        items.sort(key=lambda item: (-item[1], item[0]))
+        self._results: List[Dict[str, Any]] = [result for _, _, result in items]
+
+        entries: List[Tuple[str, int]] = []
+        for rank, (label, _, _) in enumerate(items):
+            normalized = normalize_label(label)
+            starts = [0] + [position + 1 for position, char in enumerate(normalized) if char == " "]
+            for start in starts[:MAX_KEYS_PER_ITEM]:
+                entries.append((normalized[start:], rank))
+        entries.sort()
+
+        self._keys: List[str] = [key for key, _ in entries]
+        self._ranks = np.fromiter((rank for _, rank in entries), dtype=np.int32, count=len(entries))
+        self._cache = TTLCache(max_entries=cache_size, ttl_seconds=math.inf)
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+    @property
+    def key_count(self) -> int:
+        return len(self._keys)
+
+    def _top_ranks(self, start: int, end: int, k: int) -> np.ndarray:
+        """Aralikta en populer k farkli ogenin siralari (artan)"""
+        ranks = self._ranks[start:end]
+        # Bir oge en fazla MAX_KEYS_PER_ITEM kez gecer - en kucuk k*MAX siralar ilk k ogeyi kapsar
+        budget = k * MAX_KEYS_PER_ITEM
+        if ranks.size > budget:
+            ranks = np.partition(ranks, budget - 1)[:budget]
+        return np.unique(ranks)[:k]
+
+    def complete(self, prefix: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Onege uyan en populer k sonuc (yeni sozlukler)"""
+        normalized = normalize_label(prefix)
+        if not normalized or k <= 0:
+            return []
+        # Yazilmakta olan son kelime bosluksuz gelir; "surry " ile "surry" ayni onek
+        cache_key = (normalized, k)
+        ranks = self._cache.get(cache_key)
+        if ranks is None:
+            start = bisect_left(self._keys, normalized)
+            end = bisect_left(self._keys, normalized + "\uffff", start)
+            ranks = self._top_ranks(start, end, k).tolist() if end > start else []
+            self._cache.set(cache_key, ranks)
+        return [dict(self._results[rank]) for rank in ranks]
+
+    def cache_stats(self) -> Dict[str, int]:
+        """Onek onbellegi isabet/iska sayilari"""
+        return {"hits": self._cache.hits, "misses": self._cache.misses, "size": len(self._cache)}
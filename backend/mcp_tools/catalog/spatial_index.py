@@ -0,0 +1,320 @@
+# Sydney Guide - Spatial Grid Index
+# Mekan katalogu icin sabit boyutlu enlem/boylam grid indeksi
+
+import math
+from typing import Dict, Iterator, List, Set, Tuple
+
+import numpy as np
+
+from ..geodesy import KM_PER_DEGREE, radius_to_degree_span
+
+# Hucre kodu: satir * 2^32 + (sutun + 2^31) - (satir, sutun) sirasiyla ayni sirada artan int64
+_COL_OFFSET = 1 << 31
+_COL_MASK = (1 << 32) - 1
+# Degisiklik (ekleme + silme) sayisi bunu ve donuk id sayisinin yarisini gecince dizilere birlestirilir
+FREEZE_MIN_CHANGES = 4096
+
+def _cell_code(row, col):
+    """Hucre (satir, sutun) -> int64 kod (tamsayi ya da numpy dizisi)"""
+    return (row << 32) + (col + _COL_OFFSET)
+
+class SpatialGridIndex:
+    """
+    Noktalari sabit derece boyutlu hucrelere dagitan grid indeksi
+
+    Yaricap sorgusu sadece arama kutusuyla kesisen hucrelere bakar; boylece
+    sorgu maliyeti katalog boyutuyla degil, bolgedeki nokta sayisiyla buyur.
+    Indeks sadece aday dondurur, kesin mesafe filtresi cagirana aittir.
+
+    Hucreler CSR bicimindedir: sirali hucre kodlari, hucre basina ofset ve
+    hucre sirasiyla dizilmis int32 id'ler. Bir grid satirindaki hucre araligi
+    tek searchsorted ile bulunur ve id'leri bitisik tek dilimdir. Donuk
+    diziler yerinde degismez; ekleme kucuk bir sozlukte, silme id kumesinde
+    birikir ve yeterince buyuyunce yeni dizilere birlestirilir.
+    """
+
+    def __init__(self, cell_size_km: float = 0.5):
+        self.cell_size_km = cell_size_km
+        self.cell_size_deg = cell_size_km / KM_PER_DEGREE
+        self._codes = np.empty(0, dtype=np.int64)
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._ids = np.empty(0, dtype=np.int32)
+        # Son birlestirmeden beri eklenenler (hucre -> id'ler) ve donuk kisimdan silinen id'ler
+        self._added: Dict[Tuple[int, int], List[int]] = {}
+        self._removed: Set[int] = set()
+        self._changes = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """Donuk dizilerin bayt boyutu (bekleyen degisiklikler haric)"""
+        return self._codes.nbytes + self._offsets.nbytes + self._ids.nbytes
+
+    def _cell_key(self, lat: float, lng: float) -> Tuple[int, int]:
+        """Koordinatin dustugu hucre anahtarini dondur"""
+        return (math.floor(lat / self.cell_size_deg), math.floor(lng / self.cell_size_deg))
+
+    def insert(self, item_id: int, lat: float, lng: float) -> None:
+        """Noktayi indekse ekle"""
+        if item_id in self._removed:
+            # Silinen id tekrar eklenirse eski kaydi once kalici olarak dusur
+            self.freeze()
+        self._added.setdefault(self._cell_key(lat, lng), []).append(item_id)
+        self._size += 1
+        self._changes += 1
+        self._maybe_freeze()
+
+    def copy(self) -> "SpatialGridIndex":
+        """Bagimsiz kopya - donuk diziler paylasilir, bekleyen degisiklikler kopyalanir"""
+        clone = SpatialGridIndex(self.cell_size_km)
+        clone._codes, clone._offsets, clone._ids = self._codes, self._offsets, self._ids
+        clone._added = {key: list(bucket) for key, bucket in self._added.items()}
+        clone._removed = set(self._removed)
+        clone._changes = self._changes
+        clone._size = self._size
+        return clone
+
+    def remove(self, item_id: int, lat: float, lng: float) -> bool:
+        """Noktayi indeksten cikar - bulunamazsa False dondur"""
+        key = self._cell_key(lat, lng)
+        bucket = self._added.get(key)
+        if bucket and item_id in bucket:
+            bucket.remove(item_id)
+            if not bucket:
+                del self._added[key]
+            self._size -= 1
+            self._changes -= 1
+            return True
+
+        if item_id in self._removed:
+            return False
+        code = _cell_code(*key)
+        cell = np.searchsorted(self._codes, code)
+        if cell == self._codes.size or self._codes[cell] != code:
+            return False
+        if not (self._ids[self._offsets[cell]:self._offsets[cell + 1]] == item_id).any():
+            return False
+
+        self._removed.add(item_id)
+        self._size -= 1
+        self._changes += 1
+        self._maybe_freeze()
+        return True
+
+    def _maybe_freeze(self) -> None:
+        if self._changes > max(FREEZE_MIN_CHANGES, self._ids.size // 2):
+            self.freeze()
+
+    def freeze(self) -> None:
+        """
+        Bekleyen ekleme/silmeleri yeni donuk dizilere birlestir
+
+        Mevcut diziler degistirilmez (kopyalar onlari paylasir). Toplu
+        yuklemeden sonra cagrilirsa tum id'ler dizilerde kalir.
+        """
+        if not self._added and not self._removed:
+            return
+        codes = np.repeat(self._codes, np.diff(self._offsets))
+        ids = self._ids
+        if self._removed:
+            keep = ~np.isin(ids, np.fromiter(self._removed, dtype=np.int32, count=len(self._removed)))
+            codes, ids = codes[keep], ids[keep]
+        if self._added:
+            counts = [len(bucket) for bucket in self._added.values()]
+            added_codes = np.repeat(np.fromiter((_cell_code(row, col) for row, col in self._added),
+                                                dtype=np.int64, count=len(self._added)), counts)
+            added_ids = np.fromiter((item_id for bucket in self._added.values() for item_id in bucket),
+                                    dtype=np.int32, count=sum(counts))
+            codes, ids = np.concatenate((codes, added_codes)), np.concatenate((ids, added_ids))
+
+        order = np.argsort(codes, kind="stable")
+        codes, ids = codes[order], ids[order]
+        self._codes, starts = np.unique(codes, return_index=True)
+        self._offsets = np.append(starts, ids.size).astype(np.int64)
+        self._ids = ids
+        self._added = {}
+        self._removed = set()
+        self._changes = 0
+
+    # =====================================
+    # QUERIES
+    # =====================================
+
+    def _drop_removed(self, ids: np.ndarray) -> np.ndarray:
+        """Donuk kisimdan silinmis id'leri at"""
+        if self._removed and ids.size:
+            ids = ids[~np.isin(ids, np.fromiter(self._removed, dtype=np.int32, count=len(self._removed)))]
+        return ids
+
+    def _frozen_ids(self, lo: np.ndarray, hi: np.ndarray) -> List[np.ndarray]:
+        """Donuk hucre araliklarinin [lo, hi) id dilimleri (bos araliklar atlanir)"""
+        starts, ends = self._offsets[lo], self._offsets[hi]
+        return [self._ids[start:end] for start, end in zip(starts.tolist(), ends.tolist()) if end > start]
+
+    def _added_in_box(self, min_row: int, min_col: int, max_row: int, max_col: int,
+                      covered_cells: int) -> List[int]:
+        """Bekleyen eklemelerden kutudaki id'ler"""
+        ids: List[int] = []
+        if covered_cells > len(self._added):
+            for (row, col), bucket in self._added.items():
+                if min_row <= row <= max_row and min_col <= col <= max_col:
+                    ids.extend(bucket)
+        else:
+            for row in range(min_row, max_row + 1):
+                for col in range(min_col, max_col + 1):
+                    bucket = self._added.get((row, col))
+                    if bucket:
+                        ids.extend(bucket)
+        return ids
+
+    def query_radius(self, lat: float, lng: float, radius_km: float) -> np.ndarray:
+        """Yaricapi kapsayan kutudaki hucrelerden aday id'leri topla"""
+        lat_span, lng_span = radius_to_degree_span(lat, radius_km)
+        return self.query_bbox(lat - lat_span, lng - lng_span, lat + lat_span, lng + lng_span)
+
+    def query_bbox(self, min_lat: float, min_lng: float, max_lat: float, max_lng: float) -> np.ndarray:
+        """Koordinat kutusuyla kesisen hucrelerden aday id'leri topla (int32 dizi)"""
+        min_row, min_col = self._cell_key(min_lat, min_lng)
+        max_row, max_col = self._cell_key(max_lat, max_lng)
+        covered_cells = (max_row - min_row + 1) * (max_col - min_col + 1)
+
+        if covered_cells > self._codes.size:
+            # Kutu dolu hucre sayisindan buyukse dolu hucreleri tek maskeyle tara
+            cell_rows = self._codes >> 32
+            cell_cols = (self._codes & _COL_MASK) - _COL_OFFSET
+            inside = (cell_rows >= min_row) & (cell_rows <= max_row) & (cell_cols >= min_col) & (cell_cols <= max_col)
+            pieces = [self._ids[np.repeat(inside, np.diff(self._offsets))]]
+        else:
+            # Her grid satirindaki sutun araligi bitisik hucrelerdir - satir basina tek dilim
+            rows = np.arange(min_row, max_row + 1, dtype=np.int64)
+            lo = np.searchsorted(self._codes, _cell_code(rows, min_col))
+            hi = np.searchsorted(self._codes, _cell_code(rows, max_col), side="right")
+            pieces = self._frozen_ids(lo, hi)
+
+        candidates = self._drop_removed(np.concatenate(pieces) if pieces else self._ids[:0])
+        if self._added:
+            added = self._added_in_box(min_row, min_col, max_row, max_col, covered_cells)
+            if added:
+                candidates = np.concatenate((candidates, np.asarray(added, dtype=np.int32)))
+        return candidates
+
+    def iter_rings(self, lat: float, lng: float) -> Iterator[Tuple[float, np.ndarray]]:
+        """
+        Sorgu hucresinden disa dogru halka halka id'leri ver (best-first)
+
+        Her halka icin (alt_sinir_km, id'ler) dondurulur; alt sinir halkadaki
+        hicbir noktanin sorguya bundan yakin olamayacagini garanti eder. Cagiran
+        k. en yakin mesafesi alt sinirin altina dusunce durabilir. Tum dolu
+        hucreler gezilince iterasyon biter.
+        """
+        center_row, center_col = self._cell_key(lat, lng)
+        # Donuk ve bekleyen hucreler ayri sayilir (ayni hucre ikisinde de olabilir)
+        occupied = self._codes.size + len(self._added)
+        remaining = occupied
+        ring = 0
+
+        while remaining > 0:
+            # Halka dolu hucrelerden cok daha buyukse kalan dolu hucreleri halkasina gore grupla
+            if (2 * ring + 1) ** 2 > 4 * occupied:
+                yield from self._remaining_rings(lat, center_row, center_col, ring)
+                return
+
+            if ring:
+                # Ilk ve son satirda tum sutunlar, aradakilerde sadece iki kenar hucresi
+                edge_rows = np.array([center_row - ring, center_row + ring], dtype=np.int64)
+                side_rows = np.arange(center_row - ring + 1, center_row + ring, dtype=np.int64)
+                low_codes = np.concatenate((_cell_code(edge_rows, center_col - ring),
+                                            _cell_code(side_rows, center_col - ring),
+                                            _cell_code(side_rows, center_col + ring)))
+                high_codes = np.concatenate((_cell_code(edge_rows, center_col + ring),
+                                             _cell_code(side_rows, center_col - ring),
+                                             _cell_code(side_rows, center_col + ring)))
+            else:
+                low_codes = high_codes = np.array([_cell_code(center_row, center_col)], dtype=np.int64)
+            lo = np.searchsorted(self._codes, low_codes)
+            hi = np.searchsorted(self._codes, high_codes, side="right")
+            remaining -= int((hi - lo).sum())
+            pieces = self._frozen_ids(lo, hi)
+            ids = self._drop_removed(np.concatenate(pieces) if pieces else self._ids[:0])
+
+            if self._added:
+                added: List[int] = []
+                for row in range(center_row - ring, center_row + ring + 1):
+                    if row in (center_row - ring, center_row + ring):
+                        cols = range(center_col - ring, center_col + ring + 1)
+                    else:
+                        cols = (center_col - ring, center_col + ring)
+                    for col in cols:
+                        bucket = self._added.get((row, col))
+                        if bucket:
+                            added.extend(bucket)
+                            remaining -= 1
+                if added:
+                    ids = np.concatenate((ids, np.asarray(added, dtype=np.int32)))
+            yield self._ring_bound_km(lat, ring), ids
+            ring += 1
+
+    def _ring_bound_km(self, lat: float, ring: int) -> float:
+        """
+        Halkadaki noktalarin sorguya en kisa uzakligi icin alt sinir (km)
+
+        Halkadaki hucre ya ring satir uzaktadir (enlem farki en az ring - 1
+        hucre) ya da j < ring satir ve ring sutun uzaktadir. Ikincisinde
+        boylam farki en az ring - 1 hucredir ama cos(enlem) ile daralir;
+        o satirlarin ulastigi en yuksek enlem |lat| + (j + 1) hucredir.
+        Sinir j uzerinden en kucuk max(enlem siniri, boylam siniri) olur -
+        kutba yakin satirlar da enlem farkiyla sinirlanir. Deger halkalar
+        boyunca azalmaz; cagiran ilk asilan sinirda durabilir.
+        """
+        if ring <= 1:
+            return 0.0
+
+        def lat_bound(rows: int) -> float:
+            return max(rows - 1, 0) * self.cell_size_km
+
+        def lng_bound(rows: int) -> float:
+            reach = min(abs(lat) + (rows + 1) * self.cell_size_deg, 90.0)
+            # %5 guvenlik payi (paralel yayi ile buyuk daire farki)
+            return (ring - 1) * self.cell_size_km * max(math.cos(math.radians(reach)), 0.0) * 0.95
+
+        # lat_bound artan, lng_bound azalan - en kucuk max kesisim noktasindadir
+        low, high = 0, ring
+        while low < high:
+            middle = (low + high) // 2
+            if lat_bound(middle) >= lng_bound(middle):
+                high = middle
+            else:
+                low = middle + 1
+        bound = lat_bound(low)
+        if low > 0:
+            bound = min(bound, lng_bound(low - 1))
+        return bound
+
+    def _remaining_rings(self, lat: float, center_row: int, center_col: int,
+                         first_ring: int) -> Iterator[Tuple[float, np.ndarray]]:
+        """first_ring ve otesindeki tum dolu hucrelerin id'lerini halka sirasiyla ver"""
+        cell_rings = np.maximum(np.abs((self._codes >> 32) - center_row),
+                                np.abs((self._codes & _COL_MASK) - _COL_OFFSET - center_col))
+        id_rings = np.repeat(cell_rings, np.diff(self._offsets))
+        ids = self._ids
+        if self._added:
+            added_rings = [max(abs(row - center_row), abs(col - center_col))
+                           for (row, col), bucket in self._added.items() for _ in bucket]
+            added_ids = [item_id for bucket in self._added.values() for item_id in bucket]
+            id_rings = np.concatenate((id_rings, np.asarray(added_rings, dtype=np.int64)))
+            ids = np.concatenate((ids, np.asarray(added_ids, dtype=np.int32)))
+
+        outside = id_rings >= first_ring
+        id_rings, ids = id_rings[outside], ids[outside]
+        if self._removed and ids.size:
+            alive = ~np.isin(ids, np.fromiter(self._removed, dtype=np.int32, count=len(self._removed)))
+            id_rings, ids = id_rings[alive], ids[alive]
+
+        order = np.argsort(id_rings, kind="stable")
+        id_rings, ids = id_rings[order], ids[order]
+        rings, starts = np.unique(id_rings, return_index=True)
+        for cell_ring, group in zip(rings.tolist(), np.split(ids, starts[1:])):
+            yield self._ring_bound_km(lat, cell_ring), group
@@ -0,0 +1,306 @@
+# Sydney Guide - SQLite Place Store
+# Gercek API sonuclarinin yazildigi kalici yerel mekan katalogu (R*Tree + FTS5)
+
+import json
+import logging
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import create_engine, event, text
+
+from ..geodesy import haversine_one_to_many, radius_to_degree_span
+from .text_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Arama sonucunun mesafesi arama noktasina gore degisir - saklanmaz
+_TRANSIENT_FIELDS = ("distance_km",)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS places (
+        id INTEGER PRIMARY KEY,
+        place_id TEXT NOT NULL UNIQUE,
+        name TEXT NOT NULL DEFAULT '',
+        place_type TEXT,
+        types TEXT NOT NULL DEFAULT ' ',
+        rating REAL NOT NULL DEFAULT 0,
+        lat REAL NOT NULL,
+        lng REAL NOT NULL,
+        data TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_places_rating ON places (rating DESC)",
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS places_rtree USING rtree (
+        id, min_lat, max_lat, min_lng, max_lng
+    )
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS places_fts USING fts5 (
+        name, address, description, tokenize = 'unicode61'
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS coverage (
+        key TEXT PRIMARY KEY,
+        requested INTEGER NOT NULL,
+        fetched_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS coverage_places (
+        key TEXT NOT NULL,
+        place_id INTEGER NOT NULL,
+        PRIMARY KEY (key, place_id)
+    )
+    """
+)
+
+def _types_column(place_data: Dict[str, Any]) -> str:
+    """Tip uyeligi icin ' restaurant food ' bicimli sutun degeri"""
+    types = list(place_data.get("types") or [])
+    if place_data.get("place_type") and place_data["place_type"] not in types:
+        types.append(place_data["place_type"])
+    return " " + " ".join(types) + " "
+
+def _fts_query(query: str) -> Optional[str]:
+    """Sorguyu FTS5 onek eslesmesine cevir - tum terimler zorunlu (AND)"""
+    terms = tokenize(query)
+    if not terms:
+        return None
+    return " AND ".join(f'"{term}"*' for term in terms)
+
+class SQLitePlaceStore:
+    """
+    SQLite tabanli yerel mekan katalogu
+
+    - places: mekan kaydi (JSON) + siralama/filtre sutunlari
+    - places_rtree: koordinat kutusu icin R*Tree sanal tablosu
+    - places_fts: ad/adres/aciklama icin FTS5 tam metin indeksi
+    - coverage: hangi sorgunun ne zaman upstream'den cekildigi ve donen mekanlar
+
+    Yerel cevap sadece ilgili sorgu kapsandiysa verilir; kapsanmayan sorgu
+    upstream'e gider, sonucu buraya yazilir (write-through).
+    """
+
+    def __init__(self, database_url: str):
+        self._engine = create_engine(database_url)
+
+        @event.listens_for(self._engine, "connect")
+        def _configure_connection(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("PRAGMA synchronous=NORMAL")
+            cursor.close()
+
+        with self._engine.begin() as connection:
+            for statement in _SCHEMA:
+                connection.execute(text(statement))
+
+    def close(self) -> None:
+        """Baglanti havuzunu kapat"""
+        self._engine.dispose()
+
+    # =====================================
+    # WRITE-THROUGH
+    # =====================================
+
+    def upsert_places(self, places: Iterable[Dict[str, Any]]) -> List[int]:
+        """
+        Mekanlari ekle veya guncelle, satir id'lerini dondur
+
+        Var olan kayit yeni gelenle birlestirilir; bos gelen alanlar (ornegin
+        arama sonucunda olmayan telefon) eski degeri ezmez. Sozluk alanlari bir
+        seviye birlestirilir - aramadan gelen opening_hours.open_now, detaydan
+        gelen haftalik saatleri silmez.
+        """
+        row_ids = []
+        now = time.time()
+
+        with self._engine.begin() as connection:
+            for place_data in places:
+                place_id = place_data.get("place_id")
+                location = place_data.get("location") or {}
+                if not place_id or location.get("lat") is None or location.get("lng") is None:
+                    continue
+
+                existing = connection.execute(
+                    text("SELECT id, data FROM places WHERE place_id = :place_id"),
+                    {"place_id": place_id}
+                ).first()
+
+                merged = json.loads(existing.data) if existing else {}
+                for key, value in place_data.items():
+                    if key in _TRANSIENT_FIELDS or value in ("", None, [], {}):
+                        continue
+                    if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                        value = dict(merged[key], **value)
+                    merged[key] = value
+
+                params = {
+                    "place_id": place_id,
+                    "name": merged.get("name", ""),
+                    "place_type": merged.get("place_type"),
+                    "types": _types_column(merged),
+                    "rating": merged.get("rating") or 0,
+                    "lat": location["lat"],
+                    "lng": location["lng"],
+                    "data": json.dumps(merged),
+                    "updated_at": now
+                }
+
+                if existing:
+                    row_id = existing.id
+                    connection.execute(text(
+                        "UPDATE places SET name = :name, place_type = :place_type, types = :types, "
+                        "rating = :rating, lat = :lat, lng = :lng, data = :data, updated_at = :updated_at "
+                        "WHERE id = :id"
+                    ), dict(params, id=row_id))
+                    connection.execute(text("DELETE FROM places_fts WHERE rowid = :id"), {"id": row_id})
+                else:
+                    row_id = connection.execute(text(
+                        "INSERT INTO places (place_id, name, place_type, types, rating, lat, lng, data, updated_at) "
+                        "VALUES (:place_id, :name, :place_type, :types, :rating, :lat, :lng, :data, :updated_at)"
+                    ), params).lastrowid
+
+                connection.execute(text(
+                    "INSERT OR REPLACE INTO places_rtree (id, min_lat, max_lat, min_lng, max_lng) "
+                    "VALUES (:id, :lat, :lat, :lng, :lng)"
+                ), {"id": row_id, "lat": location["lat"], "lng": location["lng"]})
+                connection.execute(text(
+                    "INSERT INTO places_fts (rowid, name, address, description) "
+                    "VALUES (:id, :name, :address, :description)"
+                ), {
+                    "id": row_id,
+                    "name": merged.get("name", ""),
+                    "address": merged.get("address", ""),
+                    "description": merged.get("description", "")
+                })
+                row_ids.append(row_id)
+
+        return row_ids
+
+    def record_coverage(self, key: str, requested: int, places: Sequence[Dict[str, Any]]) -> None:
+        """Upstream'den cekilen sorguyu ve donen mekanlari kaydet (mekanlar yazilir)"""
+        row_ids = self.upsert_places(places)
+
+        with self._engine.begin() as connection:
+            connection.execute(text("DELETE FROM coverage_places WHERE key = :key"), {"key": key})
+            connection.execute(text(
+                "INSERT OR REPLACE INTO coverage (key, requested, fetched_at) VALUES (:key, :requested, :now)"
+            ), {"key": key, "requested": requested, "now": time.time()})
+            if row_ids:
+                connection.execute(
+                    text("INSERT OR IGNORE INTO coverage_places (key, place_id) VALUES (:key, :place_id)"),
+                    [{"key": key, "place_id": row_id} for row_id in row_ids]
+                )
+
+    def is_covered(self, key: str, requested: int, max_age_seconds: float) -> bool:
+        """Sorgu en az requested sonuc icin max_age icinde upstream'den cekildi mi"""
+        with self._engine.connect() as connection:
+            row = connection.execute(
+                text("SELECT requested, fetched_at FROM coverage WHERE key = :key"), {"key": key}
+            ).first()
+        return row is not None and row.requested >= requested and \
+            time.time() - row.fetched_at < max_age_seconds
+
+    # =====================================
+    # LOCAL QUERIES
+    # =====================================
+
+    def get_place(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """place_id ile kayit"""
+        with self._engine.connect() as connection:
+            row = connection.execute(
+                text("SELECT data FROM places WHERE place_id = :place_id"), {"place_id": place_id}
+            ).first()
+        return json.loads(row.data) if row else None
+
+    def search(self, lat: float, lng: float, radius_km: float, query: str = "",
+               place_type: Optional[str] = None,
+               coverage_key: Optional[str] = None) -> List[Tuple[Dict[str, Any], float]]:
+        """
+        Yaricap icindeki mekanlari mesafeye gore sirali dondur
+
+        R*Tree kutusu adaylari daraltir; query varsa FTS5 eslesmesi (veya
+        coverage_key ile upstream'in o sorgu icin dondurdugu mekanlar) aranir.
+        Kesin yaricap filtresi aday koordinatlari uzerinde vektorel yapilir.
+        """
+        lat_span, lng_span = radius_to_degree_span(lat, radius_km)
+        params = {
+            "min_lat": lat - lat_span, "max_lat": lat + lat_span,
+            "min_lng": lng - lng_span, "max_lng": lng + lng_span
+        }
+        sql = (
+            "SELECT p.id, p.data, p.lat, p.lng FROM places_rtree r JOIN places p ON p.id = r.id "
+            "WHERE r.min_lat >= :min_lat AND r.max_lat <= :max_lat "
+            "AND r.min_lng >= :min_lng AND r.max_lng <= :max_lng"
+        )
+
+        if place_type and place_type != "all":
+            sql += " AND instr(p.types, :type_token) > 0"
+            params["type_token"] = f" {place_type} "
+
+        match = _fts_query(query)
+        text_filters = []
+        if match:
+            text_filters.append("p.id IN (SELECT rowid FROM places_fts WHERE places_fts MATCH :match)")
+            params["match"] = match
+        if coverage_key:
+            text_filters.append("p.id IN (SELECT place_id FROM coverage_places WHERE key = :coverage_key)")
+            params["coverage_key"] = coverage_key
+        if text_filters:
+            sql += " AND (" + " OR ".join(text_filters) + ")"
+
+        with self._engine.connect() as connection:
+            rows = connection.execute(text(sql), params).all()
+
+        if not rows:
+            return []
+
+        distances = haversine_one_to_many(lat, lng, [row.lat for row in rows], [row.lng for row in rows])
+        matches = [
+            (json.loads(row.data), distance)
+            for row, distance in zip(rows, distances.tolist())
+            if distance <= radius_km
+        ]
+        matches.sort(key=lambda match_item: match_item[1])
+        return matches
+
+    def top_rated(self, place_type: Optional[str] = None, limit: int = 10,
+                  min_rating: float = 0.0) -> List[Dict[str, Any]]:
+        """Rating'e gore en iyi mekanlar - place_type None ise tum katalog"""
+        sql = "SELECT data FROM places WHERE rating >= :min_rating"
+        params: Dict[str, Any] = {"min_rating": min_rating, "limit": limit}
+        if place_type:
+            sql += " AND instr(types, :type_token) > 0"
+            params["type_token"] = f" {place_type} "
+        sql += " ORDER BY rating DESC LIMIT :limit"
+
+        with self._engine.connect() as connection:
+            rows = connection.execute(text(sql), params).all()
+        return [json.loads(row.data) for row in rows]
+
+    def snapshot_token(self) -> Tuple[int, float]:
+        """Degisiklik belirteci - (kayit sayisi, en son guncelleme zamani)"""
+        with self._engine.connect() as connection:
+            row = connection.execute(text("SELECT count(*) AS total, max(updated_at) AS latest FROM places")).first()
+        return row.total, row.latest or 0.0
+
+    def export_places(self) -> Dict[str, Dict[str, Any]]:
+        """Tum kayitlar - place_id -> veri"""
+        with self._engine.connect() as connection:
+            rows = connection.execute(text("SELECT place_id, data FROM places")).all()
+        return {row.place_id: json.loads(row.data) for row in rows}
+
+    def count(self, place_type: Optional[str] = None) -> int:
+        """Katalogdaki (tipteki) mekan sayisi"""
+        sql = "SELECT count(*) FROM places"
+        params = {}
+        if place_type:
+            sql += " WHERE instr(types, :type_token) > 0"
+            params["type_token"] = f" {place_type} "
+        with self._engine.connect() as connection:
+            return connection.execute(text(sql), params).scalar_one()
@@ -0,0 +1,180 @@
+# Sydney Guide - Inverted Text Index
+# Mekan adi ve aciklamasi uzerinde kelime bazli ters indeks
+
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+# Degisiklik (posting ekleme + satir silme) sayisi bunu ve donuk posting sayisinin yarisini gecince birlestirilir
+FREEZE_MIN_CHANGES = 4096
+
+def tokenize(text: str) -> List[str]:
+    """Metni kucuk harfli kelimelere ayir"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+class TextIndex:
+    """
+    Kelime -> satirlar ters indeksi
+
+    Sorgudaki her kelime indeksli kelimelerin onekiyle eslesir ("veg" ->
+    "vegan", "vegetarian"); tum sorgu kelimeleri ayni satirda bulunmalidir.
+    Boylece sorgu maliyeti katalog boyutuna degil posting listelerine baglidir.
+
+    Posting listeleri CSR bicimindedir: sirali kelime listesi, kelime basina
+    ofset ve kelime sirasiyla dizilmis int32 satirlar (satir basina kume
+    yok). Donuk diziler yerinde degismez; ekleme kucuk bir sozlukte, silme
+    satir kumesinde birikir ve yeterince buyuyunce yeni dizilere birlestirilir.
+    """
+
+    def __init__(self):
+        self._tokens: List[str] = []
+        self._offsets = np.zeros(1, dtype=np.int64)
+        self._rows = np.empty(0, dtype=np.int32)
+        # Son birlestirmeden beri eklenen postingler (onek aramasi icin sirali kelimelerle)
+        # ve donuk kisimdan silinen satirlar
+        self._added: Dict[str, List[int]] = {}
+        self._added_tokens: List[str] = []
+        self._removed: Set[int] = set()
+        self._changes = 0
+
+    def __len__(self) -> int:
+        """Kelime sayisi (son birlestirmeden beri bosalan kelimeler dahil)"""
+        new_tokens = sum(1 for token in self._added_tokens if not self._is_frozen_token(token))
+        return len(self._tokens) + new_tokens
+
+    @property
+    def nbytes(self) -> int:
+        """Donuk dizilerin bayt boyutu (kelime listesi ve bekleyen degisiklikler haric)"""
+        return self._offsets.nbytes + self._rows.nbytes
+
+    def _is_frozen_token(self, token: str) -> bool:
+        position = bisect_left(self._tokens, token)
+        return position < len(self._tokens) and self._tokens[position] == token
+
+    def add(self, row: int, texts: Iterable[str]) -> None:
+        """Satirin metinlerini indekse ekle"""
+        if row in self._removed:
+            # Silinen satir tekrar eklenirse eski postingleri once kalici olarak dusur
+            self.freeze()
+        for token in {token for text in texts for token in tokenize(text)}:
+            posting = self._added.get(token)
+            if posting is None:
+                posting = self._added[token] = []
+                insort(self._added_tokens, token)
+            posting.append(row)
+            self._changes += 1
+        self._maybe_freeze()
+
+    def copy(self) -> "TextIndex":
+        """Bagimsiz kopya - donuk diziler paylasilir, bekleyen degisiklikler kopyalanir"""
+        clone = TextIndex()
+        clone._tokens, clone._offsets, clone._rows = self._tokens, self._offsets, self._rows
+        clone._added = {token: list(rows) for token, rows in self._added.items()}
+        clone._added_tokens = list(self._added_tokens)
+        clone._removed = set(self._removed)
+        clone._changes = self._changes
+        return clone
+
+    def remove(self, row: int, texts: Iterable[str]) -> None:
+        """Satirin metinlerini indeksten cikar"""
+        pending = False
+        for token in {token for text in texts for token in tokenize(text)}:
+            posting = self._added.get(token)
+            if posting is None or row not in posting:
+                continue
+            posting.remove(row)
+            self._changes -= 1
+            pending = True
+            if not posting:
+                del self._added[token]
+                del self._added_tokens[bisect_left(self._added_tokens, token)]
+
+        # Son birlestirmeden sonra eklenen satirin donuk postingi yoktur
+        if not pending:
+            self._removed.add(row)
+            self._changes += 1
+            self._maybe_freeze()
+
+    def _maybe_freeze(self) -> None:
+        if self._changes > max(FREEZE_MIN_CHANGES, self._rows.size // 2):
+            self.freeze()
+
+    def freeze(self) -> None:
+        """
+        Bekleyen ekleme/silmeleri yeni donuk dizilere birlestir
+
+        Mevcut diziler ve kelime listesi degistirilmez (kopyalar onlari
+        paylasir). Toplu yuklemeden sonra cagrilirsa tum postingler dizilerde kalir.
+        """
+        if not self._added and not self._removed:
+            return
+        new_tokens = [token for token in self._added_tokens if not self._is_frozen_token(token)]
+        tokens = sorted(self._tokens + new_tokens)
+        # Eski kelime i, oncesine giren yeni kelime sayisi kadar kayar
+        positions = np.fromiter((bisect_left(self._tokens, token) for token in new_tokens),
+                                dtype=np.int64, count=len(new_tokens))
+        insertions = np.bincount(positions, minlength=len(self._tokens) + 1)
+        shifted = np.arange(len(self._tokens)) + np.cumsum(insertions)[:len(self._tokens)]
+
+        token_ids = np.repeat(shifted, np.diff(self._offsets))
+        rows = self._rows
+        if self._removed:
+            keep = ~np.isin(rows, np.fromiter(self._removed, dtype=np.int32, count=len(self._removed)))
+            token_ids, rows = token_ids[keep], rows[keep]
+        if self._added:
+            counts = [len(posting) for posting in self._added.values()]
+            added_ids = np.repeat(np.fromiter((bisect_left(tokens, token) for token in self._added),
+                                              dtype=np.int64, count=len(self._added)), counts)
+            added_rows = np.fromiter((row for posting in self._added.values() for row in posting),
+                                     dtype=np.int32, count=sum(counts))
+            token_ids, rows = np.concatenate((token_ids, added_ids)), np.concatenate((rows, added_rows))
+
+        order = np.argsort(token_ids, kind="stable")
+        counts = np.bincount(token_ids, minlength=len(tokens))
+        if not counts.all():
+            # Tum satirlari silinen kelimeler listeden cikar
+            tokens = [token for token, count in zip(tokens, counts.tolist()) if count]
+            counts = counts[counts > 0]
+        self._tokens = tokens
+        self._offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+        self._rows = rows[order]
+        self._added = {}
+        self._added_tokens = []
+        self._removed = set()
+        self._changes = 0
+
+    def _rows_for_term(self, term: str) -> np.ndarray:
+        """Onegi term olan tum kelimelerin posting listelerini birlestir (tekrarsiz)"""
+        start = bisect_left(self._tokens, term)
+        end = bisect_left(self._tokens, term + "\uffff", start)
+        rows = self._rows[self._offsets[start]:self._offsets[end]]
+        if self._removed and rows.size:
+            rows = rows[~np.isin(rows, np.fromiter(self._removed, dtype=np.int32, count=len(self._removed)))]
+
+        added_start = bisect_left(self._added_tokens, term)
+        added_end = bisect_left(self._added_tokens, term + "\uffff", added_start)
+        if added_end > added_start:
+            added = [row for token in self._added_tokens[added_start:added_end] for row in self._added[token]]
+            rows = np.concatenate((rows, np.asarray(added, dtype=np.int32)))
+        elif end - start <= 1:
+            # Tek kelimenin postingi zaten tekrarsiz
+            return rows
+        return np.unique(rows)
+
+    def match(self, query: str) -> Optional[np.ndarray]:
+        """Sorgudaki tum kelimeleri iceren satirlari dondur - kelime yoksa None"""
+        terms = set(tokenize(query))
+        if not terms:
+            return None
+
+        term_rows = sorted((self._rows_for_term(term) for term in terms), key=len)
+        # En kisa listeden baslayarak kesisim al
+        result = term_rows[0]
+        for rows in term_rows[1:]:
+            if not result.size:
+                break
+            result = np.intersect1d(result, rows, assume_unique=True)
+        return result
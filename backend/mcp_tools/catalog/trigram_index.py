@@ -0,0 +1,147 @@
+# Sydney Guide - Trigram Fuzzy Index
+# Yazim hatalarina dayanikli ad/adres aramasi icin trigram indeksi ve sinirli edit mesafesi
+
+import math
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from .prefix_index import normalize_label
+
+def trigrams(text: str) -> Set[str]:
+    """
+    Normalize metnin kelime bazli trigramlari
+
+    Her kelime basta iki, sonda bir boslukla doldurulur ("  warren ");
+    boylece kelime baslari ve kisa kelimeler de trigram uretir.
+    """
+    grams: Set[str] = set()
+    for word in normalize_label(text).split():
+        padded = f"  {word} "
+        grams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return grams
+
+def bounded_edit_distance(source: str, target: str, bound: int) -> Optional[int]:
+    """
+    Levenshtein mesafesi - bound'u asarsa None
+
+    Sadece kosegen etrafindaki 2*bound+1 genislikteki bant hesaplanir ve bir
+    satirin en kucuk degeri bound'u gecince erken cikilir.
+    """
+    if abs(len(source) - len(target)) > bound:
+        return None
+    if source == target:
+        return 0
+
+    infinity = bound + 1
+    previous = [column if column <= bound else infinity for column in range(len(target) + 1)]
+    for row in range(1, len(source) + 1):
+        low = max(1, row - bound)
+        high = min(len(target), row + bound)
+        current = [infinity] * (len(target) + 1)
+        current[0] = row if row <= bound else infinity
+        row_min = current[0]
+        source_char = source[row - 1]
+        for column in range(low, high + 1):
+            cost = 0 if source_char == target[column - 1] else 1
+            value = min(previous[column] + 1, current[column - 1] + 1, previous[column - 1] + cost)
+            current[column] = value if value <= bound else infinity
+            row_min = min(row_min, current[column])
+        if row_min > bound:
+            return None
+        previous = current
+
+    distance = previous[len(target)]
+    return distance if distance <= bound else None
+
+def window_edit_distance(query: str, text: str, bound: int) -> Optional[int]:
+    """
+    Sorgu ile metnin kelime pencereleri arasindaki en kucuk sinirli edit mesafesi
+
+    "warren rd" sorgusu "73 Warren Road, Marrickville" metninde "warren road"
+    penceresiyle karsilastirilir; pencere boyu sorgu kelime sayisi +-1.
+    """
+    query = normalize_label(query)
+    words = normalize_label(text).split()
+    query_words = len(query.split())
+    best: Optional[int] = None
+
+    for size in (query_words, query_words - 1, query_words + 1):
+        if size < 1 or size > len(words):
+            continue
+        for start in range(len(words) - size + 1):
+            window = " ".join(words[start:start + size])
+            distance = bounded_edit_distance(query, window, bound if best is None else min(bound, best - 1))
+            if distance is not None:
+                best = distance
+                if best == 0:
+                    return 0
+    return best
+
+class TrigramIndex:
+    """
+    Trigram -> satir kumesi posting listeleri
+
+    Aday uretimi "prefix filtering" ile yapilir: sorgu trigramlarinin en az
+    m = ceil(esik * |Q|) tanesini iceren bir satir, en nadir |Q| - m + 1
+    trigramin posting listelerinden en az birinde bulunmak zorundadir. Boylece
+    sik trigramlarin (ornegin " st") uzun listeleri birlestirilmez; onlar
+    sadece adaylarin ortak trigram sayimi icin uyelik testinde kullanilir.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, Set[int]] = {}
+        self._row_grams: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._row_grams)
+
+    def add(self, row: int, texts: Iterable[str]) -> None:
+        """Satirin metinlerini (ad, adres) indekse ekle"""
+        grams = set().union(*(trigrams(text) for text in texts))
+        for gram in grams:
+            self._postings.setdefault(gram, set()).add(row)
+        self._row_grams[row] = len(grams)
+
+    def remove(self, row: int, texts: Iterable[str]) -> None:
+        """Satirin metinlerini indeksten cikar"""
+        for gram in set().union(*(trigrams(text) for text in texts)):
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(row)
+            if not posting:
+                del self._postings[gram]
+        self._row_grams.pop(row, None)
+
+    def candidates(self, query: str, min_overlap: float = 0.5,
+                   limit: Optional[int] = None) -> List[Tuple[int, float]]:
+        """
+        Sorgu trigramlarinin en az min_overlap oranini iceren satirlar
+
+        Returns:
+            List: (satir, ortaklik orani) - oran azalan, esitlikte satir artan; limit verilirse en fazla limit
+        """
+        query_grams = trigrams(query)
+        if not query_grams:
+            return []
+
+        required = max(1, math.ceil(min_overlap * len(query_grams)))
+        # Indekste olmayan trigramlar bos posting sayilir (en nadir)
+        ordered = sorted(query_grams, key=lambda gram: len(self._postings.get(gram, ())))
+        prefix, rest = ordered[:len(ordered) - required + 1], ordered[len(ordered) - required + 1:]
+
+        counts: Dict[int, int] = {}
+        for gram in prefix:
+            for row in self._postings.get(gram, ()):
+                counts[row] = counts.get(row, 0) + 1
+
+        for gram in rest:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            for row in counts:
+                if row in posting:
+                    counts[row] += 1
+
+        scored = [(row, count / len(query_grams)) for row, count in counts.items() if count >= required]
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return scored if limit is None else scored[:limit]
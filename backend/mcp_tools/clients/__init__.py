@@ -0,0 +1,24 @@
+# Sydney Guide - API Clients Module
+# Dis servisler icin paylasilan async istemciler
+
+from .google_maps_client import (
+    GoogleMapsApiError,
+    GoogleMapsClient,
+    close_google_maps_client,
+    get_google_maps_client
+)
+from .nsw_transport_client import (
+    NSWTransportClient,
+    close_nsw_transport_client,
+    get_nsw_transport_client
+)
+
+__all__ = [
+    'GoogleMapsApiError',
+    'GoogleMapsClient',
+    'NSWTransportClient',
+    'close_google_maps_client',
+    'close_nsw_transport_client',
+    'get_google_maps_client',
+    'get_nsw_transport_client'
+]
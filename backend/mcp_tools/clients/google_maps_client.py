@@ -0,0 +1,167 @@
+# Sydney Guide - Async Google Maps Client
+# Google Places/Directions web servisleri icin paylasilan, baglanti havuzlu async istemci
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Havuz ve eszamanlilik ayarlari (env ile degistirilebilir)
+GOOGLE_MAPS_BASE_URL = os.getenv('GOOGLE_MAPS_BASE_URL', 'https://maps.googleapis.com')
+GOOGLE_MAPS_MAX_CONNECTIONS = int(os.getenv('GOOGLE_MAPS_MAX_CONNECTIONS', '20'))
+GOOGLE_MAPS_MAX_CONCURRENCY = int(os.getenv('GOOGLE_MAPS_MAX_CONCURRENCY', '10'))
+GOOGLE_MAPS_TIMEOUT_SECONDS = float(os.getenv('GOOGLE_MAPS_TIMEOUT_SECONDS', '10'))
+GOOGLE_MAPS_KEEPALIVE_SECONDS = float(os.getenv('GOOGLE_MAPS_KEEPALIVE_SECONDS', '30'))
+
+# Hata sayilmayan Google yanit durumlari
+_OK_STATUSES = {"OK", "ZERO_RESULTS"}
+
+class GoogleMapsApiError(Exception):
+    """Google web servisi OK disinda bir durum dondurdu"""
+
+    def __init__(self, status: str, message: str = ""):
+        super().__init__(f"{status}: {message}" if message else status)
+        self.status = status
+
+def _format_latlng(location: Tuple[float, float]) -> str:
+    """(lat, lng) ciftini Google parametre formatina cevir"""
+    return f"{location[0]},{location[1]}"
+
+class GoogleMapsClient:
+    """
+    Google Places/Directions icin async HTTP istemcisi
+
+    Tek bir aiohttp.ClientSession keep-alive baglanti havuzunu tum oturumlar
+    arasinda paylasir; semaphore ayni anda Google'a giden istek sayisini
+    sinirlar. Istekler event loop'u bloklamaz, yavas bir cagri diger
+    oturumlari bekletmez.
+    """
+
+    def __init__(self, api_key: str, base_url: str = GOOGLE_MAPS_BASE_URL,
+                 max_connections: int = GOOGLE_MAPS_MAX_CONNECTIONS,
+                 max_concurrency: int = GOOGLE_MAPS_MAX_CONCURRENCY,
+                 timeout_seconds: float = GOOGLE_MAPS_TIMEOUT_SECONDS,
+                 keepalive_seconds: float = GOOGLE_MAPS_KEEPALIVE_SECONDS):
+        self.api_key = api_key
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._session = aiohttp.ClientSession(
+            base_url=base_url,
+            timeout=aiohttp.ClientTimeout(total=timeout_seconds),
+            connector=aiohttp.TCPConnector(
+                limit=max_connections,
+                keepalive_timeout=keepalive_seconds,
+                ttl_dns_cache=300
+            )
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self._session.closed
+
+    async def aclose(self) -> None:
+        """Havuzdaki baglantilari kapat"""
+        await self._session.close()
+
+    async def _get_json(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """GET istegi at, Google durum alanini kontrol et ve JSON govdesini dondur"""
+        query = {key: str(value) for key, value in params.items() if value is not None}
+        query["key"] = self.api_key
+
+        async with self._semaphore:
+            async with self._session.get(path, params=query) as response:
+                response.raise_for_status()
+                body = await response.json()
+
+        status = body.get("status", "OK")
+        if status not in _OK_STATUSES:
+            raise GoogleMapsApiError(status, body.get("error_message", ""))
+        return body
+
+    async def places(self, query: str, location: Optional[Tuple[float, float]] = None,
+                     radius: Optional[float] = None, type: Optional[str] = None,
+                     language: Optional[str] = None,
+                     page_token: Optional[str] = None) -> Dict[str, Any]:
+        """Places Text Search"""
+        return await self._get_json("/maps/api/place/textsearch/json", {
+            "query": query,
+            "location": _format_latlng(location) if location else None,
+            "radius": int(radius) if radius else None,
+            "type": type,
+            "language": language,
+            "pagetoken": page_token
+        })
+
+    async def places_nearby(self, location: Tuple[float, float], radius: Optional[float] = None,
+                            type: Optional[str] = None, language: Optional[str] = None,
+                            page_token: Optional[str] = None, keyword: Optional[str] = None,
+                            rank_by: Optional[str] = None) -> Dict[str, Any]:
+        """Places Nearby Search - rank_by="distance" ile radius gonderilmez"""
+        return await self._get_json("/maps/api/place/nearbysearch/json", {
+            "location": _format_latlng(location),
+            "radius": int(radius) if radius and rank_by != "distance" else None,
+            "type": type,
+            "keyword": keyword,
+            "rankby": rank_by,
+            "language": language,
+            "pagetoken": page_token
+        })
+
+    async def place(self, place_id: str, fields: Optional[Sequence[str]] = None,
+                    language: Optional[str] = None) -> Dict[str, Any]:
+        """Place Details"""
+        return await self._get_json("/maps/api/place/details/json", {
+            "place_id": place_id,
+            "fields": ",".join(fields) if fields else None,
+            "language": language
+        })
+
+    async def place_autocomplete(self, input_text: str, location: Optional[Tuple[float, float]] = None,
+                                 radius: Optional[float] = None, components: Optional[str] = None,
+                                 language: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Place Autocomplete - tahmin listesini dondurur"""
+        body = await self._get_json("/maps/api/place/autocomplete/json", {
+            "input": input_text,
+            "location": _format_latlng(location) if location else None,
+            "radius": int(radius) if radius else None,
+            "components": components,
+            "language": language
+        })
+        return body.get("predictions", [])
+
+    async def directions(self, origin: Tuple[float, float], destination: Tuple[float, float],
+                         mode: str = "transit", departure_time: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Directions - rota listesini dondurur"""
+        body = await self._get_json("/maps/api/directions/json", {
+            "origin": _format_latlng(origin),
+            "destination": _format_latlng(destination),
+            "mode": mode,
+            "departure_time": departure_time
+        })
+        return body.get("routes", [])
+
+# Surec genelinde paylasilan istemci - olusturuldugu event loop'a baglidir
+_shared_client: Optional[GoogleMapsClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_google_maps_client(api_key: str) -> GoogleMapsClient:
+    """Paylasilan Google Maps istemcisini dondur, gerekirse olustur"""
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = GoogleMapsClient(api_key)
+        _shared_client_loop = loop
+        logger.info("Google Maps async client pool created")
+    return _shared_client
+
+async def close_google_maps_client() -> None:
+    """Paylasilan istemciyi kapat (sunucu kapanisinda)"""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
@@ -0,0 +1,95 @@
+# Sydney Guide - Async NSW Transport Client
+# NSW Transport Open Data (departure monitor) icin paylasilan, keep-alive baglanti havuzlu async istemci
+
+import asyncio
+import logging
+import os
+import ssl
+from typing import Any, Dict, Optional, Union
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Havuz ayarlari (env ile degistirilebilir)
+NSW_TRANSPORT_BASE_URL = os.getenv('NSW_TRANSPORT_BASE_URL', 'https://api.transport.nsw.gov.au')
+NSW_TRANSPORT_MAX_CONNECTIONS = int(os.getenv('NSW_TRANSPORT_MAX_CONNECTIONS', '20'))
+NSW_TRANSPORT_MAX_CONNECTIONS_PER_HOST = int(os.getenv('NSW_TRANSPORT_MAX_CONNECTIONS_PER_HOST', '10'))
+NSW_TRANSPORT_TIMEOUT_SECONDS = float(os.getenv('NSW_TRANSPORT_TIMEOUT_SECONDS', '10'))
+NSW_TRANSPORT_KEEPALIVE_SECONDS = float(os.getenv('NSW_TRANSPORT_KEEPALIVE_SECONDS', '30'))
+NSW_TRANSPORT_DNS_CACHE_SECONDS = int(os.getenv('NSW_TRANSPORT_DNS_CACHE_SECONDS', '300'))
+
+DEPARTURE_MONITOR_PATH = "/v1/tp/departure_mon"
+
+class NSWTransportClient:
+    """
+    NSW Transport departure monitor icin async HTTP istemcisi
+
+    Tek bir aiohttp.ClientSession sunucu boyunca yasar: baglantilar
+    keep-alive ile tekrar kullanilir (her cagri DNS + TCP + TLS kurulumu
+    yapmaz), DNS cozumlemesi onbellekte tutulur ve host basina baglanti
+    sayisi sinirlanir. Kimlik basliklari oturum seviyesinde eklenir.
+    """
+
+    def __init__(self, api_key: str, base_url: str = NSW_TRANSPORT_BASE_URL,
+                 max_connections: int = NSW_TRANSPORT_MAX_CONNECTIONS,
+                 max_connections_per_host: int = NSW_TRANSPORT_MAX_CONNECTIONS_PER_HOST,
+                 timeout_seconds: float = NSW_TRANSPORT_TIMEOUT_SECONDS,
+                 keepalive_seconds: float = NSW_TRANSPORT_KEEPALIVE_SECONDS,
+                 dns_cache_seconds: int = NSW_TRANSPORT_DNS_CACHE_SECONDS,
+                 ssl_context: Union[ssl.SSLContext, bool, None] = None):
+        self._session = aiohttp.ClientSession(
+            base_url=base_url,
+            headers={
+                "Authorization": f"apikey {api_key}",
+                "Accept": "application/json"
+            },
+            timeout=aiohttp.ClientTimeout(total=timeout_seconds),
+            connector=aiohttp.TCPConnector(
+                limit=max_connections,
+                limit_per_host=max_connections_per_host,
+                keepalive_timeout=keepalive_seconds,
+                use_dns_cache=True,
+                ttl_dns_cache=dns_cache_seconds,
+                ssl=ssl_context if ssl_context is not None else True
+            )
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        return self._session.closed
+
+    async def aclose(self) -> None:
+        """Havuzdaki baglantilari kapat"""
+        await self._session.close()
+
+    def departure_monitor(self, params: Dict[str, Any]):
+        """
+        Departure monitor GET istegi - yanit icin async context manager
+
+        Durum koduna gore davranis (401, 429, JSON hatasi) cagirana aittir.
+        """
+        return self._session.get(DEPARTURE_MONITOR_PATH, params=params)
+
+# Surec genelinde paylasilan istemci - olusturuldugu event loop'a baglidir
+_shared_client: Optional[NSWTransportClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def get_nsw_transport_client(api_key: str) -> NSWTransportClient:
+    """Paylasilan NSW Transport istemcisini dondur, gerekirse olustur"""
+    global _shared_client, _shared_client_loop
+    loop = asyncio.get_running_loop()
+
+    if _shared_client is None or _shared_client.is_closed or _shared_client_loop is not loop:
+        _shared_client = NSWTransportClient(api_key)
+        _shared_client_loop = loop
+        logger.info("NSW Transport async client pool created")
+    return _shared_client
+
+async def close_nsw_transport_client() -> None:
+    """Paylasilan istemciyi kapat (sunucu kapanisinda)"""
+    global _shared_client, _shared_client_loop
+    if _shared_client is not None and not _shared_client.is_closed:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_client_loop = None
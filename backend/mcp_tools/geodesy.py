@@ -0,0 +1,105 @@
+# Sydney Guide - Geodesy Kernels
+# Tum araclarin ortak kullandigi haversine mesafe hesaplari (tekil ve NumPy toplu)
+
+import math
+from typing import Sequence, Union
+
+import numpy as np
+
+# Dunyanin ortalama yaricapi (km)
+EARTH_RADIUS_KM = 6371.0
+# Bir enlem derecesinin yaklasik uzunlugu (km)
+KM_PER_DEGREE = 111.32
+
+ArrayLike = Union[np.ndarray, Sequence[float]]
+
+def as_coordinate_array(values: ArrayLike) -> np.ndarray:
+    """Koordinatlari bitisik float64 diziye cevir (zaten uygunsa kopyalamaz)"""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Haversine formulu ile iki nokta arasi mesafeyi km cinsinden hesapla"""
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlng = math.radians(lng2 - lng1)
+
+    a = (math.sin(dlat / 2) ** 2 +
+         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2)
+    return EARTH_RADIUS_KM * 2 * math.asin(min(1.0, math.sqrt(a)))
+
+def _haversine_kernel(lat1_rad: np.ndarray, lng1_rad: np.ndarray,
+                      lat2_rad: np.ndarray, lng2_rad: np.ndarray) -> np.ndarray:
+    """Radyan cinsinden yayinlanabilir (broadcast) dizilerle haversine"""
+    a = (np.sin((lat2_rad - lat1_rad) * 0.5) ** 2 +
+         np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin((lng2_rad - lng1_rad) * 0.5) ** 2)
+    # Yuvarlama hatasi 1'i asarsa arcsin NaN dondurur
+    np.clip(a, 0.0, 1.0, out=a)
+    return 2.0 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+def haversine_one_to_many(lat: float, lng: float,
+                          lats: ArrayLike, lngs: ArrayLike) -> np.ndarray:
+    """Tek bir noktadan N noktaya mesafeler (km), sekil (N,)"""
+    lats_rad = np.radians(as_coordinate_array(lats))
+    lngs_rad = np.radians(as_coordinate_array(lngs))
+    return _haversine_kernel(np.float64(math.radians(lat)), np.float64(math.radians(lng)),
+                             lats_rad, lngs_rad)
+
+def haversine_many_to_many(lats1: ArrayLike, lngs1: ArrayLike,
+                           lats2: ArrayLike, lngs2: ArrayLike) -> np.ndarray:
+    """N x M mesafe matrisi (km) - satirlar ilk kume, sutunlar ikinci kume"""
+    lats1_rad = np.radians(as_coordinate_array(lats1))[:, np.newaxis]
+    lngs1_rad = np.radians(as_coordinate_array(lngs1))[:, np.newaxis]
+    lats2_rad = np.radians(as_coordinate_array(lats2))[np.newaxis, :]
+    lngs2_rad = np.radians(as_coordinate_array(lngs2))[np.newaxis, :]
+    return _haversine_kernel(lats1_rad, lngs1_rad, lats2_rad, lngs2_rad)
+
+def haversine_pairwise(lats1: ArrayLike, lngs1: ArrayLike,
+                       lats2: ArrayLike, lngs2: ArrayLike) -> np.ndarray:
+    """Eslesen cift noktalar arasi mesafeler (km), i. eleman (p1[i], p2[i])"""
+    return _haversine_kernel(np.radians(as_coordinate_array(lats1)),
+                             np.radians(as_coordinate_array(lngs1)),
+                             np.radians(as_coordinate_array(lats2)),
+                             np.radians(as_coordinate_array(lngs2)))
+
+_GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+def geohash_encode(lat: float, lng: float, precision: int = 6) -> str:
+    """
+    Koordinati geohash hucresine cevir
+
+    Hassasiyet 6 yaklasik 1.2km x 0.6km, 7 ise 150m x 150m hucre verir;
+    yakin noktalar ayni hucre anahtarini paylasir.
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    use_lng = True
+
+    while len(chars) < precision:
+        value, value_range = (lng, lng_range) if use_lng else (lat, lat_range)
+        middle = (value_range[0] + value_range[1]) / 2
+        if value >= middle:
+            bits = (bits << 1) | 1
+            value_range[0] = middle
+        else:
+            bits <<= 1
+            value_range[1] = middle
+        use_lng = not use_lng
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
+
+def radius_to_degree_span(lat: float, radius_km: float) -> tuple:
+    """Yaricapi kapsayan (enlem, boylam) derece acikliklarini dondur"""
+    lat_span = radius_km / KM_PER_DEGREE
+    # Boylam derecesi kutuplara yaklastikca kisalir, en dar enlemi kullan
+    widest_lat = min(abs(lat) + lat_span, 89.0)
+    lng_span = radius_km / (KM_PER_DEGREE * math.cos(math.radians(widest_lat)))
+    return lat_span, lng_span
@@ -0,0 +1,29 @@
+# Sydney Guide - GTFS Module
+# Yerel GTFS static akisinin ingest edilmesi, disk deposu, planlayici ve canli kalkis tablosu
+
+from .ingest import TRANSPORT_MODES, ingest_gtfs_zip, route_mode
+from .store import DEFAULT_GTFS_STORE_DIR, GTFSStore, PackedStrings
+from .timetable import ServiceCalendar, walk_seconds
+from .raptor import RaptorPlanner
+from .realtime import (FileTripUpdateSource, HttpTripUpdateSource, RealtimeFeedError, RealtimeOverlay,
+                       TripUpdateSource, trip_update_sources)
+from .departures import departure_board
+
+__all__ = [
+    'DEFAULT_GTFS_STORE_DIR',
+    'FileTripUpdateSource',
+    'GTFSStore',
+    'HttpTripUpdateSource',
+    'PackedStrings',
+    'RaptorPlanner',
+    'RealtimeFeedError',
+    'RealtimeOverlay',
+    'ServiceCalendar',
+    'TRANSPORT_MODES',
+    'TripUpdateSource',
+    'departure_board',
+    'ingest_gtfs_zip',
+    'route_mode',
+    'trip_update_sources',
+    'walk_seconds'
+]
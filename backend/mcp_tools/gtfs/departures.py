@@ -0,0 +1,114 @@
+# Sydney Guide - GTFS Departure Board
+# Duragin (istasyonsa peronlarinin) yaklasan kalkislarini tarifeden hesaplar, varsa canli gecikme katmanini uygular
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from .realtime import STATUS_CANCELED, STATUS_SKIPPED, RealtimeOverlay
+from .store import GTFSStore
+from .timetable import SECONDS_PER_DAY, date_number
+
+# Tabloda gosterilen en uzak kalkis (saniye) ve en fazla kalkis sayisi
+BOARD_HORIZON_SECONDS = 90 * 60
+BOARD_MAX_DEPARTURES = 40
+# Gecikmeli seferler icin tarifeye gore bu kadar once kalkmis seferler de aranir (saniye)
+LATE_GRACE_SECONDS = 30 * 60
+
+def board_stops(store: GTFSStore, stop: int) -> np.ndarray:
+    """Tabloya giren duraklar - istasyonun peronlari, yoksa duragin kendisi"""
+    children = np.flatnonzero(store.stop_parent == stop)
+    return children if children.size else np.array([stop])
+
+def _platform_label(store: GTFSStore, platform: int, stop: int) -> str:
+    """Peron adi istasyon adiyla basliyorsa geri kalani ("Platform 1"), aksi halde peron adi"""
+    if platform == stop:
+        return ""
+    name, station_name = store.stop_names[platform], store.stop_names[stop]
+    if name.startswith(station_name):
+        return name[len(station_name):].strip(" ,-") or name
+    return name
+
+def departure_board(store: GTFSStore, stop: int, moment: datetime, overlay: Optional[RealtimeOverlay] = None,
+                    horizon_seconds: int = BOARD_HORIZON_SECONDS,
+                    max_departures: int = BOARD_MAX_DEPARTURES) -> List[Dict[str, Any]]:
+    """
+    Duragin yaklasan kalkislari, tahmini kalkisa gore sirali
+
+    Her peronun gectigi desen konumunda kalkislar sirali oldugundan (FIFO
+    desenler) pencere iki searchsorted ile bulunur. Gece yarisini asan
+    dunku seferler de dahildir. Katmanda canli kaydi olan seferlere
+    gecikme eklenir; iptal edilen ve duragi atlayan seferler durumuyla
+    listelenir. Sonuc tum turleri icerir - tur filtresi ve limit cagirana
+    aittir.
+
+    Args:
+        moment: Sydney yerel zamani
+        overlay: Canli gecikme katmani (None = sadece tarife)
+    """
+    now = moment.hour * 3600 + moment.minute * 60 + moment.second
+    midnight = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    platforms = board_stops(store, stop).tolist()
+    days = [(0, moment.date())]
+    if now + SECONDS_PER_DAY - LATE_GRACE_SECONDS <= int(store.meta.get("max_time", 0)):
+        days.append((SECONDS_PER_DAY, moment.date() - timedelta(days=1)))
+
+    rows = []
+    for offset, day in days:
+        active = store.calendar.active_services(day)
+        day_number = date_number(day)
+        for platform in platforms:
+            for index in range(int(store.stop_pattern_offsets[platform]), int(store.stop_pattern_offsets[platform + 1])):
+                pattern, position = int(store.stop_patterns[index]), int(store.stop_pattern_positions[index])
+                stop_count = int(store.pattern_stop_offsets[pattern + 1] - store.pattern_stop_offsets[pattern])
+                # Son durakta kalkis yok
+                if position == stop_count - 1 or not active[store.pattern_service[pattern]]:
+                    continue
+                trip_start = int(store.pattern_trip_offsets[pattern])
+                trip_count = int(store.pattern_trip_offsets[pattern + 1]) - trip_start
+                block_start = int(store.pattern_time_offsets[pattern]) + position * trip_count
+                block = store.pattern_departures[block_start:block_start + trip_count]
+                first = int(np.searchsorted(block, now + offset - LATE_GRACE_SECONDS, side="left"))
+                last = int(np.searchsorted(block, now + offset + horizon_seconds, side="right"))
+                for column in range(first, last):
+                    trip = int(store.pattern_trips[trip_start + column])
+                    scheduled = int(block[column]) - offset
+                    delay, status, realtime = 0, None, False
+                    live = overlay.departure_delay(platform, trip) if overlay is not None else None
+                    if live is not None and live[0] in (0, day_number):
+                        delay, status, realtime = live[1] or 0, live[2], True
+                    estimated = scheduled + delay
+                    if estimated < now or estimated > now + horizon_seconds:
+                        continue
+                    rows.append((estimated, scheduled, platform, pattern, trip, delay, status, realtime))
+
+    rows.sort(key=lambda row: (row[0], row[1]))
+    departures = []
+    for estimated, scheduled, platform, pattern, trip, delay, status, realtime in rows[:max_departures]:
+        route = int(store.pattern_route[pattern])
+        label = store.route_label(route)
+        last_stop = int(store.pattern_stops[int(store.pattern_stop_offsets[pattern + 1]) - 1])
+        if status == STATUS_CANCELED:
+            state = "canceled"
+        elif status == STATUS_SKIPPED:
+            state = "skipped"
+        elif not realtime:
+            state = "scheduled"
+        else:
+            state = "delayed" if delay >= 60 else "on_time"
+        departures.append({
+            "service_id": label,
+            "line": store.route_long_names[route] or label,
+            "mode": store.route_mode_of(route),
+            "destination": store.trip_headsigns[trip] or store.stop_names[last_stop],
+            "scheduled_time": (midnight + timedelta(seconds=scheduled)).isoformat(),
+            "estimated_time": (midnight + timedelta(seconds=estimated)).isoformat(),
+            "delay_minutes": round(delay / 60),
+            "platform": _platform_label(store, platform, stop),
+            "realtime": realtime,
+            "status": state,
+            "trip_id": store.trip_ids[trip],
+            "stop_id": store.stop_ids[platform]
+        })
+    return departures
@@ -0,0 +1,409 @@
+# Sydney Guide - GTFS Static Ingestion
+# GTFS static zip'ini (stops, routes, trips, stop_times, calendar) akis halinde okuyup kompakt disk deposuna yazar
+
+import array
+import csv
+import io
+import json
+import logging
+import math
+import os
+import shutil
+import time
+import zipfile
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..geodesy import KM_PER_DEGREE
+from .timetable import build_patterns, build_transfers, calendar_arrays, parse_clock
+
+logger = logging.getLogger(__name__)
+
+# Depo bicimi degisirse artirilir - eski depolar acilmaz, yeniden ingest gerekir
+STORE_FORMAT_VERSION = 3
+# Durak indeksinin grid hucre boyutu (km)
+STOP_CELL_SIZE_KM = 0.25
+# Yeni depo yerine gecerken eski depo bu ekle yeniden adlandirilir, yer degisimi bitince silinir
+STORE_PREVIOUS_SUFFIX = ".previous"
+
+# Hucre anahtari = satir * KEY_STRIDE + (sutun + KEY_COLUMN_OFFSET) - (satir, sutun) sirasini korur
+KEY_STRIDE = 1 << 20
+KEY_COLUMN_OFFSET = 1 << 19
+
+# Ulasim turleri - sira hem bit numarasi hem de durak turu onceligidir
+# (hem tren hem otobus gecen istasyon "train" sayilir)
+TRANSPORT_MODES = ("train", "metro", "ferry", "light_rail", "bus")
+MODE_BITS = {mode: 1 << bit for bit, mode in enumerate(TRANSPORT_MODES)}
+
+# GTFS temel route_type degerleri
+_BASIC_ROUTE_MODES = {
+    0: "light_rail",   # tram / light rail
+    1: "metro",        # metro / subway
+    2: "train",        # rail
+    3: "bus",
+    4: "ferry",
+    5: "light_rail",   # cable tram
+    7: "train",        # funicular
+    11: "bus",         # trolleybus
+    12: "light_rail"   # monorail
+}
+
+# Genisletilmis route_type (yuzluk gruplar) - NSW akisi 401 (Sydney Metro), 700 (otobus), 900 (hafif rayli) kullanir
+_EXTENDED_ROUTE_MODES = {
+    1: "train",        # 100-199 railway
+    2: "bus",          # 200-299 coach
+    4: "metro",        # 400-499 urban railway
+    7: "bus",          # 700-799 bus
+    8: "bus",          # 800 trolleybus
+    9: "light_rail",   # 900-999 tram
+    10: "ferry",       # 1000-1099 water transport
+    12: "ferry"        # 1200 ferry
+}
+
+# Durak location_type degerleri
+LOCATION_STOP = 0
+LOCATION_STATION = 1
+
+def route_mode(route_type: int) -> str:
+    """GTFS route_type -> ulasim turu (bilinmeyenler otobus sayilir)"""
+    if route_type in _BASIC_ROUTE_MODES:
+        return _BASIC_ROUTE_MODES[route_type]
+    return _EXTENDED_ROUTE_MODES.get(route_type // 100, "bus")
+
+def cell_keys(lats: np.ndarray, lngs: np.ndarray, cell_size_deg: float) -> np.ndarray:
+    """Koordinatlarin sirali grid hucre anahtarlari (int64)"""
+    rows = np.floor(lats / cell_size_deg).astype(np.int64)
+    columns = np.floor(lngs / cell_size_deg).astype(np.int64)
+    return rows * KEY_STRIDE + (columns + KEY_COLUMN_OFFSET)
+
+def pack_strings(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Metinleri tek UTF-8 blob (uint8) ve int64 ofset dizisine paketle"""
+    encoded = [value.encode("utf-8") for value in values]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return blob, offsets
+
+def _iter_rows(archive: zipfile.ZipFile, name: str, columns: Sequence[str]) -> Iterator[List[str]]:
+    """
+    Zip icindeki CSV'yi satir satir oku, sadece istenen sutunlari dondur
+
+    Dosya bellege acilmaz; BOM'lu basliklar ve eksik opsiyonel sutunlar
+    (bos metin) desteklenir. DictReader yerine sutun indeksleri kullanilir -
+    milyonlarca satirlik stop_times icin belirgin sekilde hizli.
+    """
+    with archive.open(name) as raw_file:
+        reader = csv.reader(io.TextIOWrapper(raw_file, encoding="utf-8-sig", newline=""))
+        header = [column.strip() for column in next(reader, [])]
+        positions = [header.index(column) if column in header else -1 for column in columns]
+        width = len(header)
+        for row in reader:
+            if not row:
+                continue
+            if len(row) < width:
+                row = row + [""] * (width - len(row))
+            yield [row[position].strip() if position >= 0 else "" for position in positions]
+
+def _parse_int(value: str, default: int = 0) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return default
+
+def _parse_float(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return math.nan
+
+def _archive_member(archive: zipfile.ZipFile, name: str, required: bool = True) -> Optional[str]:
+    """Dosyayi zip icinde bul (bazi akislar dosyalari bir alt klasore koyar)"""
+    for member in archive.namelist():
+        if member == name or member.endswith("/" + name):
+            return member
+    if required:
+        raise ValueError(f"GTFS feed is missing {name}")
+    return None
+
+def ingest_gtfs_zip(zip_path: str, store_dir: str,
+                    cell_size_km: float = STOP_CELL_SIZE_KM) -> Dict[str, Any]:
+    """
+    GTFS static zip'ini kompakt disk deposuna donustur
+
+    routes, trips ve calendar kucuk tablolar olarak okunur; stop_times
+    akis halinde okunup satir basina 20 baytlik tamsayi sutunlarina
+    yazilir (metin satirlari bellekte tutulmaz). Peron/giris gibi alt
+    duraklar hat listesi icin parent_station'a toplanir, aranabilir
+    duraklar (istasyonlar ve ust istasyonu olmayan duraklar) hucre
+    anahtarina gore siralanir. Tarife RAPTOR desenlerine, yurume
+    aktarmalarina ve servis takvimine cevrilir (timetable modulu).
+    Depo once gecici klasore yazilir ve hazir olunca eski deponun yerine
+    tasinir; acik depolar etkilenmez.
+
+    Returns:
+        Dict: Depo meta verisi (durak/hat/sefer sayilari, sure)
+    """
+    started = time.perf_counter()
+    with zipfile.ZipFile(zip_path) as archive:
+        # Hatlar
+        route_ids: List[str] = []
+        route_short_names: List[str] = []
+        route_long_names: List[str] = []
+        route_types: List[int] = []
+        route_index: Dict[str, int] = {}
+        for route_id, short_name, long_name, route_type in _iter_rows(
+                archive, _archive_member(archive, "routes.txt"),
+                ("route_id", "route_short_name", "route_long_name", "route_type")):
+            if route_id in route_index:
+                continue
+            route_index[route_id] = len(route_ids)
+            route_ids.append(route_id)
+            route_short_names.append(short_name)
+            route_long_names.append(long_name)
+            route_types.append(_parse_int(route_type, 3))
+
+        # Seferler: hat, servis ve yon tabelasi
+        trip_ids: List[str] = []
+        trip_headsigns: List[str] = []
+        trip_route_list: List[int] = []
+        trip_service_list: List[int] = []
+        trip_index: Dict[str, int] = {}
+        service_ids: List[str] = []
+        service_index: Dict[str, int] = {}
+        for trip_id, route_id, service_id, headsign in _iter_rows(
+                archive, _archive_member(archive, "trips.txt"),
+                ("trip_id", "route_id", "service_id", "trip_headsign")):
+            route = route_index.get(route_id)
+            if route is None or trip_id in trip_index:
+                continue
+            if service_id not in service_index:
+                service_index[service_id] = len(service_ids)
+                service_ids.append(service_id)
+            trip_index[trip_id] = len(trip_ids)
+            trip_ids.append(trip_id)
+            trip_headsigns.append(headsign)
+            trip_route_list.append(route)
+            trip_service_list.append(service_index[service_id])
+
+        # Servis takvimi (iki dosya da opsiyonel, en az biri olmali)
+        calendar_member = _archive_member(archive, "calendar.txt", required=False)
+        dates_member = _archive_member(archive, "calendar_dates.txt", required=False)
+        if calendar_member is None and dates_member is None:
+            raise ValueError("GTFS feed is missing calendar.txt and calendar_dates.txt")
+        calendar_rows = list(_iter_rows(archive, calendar_member, (
+            "service_id", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+            "start_date", "end_date"))) if calendar_member else []
+        exception_rows = list(_iter_rows(archive, dates_member, ("service_id", "date", "exception_type"))) \
+            if dates_member else []
+
+        # Duraklar
+        stop_ids: List[str] = []
+        stop_names: List[str] = []
+        stop_lats: List[float] = []
+        stop_lngs: List[float] = []
+        location_types: List[int] = []
+        wheelchair: List[int] = []
+        parent_ids: List[str] = []
+        stop_index: Dict[str, int] = {}
+        for stop_id, name, lat, lng, location_type, parent_station, wheelchair_boarding in _iter_rows(
+                archive, _archive_member(archive, "stops.txt"),
+                ("stop_id", "stop_name", "stop_lat", "stop_lon", "location_type", "parent_station",
+                 "wheelchair_boarding")):
+            if stop_id in stop_index:
+                continue
+            stop_index[stop_id] = len(stop_ids)
+            stop_ids.append(stop_id)
+            stop_names.append(name)
+            stop_lats.append(_parse_float(lat))
+            stop_lngs.append(_parse_float(lng))
+            location_types.append(_parse_int(location_type, LOCATION_STOP))
+            wheelchair.append(_parse_int(wheelchair_boarding, 0))
+            parent_ids.append(parent_station)
+
+        # stop_times: tamsayi sutunlari (ayni seferin satirlari ardisik gelir, sefer aramasi onbellekte)
+        trip_rows, stop_rows, sequence_rows = array.array("i"), array.array("i"), array.array("i")
+        arrival_rows, departure_rows = array.array("i"), array.array("i")
+        stop_time_rows = 0
+        last_trip_id, last_trip = None, None
+        for trip_id, stop_id, sequence, arrival, departure in _iter_rows(
+                archive, _archive_member(archive, "stop_times.txt"),
+                ("trip_id", "stop_id", "stop_sequence", "arrival_time", "departure_time")):
+            stop_time_rows += 1
+            if trip_id != last_trip_id:
+                last_trip_id, last_trip = trip_id, trip_index.get(trip_id)
+            stop = stop_index.get(stop_id)
+            if last_trip is None or stop is None:
+                continue
+            trip_rows.append(last_trip)
+            stop_rows.append(stop)
+            sequence_rows.append(_parse_int(sequence, 0))
+            arrival_rows.append(parse_clock(arrival))
+            departure_rows.append(parse_clock(departure))
+
+    stop_count = len(stop_ids)
+    route_count = len(route_ids)
+    trip_route = np.array(trip_route_list, dtype=np.int32)
+    trip_service = np.array(trip_service_list, dtype=np.int32)
+    trip_rows_array = np.frombuffer(trip_rows, dtype=np.int32)
+    stop_rows_array = np.frombuffer(stop_rows, dtype=np.int32)
+    lats = np.array(stop_lats, dtype=np.float64)
+    lngs = np.array(stop_lngs, dtype=np.float64)
+    parents = np.array([stop_index.get(parent_id, -1) for parent_id in parent_ids], dtype=np.int32)
+
+    # Her durak icin en ustteki istasyon (peron -> istasyon, binis alani -> peron -> istasyon)
+    station_of = np.arange(stop_count, dtype=np.int32)
+    for _ in range(3):
+        parent_of_station = parents[station_of]
+        has_parent = parent_of_station >= 0
+        if not has_parent.any():
+            break
+        station_of[has_parent] = parent_of_station[has_parent]
+
+    # Hatlari ust istasyona topla: (istasyon, hat) ciftleri
+    pair_codes = np.unique(stop_rows_array.astype(np.int64) * max(route_count, 1) + trip_route[trip_rows_array])
+    pair_stops = (pair_codes // max(route_count, 1)).astype(np.int32)
+    pair_routes = (pair_codes % max(route_count, 1)).astype(np.int32)
+    rolled = np.unique(station_of[pair_stops].astype(np.int64) * max(route_count, 1) + pair_routes)
+    rolled_stops = (rolled // max(route_count, 1)).astype(np.int32)
+    rolled_routes = (rolled % max(route_count, 1)).astype(np.int32)
+
+    # CSR: istasyon -> hatlar (np.unique sonucu zaten durak, hat sirali)
+    route_offsets = np.zeros(stop_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(rolled_stops, minlength=stop_count), out=route_offsets[1:])
+
+    modes = np.array([MODE_BITS[route_mode(route_type)] for route_type in route_types], dtype=np.uint8)
+    mode_masks = np.zeros(stop_count, dtype=np.uint8)
+    np.bitwise_or.at(mode_masks, rolled_stops, modes[rolled_routes])
+
+    # Aranabilir duraklar: hat gecen istasyonlar ve ust istasyonu olmayan duraklar
+    location_array = np.array(location_types, dtype=np.int8)
+    searchable = (((location_array == LOCATION_STATION) | ((location_array == LOCATION_STOP) & (parents < 0)))
+                  & (mode_masks > 0) & np.isfinite(lats) & np.isfinite(lngs))
+    indexed_stops = np.flatnonzero(searchable).astype(np.int32)
+    cell_size_deg = cell_size_km / KM_PER_DEGREE
+    keys = cell_keys(lats[indexed_stops], lngs[indexed_stops], cell_size_deg)
+    order = np.argsort(keys, kind="stable")
+
+    # Tarife: desenler, sefer duran duraklar arasi aktarmalar, takvim
+    timetable = build_patterns(trip_rows_array, stop_rows_array, np.frombuffer(sequence_rows, dtype=np.int32),
+                               np.frombuffer(arrival_rows, dtype=np.int32),
+                               np.frombuffer(departure_rows, dtype=np.int32),
+                               trip_route, trip_service, stop_count)
+    served_stops = np.flatnonzero(np.bincount(stop_rows_array, minlength=stop_count) > 0).astype(np.int32)
+    served_keys = cell_keys(lats[served_stops], lngs[served_stops], cell_size_deg)
+    served_order = np.argsort(served_keys, kind="stable")
+    timetable.update(build_transfers(lats, lngs, served_stops))
+    timetable.update(calendar_arrays(service_ids, calendar_rows, exception_rows))
+    timetable.update({
+        "trip_route": trip_route,
+        "trip_service": trip_service,
+        "served_keys": served_keys[served_order],
+        "served_stops": served_stops[served_order]
+    })
+
+    arrays = {
+        "stop_lat": lats,
+        "stop_lng": lngs,
+        "stop_parent": parents,
+        "stop_station": station_of,
+        "stop_location_type": location_array,
+        "stop_wheelchair": np.array(wheelchair, dtype=np.int8),
+        "stop_modes": mode_masks,
+        "stop_route_offsets": route_offsets,
+        "stop_routes": rolled_routes,
+        "route_type": np.array(route_types, dtype=np.int16),
+        "index_keys": keys[order],
+        "index_stops": indexed_stops[order]
+    }
+    arrays.update(timetable)
+    strings = {
+        "stop_id": stop_ids,
+        "stop_name": stop_names,
+        "route_id": route_ids,
+        "route_short_name": route_short_names,
+        "route_long_name": route_long_names,
+        "trip_id": trip_ids,
+        "trip_headsign": trip_headsigns,
+        "service_id": service_ids
+    }
+
+    feed_stat = os.stat(zip_path)
+    meta = {
+        "format_version": STORE_FORMAT_VERSION,
+        "cell_size_km": cell_size_km,
+        "feed": os.path.basename(zip_path),
+        "feed_token": [feed_stat.st_mtime_ns, feed_stat.st_size],
+        "stops": stop_count,
+        "indexed_stops": int(indexed_stops.size),
+        "routes": route_count,
+        "trips": len(trip_ids),
+        "patterns": int(timetable["pattern_route"].size),
+        "transfers": int(timetable["transfer_targets"].size),
+        "stop_times": stop_time_rows,
+        "max_time": int(max(timetable["pattern_arrivals"].max(initial=0),
+                            timetable["pattern_departures"].max(initial=0))),
+        "ingested_at": datetime.now().isoformat()
+    }
+
+    _write_store(store_dir, arrays, strings, meta)
+    meta["ingest_seconds"] = round(time.perf_counter() - started, 3)
+    logger.info(f"GTFS feed {meta['feed']} ingested into {store_dir}: {meta['indexed_stops']} indexed stops, "
+                f"{route_count} routes, {meta['patterns']} patterns, {stop_time_rows} stop_times "
+                f"in {meta['ingest_seconds']}s")
+    return meta
+
+def _write_store(store_dir: str, arrays: Dict[str, np.ndarray], strings: Dict[str, Sequence[str]],
+                 meta: Dict[str, Any]) -> None:
+    """
+    Depoyu gecici klasore yaz, sonra eski deponun yerine tasi
+
+    Yer degisimi atomik degildir: eski depo store_dir.previous'a tasinir,
+    sonra yeni depo store_dir'e; arada store_dir kisa sure yoktur. Okuyucu
+    bu durumu .previous klasorunden anlar (GTFSStore.is_swapping) ve tekrar
+    dener. Eski depoyu eslemis surecler kendi dizilerini okumaya devam eder.
+    """
+    store_dir = os.path.abspath(store_dir)
+    partial_dir = store_dir + ".partial"
+    previous_dir = store_dir + STORE_PREVIOUS_SUFFIX
+    for leftover in (partial_dir, previous_dir):
+        shutil.rmtree(leftover, ignore_errors=True)
+    os.makedirs(partial_dir)
+
+    for name, column in arrays.items():
+        np.save(os.path.join(partial_dir, f"{name}.npy"), column)
+    for name, values in strings.items():
+        blob, offsets = pack_strings(values)
+        np.save(os.path.join(partial_dir, f"{name}.blob.npy"), blob)
+        np.save(os.path.join(partial_dir, f"{name}.offsets.npy"), offsets)
+    # meta.json en son yazilir - varligi deponun tamamlandigini gosterir
+    with open(os.path.join(partial_dir, "meta.json"), "w", encoding="utf-8") as meta_file:
+        json.dump(meta, meta_file, indent=2)
+
+    if os.path.isdir(store_dir):
+        os.rename(store_dir, previous_dir)
+    os.rename(partial_dir, store_dir)
+    shutil.rmtree(previous_dir, ignore_errors=True)
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Komut satiri: python -m mcp_tools.gtfs.ingest <feed.zip> [depo_klasoru]"""
+    import argparse
+
+    from .store import DEFAULT_GTFS_STORE_DIR
+
+    parser = argparse.ArgumentParser(description="Ingest a GTFS static zip into the local stop store")
+    parser.add_argument("feed", help="Path to the GTFS static zip")
+    parser.add_argument("store_dir", nargs="?", default=DEFAULT_GTFS_STORE_DIR,
+                        help=f"Output directory (default: {DEFAULT_GTFS_STORE_DIR})")
+    parser.add_argument("--cell-size-km", type=float, default=STOP_CELL_SIZE_KM)
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    meta = ingest_gtfs_zip(args.feed, args.store_dir, args.cell_size_km)
+    print(json.dumps(meta, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
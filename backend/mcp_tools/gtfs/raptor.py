@@ -0,0 +1,428 @@
+# Sydney Guide - RAPTOR Journey Planner
+# Ingest edilmis GTFS tarifesi uzerinde yurume aktarmali, Pareto-optimal toplu tasima yolculuk planlayici
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..geodesy import haversine_km, haversine_pairwise
+from .ingest import MODE_BITS
+from .store import GTFSStore
+from .timetable import DEPARTURE_KEY_STRIDE, SECONDS_PER_DAY, csr_gather, walk_seconds
+
+# En fazla binis sayisi (MAX_RIDES - 1 aktarma)
+MAX_RIDES = 5
+# Baslangic/varis noktasindan duraklara en fazla yurume mesafesi (km)
+ACCESS_RADIUS_KM = 0.8
+# Kalkistan sonra bu sure icinde varmayan yolculuklar aranmaz (saniye)
+SEARCH_HORIZON_SECONDS = 3 * 3600
+# Bu mesafeye kadar sadece yurume secenegi de sunulur (km)
+WALK_ONLY_MAX_KM = 2.0
+
+# Ulasilmamis durak suresi
+_UNREACHED = np.int64(1) << 40
+
+# Etiket turleri
+_LABEL_INHERITED = 0
+_LABEL_ACCESS = 1
+_LABEL_RIDE = 2
+_LABEL_WALK = 3
+
+class _Rounds:
+    """Tur basina varis suresi ve geri izleme etiketleri (tur x durak)"""
+
+    def __init__(self, rounds: int, stop_count: int):
+        shape = (rounds + 1, stop_count)
+        self.arrival = np.full(shape, _UNREACHED, dtype=np.int64)
+        self.kind = np.zeros(shape, dtype=np.int8)
+        # Binis etiketi: desen, desendeki sefer sutunu, binis/inis konumu, gun kaydirmasi
+        self.pattern = np.full(shape, -1, dtype=np.int32)
+        self.column = np.zeros(shape, dtype=np.int32)
+        self.board = np.zeros(shape, dtype=np.int32)
+        self.alight = np.zeros(shape, dtype=np.int32)
+        self.offset = np.zeros(shape, dtype=np.int32)
+        # Yurume etiketi: gelinen durak
+        self.walk_from = np.full(shape, -1, dtype=np.int32)
+
+class RaptorPlanner:
+    """
+    RAPTOR (Round-bAsed Public Transit Optimized Router)
+
+    k. tur, en fazla k binisle ulasilabilecek en erken varis surelerini
+    hesaplar: onceki turda iyilesen duraklardan gecen desenler taranir,
+    ardindan iyilesen duraklardan yurume aktarmalari gevsetilir. Her tur
+    hedefe daha erken vardiginda (varis suresi, binis sayisi) Pareto
+    cephesine bir yolculuk eklenir.
+
+    Bir turdaki desenler birbirinden bagimsizdir (binis sadece onceki turun
+    surelerini okur), bu yuzden turun tum desenleri tek vektorel geciste
+    taranir - desen basina Python dongusu yoktur. Gece yarisini asan
+    seferler (25:10) onceki servis gunu desenleri bir gun kaydirilarak
+    taranir.
+    """
+
+    def __init__(self, store: GTFSStore, max_rides: int = MAX_RIDES,
+                 access_radius_km: float = ACCESS_RADIUS_KM,
+                 horizon_seconds: int = SEARCH_HORIZON_SECONDS):
+        self.store = store
+        self.max_rides = max_rides
+        self.access_radius_km = access_radius_km
+        self.horizon_seconds = horizon_seconds
+        self.pattern_mode_bits = store.route_mode_bits[store.pattern_route]
+        self.max_time = int(store.meta.get("max_time", SECONDS_PER_DAY))
+
+        # Desen-durak satiri basina yardimci diziler (toplam satir sayisi = desen duraklarinin toplami)
+        self._stop_offsets = store.pattern_stop_offsets
+        self._pattern_stops = store.pattern_stops
+        self._departure_keys = store.pattern_departure_keys
+        lengths = np.diff(store.pattern_stop_offsets)
+        trip_counts = np.diff(store.pattern_trip_offsets)
+        self._row_patterns = np.repeat(np.arange(lengths.size, dtype=np.int32), lengths)
+        self._row_positions = (np.arange(self._row_patterns.size, dtype=np.int64)
+                               - np.repeat(store.pattern_stop_offsets[:-1], lengths)).astype(np.int32)
+        self._row_trip_counts = np.repeat(trip_counts, lengths)
+        self._row_starts = (np.repeat(store.pattern_time_offsets[:-1], lengths)
+                            + self._row_positions * self._row_trip_counts)
+        self._row_is_last = self._row_positions == np.repeat(lengths - 1, lengths)
+
+    def _active_days(self, departure: datetime, mode_mask: int) -> List[Tuple[int, np.ndarray]]:
+        """(gun kaydirmasi, aktif desen maskesi) - bugun ve gece yarisini asan dunku seferler"""
+        store = self.store
+        seconds = departure.hour * 3600 + departure.minute * 60 + departure.second
+        mode_ok = (self.pattern_mode_bits & mode_mask) > 0
+        days = [(0, store.calendar.active_services(departure.date())[store.pattern_service] & mode_ok)]
+        if seconds + SECONDS_PER_DAY <= self.max_time:
+            yesterday = departure.date() - timedelta(days=1)
+            days.append((SECONDS_PER_DAY, store.calendar.active_services(yesterday)[store.pattern_service] & mode_ok))
+        return days
+
+    def _scan_round(self, patterns: np.ndarray, first_positions: np.ndarray, offset: int, round_number: int,
+                    rounds: _Rounds, best: np.ndarray, target_limit: int) -> np.ndarray:
+        """
+        Secilen tum desenleri first konumlarindan itibaren tek vektorel geciste tara
+
+        Desenlerin taranan satirlari arka arkaya dizilir. Her satirda
+        binilebilecek en erken sefer global kalkis anahtarlarinda tek
+        searchsorted ile bulunur; desen (segment) icindeki kumulatif minimum
+        her satira kadar binilmis en iyi seferi verir. Segmentler azalan
+        buyuk bir sapma ile kaydirilir, boylece tek minimum.accumulate bir
+        desenden digerine tasmaz. offset > 0 ise desenler onceki gunun
+        seferleridir: saatleri offset kadar geriye kaydirilmis sayilir.
+        Iyilesen duraklari dondurur.
+        """
+        store = self.store
+        starts = self._stop_offsets[patterns] + first_positions
+        counts = self._stop_offsets[patterns + 1] - starts
+        total = int(counts.sum())
+        segment_starts = np.cumsum(counts) - counts
+        segments = np.repeat(np.arange(patterns.size, dtype=np.int64), counts)
+        rows = np.arange(total, dtype=np.int64) - segment_starts[segments] + starts[segments]
+
+        stops = self._pattern_stops[rows]
+        trip_counts = self._row_trip_counts[rows]
+        row_starts = self._row_starts[rows]
+
+        # Her satirda binilebilecek en erken sefer (yoksa sefer sayisi)
+        ready = rounds.arrival[round_number - 1, stops] + offset
+        earliest = np.searchsorted(self._departure_keys,
+                                   rows * DEPARTURE_KEY_STRIDE + np.minimum(ready, DEPARTURE_KEY_STRIDE - 1))
+        earliest -= row_starts
+        earliest[ready >= DEPARTURE_KEY_STRIDE] = trip_counts[ready >= DEPARTURE_KEY_STRIDE]
+        np.minimum(earliest, trip_counts, out=earliest)
+        earliest[self._row_is_last[rows]] = trip_counts[self._row_is_last[rows]]
+
+        # Satirdan once binilmis en iyi sefer (segment ici kumulatif minimum) ve bindigi satir
+        bias = (patterns.size - segments) << 32
+        running = np.minimum.accumulate(earliest + bias) - bias
+        riding = np.empty(total, dtype=np.int64)
+        riding[1:] = running[:-1]
+        riding[segment_starts] = trip_counts[segment_starts] + 1
+        boarded_at = np.maximum.accumulate(np.where(earliest < riding, rows, -1))
+        boarding = np.empty(total, dtype=np.int64)
+        boarding[1:] = boarded_at[:-1]
+
+        on_board = np.flatnonzero(riding < trip_counts)
+        if on_board.size == 0:
+            return np.empty(0, dtype=np.int32)
+        arrival = store.pattern_arrivals[row_starts[on_board] + riding[on_board]].astype(np.int64) - offset
+        alight_stops = stops[on_board]
+        improved = arrival < np.minimum(best[alight_stops], target_limit)
+        if not improved.any():
+            return np.empty(0, dtype=np.int32)
+
+        on_board, arrival, alight_stops = on_board[improved], arrival[improved], alight_stops[improved]
+        current = rounds.arrival[round_number]
+        np.minimum.at(current, alight_stops, arrival)
+        np.minimum.at(best, alight_stops, arrival)
+        # Ayni duraga birden fazla desen/konum variyorsa en erken varan etiketi alir
+        winners = arrival == current[alight_stops]
+        on_board, alight_stops = on_board[winners], alight_stops[winners]
+        alight_rows = rows[on_board]
+
+        rounds.kind[round_number, alight_stops] = _LABEL_RIDE
+        rounds.pattern[round_number, alight_stops] = self._row_patterns[alight_rows]
+        rounds.column[round_number, alight_stops] = riding[on_board]
+        rounds.board[round_number, alight_stops] = self._row_positions[boarding[on_board]]
+        rounds.alight[round_number, alight_stops] = self._row_positions[alight_rows]
+        rounds.offset[round_number, alight_stops] = offset
+        rounds.walk_from[round_number, alight_stops] = -1
+        return alight_stops.astype(np.int32)
+
+    def _relax_transfers(self, sources: np.ndarray, round_number: int, rounds: _Rounds,
+                         best: np.ndarray, target_limit: int) -> np.ndarray:
+        """Binisle iyilesen duraklardan yurume aktarmalari - iyilesen hedef duraklari dondur"""
+        store = self.store
+        owners, positions = csr_gather(store.transfer_offsets, sources)
+        if positions.size == 0:
+            return np.empty(0, dtype=np.int32)
+        targets = store.transfer_targets[positions]
+        current = rounds.arrival[round_number]
+        arrival = current[owners] + store.transfer_seconds[positions].astype(np.int64)
+        improved = arrival < np.minimum(best[targets], target_limit)
+        if not improved.any():
+            return np.empty(0, dtype=np.int32)
+
+        owners, targets, arrival = owners[improved], targets[improved], arrival[improved]
+        np.minimum.at(current, targets, arrival)
+        np.minimum.at(best, targets, arrival)
+        winners = arrival == current[targets]
+        owners, targets = owners[winners], targets[winners]
+        rounds.kind[round_number, targets] = _LABEL_WALK
+        rounds.walk_from[round_number, targets] = owners
+        rounds.pattern[round_number, targets] = -1
+        return targets.astype(np.int32)
+
+    def plan(self, origin_lat: float, origin_lng: float, destination_lat: float, destination_lng: float,
+             departure: datetime, modes: Optional[Sequence[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Kalkis zamanindan itibaren Pareto-optimal yolculuklar
+
+        Args:
+            departure: Sydney yerel kalkis zamani
+            modes: Izin verilen ulasim turleri (None = hepsi)
+
+        Returns:
+            List: Varis suresine gore sirali yolculuklar - her biri daha az
+                binisle daha gec ya da daha fazla binisle daha erken varir
+        """
+        store = self.store
+        mode_mask = sum(MODE_BITS[mode] for mode in modes if mode in MODE_BITS) if modes else 0xFF
+        start = departure.hour * 3600 + departure.minute * 60 + departure.second
+        service_midnight = departure.replace(hour=0, minute=0, second=0, microsecond=0)
+        days = self._active_days(departure, mode_mask)
+
+        stop_count = store.stop_lat.size
+        rounds = _Rounds(self.max_rides, stop_count)
+        best = np.full(stop_count, _UNREACHED, dtype=np.int64)
+
+        access_stops, access_km = store.nearby_served_stops(origin_lat, origin_lng, self.access_radius_km)
+        egress_stops, egress_km = store.nearby_served_stops(destination_lat, destination_lng, self.access_radius_km)
+        egress_seconds = walk_seconds(egress_km).astype(np.int64)
+        rounds.arrival[0, access_stops] = start + walk_seconds(access_km)
+        rounds.kind[0, access_stops] = _LABEL_ACCESS
+        best[access_stops] = rounds.arrival[0, access_stops]
+
+        direct_km = haversine_km(origin_lat, origin_lng, destination_lat, destination_lng)
+        direct_seconds = int(walk_seconds(direct_km))
+        # Dogrudan yurumekten gec varan yolculuk (binisli) Pareto'da yer almaz
+        target_limit = start + min(self.horizon_seconds, direct_seconds)
+        results: List[Tuple[int, int, int]] = []
+        marked = access_stops.astype(np.int32)
+
+        for round_number in range(1, self.max_rides + 1):
+            if marked.size == 0 or egress_stops.size == 0:
+                break
+            rounds.arrival[round_number] = rounds.arrival[round_number - 1]
+
+            # Iyilesen duraklardan gecen desenler ve her desende en erken iyilesen konum
+            _, positions = csr_gather(store.stop_pattern_offsets, marked)
+            patterns = store.stop_patterns[positions]
+            first_positions = store.stop_pattern_positions[positions]
+            order = np.lexsort((first_positions, patterns))
+            patterns, first_positions = patterns[order], first_positions[order]
+            unique_patterns, first_index = np.unique(patterns, return_index=True)
+            first_positions = first_positions[first_index]
+
+            improved = []
+            for offset, active in days:
+                selected = active[unique_patterns]
+                if selected.any():
+                    improved.append(self._scan_round(unique_patterns[selected], first_positions[selected], offset,
+                                                     round_number, rounds, best, target_limit))
+            ridden = np.unique(np.concatenate(improved)) if improved else np.empty(0, dtype=np.int32)
+            walked = self._relax_transfers(ridden, round_number, rounds, best, target_limit) \
+                if ridden.size else np.empty(0, dtype=np.int32)
+            marked = np.union1d(ridden, walked).astype(np.int32)
+
+            at_target = rounds.arrival[round_number, egress_stops] + egress_seconds
+            index = int(np.argmin(at_target))
+            if at_target[index] < target_limit:
+                target_limit = int(at_target[index])
+                results.append((round_number, int(egress_stops[index]), int(egress_seconds[index])))
+
+        journeys = [self._journey(round_number, stop, egress, rounds, service_midnight,
+                                  (origin_lat, origin_lng), (destination_lat, destination_lng))
+                    for round_number, stop, egress in results]
+        # Sadece yurume (hic binis yok): kisa mesafede veya toplu tasima daha hizli degilse
+        if direct_km <= WALK_ONLY_MAX_KM or (not journeys and direct_seconds <= self.horizon_seconds):
+            journeys.append(self._walk_only(start, direct_km, direct_seconds, service_midnight))
+        journeys.sort(key=lambda journey: (journey["arrival_seconds"], journey["rides"]))
+        return journeys
+
+    def _journey(self, round_number: int, egress_stop: int, egress_seconds: int, rounds: _Rounds,
+                 service_midnight: datetime, origin: Tuple[float, float],
+                 destination: Tuple[float, float]) -> Dict[str, Any]:
+        """Etiketleri geriye izleyip yolculuk adimlarini kur"""
+        store = self.store
+        legs: List[Dict[str, Any]] = []
+        stop = egress_stop
+        round_number_now = round_number
+        while True:
+            kind = int(rounds.kind[round_number_now, stop])
+            if round_number_now == 0 or kind == _LABEL_ACCESS:
+                legs.append({"kind": "access", "to": stop})
+                break
+            if kind == _LABEL_WALK:
+                source = int(rounds.walk_from[round_number_now, stop])
+                legs.append({"kind": "walk", "from": source, "to": stop})
+                stop = source
+            elif kind == _LABEL_RIDE:
+                pattern = int(rounds.pattern[round_number_now, stop])
+                board = int(rounds.board[round_number_now, stop])
+                legs.append({"kind": "ride", "pattern": pattern, "column": int(rounds.column[round_number_now, stop]),
+                             "board": board, "alight": int(rounds.alight[round_number_now, stop]),
+                             "offset": int(rounds.offset[round_number_now, stop])})
+                stop_start = int(store.pattern_stop_offsets[pattern])
+                stop = int(store.pattern_stops[stop_start + board])
+                round_number_now -= 1
+            else:
+                round_number_now -= 1
+        legs.reverse()
+
+        steps: List[Dict[str, Any]] = []
+        clock = None
+        transit_km = 0.0
+        modes: List[str] = []
+        for leg in legs:
+            if leg["kind"] == "ride":
+                step = self._ride_step(leg, service_midnight)
+                transit_km += step["distance_km"]
+                modes.append(step["mode"])
+                clock = step["arrival_seconds"]
+            elif leg["kind"] == "access":
+                step = self._walk_step(origin, leg["to"], 0, service_midnight)
+            else:
+                source = (float(store.stop_lat[leg["from"]]), float(store.stop_lng[leg["from"]]))
+                step = self._walk_step(source, leg["to"], clock, service_midnight)
+                clock = step["arrival_seconds"]
+            steps.append(step)
+
+        # Ilk yurume ilk binise tam yetisecek sekilde baslar
+        first_ride = next(step for step in steps if step["mode"] != "walking")
+        access = steps[0]
+        access_seconds = access["duration_seconds"]
+        self._set_times(access, first_ride["departure_seconds"] - access_seconds, service_midnight)
+        egress_km = haversine_km(float(store.stop_lat[egress_stop]), float(store.stop_lng[egress_stop]),
+                                 destination[0], destination[1])
+        egress = {"mode": "walking", "instruction": "Walk to destination", "distance_km": round(egress_km, 2),
+                  "duration_seconds": egress_seconds}
+        self._set_times(egress, clock, service_midnight)
+        steps.append(egress)
+
+        for number, step in enumerate(steps, start=1):
+            step["step_number"] = number
+            step["duration_minutes"] = round(step.pop("duration_seconds") / 60, 0)
+        leave, arrive = access["departure_seconds"], egress["arrival_seconds"]
+        return {
+            "rides": len(modes),
+            "transfers": max(len(modes) - 1, 0),
+            "modes": modes,
+            "leave_seconds": leave,
+            "arrival_seconds": arrive,
+            "departure_time": self._clock(leave, service_midnight).isoformat(),
+            "arrival_time": self._clock(arrive, service_midnight).isoformat(),
+            "total_duration_minutes": round((arrive - leave) / 60, 0),
+            "total_distance_km": round(sum(step["distance_km"] for step in steps), 2),
+            "transit_distance_km": round(transit_km, 2),
+            "steps": steps
+        }
+
+    @staticmethod
+    def _clock(seconds: int, service_midnight: datetime) -> datetime:
+        return service_midnight + timedelta(seconds=int(seconds))
+
+    def _set_times(self, step: Dict[str, Any], departure_seconds: int, service_midnight: datetime) -> None:
+        step["departure_seconds"] = int(departure_seconds)
+        step["arrival_seconds"] = int(departure_seconds) + int(step["duration_seconds"])
+        step["departure_time"] = self._clock(step["departure_seconds"], service_midnight).strftime("%H:%M")
+        step["arrival_time"] = self._clock(step["arrival_seconds"], service_midnight).strftime("%H:%M")
+
+    def _walk_step(self, source: Tuple[float, float], target: int, departure_seconds: int,
+                   service_midnight: datetime) -> Dict[str, Any]:
+        """Noktadan duraga yurume adimi"""
+        store = self.store
+        distance_km = haversine_km(source[0], source[1], float(store.stop_lat[target]), float(store.stop_lng[target]))
+        step = {"mode": "walking", "instruction": f"Walk to {store.stop_names[target]}",
+                "distance_km": round(distance_km, 2), "duration_seconds": int(walk_seconds(distance_km)),
+                "to_stop_id": store.stop_ids[target]}
+        self._set_times(step, departure_seconds, service_midnight)
+        return step
+
+    def _ride_step(self, leg: Dict[str, Any], service_midnight: datetime) -> Dict[str, Any]:
+        """Binis adimi - hat, yon, binis/inis duraklari ve saatleri"""
+        store = self.store
+        pattern, column, board, alight, offset = leg["pattern"], leg["column"], leg["board"], leg["alight"], leg["offset"]
+        stop_start = int(store.pattern_stop_offsets[pattern])
+        trip_count = int(store.pattern_trip_offsets[pattern + 1] - store.pattern_trip_offsets[pattern])
+        time_start = int(store.pattern_time_offsets[pattern])
+        departure = int(store.pattern_departures[time_start + board * trip_count + column]) - offset
+        arrival = int(store.pattern_arrivals[time_start + alight * trip_count + column]) - offset
+
+        stops = store.pattern_stops[stop_start + board:stop_start + alight + 1]
+        distance_km = float(haversine_pairwise(store.stop_lat[stops[:-1]], store.stop_lng[stops[:-1]],
+                                               store.stop_lat[stops[1:]], store.stop_lng[stops[1:]]).sum())
+        trip = int(store.pattern_trips[int(store.pattern_trip_offsets[pattern]) + column])
+        route = int(store.pattern_route[pattern])
+        line = store.route_label(route)
+        headsign = store.trip_headsigns[trip]
+        start_name, end_name = store.stop_names[int(stops[0])], store.stop_names[int(stops[-1])]
+        towards = f" towards {headsign}" if headsign else ""
+
+        step = {
+            "mode": store.route_mode_of(route),
+            "instruction": f"Take {line}{towards} from {start_name} to {end_name}",
+            "distance_km": round(distance_km, 2),
+            "duration_seconds": arrival - departure,
+            "line": line,
+            "start_station": start_name,
+            "end_station": end_name,
+            "start_stop_id": store.stop_ids[int(stops[0])],
+            "end_stop_id": store.stop_ids[int(stops[-1])],
+            "stops": int(stops.size - 1),
+            "trip_id": store.trip_ids[trip]
+        }
+        self._set_times(step, departure, service_midnight)
+        return step
+
+    def _walk_only(self, start: int, distance_km: float, duration_seconds: int,
+                   service_midnight: datetime) -> Dict[str, Any]:
+        """Sadece yurume secenegi"""
+        step = {"mode": "walking", "instruction": "Walk to destination", "distance_km": round(distance_km, 2),
+                "duration_seconds": duration_seconds}
+        self._set_times(step, start, service_midnight)
+        step["step_number"] = 1
+        step["duration_minutes"] = round(step.pop("duration_seconds") / 60, 0)
+        return {
+            "rides": 0,
+            "transfers": 0,
+            "modes": [],
+            "leave_seconds": start,
+            "arrival_seconds": start + duration_seconds,
+            "departure_time": self._clock(start, service_midnight).isoformat(),
+            "arrival_time": self._clock(start + duration_seconds, service_midnight).isoformat(),
+            "total_duration_minutes": round(duration_seconds / 60, 0),
+            "total_distance_km": round(distance_km, 2),
+            "transit_distance_km": 0.0,
+            "steps": [step]
+        }
@@ -0,0 +1,622 @@
+# Sydney Guide - GTFS-Realtime Trip Updates
+# TripUpdate akislarini (yerel dosya veya yerel HTTP ucu) okur, static tarife ustunde durak basina gecikme katmani tutar
+
+import asyncio
+import json
+import logging
+import os
+import threading
+import time
+import urllib.request
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Sequence, Tuple
+from urllib.error import HTTPError
+
+import numpy as np
+
+from ..catalog.opening_hours import SYDNEY_TIMEZONE
+from .store import GTFSStore
+from .timetable import date_number
+
+logger = logging.getLogger(__name__)
+
+# Bu sureden uzun suredir guncellenmeyen sefer kayitlari katmandan dusurulur (saniye)
+TRIP_UPDATE_TTL_SECONDS = 3 * 3600
+# HTTP kaynagi zaman asimi (saniye)
+FETCH_TIMEOUT_SECONDS = 10.0
+
+# FeedHeader.incrementality
+FULL_DATASET = 0
+DIFFERENTIAL = 1
+# TripDescriptor.schedule_relationship
+TRIP_SCHEDULED = 0
+TRIP_ADDED = 1
+TRIP_CANCELED = 3
+# StopTimeUpdate.schedule_relationship
+STOP_SCHEDULED = 0
+STOP_SKIPPED = 1
+STOP_NO_DATA = 2
+
+# Katmandaki durak durumu
+STATUS_LIVE = 0
+STATUS_SKIPPED = 1
+STATUS_CANCELED = 2
+
+_JSON_ENUMS = {
+    "FULL_DATASET": FULL_DATASET, "DIFFERENTIAL": DIFFERENTIAL,
+    "SCHEDULED": 0, "ADDED": TRIP_ADDED, "UNSCHEDULED": 2, "CANCELED": TRIP_CANCELED, "CANCELLED": TRIP_CANCELED,
+    "SKIPPED": STOP_SKIPPED, "NO_DATA": STOP_NO_DATA
+}
+
+class RealtimeFeedError(ValueError):
+    """Cozulemeyen GTFS-Realtime akisi"""
+
+# --- Protobuf tel bicimi (sadece TripUpdate icin gereken alanlar, bagimliliksiz) ---
+
+def _varint(buffer: bytes, position: int) -> Tuple[int, int]:
+    result = shift = 0
+    while True:
+        if position >= len(buffer):
+            raise RealtimeFeedError("Truncated varint")
+        byte = buffer[position]
+        position += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, position
+        shift += 7
+
+def _signed(value: int) -> int:
+    """int32/int64 varint (negatifler 64 bit ikiye tumleyen)"""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+def _fields(buffer: bytes, start: int, end: int) -> Iterator[Tuple[int, Any]]:
+    """
+    Mesaj alanlari: (alan numarasi, deger)
+
+    Varint alanlar int, uzunluk onekli alanlar (baslangic, bitis) araligi
+    olarak doner; sabit genislikli alanlar atlanir.
+    """
+    position = start
+    while position < end:
+        key, position = _varint(buffer, position)
+        number, wire_type = key >> 3, key & 7
+        if wire_type == 0:
+            value, position = _varint(buffer, position)
+        elif wire_type == 2:
+            length, position = _varint(buffer, position)
+            value = (position, position + length)
+            position += length
+        elif wire_type in (1, 5):
+            position += 8 if wire_type == 1 else 4
+            continue
+        else:
+            raise RealtimeFeedError(f"Unsupported protobuf wire type {wire_type}")
+        if position > end:
+            raise RealtimeFeedError("Truncated protobuf message")
+        yield number, value
+
+def _text(buffer: bytes, span: Tuple[int, int]) -> str:
+    return buffer[span[0]:span[1]].decode("utf-8")
+
+def _decode_stop_time_event(buffer: bytes, span: Tuple[int, int]) -> Tuple[Optional[int], Optional[int]]:
+    """StopTimeEvent -> (delay, time)"""
+    delay = moment = None
+    for number, value in _fields(buffer, *span):
+        if number == 1:
+            delay = _signed(value)
+        elif number == 2:
+            moment = _signed(value)
+    return delay, moment
+
+def _decode_trip_update(buffer: bytes, span: Tuple[int, int]) -> Dict[str, Any]:
+    """TripUpdate mesaji -> duz sozluk (JSON yolu ile ayni bicim)"""
+    update = {"trip_id": "", "start_date": "", "relationship": TRIP_SCHEDULED, "timestamp": None,
+              "delay": None, "stop_time_updates": []}
+    for number, value in _fields(buffer, *span):
+        if number == 1:
+            for trip_number, trip_value in _fields(buffer, *value):
+                if trip_number == 1:
+                    update["trip_id"] = _text(buffer, trip_value)
+                elif trip_number == 3:
+                    update["start_date"] = _text(buffer, trip_value)
+                elif trip_number == 4:
+                    update["relationship"] = trip_value
+        elif number == 2:
+            stop_update = {"stop_sequence": None, "stop_id": "", "arrival": (None, None),
+                           "departure": (None, None), "relationship": STOP_SCHEDULED}
+            for stop_number, stop_value in _fields(buffer, *value):
+                if stop_number == 1:
+                    stop_update["stop_sequence"] = stop_value
+                elif stop_number == 2:
+                    stop_update["arrival"] = _decode_stop_time_event(buffer, stop_value)
+                elif stop_number == 3:
+                    stop_update["departure"] = _decode_stop_time_event(buffer, stop_value)
+                elif stop_number == 4:
+                    stop_update["stop_id"] = _text(buffer, stop_value)
+                elif stop_number == 5:
+                    stop_update["relationship"] = stop_value
+            update["stop_time_updates"].append(stop_update)
+        elif number == 4:
+            update["timestamp"] = value
+        elif number == 5:
+            update["delay"] = _signed(value)
+    return update
+
+def _parse_protobuf_entity(buffer: bytes) -> Tuple[str, bool, Optional[Dict[str, Any]]]:
+    """FeedEntity -> (entity id, silindi mi, TripUpdate sozlugu veya None)"""
+    entity_id, deleted, trip_update = "", False, None
+    for number, value in _fields(buffer, 0, len(buffer)):
+        if number == 1:
+            entity_id = _text(buffer, value)
+        elif number == 2:
+            deleted = bool(value)
+        elif number == 3:
+            trip_update = _decode_trip_update(buffer, value)
+    return entity_id, deleted, trip_update
+
+def _split_protobuf_feed(payload: bytes) -> Tuple[Dict[str, Any], List[Tuple[bytes, Any]]]:
+    """
+    FeedMessage -> (baslik, [(entity baytlari, cozucu)])
+
+    Entity'ler burada sadece ayrilir; parmak izi entity'nin ham baytlaridir
+    ve govde cozucu cagrilinca cozulur - onceki akistakiyle ayni baytlara
+    sahip entity'ler hic cozulmez.
+    """
+    header = {"incrementality": FULL_DATASET, "timestamp": None}
+    entities = []
+    for number, value in _fields(payload, 0, len(payload)):
+        if number == 1 and isinstance(value, tuple):
+            for header_number, header_value in _fields(payload, *value):
+                if header_number == 2:
+                    header["incrementality"] = header_value
+                elif header_number == 3:
+                    header["timestamp"] = header_value
+        elif number == 2 and isinstance(value, tuple):
+            raw = payload[value[0]:value[1]]
+            entities.append((raw, lambda raw=raw: _parse_protobuf_entity(raw)))
+    return header, entities
+
+def _json_field(message: Dict[str, Any], name: str, default: Any = None) -> Any:
+    """protobuf JSON eslemesi - snake_case veya lowerCamelCase alan adi"""
+    if name in message:
+        return message[name]
+    parts = name.split("_")
+    return message.get(parts[0] + "".join(part.title() for part in parts[1:]), default)
+
+def _json_enum(value: Any, default: int) -> int:
+    if value is None:
+        return default
+    return _JSON_ENUMS.get(value, default) if isinstance(value, str) else int(value)
+
+def _json_int(value: Any) -> Optional[int]:
+    # int64 alanlar JSON'da metin olarak yazilir
+    return None if value is None else int(value)
+
+def _json_trip_update(message: Dict[str, Any]) -> Dict[str, Any]:
+    trip = _json_field(message, "trip", {})
+    stop_updates = []
+    for stop_update in _json_field(message, "stop_time_update", []):
+        events = {}
+        for key in ("arrival", "departure"):
+            event = _json_field(stop_update, key) or {}
+            events[key] = (_json_int(_json_field(event, "delay")), _json_int(_json_field(event, "time")))
+        stop_updates.append({
+            "stop_sequence": _json_int(_json_field(stop_update, "stop_sequence")),
+            "stop_id": _json_field(stop_update, "stop_id", ""),
+            "arrival": events["arrival"],
+            "departure": events["departure"],
+            "relationship": _json_enum(_json_field(stop_update, "schedule_relationship"), STOP_SCHEDULED)
+        })
+    return {
+        "trip_id": _json_field(trip, "trip_id", ""),
+        "start_date": _json_field(trip, "start_date", ""),
+        "relationship": _json_enum(_json_field(trip, "schedule_relationship"), TRIP_SCHEDULED),
+        "timestamp": _json_int(_json_field(message, "timestamp")),
+        "delay": _json_int(_json_field(message, "delay")),
+        "stop_time_updates": stop_updates
+    }
+
+def _split_json_feed(payload: bytes) -> Tuple[Dict[str, Any], List[Tuple[bytes, Any]]]:
+    """GTFS-Realtime JSON (protobuf JSON eslemesi) - yerel test akislari icin"""
+    try:
+        message = json.loads(payload)
+    except ValueError as error:
+        raise RealtimeFeedError(f"Invalid GTFS-Realtime JSON: {error}")
+    header_message = _json_field(message, "header", {})
+    header = {"incrementality": _json_enum(_json_field(header_message, "incrementality"), FULL_DATASET),
+              "timestamp": _json_int(_json_field(header_message, "timestamp"))}
+    entities = []
+    for entity in _json_field(message, "entity", []):
+        encoded = json.dumps(entity, sort_keys=True).encode("utf-8")
+        entities.append((encoded, lambda entity=entity: _parse_json_entity(entity)))
+    return header, entities
+
+def _parse_json_entity(entity: Dict[str, Any]) -> Tuple[str, bool, Optional[Dict[str, Any]]]:
+    trip_update = _json_field(entity, "trip_update")
+    return (str(_json_field(entity, "id", "")), bool(_json_field(entity, "is_deleted", False)),
+            _json_trip_update(trip_update) if trip_update is not None else None)
+
+def split_feed(payload: bytes) -> Tuple[Dict[str, Any], List[Tuple[bytes, Any]]]:
+    """
+    GTFS-Realtime FeedMessage'i (protobuf veya JSON) entity'lerine ayir
+
+    Returns:
+        Tuple: (baslik {incrementality, timestamp}, [(parmak izi, cozucu)]);
+        cozucu () -> (entity id, silindi mi, TripUpdate sozlugu veya None)
+    """
+    if payload.lstrip()[:1] == b"{":
+        return _split_json_feed(payload)
+    return _split_protobuf_feed(payload)
+
+# --- Kaynaklar ---
+
+class TripUpdateSource(ABC):
+    """
+    TripUpdate akis kaynagi
+
+    fetch() degismemisse None, degismisse akis baytlarini dondurur. Soyut
+    taban - fetch() eksik kaynak ilk arka plan yenilemesinde degil,
+    olusturulurken hata verir.
+    """
+
+    name = "source"
+
+    @abstractmethod
+    def fetch(self) -> Optional[bytes]:
+        """Yeni akis baytlari - son okumadan beri degismemisse None"""
+
+class FileTripUpdateSource(TripUpdateSource):
+    """Yerel dosya - (mtime_ns, boyut) degismedikce tekrar okunmaz"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.name = f"file:{path}"
+        self._token: Optional[Hashable] = None
+
+    def fetch(self) -> Optional[bytes]:
+        stat = os.stat(self.path)
+        token = (stat.st_mtime_ns, stat.st_size)
+        if token == self._token:
+            return None
+        with open(self.path, "rb") as feed_file:
+            payload = feed_file.read()
+        self._token = token
+        return payload
+
+class HttpTripUpdateSource(TripUpdateSource):
+    """Yerel HTTP ucu - ETag/Last-Modified ile kosullu GET, 304 = degismedi"""
+
+    def __init__(self, url: str, timeout_seconds: float = FETCH_TIMEOUT_SECONDS):
+        self.url = url
+        self.name = url
+        self.timeout_seconds = timeout_seconds
+        self._validators: Dict[str, str] = {}
+
+    def fetch(self) -> Optional[bytes]:
+        request = urllib.request.Request(self.url, headers=dict(
+            {"Accept": "application/x-protobuf, application/json"}, **self._validators))
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout_seconds) as response:
+                payload = response.read()
+                headers = response.headers
+        except HTTPError as error:
+            if error.code == 304:
+                return None
+            raise
+        self._validators = {}
+        if headers.get("ETag"):
+            self._validators["If-None-Match"] = headers["ETag"]
+        if headers.get("Last-Modified"):
+            self._validators["If-Modified-Since"] = headers["Last-Modified"]
+        return payload
+
+def trip_update_sources(spec: str) -> List[TripUpdateSource]:
+    """Virgulle ayrilmis dosya yollari / http(s) URL'leri -> kaynaklar"""
+    sources: List[TripUpdateSource] = []
+    for item in (part.strip() for part in spec.split(",")):
+        if item.startswith(("http://", "https://")):
+            sources.append(HttpTripUpdateSource(item))
+        elif item:
+            sources.append(FileTripUpdateSource(item))
+    return sources
+
+# --- Durak basina gecikme katmani ---
+
+def service_midnight(service_date: date) -> float:
+    """Servis gunu basi (GTFS: ogle - 12 saat, yaz saati gecisinde de dogru) - epoch saniye"""
+    noon = datetime(service_date.year, service_date.month, service_date.day, 12, tzinfo=SYDNEY_TIMEZONE)
+    return (noon - timedelta(hours=12)).timestamp()
+
+class RealtimeOverlay:
+    """
+    Static tarife ustunde canli gecikme katmani
+
+    Katman durak satiri -> {sefer satiri: (servis gunu, kalkis gecikmesi,
+    durum)} sozlugudur; kalkis tablosu static saate bu gecikmeyi ekler.
+    Her akis guncellemesi artimli birlestirilir: entity'lerin parmak izi
+    onceki akisla karsilastirilir, sadece yeni/degisen TripUpdate'ler
+    cozulup uygulanir, FULL_DATASET'te gelmeyen (DIFFERENTIAL'da silinen)
+    entity'ler katmandan cikarilir. Degisen her durak sozlugu kopyalanip
+    tek atamayla yerine konur - okuyucular kilit almaz ve yari uygulanmis
+    bir durak gormez.
+
+    Gecikmeler GTFS-Realtime kuralina gore yayilir: bir durak guncellemesi
+    sonraki guncellemeye kadar asagi akis duraklarina gecer, ilk
+    guncellemeden onceki duraklar tarifeye gore kalir, NO_DATA yayilimi
+    keser.
+    """
+
+    def __init__(self, store: GTFSStore, sources: Sequence[TripUpdateSource],
+                 refresh_interval_seconds: float = 15.0):
+        self.store = store
+        self.sources = list(sources)
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self._stop_delays: Dict[int, Dict[int, Tuple[int, Optional[int], int]]] = {}
+        # (kaynak, entity id) -> (parmak izi, sefer satiri veya None, guncellenme zamani)
+        self._entities: Dict[Tuple[int, str], Tuple[bytes, Optional[int], float]] = {}
+        # (kaynak, parmak izi) -> entity anahtari - degismeyen entity'ler cozulmeden taninir
+        self._fingerprints: Dict[Tuple[int, bytes], Tuple[int, str]] = {}
+        self._last_prune = time.time()
+        # Sefer satiri -> katmanda yazdigi duraklar (kaldirma icin)
+        self._trip_stops: Dict[int, Tuple[int, ...]] = {}
+        self._feed_timestamps: List[Optional[int]] = [None] * len(self.sources)
+        self._refresh_lock = threading.Lock()
+        self._last_refresh: Optional[float] = None
+        self._last_changes: Dict[str, Any] = {}
+        self._background_task: Optional[asyncio.Task] = None
+
+    @property
+    def refreshed(self) -> bool:
+        return self._last_refresh is not None
+
+    def departure_delay(self, stop: int, trip: int) -> Optional[Tuple[int, Optional[int], int]]:
+        """(servis gunu yyyymmdd veya 0, kalkis gecikmesi saniye veya None, durum) - canli veri yoksa None"""
+        delays = self._stop_delays.get(stop)
+        return delays.get(trip) if delays else None
+
+    def refresh_now(self) -> Dict[str, Any]:
+        """
+        Tum kaynaklari kontrol et, degisen akislari katmana birlestir (bloklayan)
+
+        Kaynak hatasi loglanir, o kaynagin mevcut katmani korunur.
+        """
+        with self._refresh_lock:
+            changes = {"applied": 0, "removed": 0, "unchanged": 0, "unmatched": 0, "sources_changed": 0}
+            stop_changes: Dict[int, Dict[int, Optional[Tuple[int, Optional[int], int]]]] = {}
+            now = time.time()
+            for source_index, source in enumerate(self.sources):
+                try:
+                    payload = source.fetch()
+                    if payload is None:
+                        continue
+                    header, entities = split_feed(payload)
+                except Exception as error:
+                    logger.warning(f"GTFS-Realtime source {source.name} failed, keeping previous overlay: {error}")
+                    continue
+                changes["sources_changed"] += 1
+                self._feed_timestamps[source_index] = header["timestamp"]
+                self._merge(source_index, header, entities, now, stop_changes, changes)
+
+            # Uzun suredir guncellenmeyen seferler (DIFFERENTIAL akislarda kalanlar) - dakikada bir taranir
+            if now - self._last_prune >= 60:
+                self._last_prune = now
+                for key in [key for key, entry in self._entities.items() if now - entry[2] > TRIP_UPDATE_TTL_SECONDS]:
+                    changes["removed"] += self._drop_entity(key, stop_changes)
+
+            self._publish(stop_changes)
+            self._last_refresh = time.monotonic()
+            self._last_changes = changes
+            if changes["sources_changed"]:
+                logger.info(f"GTFS-Realtime overlay merged: {changes}")
+            return changes
+
+    async def refresh(self) -> Dict[str, Any]:
+        """refresh_now'u is parcaciginda calistir"""
+        return await asyncio.to_thread(self.refresh_now)
+
+    def maybe_refresh_in_background(self) -> None:
+        """Yenileme suresi geldiyse kaynaklari arka planda kontrol et (beklemeden doner)"""
+        if self.refresh_interval_seconds <= 0 or self._last_refresh is None:
+            return
+        if time.monotonic() - self._last_refresh < self.refresh_interval_seconds:
+            return
+        if self._background_task is not None and not self._background_task.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._background_task = loop.create_task(self._background_refresh())
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as error:
+            logger.warning(f"GTFS-Realtime refresh failed, keeping previous overlay: {error}")
+
+    def _merge(self, source_index: int, header: Dict[str, Any], entities: List[Tuple[bytes, Any]],
+               now: float, stop_changes: Dict, changes: Dict[str, Any]) -> None:
+        """Bir akisin entity'lerini katmana artimli uygula"""
+        seen = set()
+        for fingerprint, parse in entities:
+            key = self._fingerprints.get((source_index, fingerprint))
+            if key is not None:
+                # Onceki akistakiyle ayni baytlar - cozulmez, sadece tazelenir
+                self._entities[key] = (fingerprint, self._entities[key][1], now)
+                seen.add(key)
+                changes["unchanged"] += 1
+                continue
+            try:
+                entity_id, deleted, update = parse()
+            except (ValueError, TypeError) as error:
+                logger.warning(f"Skipping malformed GTFS-Realtime entity: {error}")
+                changes["unmatched"] += 1
+                continue
+
+            key = (source_index, entity_id)
+            if deleted:
+                # DIFFERENTIAL silme
+                changes["removed"] += self._drop_entity(key, stop_changes)
+                continue
+            if update is None:
+                # VehiclePosition/Alert entity'leri bu katmanin konusu degil
+                continue
+            self._drop_entity(key, stop_changes)
+            seen.add(key)
+            trip = self._apply_trip_update(update, stop_changes)
+            if trip is None:
+                changes["unmatched"] += 1
+            self._entities[key] = (fingerprint, trip, now)
+            self._fingerprints[(source_index, fingerprint)] = key
+            changes["applied"] += 1
+
+        if header["incrementality"] == FULL_DATASET:
+            for key in [key for key in self._entities if key[0] == source_index and key not in seen]:
+                changes["removed"] += self._drop_entity(key, stop_changes)
+
+    def _drop_entity(self, key: Tuple[int, str], stop_changes: Dict) -> bool:
+        """Entity'yi ve seferinin katman kayitlarini kaldir"""
+        previous = self._entities.pop(key, None)
+        if previous is None:
+            return False
+        self._fingerprints.pop((key[0], previous[0]), None)
+        self._remove_trip(previous[1], stop_changes)
+        return True
+
+    def _remove_trip(self, trip: Optional[int], stop_changes: Dict) -> None:
+        for stop in self._trip_stops.pop(trip, ()) if trip is not None else ():
+            stop_changes.setdefault(stop, {})[trip] = None
+
+    def _apply_trip_update(self, update: Dict[str, Any], stop_changes: Dict) -> Optional[int]:
+        """TripUpdate'i sefer duraklarina yay; static tarifede olmayan sefer icin None"""
+        store = self.store
+        trip = store.trip_index(update["trip_id"]) if update["trip_id"] else None
+        if trip is None or update["relationship"] == TRIP_ADDED or store.trip_pattern[trip] < 0:
+            return None
+
+        pattern, column = int(store.trip_pattern[trip]), int(store.trip_column[trip])
+        stop_start = int(store.pattern_stop_offsets[pattern])
+        stop_end = int(store.pattern_stop_offsets[pattern + 1])
+        stops = store.pattern_stops[stop_start:stop_end].tolist()
+        sequences = store.pattern_sequences[stop_start:stop_end]
+        trip_count = int(store.pattern_trip_offsets[pattern + 1] - store.pattern_trip_offsets[pattern])
+        time_start = int(store.pattern_time_offsets[pattern])
+        departures = store.pattern_departures[time_start + column:time_start + len(stops) * trip_count:trip_count]
+        arrivals = store.pattern_arrivals[time_start + column:time_start + len(stops) * trip_count:trip_count]
+
+        day = _parse_start_date(update["start_date"])
+        midnight = None
+
+        def delay_of(event: Tuple[Optional[int], Optional[int]], scheduled: int) -> Optional[int]:
+            nonlocal midnight
+            delay, moment = event
+            if delay is not None or moment is None:
+                return delay
+            if midnight is None:
+                midnight = service_midnight(day) if day else _closest_midnight(moment, scheduled)
+            return int(moment - midnight - scheduled)
+
+        entries: List[Optional[Tuple[Optional[int], int]]] = [None] * len(stops)
+        if update["relationship"] == TRIP_CANCELED:
+            entries = [(None, STATUS_CANCELED)] * len(stops)
+        elif not update["stop_time_updates"] and update["delay"] is not None:
+            entries = [(update["delay"], STATUS_LIVE)] * len(stops)
+        else:
+            cursor, current = 0, None
+            for stop_update in update["stop_time_updates"]:
+                position = _match_position(store, stops, sequences, stop_update, cursor)
+                if position is None:
+                    continue
+                # Onceki guncellemenin gecikmesi bu duraga kadar yayilir
+                for between in range(cursor, position):
+                    if entries[between] is None and current is not None:
+                        entries[between] = (current, STATUS_LIVE)
+                cursor = position
+                if stop_update["relationship"] == STOP_NO_DATA:
+                    current = None
+                    continue
+                departure = delay_of(stop_update["departure"], int(departures[position]))
+                arrival = delay_of(stop_update["arrival"], int(arrivals[position]))
+                current = departure if departure is not None else arrival if arrival is not None else current
+                status = STATUS_SKIPPED if stop_update["relationship"] == STOP_SKIPPED else STATUS_LIVE
+                entries[position] = (current, status)
+            if current is not None:
+                for between in range(cursor, len(stops)):
+                    if entries[between] is None:
+                        entries[between] = (current, STATUS_LIVE)
+
+        day_number = date_number(day) if day else 0
+        written = []
+        for stop, entry in zip(stops, entries):
+            if entry is not None:
+                stop_changes.setdefault(stop, {})[trip] = (day_number, entry[0], entry[1])
+                written.append(stop)
+        self._trip_stops[trip] = tuple(written)
+        return trip
+
+    def _publish(self, stop_changes: Dict[int, Dict[int, Optional[Tuple[int, Optional[int], int]]]]) -> None:
+        """Degisen duraklarin sozluklerini kopyala-guncelle-ata"""
+        for stop, trips in stop_changes.items():
+            delays = dict(self._stop_delays.get(stop, {}))
+            for trip, entry in trips.items():
+                if entry is None:
+                    delays.pop(trip, None)
+                else:
+                    delays[trip] = entry
+            if delays:
+                self._stop_delays[stop] = delays
+            else:
+                self._stop_delays.pop(stop, None)
+
+    def feed_age_seconds(self) -> Optional[float]:
+        """En eski kaynak basliginin yasi (baslik zamani yoksa None)"""
+        timestamps = [timestamp for timestamp in self._feed_timestamps if timestamp]
+        return round(time.time() - min(timestamps), 1) if timestamps else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Katman bilgisi"""
+        return {
+            "sources": [source.name for source in self.sources],
+            "trips": len(self._trip_stops),
+            "stops": len(self._stop_delays),
+            "entities": len(self._entities),
+            "feed_age_seconds": self.feed_age_seconds(),
+            "last_changes": self._last_changes
+        }
+
+def _parse_start_date(value: str) -> Optional[date]:
+    if len(value) != 8 or not value.isdigit():
+        return None
+    return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+
+def _closest_midnight(moment: int, scheduled: int) -> float:
+    """start_date yoksa: mutlak saate en yakin dusen servis gunu (bugun veya dun)"""
+    today = datetime.fromtimestamp(moment, SYDNEY_TIMEZONE).date()
+    candidates = [service_midnight(today - timedelta(days=days)) for days in (0, 1)]
+    return min(candidates, key=lambda midnight: abs(moment - midnight - scheduled))
+
+def _match_position(store: GTFSStore, stops: List[int], sequences: np.ndarray, stop_update: Dict[str, Any],
+                    cursor: int) -> Optional[int]:
+    """
+    StopTimeUpdate'in desendeki konumu
+
+    stop_id cursor'dan itibaren aranir (dongusel hatlarda ayni durak iki kez
+    gecer); stop_id yoksa stop_sequence desenin static sequence degerlerinde
+    aranir (GTFS sadece artmasini ister - 10, 20, 30 gibi bosluklu olabilir).
+    """
+    if stop_update["stop_id"]:
+        stop = store.stop_index(stop_update["stop_id"])
+        if stop is None:
+            return None
+        for position in range(cursor, len(stops)):
+            if stops[position] == stop:
+                return position
+        return None
+    sequence = stop_update["stop_sequence"]
+    if sequence is None:
+        return None
+    position = int(np.searchsorted(sequences, sequence))
+    if position < sequences.size and sequences[position] == sequence:
+        return position
+    return None
@@ -0,0 +1,227 @@
+# Sydney Guide - GTFS Stop Store
+# Ingest edilmis GTFS deposunu bellek eslemeli (mmap) acar, yakin durak ve hat sorgularini yanitlar
+
+import json
+import math
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..geodesy import KM_PER_DEGREE, haversine_one_to_many, radius_to_degree_span
+from .ingest import (KEY_COLUMN_OFFSET, KEY_STRIDE, MODE_BITS, STORE_FORMAT_VERSION, STORE_PREVIOUS_SUFFIX,
+                     TRANSPORT_MODES, route_mode)
+from .timetable import ServiceCalendar
+
+DEFAULT_GTFS_STORE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'gtfs'))
+
+class PackedStrings:
+    """Tek UTF-8 blob + ofset dizisinden metin okuyan salt okunur tablo"""
+
+    def __init__(self, blob: np.ndarray, offsets: np.ndarray):
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, code: int) -> str:
+        start, end = self._offsets[code], self._offsets[code + 1]
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+class GTFSStore:
+    """
+    ingest_gtfs_zip ile yazilmis GTFS deposu
+
+    Diziler np.load(mmap_mode="r") ile acilir: acilis aninda veri
+    okunmaz, sadece sorgunun dokundugu sayfalar bellege gelir ve ayni
+    depoyu acan surecler sayfa onbellegini paylasir. Yakin durak sorgusu
+    yaricapi kapsayan her grid satiri icin sirali hucre anahtarlarinda iki
+    searchsorted yapar, adaylarin mesafesini tek vektorel haversine ile
+    hesaplar - Python seviyesinde durak basina dongu yoktur. Tarife dizileri
+    (desenler, aktarmalar, takvim) RAPTOR planlayicisi icin ayni sekilde
+    acilir.
+    """
+
+    # Tarife dizileri - timetable.build_patterns/build_transfers/calendar_arrays ciktilari
+    TIMETABLE_ARRAYS = (
+        "pattern_route", "pattern_service", "pattern_stop_offsets", "pattern_stops", "pattern_sequences",
+        "pattern_trip_offsets",
+        "pattern_trips", "pattern_time_offsets", "pattern_arrivals", "pattern_departures", "pattern_departure_keys",
+        "trip_pattern", "trip_column", "trip_route", "trip_service",
+        "stop_pattern_offsets", "stop_patterns", "stop_pattern_positions",
+        "transfer_offsets", "transfer_targets", "transfer_seconds",
+        "served_keys", "served_stops"
+    )
+
+    def __init__(self, store_dir: str = DEFAULT_GTFS_STORE_DIR):
+        self.store_dir = os.path.abspath(store_dir)
+        with open(os.path.join(self.store_dir, "meta.json"), encoding="utf-8") as meta_file:
+            self.meta: Dict[str, Any] = json.load(meta_file)
+        if self.meta.get("format_version") != STORE_FORMAT_VERSION:
+            raise ValueError(f"GTFS store {self.store_dir} has format {self.meta.get('format_version')}, "
+                             f"expected {STORE_FORMAT_VERSION} - re-run the ingestion")
+
+        self.cell_size_deg = self.meta["cell_size_km"] / KM_PER_DEGREE
+        self.stop_lat = self._array("stop_lat")
+        self.stop_lng = self._array("stop_lng")
+        self.stop_parent = self._array("stop_parent")
+        self.stop_station = self._array("stop_station")
+        self.stop_wheelchair = self._array("stop_wheelchair")
+        self.stop_modes = self._array("stop_modes")
+        self.stop_route_offsets = self._array("stop_route_offsets")
+        self.stop_routes = self._array("stop_routes")
+        self.route_type = self._array("route_type")
+        self.index_keys = self._array("index_keys")
+        self.index_stops = self._array("index_stops")
+
+        self.stop_ids = self._strings("stop_id")
+        self.stop_names = self._strings("stop_name")
+        self.route_ids = self._strings("route_id")
+        self.route_short_names = self._strings("route_short_name")
+        self.route_long_names = self._strings("route_long_name")
+        self.trip_ids = self._strings("trip_id")
+        self.trip_headsigns = self._strings("trip_headsign")
+        self.service_ids = self._strings("service_id")
+        self._route_modes = [route_mode(int(route_type)) for route_type in self.route_type]
+        self.route_mode_bits = np.array([MODE_BITS[mode] for mode in self._route_modes], dtype=np.uint8)
+        self._stop_lookup: Optional[Dict[str, int]] = None
+        self._trip_lookup: Optional[Dict[str, int]] = None
+
+        for name in self.TIMETABLE_ARRAYS:
+            setattr(self, name, self._array(name))
+        self.calendar = ServiceCalendar(self._array("service_weekdays"), self._array("service_start_date"),
+                                        self._array("service_end_date"), self._array("exception_service"),
+                                        self._array("exception_date"), self._array("exception_type"))
+
+    @staticmethod
+    def exists(store_dir: str = DEFAULT_GTFS_STORE_DIR) -> bool:
+        """Tamamlanmis depo var mi (meta.json en son yazilir)"""
+        return os.path.isfile(os.path.join(store_dir, "meta.json"))
+
+    @staticmethod
+    def is_swapping(store_dir: str = DEFAULT_GTFS_STORE_DIR) -> bool:
+        """Ingest yeni depoyu yerine tasiyor mu (eski depo .previous klasorunde)"""
+        return os.path.isdir(os.path.abspath(store_dir) + STORE_PREVIOUS_SUFFIX)
+
+    def _array(self, name: str) -> np.ndarray:
+        # memmap alt sinifi yerine duz ndarray gorunumu - ayni eslenmis bellek, indeksleme ek yuku yok
+        return np.asarray(np.load(os.path.join(self.store_dir, f"{name}.npy"), mmap_mode="r"))
+
+    def _strings(self, name: str) -> PackedStrings:
+        return PackedStrings(self._array(f"{name}.blob"), self._array(f"{name}.offsets"))
+
+    def __len__(self) -> int:
+        """Aranabilir durak sayisi"""
+        return len(self.index_stops)
+
+    def stop_index(self, stop_id: str) -> Optional[int]:
+        """stop_id -> durak satiri (sozluk ilk cagrida kurulur)"""
+        if self._stop_lookup is None:
+            self._stop_lookup = {self.stop_ids[stop]: stop for stop in range(len(self.stop_ids))}
+        return self._stop_lookup.get(stop_id)
+
+    def trip_index(self, trip_id: str) -> Optional[int]:
+        """trip_id -> sefer satiri (sozluk ilk cagrida kurulur)"""
+        if self._trip_lookup is None:
+            self._trip_lookup = {self.trip_ids[trip]: trip for trip in range(len(self.trip_ids))}
+        return self._trip_lookup.get(trip_id)
+
+    def _grid_candidates(self, keys: np.ndarray, stops: np.ndarray, lat: float, lng: float,
+                         radius_km: float) -> np.ndarray:
+        """Yaricapi kapsayan grid hucrelerindeki duraklar (mesafe suzmesi yapilmamis)"""
+        lat_span, lng_span = radius_to_degree_span(lat, radius_km)
+        first_row = math.floor((lat - lat_span) / self.cell_size_deg)
+        last_row = math.floor((lat + lat_span) / self.cell_size_deg)
+        first_column = math.floor((lng - lng_span) / self.cell_size_deg) + KEY_COLUMN_OFFSET
+        last_column = math.floor((lng + lng_span) / self.cell_size_deg) + KEY_COLUMN_OFFSET
+
+        # Her grid satiri anahtar dizisinde tek bitisik aralik
+        rows = np.arange(first_row, last_row + 1, dtype=np.int64) * KEY_STRIDE
+        starts = np.searchsorted(keys, rows + first_column, side="left")
+        ends = np.searchsorted(keys, rows + last_column, side="right")
+        slices = [stops[start:end] for start, end in zip(starts.tolist(), ends.tolist()) if end > start]
+        if not slices:
+            return np.empty(0, dtype=np.int32)
+        return np.concatenate(slices)
+
+    def _within_radius(self, candidates: np.ndarray, lat: float, lng: float,
+                       radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Adaylari yaricapla suz, mesafeye gore sirala"""
+        if candidates.size == 0:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float64)
+        distances = haversine_one_to_many(lat, lng, self.stop_lat[candidates], self.stop_lng[candidates])
+        inside = distances <= radius_km
+        candidates, distances = candidates[inside], distances[inside]
+        order = np.argsort(distances, kind="stable")
+        return candidates[order], distances[order]
+
+    def nearby_stops(self, lat: float, lng: float, radius_km: float,
+                     transport_type: str = "all") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Yaricap icindeki aranabilir duraklar, mesafeye gore sirali
+
+        Args:
+            transport_type: "all" veya TRANSPORT_MODES'tan biri (bilinmeyen tur bos sonuc dondurur)
+
+        Returns:
+            Tuple: (durak satirlari int32, mesafeler km float64)
+        """
+        if transport_type != "all" and transport_type not in MODE_BITS:
+            return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float64)
+
+        candidates = self._grid_candidates(self.index_keys, self.index_stops, lat, lng, radius_km)
+
+        if transport_type != "all" and candidates.size:
+            candidates = candidates[(self.stop_modes[candidates] & MODE_BITS[transport_type]) > 0]
+        return self._within_radius(candidates, lat, lng, radius_km)
+
+    def nearby_served_stops(self, lat: float, lng: float, radius_km: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Yaricap icinde sefer duran (peron seviyesi) duraklar - planlayicinin erisim/ayrilis noktalari"""
+        candidates = self._grid_candidates(self.served_keys, self.served_stops, lat, lng, radius_km)
+        return self._within_radius(candidates, lat, lng, radius_km)
+
+    def routes_at(self, stop: int) -> np.ndarray:
+        """Duraktan (istasyonsa peronlari dahil) gecen hat satirlari"""
+        return self.stop_routes[self.stop_route_offsets[stop]:self.stop_route_offsets[stop + 1]]
+
+    def route_mode_of(self, route: int) -> str:
+        return self._route_modes[route]
+
+    def route_label(self, route: int) -> str:
+        """Hattin gorunen adi - kisa ad, yoksa uzun ad, yoksa route_id"""
+        return self.route_short_names[route] or self.route_long_names[route] or self.route_ids[route]
+
+    def stop_modes_of(self, stop: int) -> List[str]:
+        """Duraga hizmet veren ulasim turleri, oncelik sirasinda"""
+        mask = int(self.stop_modes[stop])
+        return [mode for mode in TRANSPORT_MODES if mask & MODE_BITS[mode]]
+
+    def station_record(self, stop: int, distance_km: float, transport_type: str = "all",
+                       max_services: int = 15) -> Dict[str, Any]:
+        """
+        Durak satirini find_nearby_transport istasyon sozlugune cevir
+
+        transport_type verilmisse sadece o turdeki hatlar listelenir.
+        """
+        modes = self.stop_modes_of(stop)
+        labels = sorted({self.route_label(route) for route in self.routes_at(stop).tolist()
+                         if transport_type == "all" or self._route_modes[route] == transport_type})
+        facilities = ["wheelchair_accessible"] if self.stop_wheelchair[stop] == 1 else []
+        return {
+            "stop_id": self.stop_ids[stop],
+            "name": self.stop_names[stop],
+            "type": transport_type if transport_type != "all" else modes[0],
+            "modes": modes,
+            "lat": float(self.stop_lat[stop]),
+            "lng": float(self.stop_lng[stop]),
+            "services": labels[:max_services],
+            "services_total": len(labels),
+            "facilities": facilities,
+            "distance_km": round(float(distance_km), 2)
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        """Depo bilgisi"""
+        return {key: self.meta.get(key) for key in ("feed", "stops", "indexed_stops", "routes", "trips",
+                                                   "patterns", "transfers", "stop_times", "ingested_at")}
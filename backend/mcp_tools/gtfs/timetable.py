@@ -0,0 +1,299 @@
+# Sydney Guide - GTFS Timetable Structures
+# stop_times satirlarindan sefer desenleri (pattern), yurume aktarmalari ve servis takvimi kurar
+
+import math
+from datetime import date
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..geodesy import KM_PER_DEGREE, haversine_many_to_many
+
+# Yurume modeli: duz cizgi mesafesi sokak agi icin DETOUR ile buyutulur
+WALK_SPEED_KMH = 4.5
+WALK_DETOUR_FACTOR = 1.3
+# Bu mesafedeki duraklar arasinda yurume aktarmasi kurulur (km)
+TRANSFER_RADIUS_KM = 0.4
+
+# Gun icindeki saniyeler - GTFS saatleri gece yarisini asabilir (25:10:00)
+SECONDS_PER_DAY = 24 * 3600
+# Kalkis anahtari = desen-durak satiri * DEPARTURE_KEY_STRIDE + kalkis saniyesi (saatler 3 gunu gecmez)
+DEPARTURE_KEY_STRIDE = 1 << 18
+
+def walk_seconds(distance_km):
+    """Duz cizgi mesafesinden (km, skaler veya dizi) yurume suresi (saniye)"""
+    return np.ceil(np.asarray(distance_km) * WALK_DETOUR_FACTOR / WALK_SPEED_KMH * 3600).astype(np.int32)
+
+def parse_clock(value: str) -> int:
+    """GTFS saati ("25:10:00") -> servis gunu basindan saniye, bossa -1"""
+    if not value:
+        return -1
+    hours, minutes, seconds = value.split(":")
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds)
+
+def csr_offsets(owners: np.ndarray, count: int) -> np.ndarray:
+    """Sahip numarasina gore sirali satirlar icin CSR ofset dizisi (count + 1)"""
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(owners, minlength=count), out=offsets[1:])
+    return offsets
+
+def csr_gather(offsets: np.ndarray, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Birden fazla CSR satirinin elemanlarini tek seferde topla
+
+    Returns:
+        Tuple: (her elemanin ait oldugu satir, deger dizisindeki konumu)
+    """
+    starts = np.asarray(offsets[rows], dtype=np.int64)
+    counts = np.asarray(offsets[rows + 1], dtype=np.int64) - starts
+    total = int(counts.sum())
+    owners = np.repeat(rows, counts)
+    if total == 0:
+        return owners, np.empty(0, dtype=np.int64)
+    group_starts = np.cumsum(counts) - counts
+    positions = np.arange(total, dtype=np.int64) - np.repeat(group_starts, counts) + np.repeat(starts, counts)
+    return owners, positions
+
+def _fill_missing_times(times: np.ndarray, trip_starts: np.ndarray, trip_ends: np.ndarray) -> None:
+    """Saati olmayan ara duraklari (timepoint olmayan) ayni seferin bilinen saatleriyle dogrusal doldur"""
+    missing_rows = np.flatnonzero(times < 0)
+    if missing_rows.size == 0:
+        return
+    trips = np.unique(np.searchsorted(trip_starts, missing_rows, side="right") - 1)
+    for trip in trips.tolist():
+        start, end = trip_starts[trip], trip_ends[trip]
+        block = times[start:end]
+        known = np.flatnonzero(block >= 0)
+        if known.size == 0:
+            continue
+        positions = np.arange(block.size)
+        block[:] = np.round(np.interp(positions, known, block[known])).astype(block.dtype)
+
+def build_patterns(trip_rows: np.ndarray, stop_rows: np.ndarray, sequence_rows: np.ndarray,
+                   arrival_rows: np.ndarray, departure_rows: np.ndarray,
+                   trip_route: np.ndarray, trip_service: np.ndarray, stop_count: int) -> Dict[str, np.ndarray]:
+    """
+    stop_times satirlarini RAPTOR desenlerine donustur
+
+    Ayni hat ve servisle ayni durak dizisini ayni stop_sequence
+    degerleriyle izleyen seferler bir desen olusturur; desenin sequence
+    degerleri (10, 20, 30 gibi ardisik olmayabilir) duraklarla birlikte
+    saklanir. Desen icinde seferler ilk kalkisa gore siralanir; bir sefer
+    oncekini herhangi bir durakta sollarsa (FIFO bozulursa) ayri desene
+    ayrilir, boylece her durak sutunu sirali kalir. Saatler desen basina
+    [durak konumu, sefer] sirasiyla duz int32 bloklarda tutulur. Ayrica
+    tum desen-durak satirlarinin kalkislari tek global sirali anahtar
+    dizisinde birlestirilir: bir turdaki tum desenlerde binilebilecek en
+    erken sefer tek searchsorted ile bulunur.
+    """
+    order = np.lexsort((sequence_rows, trip_rows))
+    trip_rows, stop_rows, sequences = trip_rows[order], stop_rows[order], sequence_rows[order]
+    arrivals, departures = arrival_rows[order], departure_rows[order]
+
+    boundaries = np.flatnonzero(np.diff(trip_rows)) + 1
+    trip_starts = np.concatenate(([0], boundaries)).astype(np.int64)
+    trip_ends = np.concatenate((boundaries, [trip_rows.size])).astype(np.int64)
+    trip_ids = trip_rows[trip_starts]
+
+    arrivals = np.where(arrivals < 0, departures, arrivals)
+    departures = np.where(departures < 0, arrivals, departures)
+    _fill_missing_times(arrivals, trip_starts, trip_ends)
+    _fill_missing_times(departures, trip_starts, trip_ends)
+
+    # (hat, servis, durak dizisi, sequence dizisi) -> seferler
+    groups: Dict[Tuple[int, int, bytes, bytes], List[int]] = {}
+    for position, trip in enumerate(trip_ids.tolist()):
+        start, end = trip_starts[position], trip_ends[position]
+        if end - start < 2:
+            continue
+        key = (int(trip_route[trip]), int(trip_service[trip]), stop_rows[start:end].tobytes(),
+               sequences[start:end].tobytes())
+        groups.setdefault(key, []).append(position)
+
+    pattern_route: List[int] = []
+    pattern_service: List[int] = []
+    pattern_stops: List[np.ndarray] = []
+    pattern_sequences: List[np.ndarray] = []
+    pattern_trips: List[np.ndarray] = []
+    arrival_blocks: List[np.ndarray] = []
+    departure_blocks: List[np.ndarray] = []
+
+    for (route, service, _, _), positions in groups.items():
+        positions.sort(key=lambda position: (departures[trip_starts[position]], arrivals[trip_ends[position] - 1]))
+        # FIFO'yu koruyan alt desenler: her biri son seferinin saat dizisini tutar
+        lanes: List[List[int]] = []
+        for position in positions:
+            start, end = trip_starts[position], trip_ends[position]
+            for lane in lanes:
+                last_start, last_end = trip_starts[lane[-1]], trip_ends[lane[-1]]
+                if (np.all(departures[start:end] >= departures[last_start:last_end])
+                        and np.all(arrivals[start:end] >= arrivals[last_start:last_end])):
+                    lane.append(position)
+                    break
+            else:
+                lanes.append([position])
+
+        for lane in lanes:
+            start = trip_starts[lane[0]]
+            pattern_route.append(route)
+            pattern_service.append(service)
+            pattern_stops.append(stop_rows[start:trip_ends[lane[0]]])
+            pattern_sequences.append(sequences[start:trip_ends[lane[0]]])
+            pattern_trips.append(trip_ids[lane])
+            arrival_blocks.append(np.stack([arrivals[trip_starts[p]:trip_ends[p]] for p in lane], axis=1).ravel())
+            departure_blocks.append(np.stack([departures[trip_starts[p]:trip_ends[p]] for p in lane], axis=1).ravel())
+
+    pattern_count = len(pattern_route)
+    stop_lengths = np.array([stops.size for stops in pattern_stops], dtype=np.int64)
+    trip_lengths = np.array([trips.size for trips in pattern_trips], dtype=np.int64)
+    all_stops = np.concatenate(pattern_stops).astype(np.int32) if pattern_count else np.empty(0, np.int32)
+    all_sequences = np.concatenate(pattern_sequences).astype(np.int32) if pattern_count else np.empty(0, np.int32)
+    all_trips = np.concatenate(pattern_trips).astype(np.int32) if pattern_count else np.empty(0, np.int32)
+
+    stop_offsets = np.zeros(pattern_count + 1, dtype=np.int64)
+    np.cumsum(stop_lengths, out=stop_offsets[1:])
+    trip_offsets = np.zeros(pattern_count + 1, dtype=np.int64)
+    np.cumsum(trip_lengths, out=trip_offsets[1:])
+    time_offsets = np.zeros(pattern_count + 1, dtype=np.int64)
+    np.cumsum(stop_lengths * trip_lengths, out=time_offsets[1:])
+
+    all_departures = (np.concatenate(departure_blocks) if pattern_count else np.empty(0)).astype(np.int32)
+    row_trip_counts = np.repeat(trip_lengths, stop_lengths)
+    departure_keys = (np.repeat(np.arange(row_trip_counts.size, dtype=np.int64), row_trip_counts)
+                      * DEPARTURE_KEY_STRIDE + all_departures)
+
+    # Sefer -> (desen, desendeki sutun) - canli gecikme eslestirmesi icin
+    trip_count = trip_route.size
+    trip_pattern = np.full(trip_count, -1, dtype=np.int32)
+    trip_column = np.full(trip_count, -1, dtype=np.int32)
+    owners = np.repeat(np.arange(pattern_count, dtype=np.int32), trip_lengths)
+    trip_pattern[all_trips] = owners
+    trip_column[all_trips] = (np.arange(all_trips.size) - np.repeat(trip_offsets[:-1], trip_lengths)).astype(np.int32)
+
+    # Durak -> (desen, konum) CSR
+    stop_pattern_owner = np.repeat(np.arange(pattern_count, dtype=np.int32), stop_lengths)
+    stop_position = (np.arange(all_stops.size) - np.repeat(stop_offsets[:-1], stop_lengths)).astype(np.int32)
+    by_stop = np.argsort(all_stops, kind="stable")
+
+    return {
+        "pattern_route": np.array(pattern_route, dtype=np.int32),
+        "pattern_service": np.array(pattern_service, dtype=np.int32),
+        "pattern_stop_offsets": stop_offsets,
+        "pattern_stops": all_stops,
+        "pattern_sequences": all_sequences,
+        "pattern_trip_offsets": trip_offsets,
+        "pattern_trips": all_trips,
+        "pattern_time_offsets": time_offsets,
+        "pattern_arrivals": (np.concatenate(arrival_blocks) if pattern_count else np.empty(0)).astype(np.int32),
+        "pattern_departures": all_departures,
+        "pattern_departure_keys": departure_keys,
+        "trip_pattern": trip_pattern,
+        "trip_column": trip_column,
+        "stop_pattern_offsets": csr_offsets(all_stops[by_stop], stop_count),
+        "stop_patterns": stop_pattern_owner[by_stop],
+        "stop_pattern_positions": stop_position[by_stop]
+    }
+
+def build_transfers(lats: np.ndarray, lngs: np.ndarray, served_stops: np.ndarray,
+                    radius_km: float = TRANSFER_RADIUS_KM) -> Dict[str, np.ndarray]:
+    """
+    Sefer duran duraklar arasi yurume aktarmalari (CSR, sure saniye)
+
+    Duraklar yaricap boyunda hucrelere ayrilir; her hucre sadece kendisi
+    ve 8 komsu hucredeki duraklarla tek mesafe matrisiyle karsilastirilir.
+    """
+    stop_count = lats.size
+    cell_size_deg = radius_km / KM_PER_DEGREE
+    # Boylam hucreleri enlem ile daralir - en kotu enlem icin genislet
+    lng_scale = 1.0 / max(math.cos(math.radians(min(float(np.nanmax(np.abs(lats[served_stops])))
+                                                     if served_stops.size else 0.0, 89.0))), 0.01)
+    rows = np.floor(lats[served_stops] / cell_size_deg).astype(np.int64)
+    columns = np.floor(lngs[served_stops] / (cell_size_deg * lng_scale)).astype(np.int64)
+    cells: Dict[Tuple[int, int], List[int]] = {}
+    for stop, row, column in zip(served_stops.tolist(), rows.tolist(), columns.tolist()):
+        cells.setdefault((row, column), []).append(stop)
+    cell_arrays = {key: np.array(members, dtype=np.int32) for key, members in cells.items()}
+
+    sources, targets, seconds = [], [], []
+    for (row, column), members in cell_arrays.items():
+        neighbours = [cell_arrays[(row + dr, column + dc)] for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                      if (row + dr, column + dc) in cell_arrays]
+        candidates = np.concatenate(neighbours)
+        distances = haversine_many_to_many(lats[members], lngs[members], lats[candidates], lngs[candidates])
+        source_index, target_index = np.nonzero((distances <= radius_km) & (members[:, None] != candidates[None, :]))
+        sources.append(members[source_index])
+        targets.append(candidates[target_index])
+        seconds.append(walk_seconds(distances[source_index, target_index]))
+
+    if sources:
+        sources_array = np.concatenate(sources)
+        targets_array = np.concatenate(targets)
+        seconds_array = np.concatenate(seconds)
+    else:
+        sources_array = targets_array = np.empty(0, dtype=np.int32)
+        seconds_array = np.empty(0, dtype=np.int32)
+    order = np.lexsort((seconds_array, sources_array))
+    return {
+        "transfer_offsets": csr_offsets(sources_array[order], stop_count),
+        "transfer_targets": targets_array[order].astype(np.int32),
+        "transfer_seconds": seconds_array[order].astype(np.int32)
+    }
+
+def date_number(day: date) -> int:
+    """Tarih -> GTFS YYYYMMDD tamsayisi"""
+    return day.year * 10000 + day.month * 100 + day.day
+
+class ServiceCalendar:
+    """
+    calendar.txt + calendar_dates.txt sorgusu
+
+    Servisin hafta gunu bitleri (bit 0 = pazartesi) ve gecerlilik
+    araligi dizilerde tutulur; istisnalar (1 = eklendi, 2 = kaldirildi)
+    gune gore uygulanir.
+    """
+
+    def __init__(self, weekdays: np.ndarray, start_dates: np.ndarray, end_dates: np.ndarray,
+                 exception_services: np.ndarray, exception_dates: np.ndarray, exception_types: np.ndarray):
+        self.weekdays = np.asarray(weekdays)
+        self.start_dates = np.asarray(start_dates)
+        self.end_dates = np.asarray(end_dates)
+        self.exception_services = np.asarray(exception_services)
+        self.exception_dates = np.asarray(exception_dates)
+        self.exception_types = np.asarray(exception_types)
+
+    def active_services(self, day: date) -> np.ndarray:
+        """Gunde calisan servisler - sekil (servis sayisi,) bool"""
+        number = date_number(day)
+        active = (((self.weekdays & (1 << day.weekday())) > 0)
+                  & (self.start_dates <= number) & (self.end_dates >= number))
+        today = self.exception_dates == number
+        active[self.exception_services[today & (self.exception_types == 1)]] = True
+        active[self.exception_services[today & (self.exception_types == 2)]] = False
+        return active
+
+def calendar_arrays(service_ids: Sequence[str], calendar_rows: Sequence[Sequence[str]],
+                    exception_rows: Sequence[Sequence[str]]) -> Dict[str, np.ndarray]:
+    """calendar/calendar_dates satirlarini servis dizilerine cevir (bilinmeyen servisler atlanir)"""
+    service_index = {service_id: index for index, service_id in enumerate(service_ids)}
+    weekdays = np.zeros(len(service_ids), dtype=np.uint8)
+    start_dates = np.zeros(len(service_ids), dtype=np.int32)
+    end_dates = np.zeros(len(service_ids), dtype=np.int32)
+    for service_id, *days, start_date, end_date in calendar_rows:
+        service = service_index.get(service_id)
+        if service is None:
+            continue
+        weekdays[service] = sum(1 << bit for bit, flag in enumerate(days) if flag == "1")
+        start_dates[service] = int(start_date or 0)
+        end_dates[service] = int(end_date or 0)
+
+    exceptions = [(service_index[service_id], int(exception_date), int(exception_type))
+                  for service_id, exception_date, exception_type in exception_rows
+                  if service_id in service_index and exception_date and exception_type in ("1", "2")]
+    return {
+        "service_weekdays": weekdays,
+        "service_start_date": start_dates,
+        "service_end_date": end_dates,
+        "exception_service": np.array([item[0] for item in exceptions], dtype=np.int32),
+        "exception_date": np.array([item[1] for item in exceptions], dtype=np.int32),
+        "exception_type": np.array([item[2] for item in exceptions], dtype=np.int8)
+    }
@@ -3,13 +3,14 @@
 
 import asyncio
 import json
-import math
 import os
 import logging
 from typing import Dict, Any, Tuple, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 
+from .geodesy import haversine_km
+
 # Load environment variables
 load_dotenv()
 
@@ -137,7 +138,7 @@ async def get_current_location(accuracy: str = "high") -> Dict[str, Any]:
 async def calculate_distance(start_lat: float, start_lng: float, end_lat: float, end_lng: float, unit: str = "km") -> Dict[str, Any]:
     """Iki nokta arasindaki mesafeyi hesapla"""
     try:
-        distance_km = _calculate_haversine_distance(start_lat, start_lng, end_lat, end_lng)
+        distance_km = haversine_km(start_lat, start_lng, end_lat, end_lng)
         distance_value = _convert_distance_unit(distance_km, unit)
         
         return {
@@ -154,22 +155,6 @@ async def calculate_distance(start_lat: float, start_lng: float, end_lat: float,
     except Exception as error:
         return {"status": "error", "message": "Distance calculation failed", "error_code": "CALCULATION_ERROR", "timestamp": datetime.now().isoformat()}
 
-def _calculate_haversine_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Haversine formulu ile iki nokta arasi mesafeyi km cinsinden hesapla"""
-    lat1_rad = math.radians(lat1)
-    lng1_rad = math.radians(lng1)
-    lat2_rad = math.radians(lat2)
-    lng2_rad = math.radians(lng2)
-    
-    dlat = lat2_rad - lat1_rad
-    dlng = lng2_rad - lng1_rad
-    
-    a = (math.sin(dlat / 2) ** 2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2)
-    c = 2 * math.asin(math.sqrt(a))
-    
-    earth_radius_km = 6371
-    return earth_radius_km * c
-
 def _convert_distance_unit(distance_km: float, unit: str) -> float:
     """Mesafe birimini donustur"""
     unit_conversions = {"km": 1.0, "miles": 0.621371, "meters": 1000.0}
@@ -8,6 +8,8 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+from .geodesy import haversine_km, haversine_one_to_many
+
 # Load environment variables
 load_dotenv()
 
@@ -363,17 +365,21 @@ async def update_journey_location(session_id: str, current_location: Dict[str, A
         
         triggered_alerts = []
         
-        # Her durak icin yakinlik kontrolu
-        for i, stop in enumerate(stops):
-            stop_lat = stop.get("lat", 0)
-            stop_lng = stop.get("lng", 0)
-            
-            # Mesafe hesapla (basit haversine)
-            distance = calculate_distance_simple(user_lat, user_lng, stop_lat, stop_lng)
-            
-            # Yakinlik uyarisi kontrolu
-            alert_distance = session["tracking_options"].get("alert_distance_meters", 200)
-            stops_ahead = session["tracking_options"].get("stops_ahead_warning", 2)
+        # Yakinlik uyarisi ayarlari
+        alert_distance = session["tracking_options"].get("alert_distance_meters", 200)
+        stops_ahead = session["tracking_options"].get("stops_ahead_warning", 2)
+        
+        # Tum duraklarin mesafesini tek vektorel cagriyla hesapla (metre)
+        stop_distances = haversine_one_to_many(
+            user_lat, user_lng,
+            [stop.get("lat", 0) for stop in stops],
+            [stop.get("lng", 0) for stop in stops]
+        ) * 1000
+        
+        # Sadece uyari menzilindeki duraklari kontrol et
+        for i in (stop_distances <= alert_distance * 2).nonzero()[0].tolist():
+            stop = stops[i]
+            distance = float(stop_distances[i])
             
             # Hedef duraga yakin mi?
             if stop["name"] == destination_stop["name"] and distance <= alert_distance:
@@ -440,24 +446,7 @@ async def send_proximity_alert(user_token: str, message: str, stop: Dict[str, An
 
 def calculate_distance_simple(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
     """Basit mesafe hesaplama (metre cinsinden)"""
-    import math
-    
-    # Haversine formula
-    R = 6371000  # Earth radius in meters
-    
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lng = math.radians(lng2 - lng1)
-    
-    a = (math.sin(delta_lat/2) * math.sin(delta_lat/2) + 
-         math.cos(lat1_rad) * math.cos(lat2_rad) * 
-         math.sin(delta_lng/2) * math.sin(delta_lng/2))
-    
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-    distance = R * c
-    
-    return distance
+    return haversine_km(lat1, lng1, lat2, lng2) * 1000
 
 async def stop_journey_tracking(session_id: str) -> Dict[str, Any]:
     """
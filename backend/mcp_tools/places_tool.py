@@ -5,11 +5,14 @@ Uses organized fixtures from tests/fixtures/ instead of hardcoded data
 Proper USE_REAL_API logic for all functions
 """
 
+import asyncio
+import heapq
+import importlib
 import logging
 import os
+import time
 from datetime import datetime
-from typing import Dict, Any, List
-import googlemaps
+from typing import Dict, Any, AsyncIterator, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -23,16 +26,70 @@ load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
 USE_REAL_API = os.getenv('MOCK_MODE', 'true').lower() == 'false'
 GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY')
 
+# Gercek API arama onbellegi ayarlari
+PLACES_CACHE_TTL_SECONDS = float(os.getenv('PLACES_CACHE_TTL_SECONDS', '600'))
+PLACES_CACHE_MAX_ENTRIES = int(os.getenv('PLACES_CACHE_MAX_ENTRIES', '2000'))
+PLACES_CACHE_GEOHASH_PRECISION = int(os.getenv('PLACES_CACHE_GEOHASH_PRECISION', '6'))
+
+# Mekan detay onbellegi - yumusak TTL sonrasi arka planda yenilenir, sert TTL'de silinir
+PLACE_DETAILS_SOFT_TTL_SECONDS = float(os.getenv('PLACE_DETAILS_SOFT_TTL_SECONDS', '3600'))
+PLACE_DETAILS_HARD_TTL_SECONDS = float(os.getenv('PLACE_DETAILS_HARD_TTL_SECONDS', '86400'))
+PLACE_DETAILS_CACHE_MAX_ENTRIES = int(os.getenv('PLACE_DETAILS_CACHE_MAX_ENTRIES', '5000'))
+
+# Sayfalama - Google next_page_token birkac saniye sonra gecerli olur, en fazla 3 sayfa (60 sonuc) verir
+PLACES_MAX_PAGES = int(os.getenv('PLACES_MAX_PAGES', '3'))
+PLACES_PAGE_TOKEN_DELAY_SECONDS = float(os.getenv('PLACES_PAGE_TOKEN_DELAY_SECONDS', '2.0'))
+PLACES_PAGE_TOKEN_RETRIES = int(os.getenv('PLACES_PAGE_TOKEN_RETRIES', '3'))
+
+# Toplu detay - ayni anda en fazla kac detay istegi, tek cagrida en fazla kac place_id
+PLACES_BATCH_CONCURRENCY = int(os.getenv('PLACES_BATCH_CONCURRENCY', '5'))
+PLACES_BATCH_MAX_IDS = int(os.getenv('PLACES_BATCH_MAX_IDS', '20'))
+
+# Yerel SQLite katalog - gercek API sonuclari buraya yazilir, kapsanan sorgular yerelden cevaplanir
+# (PLACES_CATALOG_DB_URL bos birakilirsa devre disi)
+PLACES_CATALOG_DB_URL = os.getenv(
+    'PLACES_CATALOG_DB_URL',
+    'sqlite:///' + os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'places_catalog.db'))
+)
+PLACES_CATALOG_COVERAGE_TTL_SECONDS = float(os.getenv('PLACES_CATALOG_COVERAGE_TTL_SECONDS', '86400'))
+
+# Cok kriterli siralama - gercek API'de siralanacak en az aday sayisi (bir Google sayfasi)
+PLACES_RANKING_CANDIDATES = int(os.getenv('PLACES_RANKING_CANDIDATES', '20'))
+
+# Autocomplete - gercek API tahminleri onek basina onbellekte tutulur
+PLACES_AUTOCOMPLETE_CACHE_MAX_ENTRIES = int(os.getenv('PLACES_AUTOCOMPLETE_CACHE_MAX_ENTRIES', '2000'))
+PLACES_AUTOCOMPLETE_MAX_RESULTS = 10
+
+# Mock katalog kaynagi - bos: tests/fixtures, *.json: JSON dosyasi, sqlite:///...: SQLite snapshot
+# Kaynak en fazla PLACES_CATALOG_RELOAD_SECONDS'de bir arka planda kontrol edilir (0 = yeniden yukleme yok)
+PLACES_CATALOG_SOURCE = os.getenv('PLACES_CATALOG_SOURCE', '')
+PLACES_CATALOG_RELOAD_SECONDS = float(os.getenv('PLACES_CATALOG_RELOAD_SECONDS', '30'))
+
+# Arama modlari: radius = yaricap icindeki her sey, knn = yaricaptan bagimsiz en yakin max_results mekan
+SEARCH_MODES = ("radius", "knn")
+
+# Alan projeksiyonu - her arac varsayilan olarak sadece konusma adiminin ihtiyac duydugu alanlari dondurur
+# Arama: aday listesi icin karsilastirma alanlari
+SEARCH_DEFAULT_FIELDS = ("place_id", "name", "place_type", "address", "location", "distance_km",
+                         "rating", "user_ratings_total", "price_level", "opening_hours", "ranking_score")
+# Tip/populer listeleri: kesif icin kisa ozet
+LIST_DEFAULT_FIELDS = ("place_id", "name", "place_type", "address", "location",
+                       "rating", "user_ratings_total", "ranking_score")
+# Detay: kullanici bir mekani sectiginde tum alanlar (None = hepsi)
+DETAILS_DEFAULT_FIELDS = None
+
 # Import clean fixtures from tests directory  
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
 try:
+    from tests.fixtures import mock_places_data as _mock_places_module
     from tests.fixtures.mock_places_data import get_all_mock_places
     logger.info("✅ Successfully imported clean fixtures from tests/fixtures/")
 except ImportError as e:
     logger.warning(f"❌ Could not import fixtures: {e}, using fallback")
+    _mock_places_module = None
     # Fallback to minimal mock data if fixtures fail
     def get_all_mock_places():
         return {
@@ -49,6 +106,101 @@ except ImportError as e:
             }
         }
 
+from .cache import StaleWhileRevalidateCache, TTLCache, single_flight
+from .catalog import (CatalogReloader, CatalogSource, CompactPlaceCatalog, FeedSource, InvalidAreaError,
+                      InvalidOpenAtError, JsonFileSource, PreparedArea, SQLitePlaceStore,
+                      SQLiteSnapshotSource, area_cache_stats, is_open_at, normalize_label, parse_open_at,
+                      prepare_area, week_minute, weekly_intervals)
+from .clients import GoogleMapsApiError, get_google_maps_client
+from .geodesy import geohash_encode, haversine_km, haversine_one_to_many
+from .ranking import RankingError, rank_places, ranking_profiles, resolve_weights, score_candidates, top_k
+
+# Mekan katalogu - ilk kullanimda kaynaktan kurulur, kaynak degisince yeni surum artimli yayinlanir
+_catalog_reloader = None
+
+def _catalog_source() -> CatalogSource:
+    """PLACES_CATALOG_SOURCE'a gore katalog kaynagi"""
+    if PLACES_CATALOG_SOURCE.startswith('sqlite:'):
+        return SQLiteSnapshotSource(SQLitePlaceStore(PLACES_CATALOG_SOURCE))
+    if PLACES_CATALOG_SOURCE:
+        return JsonFileSource(PLACES_CATALOG_SOURCE)
+    if _mock_places_module is not None:
+        # Fixture dosyasi degisince modul yeniden import edilir
+        return FeedSource(lambda: importlib.reload(_mock_places_module).get_all_mock_places(),
+                          watch_path=_mock_places_module.__file__, name="fixtures")
+    # Gomulu yedek veri surec boyunca degismez - sabit surum, arka plan kontrolu yuklemez
+    return FeedSource(get_all_mock_places, version=lambda: "fallback", name="fallback")
+
+def _get_catalog_reloader() -> CatalogReloader:
+    """Katalog yukleyicisini dondur, gerekirse olustur"""
+    global _catalog_reloader
+    if _catalog_reloader is None:
+        _catalog_reloader = CatalogReloader(_catalog_source(),
+                                            check_interval_seconds=PLACES_CATALOG_RELOAD_SECONDS)
+    return _catalog_reloader
+
+def _get_place_catalog() -> CompactPlaceCatalog:
+    """
+    Yayindaki katalog surumunu dondur, gerekirse ilk surumu kur
+    
+    Kontrol suresi geldiyse kaynak arka planda kontrol edilir; cagri
+    beklemez ve o ana kadar yayindaki surumu alir.
+    """
+    reloader = _get_catalog_reloader()
+    catalog = reloader.current.catalog
+    reloader.maybe_reload_in_background()
+    return catalog
+
+async def reload_place_catalog() -> Dict[str, Any]:
+    """Katalog kaynagini hemen kontrol et, degistiyse yeni surumu yayinla"""
+    return await _get_catalog_reloader().reload()
+
+# Google Places arama yanitlari - anahtar konum geohash hucresiyle kuantize edilir
+_places_search_cache = TTLCache(max_entries=PLACES_CACHE_MAX_ENTRIES,
+                                ttl_seconds=PLACES_CACHE_TTL_SECONDS)
+
+# Google Place Details yanitlari - place_id ile anahtarlanir
+_place_details_cache = StaleWhileRevalidateCache(
+    soft_ttl_seconds=PLACE_DETAILS_SOFT_TTL_SECONDS,
+    hard_ttl_seconds=PLACE_DETAILS_HARD_TTL_SECONDS,
+    max_entries=PLACE_DETAILS_CACHE_MAX_ENTRIES
+)
+
+# Google Place Autocomplete tahminleri - normalize onek ve limit ile anahtarlanir
+_autocomplete_cache = TTLCache(max_entries=PLACES_AUTOCOMPLETE_CACHE_MAX_ENTRIES,
+                               ttl_seconds=PLACES_CACHE_TTL_SECONDS)
+
+def get_places_cache_stats() -> Dict[str, Any]:
+    """Arama ve detay onbellegi isabet/iska istatistikleri"""
+    stats = _places_search_cache.stats()
+    stats["place_details"] = _place_details_cache.stats()
+    stats["areas"] = area_cache_stats()
+    stats["autocomplete"] = _autocomplete_cache.stats()
+    stats["catalog"] = _get_catalog_reloader().stats()
+    return stats
+
+# Yerel SQLite katalog - ilk kullanimda acilir, acilamazsa None kalir ve upstream kullanilir
+_place_store = None
+_place_store_unavailable = False
+
+def _get_place_store() -> Optional[SQLitePlaceStore]:
+    """Yerel mekan katalogunu dondur, gerekirse ac"""
+    global _place_store, _place_store_unavailable
+    if _place_store is None and not _place_store_unavailable and PLACES_CATALOG_DB_URL:
+        try:
+            if PLACES_CATALOG_DB_URL.startswith('sqlite:///'):
+                os.makedirs(os.path.dirname(PLACES_CATALOG_DB_URL[len('sqlite:///'):]) or '.', exist_ok=True)
+            _place_store = SQLitePlaceStore(PLACES_CATALOG_DB_URL)
+            logger.info(f"Local place store opened: {PLACES_CATALOG_DB_URL}")
+        except Exception as error:
+            _place_store_unavailable = True
+            logger.warning(f"Local place store unavailable, using upstream only: {error}")
+    return _place_store
+
+def _is_cacheable_result(result: Dict[str, Any]) -> bool:
+    """Sadece basarili yanitlar onbellege yazilir"""
+    return result.get("status") == "success"
+
 # MCP Tool Decorator
 def mcp_tool(name: str, description: str, parameters: dict = {}):
     """MCP tool decorator - enhanced version"""
@@ -77,7 +229,21 @@ def mcp_tool(name: str, description: str, parameters: dict = {}):
             "description": "Place type filter"
         },
         "radius": {"type": "number", "default": 5.0, "description": "Search radius in km"},
-        "max_results": {"type": "integer", "default": 10, "description": "Maximum number of results"}
+        "max_results": {"type": "integer", "default": 10, "description": "Maximum number of results"},
+        "fields": {"type": "array", "items": {"type": "string"}, "description": "Place fields to return (default: summary fields, ['all'] for every field)"},
+        "mode": {
+            "type": "string",
+            "enum": ["radius", "knn"],
+            "default": "radius",
+            "description": "radius: places within radius, knn: max_results nearest places regardless of radius"
+        },
+        "ranking": {
+            "type": "string",
+            "enum": ["default", "first_time_visitor", "food_explorer", "budget_traveler", "family_with_kids", "business_traveler"],
+            "description": "Rank by weighted distance, rating, popularity, price and open-now (profile per scenario) instead of distance only"
+        },
+        "ranking_weights": {"type": "object", "description": "Per-criterion weight overrides (distance, rating, popularity, price, open_now)"},
+        "open_at": {"type": "string", "description": "Only places open at this Sydney time: 'now', 'HH:MM', '<day> HH:MM' or ISO 8601 datetime"}
     }
 )
 async def search_places(query: str = "", 
@@ -85,20 +251,71 @@ async def search_places(query: str = "",
                        lng: float = 151.2093,
                        place_type: str = "all",
                        radius: float = 5.0,
-                       max_results: int = 10) -> Dict[str, Any]:
+                       max_results: int = 10,
+                       fields: Optional[List[str]] = None,
+                       mode: str = "radius",
+                       ranking: Optional[str] = None,
+                       ranking_weights: Optional[Dict[str, float]] = None,
+                       open_at: Optional[str] = None) -> Dict[str, Any]:
     """
     Sydney'de mekan arama (mock veya gercek API)
     
+    Args:
+        fields: Dondurulecek mekan alanlari (None = SEARCH_DEFAULT_FIELDS, ["all"] = hepsi)
+        mode: "radius" (yaricap icindekiler) veya "knn" (yaricap yok sayilir, en yakin max_results)
+        ranking: Siralama profili ("default" veya senaryo adi) - None ise mesafeye gore
+        ranking_weights: Profil agirliklarinin ustune yazilan kriter agirliklari
+        open_at: Sadece bu anda acik oldugu bilinen mekanlar ("now", "21:00", "fri 21:00", ISO 8601)
+    
     Returns:
         Dict: Arama sonuclari ve metadata
     """
     try:
+        if mode not in SEARCH_MODES:
+            return {
+                "status": "error",
+                "message": f"Unknown search mode: {mode} (expected one of {', '.join(SEARCH_MODES)})",
+                "error_code": "INVALID_MODE",
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        weights, error = _resolve_ranking(ranking, ranking_weights)
+        if error:
+            return error
+        
+        open_moment = None
+        if open_at is not None:
+            try:
+                open_moment = parse_open_at(open_at)
+            except InvalidOpenAtError as error:
+                return {
+                    "status": "error",
+                    "message": str(error),
+                    "error_code": "INVALID_OPEN_AT",
+                    "timestamp": datetime.now().isoformat()
+                }
+        
         if USE_REAL_API and GOOGLE_MAPS_API_KEY:
-            # Gercek Google Places API kullan
-            return await _search_places_real_api(query, lat, lng, place_type, radius, max_results)
+            # Gercek Google Places API kullan (onbellek ve yerel katalog uzerinden)
+            if weights is None and open_moment is None:
+                result = await _search_places_cached(query, lat, lng, place_type, radius, max_results, mode)
+            else:
+                # Siralama/saat filtresi icin en az bir sayfalik aday havuzu istenir, sonra en iyi max_results secilir
+                pool_size = max(max_results, PLACES_RANKING_CANDIDATES)
+                result = await _search_places_cached(query, lat, lng, place_type, radius, pool_size, mode)
+                if open_moment is not None:
+                    # Saati eksik mekanlar yerel katalogdan okunur - event loop bloklanmaz
+                    result = await asyncio.to_thread(_filter_open_at_result, result, open_moment, pool_size)
+                if weights is not None:
+                    result = _rank_places_result(result, ranking, weights, max_results)
+                elif result.get("status") == "success":
+                    result = dict(result, data=dict(result["data"], places=result["data"]["places"][:max_results]))
         else:
             # Mock data kullan
-            return await _search_places_mock_data(query, lat, lng, place_type, radius, max_results)
+            result = await _search_places_mock_data(query, lat, lng, place_type, radius, max_results, mode,
+                                                    ranking, weights, open_moment)
+        
+        return _project_places_result(result, _resolve_fields(fields, SEARCH_DEFAULT_FIELDS))
         
     except Exception as error:
         return {
@@ -108,30 +325,103 @@ async def search_places(query: str = "",
             "timestamp": datetime.now().isoformat()
         }
 
+@mcp_tool(
+    name="search_places_in_area",
+    description="Search places inside a bounding box or GeoJSON polygon (e.g. a neighbourhood), best rated first",
+    parameters={
+        "query": {"type": "string", "default": "", "description": "Search query"},
+        "bbox": {"type": "array", "items": {"type": "number"}, "description": "Bounding box [min_lng, min_lat, max_lng, max_lat]"},
+        "polygon": {"type": "object", "description": "GeoJSON Polygon/MultiPolygon geometry or Feature ([lng, lat] positions); used instead of bbox when given"},
+        "place_type": {
+            "type": "string",
+            "enum": ["all", "restaurant", "tourist_attraction", "shopping_mall", "museum", "park", "transport"],
+            "default": "all",
+            "description": "Place type filter"
+        },
+        "max_results": {"type": "integer", "default": 10, "description": "Maximum number of results"},
+        "fields": {"type": "array", "items": {"type": "string"}, "description": "Place fields to return (default: summary fields, ['all'] for every field)"}
+    }
+)
+async def search_places_in_area(query: str = "",
+                                bbox: Optional[List[float]] = None,
+                                polygon: Optional[Dict[str, Any]] = None,
+                                place_type: str = "all",
+                                max_results: int = 10,
+                                fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Bbox veya GeoJSON poligon icindeki mekanlar (mock veya gercek API)
+    
+    Args:
+        bbox: [min_lng, min_lat, max_lng, max_lat]
+        polygon: GeoJSON Polygon/MultiPolygon (veya Feature) - verilirse bbox yok sayilir
+        fields: Dondurulecek mekan alanlari (None = SEARCH_DEFAULT_FIELDS, ["all"] = hepsi)
+    
+    Returns:
+        Dict: Alan icindeki mekanlar (rating'e gore azalan) ve metadata
+    """
+    try:
+        try:
+            area = prepare_area(bbox, polygon)
+        except InvalidAreaError as error:
+            return {
+                "status": "error",
+                "message": f"Invalid area: {str(error)}",
+                "error_code": "INVALID_AREA",
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        if USE_REAL_API and GOOGLE_MAPS_API_KEY:
+            # Alani kapsayan daire ile (onbellekli) gercek arama, sonra poligon filtresi
+            result = await _search_places_in_area_real_api(query, area, place_type, max_results)
+        else:
+            # Mock data kullan
+            result = await _search_places_in_area_mock_data(query, area, place_type, max_results)
+        
+        return _project_places_result(result, _resolve_fields(fields, SEARCH_DEFAULT_FIELDS))
+        
+    except Exception as error:
+        return {
+            "status": "error",
+            "message": f"Area search failed: {str(error)}",
+            "error_code": "AREA_SEARCH_ERROR",
+            "timestamp": datetime.now().isoformat()
+        }
+
 @mcp_tool(
     name="get_place_details",
     description="Get detailed information for a specific place",
     parameters={
-        "place_id": {"type": "string", "description": "Place ID (example: place_001)"}
+        "place_id": {"type": "string", "description": "Place ID (example: place_001)"},
+        "fields": {"type": "array", "items": {"type": "string"}, "description": "Place fields to return (default: all fields, ['all'] for every field)"}
     }
 )
-async def get_place_details(place_id: str) -> Dict[str, Any]:
+async def get_place_details(place_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     Belirli bir mekanin detaylarini al
     
     Args:
         place_id: Mekan ID'si
+        fields: Dondurulecek mekan alanlari (None = tum alanlar)
         
     Returns:
         Dict: Mekan detaylari
     """
     try:
         if USE_REAL_API and GOOGLE_MAPS_API_KEY:
-            # Gercek Google Places API kullan
-            return await _get_place_details_real_api(place_id)
+            # Gercek Google Places API kullan - eskimis detay aninda doner, arka planda yenilenir
+            result = await _place_details_cache.get_or_fetch(
+                place_id,
+                lambda: _get_place_details_real_api(place_id),
+                should_cache=_is_cacheable_result
+            )
         else:
             # Mock data kullan
-            return await _get_place_details_mock_data(place_id)
+            result = await _get_place_details_mock_data(place_id)
+        
+        projected_fields = _resolve_fields(fields, DETAILS_DEFAULT_FIELDS)
+        if projected_fields is None or result.get("status") != "success":
+            return result
+        return dict(result, data=_project_place(result["data"], projected_fields))
         
     except Exception as error:
         return {
@@ -141,6 +431,91 @@ async def get_place_details(place_id: str) -> Dict[str, Any]:
             "timestamp": datetime.now().isoformat()
         }
 
+@mcp_tool(
+    name="get_places_details_batch",
+    description="Get detailed information for several places in one call",
+    parameters={
+        "place_ids": {"type": "array", "items": {"type": "string"}, "description": "Place ID list (example: ['place_001', 'place_002'])"},
+        "fields": {"type": "array", "items": {"type": "string"}, "description": "Place fields to return (default: all fields, ['all'] for every field)"}
+    }
+)
+async def get_places_details_batch(place_ids: List[str], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Birden fazla mekanin detaylarini tek cagrida al
+    
+    Detaylar semaphore ile sinirli eszamanlilikla paralel cekilir; bir
+    mekanin hatasi digerlerini etkilemez, her place_id kendi durumunu tasir.
+    
+    Args:
+        place_ids: Mekan ID listesi (tekrarlar bir kez cekilir)
+        fields: Her mekan icin dondurulecek alanlar (None = tum alanlar)
+        
+    Returns:
+        Dict: place_id basina durum ve detaylar
+    """
+    try:
+        # Sirayi koruyarak tekrarlari at
+        unique_ids = list(dict.fromkeys(place_ids))
+        
+        if not unique_ids:
+            return {
+                "status": "error",
+                "message": "place_ids must contain at least one place ID",
+                "error_code": "INVALID_BATCH",
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        if len(unique_ids) > PLACES_BATCH_MAX_IDS:
+            return {
+                "status": "error",
+                "message": f"Too many place IDs: {len(unique_ids)} (max {PLACES_BATCH_MAX_IDS})",
+                "error_code": "INVALID_BATCH",
+                "timestamp": datetime.now().isoformat()
+            }
+        
+        semaphore = asyncio.Semaphore(PLACES_BATCH_CONCURRENCY)
+        
+        async def fetch_one(place_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                detail = await get_place_details(place_id, fields)
+            
+            if detail.get("status") == "success":
+                return {"place_id": place_id, "status": "success", "data": detail["data"]}
+            return {
+                "place_id": place_id,
+                "status": "error",
+                "message": detail.get("message", "Unknown error"),
+                "error_code": detail.get("error_code", "DETAIL_ERROR")
+            }
+        
+        results = await asyncio.gather(*(fetch_one(place_id) for place_id in unique_ids))
+        succeeded = sum(1 for result in results if result["status"] == "success")
+        
+        response = {
+            "status": "success",
+            "data": {
+                "results": results,
+                "requested": len(unique_ids),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+                "timestamp": datetime.now().isoformat()
+            }
+        }
+        
+        # Hicbiri alinamadiysa tum cagri hata sayilir - sonuclar yine de dondurulur
+        if not succeeded:
+            response.update(status="error", message="No place details could be retrieved",
+                            error_code="BATCH_DETAIL_ERROR")
+        return response
+        
+    except Exception as error:
+        return {
+            "status": "error",
+            "message": f"Failed to get place details batch: {str(error)}",
+            "error_code": "BATCH_DETAIL_ERROR",
+            "timestamp": datetime.now().isoformat()
+        }
+
 @mcp_tool(
     name="get_places_by_type",
     description="List places of specific type",
@@ -150,27 +525,50 @@ async def get_place_details(place_id: str) -> Dict[str, Any]:
             "enum": ["restaurant", "tourist_attraction", "shopping_mall", "museum", "park", "transport"],
             "description": "Place type"
         },
-        "limit": {"type": "integer", "default": 10, "description": "Maximum number of results"}
+        "limit": {"type": "integer", "default": 10, "description": "Maximum number of results"},
+        "fields": {"type": "array", "items": {"type": "string"}, "description": "Place fields to return (default: summary fields, ['all'] for every field)"},
+        "ranking": {
+            "type": "string",
+            "enum": ["default", "first_time_visitor", "food_explorer", "budget_traveler", "family_with_kids", "business_traveler"],
+            "description": "Rank by weighted rating, popularity, price and open-now (profile per scenario) instead of rating only"
+        },
+        "ranking_weights": {"type": "object", "description": "Per-criterion weight overrides (rating, popularity, price, open_now)"}
     }
 )
-async def get_places_by_type(place_type: str, limit: int = 10) -> Dict[str, Any]:
+async def get_places_by_type(place_type: str, limit: int = 10,
+                             fields: Optional[List[str]] = None,
+                             ranking: Optional[str] = None,
+                             ranking_weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
     """
     Tip bazinda mekan listesi - NOW WITH PROPER USE_REAL_API LOGIC
     
     Args:
         place_type: Mekan tipi
         limit: Maksimum sonuc sayisi
+        fields: Dondurulecek mekan alanlari (None = LIST_DEFAULT_FIELDS, ["all"] = hepsi)
+        ranking: Siralama profili ("default" veya senaryo adi) - None ise rating'e gore
+        ranking_weights: Profil agirliklarinin ustune yazilan kriter agirliklari
         
     Returns:
         Dict: Mekan listesi
     """
     try:
+        weights, error = _resolve_ranking(ranking, ranking_weights)
+        if error:
+            return error
+        
         if USE_REAL_API and GOOGLE_MAPS_API_KEY:
-            # Gercek Google Places API kullan
-            return await _get_places_by_type_real_api(place_type, limit)
+            # Yerel katalog, kapsanmadiysa gercek Google Places API
+            if weights is None:
+                result = await _get_places_by_type_local_first(place_type, limit)
+            else:
+                result = await _get_places_by_type_local_first(place_type, max(limit, PLACES_RANKING_CANDIDATES))
+                result = _rank_places_result(result, ranking, weights, limit)
         else:
             # Mock data kullan
-            return await _get_places_by_type_mock_data(place_type, limit)
+            result = await _get_places_by_type_mock_data(place_type, limit, ranking, weights)
+        
+        return _project_places_result(result, _resolve_fields(fields, LIST_DEFAULT_FIELDS))
         
     except Exception as error:
         return {
@@ -184,26 +582,30 @@ async def get_places_by_type(place_type: str, limit: int = 10) -> Dict[str, Any]
     name="get_popular_places",
     description="Get most popular places by rating",
     parameters={
-        "limit": {"type": "integer", "default": 5, "description": "Maximum number of results"}
+        "limit": {"type": "integer", "default": 5, "description": "Maximum number of results"},
+        "fields": {"type": "array", "items": {"type": "string"}, "description": "Place fields to return (default: summary fields, ['all'] for every field)"}
     }
 )
-async def get_popular_places(limit: int = 5) -> Dict[str, Any]:
+async def get_popular_places(limit: int = 5, fields: Optional[List[str]] = None) -> Dict[str, Any]:
     """
     En populer mekanları al - NOW WITH PROPER USE_REAL_API LOGIC
     
     Args:
         limit: Maksimum sonuc sayisi
+        fields: Dondurulecek mekan alanlari (None = LIST_DEFAULT_FIELDS, ["all"] = hepsi)
         
     Returns:
         Dict: Populer mekanlar
     """
     try:
         if USE_REAL_API and GOOGLE_MAPS_API_KEY:
-            # Gercek Google Places API kullan
-            return await _get_popular_places_real_api(limit)
+            # Yerel katalog, kapsanmadiysa gercek Google Places API
+            result = await _get_popular_places_local_first(limit)
         else:
             # Mock data kullan
-            return await _get_popular_places_mock_data(limit)
+            result = await _get_popular_places_mock_data(limit)
+        
+        return _project_places_result(result, _resolve_fields(fields, LIST_DEFAULT_FIELDS))
         
     except Exception as error:
         return {
@@ -213,60 +615,146 @@ async def get_popular_places(limit: int = 5) -> Dict[str, Any]:
             "timestamp": datetime.now().isoformat()
         }
 
+@mcp_tool(
+    name="autocomplete_places",
+    description="Autocomplete place names and suburbs from a typed prefix, most popular first",
+    parameters={
+        "prefix": {"type": "string", "description": "What the user has typed so far (e.g. 'opera h', 'surry')"},
+        "limit": {"type": "integer", "default": 5, "description": "Maximum number of suggestions (max 10)"}
+    }
+)
+async def autocomplete_places(prefix: str, limit: int = 5) -> Dict[str, Any]:
+    """
+    Yazilan oneke uyan mekan ve semt onerileri (mock veya gercek API)
+    
+    Args:
+        prefix: Kullanicinin o ana kadar yazdigi metin (kelime basindan eslesir)
+        limit: Maksimum oneri sayisi (en fazla PLACES_AUTOCOMPLETE_MAX_RESULTS)
+        
+    Returns:
+        Dict: Populerlige gore sirali oneriler
+    """
+    try:
+        limit = max(1, min(limit, PLACES_AUTOCOMPLETE_MAX_RESULTS))
+        if not normalize_label(prefix):
+            return {
+                "status": "success",
+                "data": {
+                    "prefix": prefix,
+                    "suggestions": [],
+                    "timestamp": datetime.now().isoformat(),
+                    "source": "empty_prefix"
+                }
+            }
+        
+        if USE_REAL_API and GOOGLE_MAPS_API_KEY:
+            # Gercek Google Place Autocomplete (onek onbellegi uzerinden)
+            return await _autocomplete_places_cached(prefix, limit)
+        # Mock data kullan
+        return await _autocomplete_places_mock_data(prefix, limit)
+        
+    except Exception as error:
+        return {
+            "status": "error",
+            "message": f"Autocomplete failed: {str(error)}",
+            "error_code": "AUTOCOMPLETE_ERROR",
+            "timestamp": datetime.now().isoformat()
+        }
+
 # =====================================
 # MOCK DATA IMPLEMENTATIONS - Using Clean Fixtures
 # =====================================
 
 async def _search_places_mock_data(query: str, lat: float, lng: float, 
-                                  place_type: str, radius: float, max_results: int) -> Dict[str, Any]:
+                                  place_type: str, radius: float, max_results: int,
+                                  mode: str = "radius", ranking: Optional[str] = None,
+                                  weights: Optional[Dict[str, float]] = None,
+                                  open_moment: Optional[datetime] = None) -> Dict[str, Any]:
     """Mock data ile mekan arama - using clean fixtures"""
-    matching_places = []
-    
-    # Get clean fixtures data
-    all_places = get_all_mock_places()
-    
-    # Tum mekanları tara
-    for place_id, place_data in all_places.items():
-        place_matches = True
-        
-        # Tip filtresi kontrolu
-        if place_type != "all" and place_data.get("place_type") != place_type:
-            place_matches = False
-        
-        # Sorgu filtresi kontrolu
-        if query and place_matches:
-            query_lower = query.lower()
-            if not (query_lower in place_data.get("name", "").lower() or 
-                   query_lower in place_data.get("description", "").lower()):
-                place_matches = False
-        
-        # Mesafe filtresi kontrolu
-        if place_matches:
-            distance = _calculate_distance(
-                lat, lng, place_data.get("lat", 0), place_data.get("lng", 0)
-            )
-            if distance <= radius:
-                # Mesafe bilgisini ekle
-                place_data_with_distance = place_data.copy()
-                place_data_with_distance["distance_km"] = round(distance, 2)
-                matching_places.append(place_data_with_distance)
+    catalog = _get_place_catalog()
+    # Saat filtresi katalogdaki haftalik program araliklarindan vektorel okunur
+    open_minute = week_minute(open_moment) if open_moment is not None else None
     
-    # Mesafeye gore sirala
-    matching_places.sort(key=lambda x: x.get("distance_km", 0))
+    def find_rows(text_rows: Optional[Set[int]] = None):
+        if mode == "knn":
+            # Grid halkalari yakindan uzaga gezilir - sonuc zaten mesafeye gore sirali
+            return catalog.nearest_rows(lat, lng, max_results, query, place_type, text_rows, open_minute)
+        # Sorgu, tip ve yaricap filtreleri katalog indekslerinden cevaplanir (sozluk uretmeden)
+        return catalog.search_rows(lat, lng, radius, query, place_type, text_rows, open_minute)
     
-    # Maksimum sonuc sayisini uygula
-    limited_places = matching_places[:max_results]
+    rows, distances = find_rows()
+    match = "exact"
+    if query and rows.size == 0:
+        # Tam eslesme yoksa yazim hatasi olabilir - trigram adaylari edit mesafesiyle elenir,
+        # tumu yaricap/tip filtresine girer (max_results ancak filtreden sonra uygulanir)
+        fuzzy_rows = catalog.fuzzy_rows(query)
+        if fuzzy_rows:
+            rows, distances = find_rows(set(fuzzy_rows))
+            match = "fuzzy"
     
-    return {
+    if mode == "knn":
+        nearest = list(zip(distances.tolist(), rows.tolist()))
+    else:
+        # En yakin max_results satiri heap ile sec (tum listeyi siralamadan)
+        nearest = heapq.nsmallest(max_results, zip(distances.tolist(), rows.tolist()))
+    
+    scores = None
+    if weights is not None:
+        # Tum adaylar sutunlardan vektorel puanlanir, en iyi max_results argpartition ile secilir
+        scores = score_candidates(weights, distances_km=distances,
+                                  distance_scale_km=radius / 2 if mode == "radius" else None,
+                                  **catalog.ranking_columns(rows))
+        selected = top_k(scores, max_results)
+        nearest = list(zip(distances[selected].tolist(), rows[selected].tolist(), scores[selected].tolist()))
+    
+    # Sadece donen satirlar icin sozluk uret ve mesafe bilgisini ekle
+    limited_places = []
+    for distance, row, *score in nearest:
+        place_data = catalog.materialize(row)
+        place_data["distance_km"] = round(distance, 2)
+        if score:
+            place_data["ranking_score"] = round(score[0], 4)
+        limited_places.append(place_data)
+    
+    result = {
         "status": "success",
         "data": {
             "places": limited_places,
-            "total_found": len(matching_places),
+            "total_found": int(rows.size),
             "search_params": {
                 "query": query,
                 "location": {"lat": lat, "lng": lng},
                 "place_type": place_type,
                 "radius_km": radius,
+                "max_results": max_results,
+                "mode": mode,
+                "match": match
+            },
+            "timestamp": datetime.now().isoformat(),
+            "source": "clean_fixtures"
+        }
+    }
+    if weights is not None:
+        result["data"]["ranking"] = _ranking_info(ranking, weights)
+    if open_moment is not None:
+        result["data"]["search_params"]["open_at"] = open_moment.isoformat()
+    return result
+
+async def _search_places_in_area_mock_data(query: str, area: PreparedArea,
+                                           place_type: str, max_results: int) -> Dict[str, Any]:
+    """Mock data ile alan aramasi - grid kutu adaylari + vektorel poligon testi"""
+    catalog = _get_place_catalog()
+    rows = catalog.area_rows(area, query, place_type)
+    
+    return {
+        "status": "success",
+        "data": {
+            "places": [catalog.materialize(row) for row in rows[:max_results].tolist()],
+            "total_found": int(rows.size),
+            "search_params": {
+                "query": query,
+                "area": area.describe(),
+                "place_type": place_type,
                 "max_results": max_results
             },
             "timestamp": datetime.now().isoformat(),
@@ -277,10 +765,9 @@ async def _search_places_mock_data(query: str, lat: float, lng: float,
 async def _get_place_details_mock_data(place_id: str) -> Dict[str, Any]:
     """Mock data'dan mekan detayları - using clean fixtures"""
     try:
-        all_places = get_all_mock_places()
+        place_data = _get_place_catalog().get_place(place_id)
         
-        if place_id in all_places:
-            place_data = all_places[place_id]
+        if place_data is not None:
             return {
                 "status": "success", 
                 "data": place_data,
@@ -303,33 +790,39 @@ async def _get_place_details_mock_data(place_id: str) -> Dict[str, Any]:
             "timestamp": datetime.now().isoformat()
         }
 
-async def _get_places_by_type_mock_data(place_type: str, limit: int) -> Dict[str, Any]:
+async def _get_places_by_type_mock_data(place_type: str, limit: int, ranking: Optional[str] = None,
+                                        weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
     """Mock data'dan tip bazinda mekan listesi - using clean fixtures"""
     try:
-        all_places = get_all_mock_places()
-        type_places = []
+        catalog = _get_place_catalog()
         
-        for place_id, place_data in all_places.items():
-            if place_data.get("place_type") == place_type:
-                type_places.append(place_data.copy())
-        
-        # Rating'e gore sirala (yuksekten dusuge)
-        type_places.sort(key=lambda x: x.get("rating", 0), reverse=True)
-        
-        # Limit uygula
-        limited_places = type_places[:limit]
+        if weights is None:
+            # Tip sirasi rating'e gore hazir - sadece ilk limit satir sozluge cevrilir
+            limited_places = catalog.top_rated(place_type, limit)
+        else:
+            # Referans nokta yok - mesafe disindaki kriterlerle puanla
+            rows = catalog.type_rows(place_type)
+            scores = score_candidates(weights, **catalog.ranking_columns(rows))
+            limited_places = []
+            for index in top_k(scores, limit).tolist():
+                place_data = catalog.materialize(int(rows[index]))
+                place_data["ranking_score"] = round(float(scores[index]), 4)
+                limited_places.append(place_data)
         
-        return {
+        result = {
             "status": "success",
             "data": {
                 "places": limited_places,
                 "place_type": place_type,
-                "total_found": len(type_places),
+                "total_found": catalog.count_by_type(place_type),
                 "limit": limit,
                 "timestamp": datetime.now().isoformat(),
                 "source": "clean_fixtures"
             }
         }
+        if weights is not None:
+            result["data"]["ranking"] = _ranking_info(ranking, weights)
+        return result
         
     except Exception as error:
         return {
@@ -342,14 +835,8 @@ async def _get_places_by_type_mock_data(place_type: str, limit: int) -> Dict[str
 async def _get_popular_places_mock_data(limit: int) -> Dict[str, Any]:
     """Mock data'dan populer mekanlar - using clean fixtures"""
     try:
-        all_places = get_all_mock_places()
-        places_list = list(all_places.values())
-        
-        # Rating'e gore sirala (yuksekten dusuge)
-        popular_places = sorted(places_list, key=lambda x: x.get("rating", 0), reverse=True)
-        
-        # Limit uygula
-        top_places = popular_places[:limit]
+        # Genel liste rating'e gore hazir sirali - sadece limit satir sozluge cevrilir
+        top_places = _get_place_catalog().top_rated(None, limit)
         
         return {
             "status": "success",
@@ -370,71 +857,362 @@ async def _get_popular_places_mock_data(limit: int) -> Dict[str, Any]:
             "timestamp": datetime.now().isoformat()
         }
 
+async def _autocomplete_places_mock_data(prefix: str, limit: int) -> Dict[str, Any]:
+    """Katalog onek indeksinden oneriler - using clean fixtures"""
+    return {
+        "status": "success",
+        "data": {
+            "prefix": prefix,
+            "suggestions": _get_place_catalog().prefix_index().complete(prefix, limit),
+            "timestamp": datetime.now().isoformat(),
+            "source": "clean_fixtures"
+        }
+    }
+
 # =====================================
 # REAL API IMPLEMENTATIONS - Google Places API
 # =====================================
 
-async def _search_places_real_api(query: str, lat: float, lng: float,
-                                 place_type: str, radius: float, max_results: int) -> Dict[str, Any]:
-    """Gercek Google Places API ile mekan arama"""
+async def _search_places_cached(query: str, lat: float, lng: float,
+                                place_type: str, radius: float, max_results: int,
+                                mode: str = "radius") -> Dict[str, Any]:
+    """Yakin konumlardan gelen ayni aramalari onbellekten cevapla"""
+    cache_key = (
+        query.strip().lower(),
+        place_type,
+        round(radius, 3) if mode == "radius" else None,
+        max_results,
+        geohash_encode(lat, lng, PLACES_CACHE_GEOHASH_PRECISION),
+        mode
+    )
+    
+    cached_result = _places_search_cache.get(cache_key)
+    if cached_result is not None:
+        logger.info(f"Places search cache hit: {cache_key}")
+        return _relocate_search_result(cached_result, lat, lng)
+    
+    coverage_key = "search|" + "|".join(str(part) for part in cache_key)
+    
+    # Yerel katalog yaricap sorgusu yapar - knn her zaman upstream'e gider (sonuc yine yazilir)
+    result = None
+    if mode == "radius":
+        result = await _search_places_local(coverage_key, query, lat, lng, place_type, radius, max_results)
+    
+    if result is None:
+        result = await _search_places_real_api(query, lat, lng, place_type, radius, max_results, mode)
+        if _is_cacheable_result(result):
+            await _record_coverage(coverage_key, max_results, result["data"]["places"])
+    
+    # Sadece basarili yanitlari sakla
+    if _is_cacheable_result(result):
+        _places_search_cache.set(cache_key, result)
+    return result
+
+async def _search_places_in_area_real_api(query: str, area: PreparedArea,
+                                          place_type: str, max_results: int) -> Dict[str, Any]:
+    """
+    Google'da poligon aramasi yok - alani kapsayan daire ile aranir, sonuc poligonla suzulur
+    
+    Daire aramasi normal arama onbellegi/yerel katalog yolundan gecer; filtre
+    sonrasi max_results'u doldurabilmek icin tum sayfalar istenir.
+    """
+    center_lat, center_lng = area.center
+    # Google Places yaricap ust siniri 50km
+    radius = min(area.enclosing_radius_km(), 50.0)
+    result = await _search_places_cached(query, center_lat, center_lng, place_type, radius,
+                                         max(max_results, PLACES_MAX_PAGES * 20))
+    if result.get("status") != "success":
+        return result
+    
+    candidates = result["data"]["places"]
+    inside = area.contains(
+        [place.get("location", {}).get("lat", 0) for place in candidates],
+        [place.get("location", {}).get("lng", 0) for place in candidates]
+    )
+    places = [place for place, is_inside in zip(candidates, inside.tolist()) if is_inside]
+    places.sort(key=lambda place: place.get("rating") or 0, reverse=True)
+    
+    return {
+        "status": "success",
+        "data": {
+            "places": places[:max_results],
+            "total_found": len(places),
+            "search_params": {
+                "query": query,
+                "area": area.describe(),
+                "place_type": place_type,
+                "max_results": max_results
+            },
+            "timestamp": datetime.now().isoformat(),
+            "source": result["data"].get("source", "google_places_api")
+        }
+    }
+
+async def _record_coverage(coverage_key: str, requested: int, places: List[Dict[str, Any]]) -> None:
+    """
+    Upstream sonucunu yerel kataloga yaz - hata yaniti bozmaz
+    
+    SQLite yazimi is parcaciginda yapilir; katalog okumalari ve yazimlari
+    event loop'u bloklamaz (GTFS ingest ve katalog yenilemesindeki gibi).
+    """
+    store = _get_place_store()
+    if store is None:
+        return
+    try:
+        await asyncio.to_thread(store.record_coverage, coverage_key, requested, places)
+    except Exception as error:
+        logger.warning(f"Local place store write failed: {error}")
+
+async def _local_store_for(coverage_key: str, requested: int) -> Optional[SQLitePlaceStore]:
+    """Sorgu yerel katalogda kapsandiysa store'u dondur"""
+    store = _get_place_store()
+    if store is None:
+        return None
     try:
-        gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
+        if await asyncio.to_thread(store.is_covered, coverage_key, requested,
+                                   PLACES_CATALOG_COVERAGE_TTL_SECONDS):
+            return store
+    except Exception as error:
+        logger.warning(f"Local place store read failed: {error}")
+    return None
+
+async def _search_places_local(coverage_key: str, query: str, lat: float, lng: float,
+                               place_type: str, radius: float, max_results: int) -> Optional[Dict[str, Any]]:
+    """Kapsanan aramayi yerel katalogdan cevapla - kapsanmadiysa None"""
+    store = await _local_store_for(coverage_key, max_results)
+    if store is None:
+        return None
+    
+    matches = await asyncio.to_thread(store.search, lat, lng, radius, query,
+                                      _convert_place_type_to_google_format(place_type), coverage_key)
+    places = []
+    for place_data, distance in matches[:max_results]:
+        place_data["distance_km"] = round(distance, 2)
+        places.append(place_data)
+    
+    return {
+        "status": "success",
+        "data": {
+            "places": places,
+            "total_found": len(matches),
+            "search_params": {
+                "query": query,
+                "location": {"lat": lat, "lng": lng},
+                "place_type": place_type,
+                "radius_km": radius,
+                "max_results": max_results
+            },
+            "timestamp": datetime.now().isoformat(),
+            "source": "local_catalog"
+        }
+    }
+
+async def _get_places_by_type_local_first(place_type: str, limit: int) -> Dict[str, Any]:
+    """Tip listesini yerel katalogdan ver, kapsanmadiysa upstream'e git ve yaz"""
+    coverage_key = f"type|{place_type}"
+    store = await _local_store_for(coverage_key, limit)
+    
+    if store is None:
+        result = await _get_places_by_type_real_api(place_type, limit)
+        if _is_cacheable_result(result):
+            await _record_coverage(coverage_key, limit, result["data"]["places"])
+        return result
+    
+    google_type = _convert_place_type_to_google_format(place_type)
+    places = await asyncio.to_thread(store.top_rated, google_type, limit)
+    total_found = await asyncio.to_thread(store.count, google_type)
+    return {
+        "status": "success",
+        "data": {
+            "places": places,
+            "place_type": place_type,
+            "total_found": total_found,
+            "limit": limit,
+            "timestamp": datetime.now().isoformat(),
+            "source": "local_catalog"
+        }
+    }
+
+async def _get_popular_places_local_first(limit: int) -> Dict[str, Any]:
+    """Populer mekanlari yerel katalogdan ver, kapsanmadiysa upstream'e git ve yaz"""
+    coverage_key = "popular"
+    store = await _local_store_for(coverage_key, limit)
+    
+    if store is None:
+        result = await _get_popular_places_real_api(limit)
+        if _is_cacheable_result(result):
+            await _record_coverage(coverage_key, limit, result["data"]["places"])
+        return result
+    
+    places = await asyncio.to_thread(store.top_rated, None, limit, min_rating=4.0)
+    return {
+        "status": "success",
+        "data": {
+            "places": places,
+            "criteria": "highest_rating",
+            "limit": limit,
+            "timestamp": datetime.now().isoformat(),
+            "source": "local_catalog"
+        }
+    }
+
+def _relocate_search_result(cached_result: Dict[str, Any], lat: float, lng: float) -> Dict[str, Any]:
+    """Onbellekteki yaniti mevcut arama noktasina gore mesafelerle kopyala"""
+    data = cached_result["data"]
+    places = [place.copy() for place in data["places"]]
+    
+    if places:
+        distances = haversine_one_to_many(
+            lat, lng,
+            [place.get("location", {}).get("lat", 0) for place in places],
+            [place.get("location", {}).get("lng", 0) for place in places]
+        )
+        for place, distance in zip(places, distances.tolist()):
+            place["distance_km"] = round(distance, 2)
         
-        # Place type'i Google Places API formatina cevir
-        google_place_type = _convert_place_type_to_google_format(place_type)
+        # knn sonucu yeni noktaya gore yeniden siralanir
+        if data["search_params"].get("mode") == "knn":
+            places.sort(key=lambda place: place["distance_km"])
+    
+    search_params = dict(data["search_params"], location={"lat": lat, "lng": lng})
+    return {
+        "status": cached_result["status"],
+        "data": dict(data, places=places, search_params=search_params, cache_hit=True)
+    }
+
+async def iter_places_pages(query: str, lat: float, lng: float, place_type: str = "all",
+                            radius: float = 5.0, max_results: Optional[int] = None,
+                            max_pages: int = PLACES_MAX_PAGES,
+                            fields: Optional[Iterable[str]] = None,
+                            mode: str = "radius") -> AsyncIterator[Dict[str, Any]]:
+    """
+    Google Places sonuclarini sayfa sayfa ureten async generator
+    
+    Her sayfa geldigi anda formatlanip yield edilir; next_page_token varsa
+    token gecerli olana kadar beklenip sonraki sayfa istenir. max_results
+    dolunca veya cagiran donguden cikinca yeni sayfa istenmez.
+    
+    Args:
+        query: Arama terimi (bossa nearby search)
+        lat, lng: Arama merkezi
+        place_type: Mekan tipi
+        radius: Arama yaricapi (km)
+        max_results: Toplam sonuc siniri (None = tum sayfalar)
+        max_pages: Istenecek en fazla sayfa
+        fields: Uretilecek mekan alanlari (None = hepsi)
+        mode: "knn" ise Nearby Search rankby=distance ile yaricapsiz en yakinlar istenir
         
+    Yields:
+        Dict: places, page, results_seen (o ana kadar Google'in dondurdugu sonuc) ve has_more
+    """
+    gmaps = get_google_maps_client(GOOGLE_MAPS_API_KEY)
+    projected_fields = _resolve_fields(fields, None)
+    
+    # Place type'i Google Places API formatina cevir
+    google_type = _convert_place_type_to_google_format(place_type) if place_type != "all" else None
+    
+    async def fetch_page(page_token: Optional[str]) -> Dict[str, Any]:
+        if mode == "knn":
+            # rankby=distance keyword veya type ister - ikisi de yoksa genel ilgi noktasi
+            return await gmaps.places_nearby(
+                location=(lat, lng),
+                keyword=query or None,
+                type=google_type or (None if query else 'point_of_interest'),
+                rank_by='distance',
+                language='en',
+                page_token=page_token
+            )
         # Text search if query provided, otherwise nearby search
         if query:
-            places_result = gmaps.places(
+            return await gmaps.places(
                 query=f"{query} in Sydney",
                 location=(lat, lng),
                 radius=radius * 1000,  # Convert km to meters
-                type=google_place_type if place_type != "all" else None,
-                language='en'
+                type=google_type,
+                language='en',
+                page_token=page_token
             )
+        return await gmaps.places_nearby(
+            location=(lat, lng),
+            radius=radius * 1000,  # Convert km to meters
+            type=google_type,
+            language='en',
+            page_token=page_token
+        )
+    
+    page_token = None
+    token_issued_at = 0.0
+    results_seen = 0
+    yielded = 0
+    
+    for page in range(1, max_pages + 1):
+        if page_token is None:
+            places_result = await fetch_page(None)
         else:
-            places_result = gmaps.places_nearby(
-                location=(lat, lng),
-                radius=radius * 1000,  # Convert km to meters
-                type=google_place_type if place_type != "all" else None,
-                language='en'
-            )
+            places_result = await _fetch_next_page(fetch_page, page_token, token_issued_at)
         
-        if not places_result or 'results' not in places_result:
-            return {
-                "status": "success",
-                "data": {
-                    "places": [],
-                    "total_found": 0,
-                    "search_params": {
-                        "query": query,
-                        "location": {"lat": lat, "lng": lng},
-                        "place_type": place_type,
-                        "radius_km": radius,
-                        "max_results": max_results
-                    },
-                    "timestamp": datetime.now().isoformat(),
-                    "source": "google_places_api"
-                }
-            }
+        results = (places_result or {}).get('results', [])
+        page_token = (places_result or {}).get('next_page_token')
+        token_issued_at = time.monotonic()
+        results_seen += len(results)
         
-        # Format results
+        if max_results is not None:
+            results = results[:max_results - yielded]
+        yielded += len(results)
+        
+        done = page_token is None or page == max_pages or \
+            (max_results is not None and yielded >= max_results)
+        yield {
+            "places": _format_google_places(results, lat, lng, projected_fields),
+            "page": page,
+            "results_seen": results_seen,
+            "has_more": page_token is not None
+        }
+        if done:
+            return
+
+async def _fetch_next_page(fetch_page, page_token: str, token_issued_at: float) -> Dict[str, Any]:
+    """Token gecerli olana kadar bekle - erken istekte Google INVALID_REQUEST dondurur"""
+    wait = PLACES_PAGE_TOKEN_DELAY_SECONDS - (time.monotonic() - token_issued_at)
+    if wait > 0:
+        await asyncio.sleep(wait)
+    
+    for attempt in range(PLACES_PAGE_TOKEN_RETRIES):
+        try:
+            return await fetch_page(page_token)
+        except GoogleMapsApiError as error:
+            if error.status != "INVALID_REQUEST" or attempt == PLACES_PAGE_TOKEN_RETRIES - 1:
+                raise
+            await asyncio.sleep(PLACES_PAGE_TOKEN_DELAY_SECONDS / 2)
+
+@single_flight
+async def _search_places_real_api(query: str, lat: float, lng: float,
+                                 place_type: str, radius: float, max_results: int,
+                                 mode: str = "radius") -> Dict[str, Any]:
+    """Gercek Google Places API ile mekan arama - sayfalar max_results dolana kadar okunur"""
+    try:
         formatted_places = []
-        for place in places_result['results'][:max_results]:
-            formatted_place = _format_google_place_response(place, lat, lng)
-            formatted_places.append(formatted_place)
+        results_seen = 0
+        has_more = False
+        
+        async for page in iter_places_pages(query, lat, lng, place_type, radius, max_results, mode=mode):
+            formatted_places.extend(page["places"])
+            results_seen = page["results_seen"]
+            has_more = page["has_more"]
         
         return {
             "status": "success",
             "data": {
                 "places": formatted_places,
-                "total_found": len(places_result['results']),
+                "total_found": results_seen,
+                "has_more": has_more,
                 "search_params": {
                     "query": query,
                     "location": {"lat": lat, "lng": lng},
                     "place_type": place_type,
                     "radius_km": radius,
-                    "max_results": max_results
+                    "max_results": max_results,
+                    "mode": mode
                 },
                 "timestamp": datetime.now().isoformat(),
                 "source": "google_places_api"
@@ -450,13 +1228,14 @@ async def _search_places_real_api(query: str, lat: float, lng: float,
             "timestamp": datetime.now().isoformat()
         }
 
+@single_flight
 async def _get_place_details_real_api(place_id: str) -> Dict[str, Any]:
     """Gercek Google Places API'den mekan detayları"""
     try:
-        gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
+        gmaps = get_google_maps_client(GOOGLE_MAPS_API_KEY)
         
         # Get place details from Google
-        place_details = gmaps.place(
+        place_details = await gmaps.place(
             place_id=place_id,
             fields=['name', 'rating', 'formatted_address', 'geometry', 'type', 
                    'opening_hours', 'formatted_phone_number', 'website', 'price_level',
@@ -475,6 +1254,14 @@ async def _get_place_details_real_api(place_id: str) -> Dict[str, Any]:
         place_data = place_details['result']
         formatted_place = _format_google_place_response(place_data, -33.8688, 151.2093)
         
+        # Detaylari yerel kataloga yaz (write-through)
+        store = _get_place_store()
+        if store is not None and formatted_place:
+            try:
+                await asyncio.to_thread(store.upsert_places, [formatted_place])
+            except Exception as error:
+                logger.warning(f"Local place store write failed: {error}")
+        
         return {
             "status": "success",
             "data": formatted_place,
@@ -491,10 +1278,11 @@ async def _get_place_details_real_api(place_id: str) -> Dict[str, Any]:
             "timestamp": datetime.now().isoformat()
         }
 
+@single_flight
 async def _get_places_by_type_real_api(place_type: str, limit: int) -> Dict[str, Any]:
     """Gercek Google Places API'den tip bazinda mekan listesi"""
     try:
-        gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
+        gmaps = get_google_maps_client(GOOGLE_MAPS_API_KEY)
         
         # Sydney center coordinates
         sydney_center = (-33.8688, 151.2093)
@@ -503,7 +1291,7 @@ async def _get_places_by_type_real_api(place_type: str, limit: int) -> Dict[str,
         google_type = _convert_place_type_to_google_format(place_type)
         
         # Nearby search
-        places_result = gmaps.places_nearby(
+        places_result = await gmaps.places_nearby(
             location=sydney_center,
             radius=10000,  # 10km radius for city-wide search
             type=google_type,
@@ -524,10 +1312,8 @@ async def _get_places_by_type_real_api(place_type: str, limit: int) -> Dict[str,
             }
         
         # Format results
-        formatted_places = []
-        for place in places_result['results'][:limit]:
-            formatted_place = _format_google_place_response(place, sydney_center[0], sydney_center[1])
-            formatted_places.append(formatted_place)
+        formatted_places = _format_google_places(places_result['results'][:limit],
+                                                 sydney_center[0], sydney_center[1])
         
         # Sort by rating
         formatted_places.sort(key=lambda x: x.get("rating", 0), reverse=True)
@@ -553,16 +1339,17 @@ async def _get_places_by_type_real_api(place_type: str, limit: int) -> Dict[str,
             "timestamp": datetime.now().isoformat()
         }
 
+@single_flight
 async def _get_popular_places_real_api(limit: int) -> Dict[str, Any]:
     """Gercek Google Places API'den populer mekanlar"""
     try:
-        gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
+        gmaps = get_google_maps_client(GOOGLE_MAPS_API_KEY)
         
         # Sydney center coordinates
         sydney_center = (-33.8688, 151.2093)
         
         # Search for highly rated places in Sydney
-        places_result = gmaps.places(
+        places_result = await gmaps.places(
             query="popular attractions restaurants Sydney",
             location=sydney_center,
             radius=15000,  # 15km radius for wider search
@@ -581,18 +1368,12 @@ async def _get_popular_places_real_api(limit: int) -> Dict[str, Any]:
                 }
             }
         
-        # Format and filter highly rated places
-        formatted_places = []
-        for place in places_result['results']:
-            if place.get('rating', 0) >= 4.0:  # Only highly rated places
-                formatted_place = _format_google_place_response(place, sydney_center[0], sydney_center[1])
-                formatted_places.append(formatted_place)
+        # Yuksek puanli mekanlardan en iyi limit tanesini heap ile sec
+        highly_rated = (place for place in places_result['results'] if place.get('rating', 0) >= 4.0)
+        top_results = heapq.nlargest(limit, highly_rated, key=lambda place: place.get('rating', 0))
         
-        # Sort by rating (highest first)
-        formatted_places.sort(key=lambda x: x.get("rating", 0), reverse=True)
-        
-        # Apply limit
-        top_places = formatted_places[:limit]
+        # Sadece secilen mekanlari formatla
+        top_places = _format_google_places(top_results, sydney_center[0], sydney_center[1])
         
         return {
             "status": "success",
@@ -614,33 +1395,160 @@ async def _get_popular_places_real_api(limit: int) -> Dict[str, Any]:
             "timestamp": datetime.now().isoformat()
         }
 
+async def _autocomplete_places_cached(prefix: str, limit: int) -> Dict[str, Any]:
+    """Ayni onek icin Google'a tekrar gitme - her tus vurusu ucretli bir istek"""
+    cache_key = (normalize_label(prefix), limit)
+    cached_result = _autocomplete_cache.get(cache_key)
+    if cached_result is not None:
+        return dict(cached_result, data=dict(cached_result["data"], prefix=prefix, cache_hit=True))
+    
+    result = await _autocomplete_places_real_api(cache_key[0], limit)
+    if _is_cacheable_result(result):
+        _autocomplete_cache.set(cache_key, result)
+    return result
+
+@single_flight
+async def _autocomplete_places_real_api(prefix: str, limit: int) -> Dict[str, Any]:
+    """Gercek Google Place Autocomplete - Sydney merkezli, Avustralya ile sinirli"""
+    try:
+        gmaps = get_google_maps_client(GOOGLE_MAPS_API_KEY)
+        predictions = await gmaps.place_autocomplete(
+            prefix, location=(-33.8688, 151.2093), radius=50000, components="country:au"
+        )
+        
+        suggestions = []
+        for prediction in predictions[:limit]:
+            formatting = prediction.get("structured_formatting", {})
+            types = prediction.get("types", [])
+            is_suburb = "locality" in types or "sublocality" in types
+            suggestions.append({
+                "type": "suburb" if is_suburb else "place",
+                "label": formatting.get("main_text", prediction.get("description", "")),
+                "place_id": prediction.get("place_id", ""),
+                "address": formatting.get("secondary_text", "")
+            })
+        
+        return {
+            "status": "success",
+            "data": {
+                "prefix": prefix,
+                "suggestions": suggestions,
+                "timestamp": datetime.now().isoformat(),
+                "source": "google_places_api"
+            }
+        }
+        
+    except Exception as error:
+        logger.error(f"Google Places Autocomplete error: {error}")
+        return {
+            "status": "error",
+            "message": f"Google Places API error: {str(error)}",
+            "error_code": "API_ERROR",
+            "timestamp": datetime.now().isoformat()
+        }
+
 # =====================================
 # UTILITY FUNCTIONS
 # =====================================
 
-def _calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Haversine formulu ile iki nokta arasi mesafeyi km cinsinden hesapla"""
-    import math
+def _resolve_fields(fields: Optional[Iterable[str]],
+                    default_fields: Optional[Iterable[str]]) -> Optional[FrozenSet[str]]:
+    """Istenen alan kumesini coz - None sonuc tum alanlar demek, place_id hep dahil"""
+    if fields is None:
+        fields = default_fields
+    if fields is None or "all" in fields:
+        return None
+    return frozenset(fields) | {"place_id"}
+
+def _project_place(place_data: Dict[str, Any], fields: Optional[FrozenSet[str]]) -> Dict[str, Any]:
+    """Mekan kaydindan sadece istenen alanlari iceren yeni sozluk uret"""
+    if fields is None:
+        return place_data
+    
+    projected = {key: value for key, value in place_data.items() if key in fields}
+    
+    # Fixture kayitlarinda konum ust seviye lat/lng olarak tutulur
+    if "location" in fields and "location" not in place_data and "lat" in place_data:
+        projected["lat"] = place_data["lat"]
+        projected["lng"] = place_data.get("lng")
+    return projected
+
+def _project_places_result(result: Dict[str, Any], fields: Optional[FrozenSet[str]]) -> Dict[str, Any]:
+    """Liste yanitindaki mekanlari projekte et - onbellekteki nesnelere dokunmaz"""
+    if fields is None or result.get("status") != "success":
+        return result
     
-    # Koordinatlari radyana cevir
-    lat1_rad = math.radians(lat1)
-    lng1_rad = math.radians(lng1)
-    lat2_rad = math.radians(lat2)
-    lng2_rad = math.radians(lng2)
+    data = result["data"]
+    places = [_project_place(place_data, fields) for place_data in data.get("places", [])]
+    return dict(result, data=dict(data, places=places, fields=sorted(fields)))
+
+def _resolve_ranking(ranking: Optional[str],
+                     ranking_weights: Optional[Dict[str, float]]) -> Tuple[Optional[Dict[str, float]], Optional[Dict[str, Any]]]:
+    """Siralama agirliklarini coz - (agirliklar veya None, hata yaniti veya None)"""
+    if ranking is None and ranking_weights is None:
+        return None, None
+    try:
+        return resolve_weights(ranking, ranking_weights), None
+    except RankingError as error:
+        return None, {
+            "status": "error",
+            "message": str(error),
+            "error_code": "INVALID_RANKING",
+            "available_profiles": ranking_profiles(),
+            "timestamp": datetime.now().isoformat()
+        }
+
+def _ranking_info(ranking: Optional[str], weights: Dict[str, float]) -> Dict[str, Any]:
+    """Yanitta donen siralama profili ve normalize agirliklar"""
+    return {
+        "profile": ranking or "default",
+        "weights": {criterion: round(weight, 3) for criterion, weight in weights.items()}
+    }
+
+def _rank_places_result(result: Dict[str, Any], ranking: Optional[str],
+                        weights: Dict[str, float], limit: int) -> Dict[str, Any]:
+    """Liste yanitindaki mekanlari puanla ve en iyi limit tanesini tut - onbellekteki nesnelere dokunmaz"""
+    if result.get("status") != "success":
+        return result
     
-    # Farkları hesapla
-    dlat = lat2_rad - lat1_rad
-    dlng = lng2_rad - lng1_rad
+    data = result["data"]
+    places = rank_places(data.get("places", []), weights, limit)
+    return dict(result, data=dict(data, places=places, ranking=_ranking_info(ranking, weights)))
+
+def _filter_open_at_result(result: Dict[str, Any], open_moment: datetime, limit: int) -> Dict[str, Any]:
+    """
+    Liste yanitindan open_at aninda acik oldugu bilinen mekanlari tut - onbellekteki nesnelere dokunmaz
     
-    # Haversine formulu
-    a = (math.sin(dlat / 2) ** 2 + 
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2)
-    c = 2 * math.asin(math.sqrt(a))
+    Haftalik saatler mekan kaydindan, yoksa yerel katalogdan (detay
+    write-through'u) okunur; upstream'e ek cagri yapilmaz. Saati
+    bilinmeyen mekanlar elenir ve sayilari yanitta doner.
+    """
+    if result.get("status") != "success":
+        return result
     
-    # Dunyanin yaricapi (km)
-    earth_radius_km = 6371
+    data = result["data"]
+    minute = week_minute(open_moment)
+    store = _get_place_store()
+    open_places = []
+    hours_unknown = 0
+    for place_data in data.get("places", []):
+        intervals = weekly_intervals(place_data.get("opening_hours"))
+        if intervals is None and store is not None:
+            try:
+                stored = store.get_place(place_data.get("place_id", ""))
+            except Exception as error:
+                logger.warning(f"Local place store read failed: {error}")
+                stored = None
+            if stored:
+                intervals = weekly_intervals(stored.get("opening_hours"))
+        if intervals is None:
+            hours_unknown += 1
+        elif is_open_at(intervals, minute):
+            open_places.append(place_data)
     
-    return earth_radius_km * c
+    search_params = dict(data.get("search_params", {}), open_at=open_moment.isoformat(),
+                         hours_unknown=hours_unknown)
+    return dict(result, data=dict(data, places=open_places[:limit], search_params=search_params))
 
 def _convert_place_type_to_google_format(place_type: str) -> str:
     """Yer tipini Google Places API formatina cevir"""
@@ -662,38 +1570,83 @@ def _convert_place_type_to_google_format(place_type: str) -> str:
     }
     return type_mapping.get(place_type, place_type)
 
-def _format_google_place_response(google_place: Dict, search_lat: float, search_lng: float) -> Dict[str, Any]:
-    """Google Places API yaniti format"""
+def _format_google_places(google_places: List[Dict], search_lat: float, search_lng: float,
+                          fields: Optional[FrozenSet[str]] = None) -> List[Dict[str, Any]]:
+    """Google sonuc listesini formatla - mesafeler tek vektorel cagriyla hesaplanir"""
+    if not google_places:
+        return []
+    
+    if fields is not None and "distance_km" not in fields:
+        return [_format_google_place_response(place, search_lat, search_lng, fields=fields)
+                for place in google_places]
+    
+    locations = [place.get('geometry', {}).get('location', {}) for place in google_places]
+    distances = haversine_one_to_many(
+        search_lat, search_lng,
+        [location.get('lat', 0) for location in locations],
+        [location.get('lng', 0) for location in locations]
+    )
+    
+    return [
+        _format_google_place_response(place, search_lat, search_lng, distance_km=distance, fields=fields)
+        for place, distance in zip(google_places, distances.tolist())
+    ]
+
+def _google_location(google_place: Dict) -> Dict[str, float]:
+    """Google yanitindaki koordinatlar"""
+    location = google_place.get('geometry', {}).get('location', {})
+    return {'lat': location.get('lat', 0), 'lng': location.get('lng', 0)}
+
+def _google_opening_hours(google_place: Dict) -> Dict[str, Any]:
+    """open_now ve (detay yanitinda periods varsa) haftalik dakika araliklari"""
+    opening_hours = google_place.get('opening_hours', {})
+    formatted = {'open_now': opening_hours.get('open_now', False)}
+    intervals = weekly_intervals(opening_hours)
+    if intervals is not None:
+        formatted['weekly_minutes'] = [list(interval) for interval in intervals]
+    return formatted
+
+# Standart mekan alanlari ve Google yanitindan her birini ureten fonksiyon (cikti sirasi)
+# distance_km arama noktasina bagli oldugu icin formatlayici icinde hesaplanir
+_GOOGLE_FIELD_BUILDERS = {
+    'place_id': lambda place: place.get('place_id', ''),
+    'name': lambda place: place.get('name', ''),
+    'address': lambda place: place.get('formatted_address', place.get('vicinity', '')),
+    'rating': lambda place: place.get('rating', 0.0),
+    'user_ratings_total': lambda place: place.get('user_ratings_total', 0),
+    'price_level': lambda place: place.get('price_level', 0),
+    'location': _google_location,
+    'distance_km': None,
+    'phone': lambda place: place.get('formatted_phone_number', ''),
+    'website': lambda place: place.get('website', ''),
+    'opening_hours': _google_opening_hours,
+    'photos': lambda place: _extract_photo_references(place.get('photos', [])),
+    'types': lambda place: place.get('types', []),
+    'place_type': lambda place: _convert_google_type_to_our_format(place.get('types', []))
+}
+
+def _format_google_place_response(google_place: Dict, search_lat: float, search_lng: float,
+                                  distance_km: Optional[float] = None,
+                                  fields: Optional[FrozenSet[str]] = None) -> Dict[str, Any]:
+    """Google Places API yaniti format - fields verilirse sadece o alanlar uretilir"""
     try:
-        location = google_place.get('geometry', {}).get('location', {})
-        place_lat = location.get('lat', 0)
-        place_lng = location.get('lng', 0)
-        
-        # Calculate distance
-        distance = _calculate_distance(search_lat, search_lng, place_lat, place_lng)
+        formatted_place = {}
         
         # Format the response to match our standard structure
-        formatted_place = {
-            'place_id': google_place.get('place_id', ''),
-            'name': google_place.get('name', ''),
-            'address': google_place.get('formatted_address', google_place.get('vicinity', '')),
-            'rating': google_place.get('rating', 0.0),
-            'user_ratings_total': google_place.get('user_ratings_total', 0),
-            'price_level': google_place.get('price_level', 0),
-            'location': {
-                'lat': place_lat,
-                'lng': place_lng
-            },
-            'distance_km': round(distance, 2),
-            'phone': google_place.get('formatted_phone_number', ''),
-            'website': google_place.get('website', ''),
-            'opening_hours': {
-                'open_now': google_place.get('opening_hours', {}).get('open_now', False)
-            },
-            'photos': _extract_photo_references(google_place.get('photos', [])),
-            'types': google_place.get('types', []),
-            'place_type': _convert_google_type_to_our_format(google_place.get('types', []))
-        }
+        for field_name, build in _GOOGLE_FIELD_BUILDERS.items():
+            if fields is not None and field_name not in fields:
+                continue
+            
+            if build is not None:
+                formatted_place[field_name] = build(google_place)
+                continue
+            
+            # Mesafe toplu hesaplanmadiysa tek nokta icin hesapla
+            distance = distance_km
+            if distance is None:
+                location = _google_location(google_place)
+                distance = haversine_km(search_lat, search_lng, location['lat'], location['lng'])
+            formatted_place['distance_km'] = round(distance, 2)
         
         return formatted_place
         
@@ -744,21 +1697,44 @@ class PlacesTool:
     
     async def search_places(self, query: str = "", lat: float = -33.8688, 
                            lng: float = 151.2093, place_type: str = "all",
-                           radius: float = 5.0, max_results: int = 10) -> Dict[str, Any]:
+                           radius: float = 5.0, max_results: int = 10,
+                           fields: Optional[List[str]] = None, mode: str = "radius",
+                           ranking: Optional[str] = None,
+                           ranking_weights: Optional[Dict[str, float]] = None,
+                           open_at: Optional[str] = None) -> Dict[str, Any]:
+        """Wrapper method - MCP tool'u cagir"""
+        return await search_places(query, lat, lng, place_type, radius, max_results, fields, mode,
+                                   ranking, ranking_weights, open_at)
+    
+    async def search_places_in_area(self, query: str = "", bbox: Optional[List[float]] = None,
+                                    polygon: Optional[Dict[str, Any]] = None, place_type: str = "all",
+                                    max_results: int = 10,
+                                    fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Wrapper method - MCP tool'u cagir"""
+        return await search_places_in_area(query, bbox, polygon, place_type, max_results, fields)
+    
+    async def get_place_details(self, place_id: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Wrapper method - MCP tool'u cagir"""
+        return await get_place_details(place_id, fields)
+    
+    async def get_places_details_batch(self, place_ids: List[str],
+                                       fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Wrapper method - MCP tool'u cagir"""
-        return await search_places(query, lat, lng, place_type, radius, max_results)
+        return await get_places_details_batch(place_ids, fields)
     
-    async def get_place_details(self, place_id: str) -> Dict[str, Any]:
+    async def get_places_by_type(self, place_type: str, limit: int = 10,
+                                 fields: Optional[List[str]] = None, ranking: Optional[str] = None,
+                                 ranking_weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """Wrapper method - MCP tool'u cagir"""
-        return await get_place_details(place_id)
+        return await get_places_by_type(place_type, limit, fields, ranking, ranking_weights)
     
-    async def get_places_by_type(self, place_type: str, limit: int = 10) -> Dict[str, Any]:
+    async def get_popular_places(self, limit: int = 5, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Wrapper method - MCP tool'u cagir"""
-        return await get_places_by_type(place_type, limit)
+        return await get_popular_places(limit, fields)
     
-    async def get_popular_places(self, limit: int = 5) -> Dict[str, Any]:
+    async def autocomplete_places(self, prefix: str, limit: int = 5) -> Dict[str, Any]:
         """Wrapper method - MCP tool'u cagir"""
-        return await get_popular_places(limit)
+        return await autocomplete_places(prefix, limit)
 
 # MCP tool instance'i olustur
 places_tool = PlacesTool()
@@ -766,8 +1742,13 @@ places_tool = PlacesTool()
 # Export for backward compatibility
 __all__ = [
     'search_places',
+    'search_places_in_area',
     'get_place_details', 
+    'get_places_details_batch',
     'get_places_by_type',
     'get_popular_places',
+    'autocomplete_places',
+    'get_places_cache_stats',
+    'iter_places_pages',
     'places_tool'
 ] 
\ No newline at end of file
@@ -0,0 +1,162 @@
+# Sydney Guide - Multi-Criteria Ranking
+# Mekan adaylarini mesafe, puan, populerlik, fiyat ve acik olma durumuna gore NumPy ile puanlar
+
+import math
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from claude_integration.system_prompts.scenarios import SCENARIO_RANKING_PROFILES
+
+# Siralama kriterleri - her biri [0, 1] araligina normalize edilir (1 = en iyi)
+RANKING_CRITERIA = ("distance", "rating", "popularity", "price", "open_now")
+
+# Senaryo verilmezse kullanilan dengeli agirliklar
+DEFAULT_RANKING_WEIGHTS = {
+    "distance": 0.35,
+    "rating": 0.35,
+    "popularity": 0.15,
+    "price": 0.05,
+    "open_now": 0.10
+}
+
+# Bilinmeyen fiyat ve acik/kapali bilgisi notr sayilir
+_UNKNOWN_SCORE = 0.5
+
+class RankingError(ValueError):
+    """Bilinmeyen profil veya gecersiz agirlik"""
+
+def ranking_profiles() -> List[str]:
+    """Secilebilir profil adlari"""
+    return ["default", *SCENARIO_RANKING_PROFILES]
+
+def resolve_weights(profile: Optional[str] = None,
+                    weights: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+    """
+    Profil agirliklarini al, verilen agirliklarla ustune yaz ve toplami 1'e normalize et
+
+    profile None veya "default" ise DEFAULT_RANKING_WEIGHTS kullanilir.
+    """
+    if profile in (None, "default"):
+        base = DEFAULT_RANKING_WEIGHTS
+    elif profile in SCENARIO_RANKING_PROFILES:
+        base = SCENARIO_RANKING_PROFILES[profile]
+    else:
+        raise RankingError(f"Unknown ranking profile: {profile} (expected one of {', '.join(ranking_profiles())})")
+
+    resolved = {criterion: float(base.get(criterion, 0.0)) for criterion in RANKING_CRITERIA}
+    for criterion, weight in (weights or {}).items():
+        if criterion not in resolved:
+            raise RankingError(f"Unknown ranking criterion: {criterion} (expected one of {', '.join(RANKING_CRITERIA)})")
+        if not isinstance(weight, (int, float)) or isinstance(weight, bool) or weight < 0 or math.isnan(weight):
+            raise RankingError(f"Ranking weight for {criterion} must be a non-negative number")
+        resolved[criterion] = float(weight)
+
+    total = sum(resolved.values())
+    if total <= 0:
+        raise RankingError("At least one ranking weight must be positive")
+    return {criterion: weight / total for criterion, weight in resolved.items()}
+
+def score_candidates(weights: Dict[str, float],
+                     distances_km: Optional[np.ndarray] = None,
+                     ratings: Optional[np.ndarray] = None,
+                     ratings_totals: Optional[np.ndarray] = None,
+                     price_levels: Optional[np.ndarray] = None,
+                     open_now: Optional[np.ndarray] = None,
+                     distance_scale_km: Optional[float] = None) -> np.ndarray:
+    """
+    Adaylarin agirlikli puanlari, sekil (N,)
+
+    Eksik degerler NaN ile gelir. Mesafe exp(-d / olcek) ile (olcek
+    verilmezse en uzak adayin yarisi), rating 1-5 araliginda, populerlik
+    adaylar icindeki en buyuk yorum sayisina gore log olcekte, fiyat
+    0 (bedava) - 4 (cok pahali) tersine normalize edilir. Verilmeyen kriter
+    dizisi puana katkida bulunmaz.
+    """
+    columns = [column for column in (distances_km, ratings, ratings_totals, price_levels, open_now)
+               if column is not None]
+    size = columns[0].shape[0] if columns else 0
+    scores = np.zeros(size, dtype=np.float64)
+
+    if distances_km is not None and weights.get("distance"):
+        if distance_scale_km is None:
+            known = distances_km[~np.isnan(distances_km)]
+            distance_scale_km = known.max() / 2 if known.size else 1.0
+        scale = max(distance_scale_km, 1e-3)
+        scores += weights["distance"] * np.exp(-np.nan_to_num(distances_km, nan=np.inf) / scale)
+
+    if ratings is not None and weights.get("rating"):
+        rating_scores = np.clip((ratings.astype(np.float64) - 1.0) / 4.0, 0.0, 1.0)
+        scores += weights["rating"] * np.nan_to_num(rating_scores, nan=0.0)
+
+    if ratings_totals is not None and weights.get("popularity"):
+        log_totals = np.log1p(np.nan_to_num(ratings_totals.astype(np.float64), nan=0.0).clip(min=0.0))
+        top = log_totals.max() if log_totals.size else 0.0
+        if top > 0:
+            scores += weights["popularity"] * (log_totals / top)
+
+    if price_levels is not None and weights.get("price"):
+        price_scores = np.clip(1.0 - price_levels.astype(np.float64) / 4.0, 0.0, 1.0)
+        scores += weights["price"] * np.nan_to_num(price_scores, nan=_UNKNOWN_SCORE)
+
+    if open_now is not None and weights.get("open_now"):
+        scores += weights["open_now"] * np.nan_to_num(open_now.astype(np.float64), nan=_UNKNOWN_SCORE)
+
+    return scores
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    En yuksek puanli k adayin indeksleri, puana gore azalan (esitlikte indeks sirasi)
+
+    argpartition O(N) secim yapar; sadece secilen k eleman siralanir. Sinirdaki
+    esit puanlilardan kucuk indeksliler alinir, sonuc tam siralamayla aynidir.
+    """
+    if k <= 0 or scores.size == 0:
+        return np.empty(0, dtype=np.intp)
+    if k < scores.size:
+        threshold = scores[np.argpartition(-scores, k - 1)[k - 1]]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)[:k - above.size]
+        selected = np.concatenate((above, tied))
+    else:
+        selected = np.arange(scores.size)
+    return selected[np.lexsort((selected, -scores[selected]))]
+
+def _open_now_of(place_data: Dict[str, Any]) -> float:
+    """Google bicimli opening_hours.open_now - bilinmiyorsa NaN"""
+    opening_hours = place_data.get("opening_hours")
+    if isinstance(opening_hours, dict) and isinstance(opening_hours.get("open_now"), bool):
+        return float(opening_hours["open_now"])
+    return math.nan
+
+def _number_of(place_data: Dict[str, Any], field: str) -> float:
+    """Sayisal alan - yoksa NaN"""
+    value = place_data.get(field)
+    return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else math.nan
+
+def ranking_columns(places: Sequence[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Mekan sozluklerinden kriter sutunlarini cikar (eksikler NaN)"""
+    return {
+        "distances_km": np.array([_number_of(place, "distance_km") for place in places], dtype=np.float64),
+        "ratings": np.array([_number_of(place, "rating") for place in places], dtype=np.float64),
+        "ratings_totals": np.array([_number_of(place, "user_ratings_total") for place in places], dtype=np.float64),
+        "price_levels": np.array([_number_of(place, "price_level") for place in places], dtype=np.float64),
+        "open_now": np.array([_open_now_of(place) for place in places], dtype=np.float64)
+    }
+
+def rank_places(places: Sequence[Dict[str, Any]], weights: Dict[str, float], k: int,
+                distance_scale_km: Optional[float] = None) -> List[Dict[str, Any]]:
+    """
+    Mekan sozluklerini puanla, en iyi k tanesini ranking_score ile dondur
+
+    Sozlukler kopyalanir; onbellekteki nesneler degismez.
+    """
+    if not places:
+        return []
+    scores = score_candidates(weights, distance_scale_km=distance_scale_km, **ranking_columns(places))
+    ranked = []
+    for index in top_k(scores, k).tolist():
+        place_data = dict(places[index])
+        place_data["ranking_score"] = round(float(scores[index]), 4)
+        ranked.append(place_data)
+    return ranked
@@ -3,21 +3,19 @@
 
 import asyncio
 import json
-import math
 import os
 import logging
-from typing import Dict, Any, List
+import time
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-import aiohttp
 from dotenv import load_dotenv
 
-# Try to import googlemaps, but don't fail if not available
-try:
-    import googlemaps
-except ImportError:
-    googlemaps = None
-    logger = logging.getLogger(__name__)
-    logger.warning("googlemaps package not available, Google API features will be limited")
+from .cache import TTLCache, single_flight
+from .clients import get_google_maps_client, get_nsw_transport_client
+from .geodesy import haversine_km, haversine_one_to_many
+from .catalog.opening_hours import SYDNEY_TIMEZONE, InvalidOpenAtError, parse_open_at
+from .gtfs import (DEFAULT_GTFS_STORE_DIR, TRANSPORT_MODES, GTFSStore, RaptorPlanner, RealtimeOverlay,
+                   departure_board, ingest_gtfs_zip, trip_update_sources)
 
 # Load environment variables from parent directory
 load_dotenv(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
@@ -27,6 +25,24 @@ USE_REAL_API = os.getenv('MOCK_MODE', 'true').lower() == 'false'
 GOOGLE_MAPS_API_KEY = os.getenv('GOOGLE_MAPS_API_KEY', '')
 NSW_TRANSPORT_API_KEY = os.getenv('NSW_TRANSPORT_API_KEY', '')
 
+# Yerel GTFS static deposu - varsa find_nearby_transport ag kullanmadan buradan yanit verir
+GTFS_STORE_DIR = os.getenv('GTFS_STORE_DIR', DEFAULT_GTFS_STORE_DIR)
+# Verilirse depo yoksa veya zip degistiyse ilk cagrida (is parcaciginda) ingest edilir
+GTFS_STATIC_ZIP = os.getenv('GTFS_STATIC_ZIP', '')
+# Baska bir ingest depoyu yerine tasirken acilis bu kadar beklenip tekrar denenir
+GTFS_STORE_SWAP_WAIT_SECONDS = 0.05
+GTFS_STORE_SWAP_ATTEMPTS = 20
+GTFS_MAX_SERVICES_PER_STOP = int(os.getenv('GTFS_MAX_SERVICES_PER_STOP', '15'))
+# GTFS-Realtime TripUpdate kaynaklari (virgulle ayrilmis dosya yollari / yerel http URL'leri) - bos = sadece tarife
+GTFS_REALTIME_TRIP_UPDATES = os.getenv('GTFS_REALTIME_TRIP_UPDATES', '')
+GTFS_REALTIME_REFRESH_SECONDS = float(os.getenv('GTFS_REALTIME_REFRESH_SECONDS', '15'))
+GTFS_BOARD_HORIZON_MINUTES = int(os.getenv('GTFS_BOARD_HORIZON_MINUTES', '90'))
+# NSW departure monitor tablo onbellegi - durak basina kisa TTL, tur/limit bellekte uygulanir
+TRANSPORT_BOARD_CACHE_TTL_SECONDS = float(os.getenv('TRANSPORT_BOARD_CACHE_TTL_SECONDS', '20'))
+TRANSPORT_BOARD_CACHE_MAX_ENTRIES = int(os.getenv('TRANSPORT_BOARD_CACHE_MAX_ENTRIES', '500'))
+# Bir durak tablosunda tutulan en fazla kalkis (NSW ve GTFS icin ayni)
+TRANSPORT_BOARD_MAX_DEPARTURES = int(os.getenv('TRANSPORT_BOARD_MAX_DEPARTURES', '40'))
+
 # Logging configuration
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -99,7 +115,12 @@ async def find_nearby_transport(lat: float, lng: float, transport_type: str = "a
     Yakin ulasim duraklarini bul (mock veya gercek API) - Same structure as places tool
     """
     try:
-        if USE_REAL_API and GOOGLE_MAPS_API_KEY:
+        store = await _get_gtfs_store()
+        if store is not None:
+            # Yerel GTFS deposu - gercek duraklar ve hatlar, ag cagrisi yok
+            logger.info(f"Using local GTFS stop store (type: {transport_type}, radius: {radius}km)")
+            return _find_transport_gtfs(store, lat, lng, transport_type, radius, max_results)
+        elif USE_REAL_API and GOOGLE_MAPS_API_KEY:
             # Gercek Google Places API kullan (transit stations)
             logger.info(f"Using real Google Places API for transport (type: {transport_type}, radius: {radius}km)")
             return await _find_transport_real_api(lat, lng, transport_type, radius, max_results)
@@ -121,9 +142,30 @@ async def plan_route(origin_lat: float, origin_lng: float,
                     travel_modes: List[str] = ["transit", "walking"],
                     departure_time: str = "now") -> Dict[str, Any]:
     """
-    Rota planla (mock veya gercek API) - Same structure as places tool
+    Rota planla (yerel GTFS tarifesi, gercek API veya mock) - Same structure as places tool
     """
     try:
+        transit_modes = _requested_transit_modes(travel_modes)
+        store = await _get_gtfs_store() if transit_modes is not None else None
+        if store is not None:
+            try:
+                departure = parse_open_at(departure_time)
+            except InvalidOpenAtError:
+                return {
+                    "status": "error",
+                    "message": f"Invalid departure_time: {departure_time} "
+                               "(expected 'now', 'HH:MM', '<day> HH:MM' or an ISO 8601 datetime)",
+                    "error_code": "INVALID_DEPARTURE_TIME",
+                    "timestamp": datetime.now().isoformat()
+                }
+            # Yerel GTFS tarifesi uzerinde RAPTOR - Pareto-optimal yolculuklar, ag cagrisi yok
+            logger.info(f"Using local GTFS RAPTOR planner (modes: {transit_modes or 'all'})")
+            journeys = await asyncio.to_thread(_plan_journeys_gtfs, store, origin_lat, origin_lng,
+                                               destination_lat, destination_lng, departure, transit_modes)
+            if journeys:
+                return _format_gtfs_route(store, journeys, departure)
+            logger.info("GTFS planner found no journey, using fallback route data")
+
         if USE_REAL_API and GOOGLE_MAPS_API_KEY:
             # Gercek Google Directions API kullan
             logger.info(f"Using real Google Directions API for route planning")
@@ -141,12 +183,19 @@ async def plan_route(origin_lat: float, origin_lng: float,
             "timestamp": datetime.now().isoformat()
         }
 
-async def get_transport_status(stop_id: str, transport_type: str = "train", limit: int = 5) -> Dict[str, Any]:
+async def get_transport_status(stop_id: str, transport_type: str = "all", limit: int = 5) -> Dict[str, Any]:
     """
-    Ulasim durum bilgisi al (mock veya gercek API) - Same structure as places tool
+    Ulasim durum bilgisi al (yerel GTFS + canli katman, gercek API veya mock) - Same structure as places tool
     """
     try:
-        if USE_REAL_API and NSW_TRANSPORT_API_KEY:
+        store = await _get_gtfs_store()
+        stop = store.stop_index(stop_id) if store is not None else None
+        if stop is not None:
+            # Kalkis tablosu bellekten - istek basina upstream cagrisi yok
+            overlay = await _get_realtime_overlay(store)
+            logger.info(f"Using local GTFS departure board (stop: {stop_id}, realtime: {overlay is not None})")
+            return _departure_board_view(_departure_board_gtfs(store, overlay, stop), transport_type, limit)
+        elif USE_REAL_API and NSW_TRANSPORT_API_KEY:
             # Gercek NSW Transport API kullan
             logger.info(f"Using real NSW Transport API for status (stop: {stop_id}, type: {transport_type})")
             return await _get_transport_status_real_api(stop_id, transport_type, limit)
@@ -163,6 +212,201 @@ async def get_transport_status(stop_id: str, transport_type: str = "train", limi
             "timestamp": datetime.now().isoformat()
         }
 
+# GTFS static store
+_gtfs_store: Optional[GTFSStore] = None
+_gtfs_store_checked = False
+
+def _open_gtfs_store() -> Optional[GTFSStore]:
+    """
+    Depoyu ac; zip verilmis ve depo eksik/eskiyse once ingest et (bloklayan)
+    
+    Ingest eski depoyu yeni depoyla degistirirken klasor kisa sure yoktur
+    (veya dosyalari acilirken tasinir); bu durumda kisa aralarla tekrar denenir.
+    """
+    store = None
+    for _ in range(GTFS_STORE_SWAP_ATTEMPTS):
+        try:
+            if GTFSStore.exists(GTFS_STORE_DIR):
+                store = GTFSStore(GTFS_STORE_DIR)
+        except ValueError as error:
+            logger.warning(f"Ignoring GTFS store: {error}")
+            break
+        except FileNotFoundError:
+            # Depo acilirken yerine yenisi tasindi
+            store = None
+        if store is not None or not GTFSStore.is_swapping(GTFS_STORE_DIR):
+            break
+        time.sleep(GTFS_STORE_SWAP_WAIT_SECONDS)
+
+    if GTFS_STATIC_ZIP and os.path.isfile(GTFS_STATIC_ZIP):
+        feed_stat = os.stat(GTFS_STATIC_ZIP)
+        if store is None or store.meta.get("feed_token") != [feed_stat.st_mtime_ns, feed_stat.st_size]:
+            ingest_gtfs_zip(GTFS_STATIC_ZIP, GTFS_STORE_DIR)
+            store = GTFSStore(GTFS_STORE_DIR)
+    return store
+
+@single_flight
+async def _load_gtfs_store() -> Optional[GTFSStore]:
+    """Depoyu is parcaciginda ac - es zamanli ilk cagrilar tek ingest'i paylasir"""
+    global _gtfs_store, _gtfs_store_checked
+    try:
+        _gtfs_store = await asyncio.to_thread(_open_gtfs_store)
+        if _gtfs_store is not None:
+            logger.info(f"GTFS stop store ready: {_gtfs_store.stats()}")
+    except Exception as error:
+        logger.warning(f"GTFS store unavailable, using fallback transport data: {error}")
+        _gtfs_store = None
+    _gtfs_store_checked = True
+    return _gtfs_store
+
+async def _get_gtfs_store() -> Optional[GTFSStore]:
+    """Acik GTFS deposu - yapilandirilmamissa None"""
+    if _gtfs_store_checked:
+        return _gtfs_store
+    return await _load_gtfs_store()
+
+# GTFS RAPTOR planner - depo ile birlikte yenilenir
+_route_planner: Optional[RaptorPlanner] = None
+
+def _requested_transit_modes(travel_modes: List[str]) -> Optional[List[str]]:
+    """
+    travel_modes -> planlayici tur filtresi
+
+    Returns:
+        []: tum toplu tasima turleri ("transit"), tur listesi: sadece onlar,
+        None: toplu tasima istenmemis (walking/driving)
+    """
+    if "transit" in travel_modes:
+        return []
+    modes = [mode for mode in travel_modes if mode in TRANSPORT_MODES]
+    return modes or None
+
+def _plan_journeys_gtfs(store: GTFSStore, origin_lat: float, origin_lng: float, destination_lat: float,
+                        destination_lng: float, departure: datetime, modes: List[str]) -> List[Dict[str, Any]]:
+    """Planlayiciyi (gerekirse) kur ve sorguyu calistir (bloklayan - is parcaciginda cagrilir)"""
+    global _route_planner
+    if _route_planner is None or _route_planner.store is not store:
+        _route_planner = RaptorPlanner(store)
+    return _route_planner.plan(origin_lat, origin_lng, destination_lat, destination_lng, departure, modes or None)
+
+def _is_opal_peak(moment: datetime) -> bool:
+    """Opal zirve saatleri: hafta ici 06:30-10:00 ve 15:00-19:00"""
+    if moment.weekday() >= 5:
+        return False
+    minutes = moment.hour * 60 + moment.minute
+    return 390 <= minutes < 600 or 900 <= minutes < 1140
+
+def _journey_overview(journey: Dict[str, Any]) -> Dict[str, Any]:
+    """Planlayici yolculugunu plan_route overview sozlugune cevir"""
+    leave = datetime.fromisoformat(journey["departure_time"])
+    fare = 0.0
+    if journey["rides"]:
+        fare = calculate_journey_fare(journey["transit_distance_km"], peak_time=_is_opal_peak(leave),
+                                      transport_type=journey["modes"][0])
+    return {
+        "total_distance_km": journey["total_distance_km"],
+        "total_duration_minutes": journey["total_duration_minutes"],
+        "total_cost_aud": round(fare, 2),
+        "departure_time": journey["departure_time"],
+        "arrival_time": journey["arrival_time"],
+        "transfers": journey["transfers"],
+        "modes": journey["modes"],
+        "pricing_method": "real_opal_calculation"
+    }
+
+def _format_gtfs_route(store: GTFSStore, journeys: List[Dict[str, Any]], departure: datetime) -> Dict[str, Any]:
+    """
+    Pareto cephesini plan_route yanitina cevir
+
+    data.overview/steps en erken varan yolculuktur (mevcut yanit bicimi);
+    journeys tum Pareto-optimal secenekleri (daha az aktarma, daha gec
+    varis) kendi overview ve adimlariyla listeler.
+    """
+    options = [{"overview": _journey_overview(journey), "steps": journey["steps"]} for journey in journeys]
+    return {
+        "status": "success",
+        "data": {
+            "overview": options[0]["overview"],
+            "steps": options[0]["steps"],
+            "journeys": options,
+            "requested_departure": departure.isoformat(),
+            "source": "gtfs_raptor",
+            "feed": store.meta.get("feed")
+        },
+        "timestamp": datetime.now().isoformat(),
+        "source": "gtfs_raptor"
+    }
+
+# GTFS-Realtime gecikme katmani - depo ile birlikte yenilenir
+_realtime_overlay: Optional[RealtimeOverlay] = None
+
+@single_flight
+async def _load_realtime_overlay(store: GTFSStore) -> RealtimeOverlay:
+    """Katmani kur ve ilk akislari birlestir - es zamanli ilk cagrilar tek yuklemeyi paylasir"""
+    global _realtime_overlay
+    overlay = RealtimeOverlay(store, trip_update_sources(GTFS_REALTIME_TRIP_UPDATES), GTFS_REALTIME_REFRESH_SECONDS)
+    await overlay.refresh()
+    _realtime_overlay = overlay
+    return overlay
+
+async def _get_realtime_overlay(store: GTFSStore) -> Optional[RealtimeOverlay]:
+    """Canli gecikme katmani - kaynak yapilandirilmamissa None; suresi gelen yenileme arka planda yapilir"""
+    if not GTFS_REALTIME_TRIP_UPDATES:
+        return None
+    overlay = _realtime_overlay
+    if overlay is None or overlay.store is not store:
+        return await _load_realtime_overlay(store)
+    overlay.maybe_refresh_in_background()
+    return overlay
+
+def _departure_board_gtfs(store: GTFSStore, overlay: Optional[RealtimeOverlay], stop: int) -> Dict[str, Any]:
+    """Duragin tum turlerdeki kalkis tablosu - tarife + canli gecikmeler"""
+    services = departure_board(store, stop, datetime.now(SYDNEY_TIMEZONE), overlay, GTFS_BOARD_HORIZON_MINUTES * 60,
+                               TRANSPORT_BOARD_MAX_DEPARTURES)
+
+    return {
+        "status": "success",
+        "data": {
+            "stop_info": {
+                "stop_id": store.stop_ids[stop],
+                "name": store.stop_names[stop],
+                "type": "all",
+                "modes": store.stop_modes_of(stop),
+                "lat": float(store.stop_lat[stop]),
+                "lng": float(store.stop_lng[stop])
+            },
+            "services": services,
+            "total_services": len(services),
+            "realtime": {"feed_age_seconds": overlay.feed_age_seconds(), "live_trips": overlay.stats()["trips"]}
+                        if overlay is not None else None
+        },
+        "timestamp": datetime.now().isoformat(),
+        "source": "gtfs_realtime" if overlay is not None else "gtfs_static"
+    }
+
+def _find_transport_gtfs(store: GTFSStore, lat: float, lng: float, transport_type: str,
+                         radius: float, max_results: int) -> Dict[str, Any]:
+    """Yerel GTFS deposundan yakin duraklar ve gecen hatlar"""
+    stops, distances = store.nearby_stops(lat, lng, radius, transport_type)
+    stations = [store.station_record(stop, distance, transport_type, GTFS_MAX_SERVICES_PER_STOP)
+                for stop, distance in zip(stops[:max_results].tolist(), distances[:max_results].tolist())]
+
+    return {
+        "status": "success",
+        "data": {
+            "stations": stations,
+            "total_found": int(stops.size),
+            "search_params": {
+                "location": {"lat": lat, "lng": lng},
+                "transport_type": transport_type,
+                "radius_km": radius
+            },
+            "timestamp": datetime.now().isoformat(),
+            "source": "gtfs_static",
+            "feed": store.meta.get("feed")
+        }
+    }
+
 # Mock data implementations
 async def _find_transport_mock_data(lat: float, lng: float, transport_type: str, radius: float, max_results: int) -> Dict[str, Any]:
     """Mock transport stations data"""
@@ -173,7 +417,6 @@ async def _find_transport_mock_data(lat: float, lng: float, transport_type: str,
             "type": "train",
             "lat": -33.8830,
             "lng": 151.2063,
-            "distance_km": round(_calculate_distance(lat, lng, -33.8830, 151.2063), 2),
             "services": ["T1", "T2", "T3", "T8"],
             "facilities": ["wheelchair_accessible", "shops"]
         },
@@ -183,7 +426,6 @@ async def _find_transport_mock_data(lat: float, lng: float, transport_type: str,
             "type": "ferry",
             "lat": -33.8611,
             "lng": 151.2107,
-            "distance_km": round(_calculate_distance(lat, lng, -33.8611, 151.2107), 2),
             "services": ["Manly Ferry", "Parramatta Ferry"],
             "facilities": ["wheelchair_accessible", "food"]
         },
@@ -193,7 +435,6 @@ async def _find_transport_mock_data(lat: float, lng: float, transport_type: str,
             "type": "train",
             "lat": -33.8655,
             "lng": 151.2065,
-            "distance_km": round(_calculate_distance(lat, lng, -33.8655, 151.2065), 2),
             "services": ["T1", "T2", "T3", "T9"],
             "facilities": ["wheelchair_accessible", "shops", "underground"]
         }
@@ -203,6 +444,9 @@ async def _find_transport_mock_data(lat: float, lng: float, transport_type: str,
     if transport_type != "all":
         mock_stations = [s for s in mock_stations if s["type"] == transport_type]
     
+    # Tum aday duraklarin mesafesini tek vektorel cagriyla hesapla
+    _attach_distances(mock_stations, lat, lng)
+    
     # Filter by radius
     nearby_stations = [s for s in mock_stations if s["distance_km"] <= radius]
     
@@ -229,7 +473,7 @@ async def _find_transport_mock_data(lat: float, lng: float, transport_type: str,
 
 async def _plan_route_mock_data(origin_lat: float, origin_lng: float, destination_lat: float, destination_lng: float, travel_modes: List[str], departure_time: str) -> Dict[str, Any]:
     """Mock route planning data with real pricing calculations"""
-    distance_km = _calculate_distance(origin_lat, origin_lng, destination_lat, destination_lng)
+    distance_km = haversine_km(origin_lat, origin_lng, destination_lat, destination_lng)
     
     # Use real pricing calculations
     journey_cost = calculate_journey_fare(distance_km, peak_time=True, transport_type="train")
@@ -313,18 +557,15 @@ async def _get_transport_status_mock_data(stop_id: str, transport_type: str, lim
     }
 
 # Real API implementations
+@single_flight
 async def _find_transport_real_api(lat: float, lng: float, transport_type: str, radius: float, max_results: int) -> Dict[str, Any]:
     """Real Google Places API for transport stations"""
     try:
         # Track API cost using real pricing
         track_api_usage("google_places", 1)
         
-        # Google Maps client
-        if googlemaps is None:
-            logger.error("googlemaps package not available")
-            return await _find_transport_mock_data(lat, lng, transport_type, radius, max_results)
-        
-        gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
+        # Paylasilan async Google Maps istemcisi
+        gmaps = get_google_maps_client(GOOGLE_MAPS_API_KEY)
         
         # Map transport type to Google Places type
         place_types = {
@@ -337,7 +578,7 @@ async def _find_transport_real_api(lat: float, lng: float, transport_type: str,
         google_type = place_types.get(transport_type, "transit_station")
         
         # Search for nearby transport
-        places_result = gmaps.places_nearby(
+        places_result = await gmaps.places_nearby(
             location=(lat, lng),
             radius=int(radius * 1000),  # Convert km to meters
             type=google_type
@@ -351,15 +592,14 @@ async def _find_transport_real_api(lat: float, lng: float, transport_type: str,
                 "type": transport_type if transport_type != "all" else "station",
                 "lat": place.get('geometry', {}).get('location', {}).get('lat', 0),
                 "lng": place.get('geometry', {}).get('location', {}).get('lng', 0),
-                "distance_km": round(_calculate_distance(lat, lng, 
-                    place.get('geometry', {}).get('location', {}).get('lat', 0),
-                    place.get('geometry', {}).get('location', {}).get('lng', 0)), 2),
                 "rating": place.get('rating', 0),
                 "services": ["Real API - Check details"],
                 "facilities": ["Real station data"]
             }
             stations.append(station_data)
         
+        _attach_distances(stations, lat, lng)
+        
         return {
             "status": "success",
             "data": {
@@ -380,24 +620,21 @@ async def _find_transport_real_api(lat: float, lng: float, transport_type: str,
         logger.error(f"Google Places API error: {str(error)}")
         return await _find_transport_mock_data(lat, lng, transport_type, radius, max_results)
 
+@single_flight
 async def _plan_route_real_api(origin_lat: float, origin_lng: float, destination_lat: float, destination_lng: float, travel_modes: List[str], departure_time: str) -> Dict[str, Any]:
     """Real Google Directions API for route planning"""
     try:
         # Track API cost using real pricing
         track_api_usage("google_directions", 1)
         
-        # Google Maps client
-        if googlemaps is None:
-            logger.error("googlemaps package not available")
-            return await _plan_route_mock_data(origin_lat, origin_lng, destination_lat, destination_lng, travel_modes, departure_time)
-        
-        gmaps = googlemaps.Client(key=GOOGLE_MAPS_API_KEY)
+        # Paylasilan async Google Maps istemcisi
+        gmaps = get_google_maps_client(GOOGLE_MAPS_API_KEY)
         
         # Convert travel modes to Google format
         mode = "transit" if "transit" in travel_modes else "walking"
         
         # Get directions
-        directions_result = gmaps.directions(
+        directions_result = await gmaps.directions(
             origin=(origin_lat, origin_lng),
             destination=(destination_lat, destination_lng),
             mode=mode,
@@ -458,21 +695,45 @@ async def _plan_route_real_api(origin_lat: float, origin_lng: float, destination
         logger.error(f"Google Directions API error: {str(error)}")
         return await _plan_route_mock_data(origin_lat, origin_lng, destination_lat, destination_lng, travel_modes, departure_time)
 
+# NSW departure monitor yanitlari - stop_id ile anahtarlanir, tur ve limitten bagimsiz tum tablo
+_departure_board_cache = TTLCache(max_entries=TRANSPORT_BOARD_CACHE_MAX_ENTRIES,
+                                  ttl_seconds=TRANSPORT_BOARD_CACHE_TTL_SECONDS)
+
+def get_transport_cache_stats() -> Dict[str, Any]:
+    """Kalkis tablosu onbellegi isabet/iska ve upstream istek birlestirme istatistikleri"""
+    stats = _departure_board_cache.stats()
+    stats["single_flight"] = _fetch_departure_board_real_api.single_flight.stats()
+    return stats
+
 async def _get_transport_status_real_api(stop_id: str, transport_type: str, limit: int) -> Dict[str, Any]:
-    """Real NSW Transport API for real-time status - FIXED IMPLEMENTATION"""
+    """NSW departure monitor - durak tablosu kisa TTL'li onbellekten, tur filtresi ve limit bellekte uygulanir"""
+    board = _departure_board_cache.get(stop_id)
+    if board is not None:
+        logger.info(f"Departure board cache hit: {stop_id}")
+    else:
+        board = await _fetch_departure_board_real_api(stop_id)
+        # Sadece gercek API tablolari saklanir - hata/mock yedegi bir sonraki cagrida yeniden denenir
+        if board.get("status") == "success" and board.get("source") == "nsw_transport_api_v2":
+            _departure_board_cache.set(stop_id, board)
+    return _departure_board_view(board, transport_type, limit)
+
+@single_flight
+async def _fetch_departure_board_real_api(stop_id: str) -> Dict[str, Any]:
+    """
+    Real NSW Transport API for real-time status - durak basina tek istek
+
+    Anahtar sadece stop_id: ayni duraga es zamanli gelen tum cagrilar
+    (farkli transport_type/limit olsa da) tek upstream istegini paylasir.
+    Tablo turden bagimsiz tum kalkislari icerir.
+    """
     try:
         # Track API cost using real pricing
         track_api_usage("nsw_transport", 1)
         
         # NSW Transport API v1 - Fallback to v1 due to v2 authentication issues
         # Documentation: https://opendata.transport.nsw.gov.au/
-        departure_url = "https://api.transport.nsw.gov.au/v1/tp/departure_mon"
-        
-        headers = {
-            "Authorization": f"apikey {NSW_TRANSPORT_API_KEY}",
-            "Accept": "application/json",
-            "Content-Type": "application/json"
-        }
+        # Paylasilan istemci: keep-alive havuzu, DNS onbellegi ve kimlik basliklari sunucu boyunca yasar
+        client = get_nsw_transport_client(NSW_TRANSPORT_API_KEY)
         
         # Parameters for NSW Transport Departure API v2
         now = datetime.now()
@@ -493,142 +754,152 @@ async def _get_transport_status_real_api(stop_id: str, transport_type: str, limi
             "TfNSWDM": "true"  # Transport for NSW departure monitor
         }
         
-        async with aiohttp.ClientSession() as session:
-            async with session.get(departure_url, headers=headers, params=params) as response:
-                logger.info(f"NSW Transport API response status: {response.status}")
-                
-                if response.status == 200:
-                    try:
-                        data = await response.json()
-                        logger.info(f"NSW Transport API response received for stop: {stop_id}")
-                        
-                        # Parse NSW Transport API response - Handle different response formats
-                        arrivals = []
-                        
-                        # Try different response structure formats
-                        stop_events = None
-                        if "stopEvents" in data:
-                            stop_events = data["stopEvents"]
-                        elif "departureList" in data:
-                            stop_events = data["departureList"]
-                        elif "departures" in data:
-                            stop_events = data["departures"]
-                        
-                        if stop_events and len(stop_events) > 0:
-                            for stop_event in stop_events[:limit]:
-                                try:
-                                    # Extract departure times
-                                    departure = (stop_event.get("departureTimeEstimated") or 
-                                               stop_event.get("estimatedTime") or 
-                                               stop_event.get("departureTimePlanned", ""))
-                                    planned = (stop_event.get("departureTimePlanned") or 
-                                             stop_event.get("scheduledTime", ""))
-                                    
-                                    # Calculate delay
-                                    delay_minutes = 0
-                                    if departure and planned and departure != planned:
-                                        try:
-                                            if 'T' in departure and 'T' in planned:
-                                                dep_time = datetime.fromisoformat(departure.replace('Z', '+00:00'))
-                                                plan_time = datetime.fromisoformat(planned.replace('Z', '+00:00'))
-                                                delay_minutes = int((dep_time - plan_time).total_seconds() / 60)
-                                        except Exception as time_error:
-                                            logger.warning(f"Time parsing error: {time_error}")
-                                            delay_minutes = 0
-                                    
-                                    # Extract transportation info
-                                    transportation = stop_event.get("transportation", {})
-                                    if not transportation:
-                                        transportation = stop_event.get("transport", {})
-                                    
-                                    # Build arrival data
-                                    arrival_data = {
-                                        "service_id": (transportation.get("number") or 
-                                                     transportation.get("routeNo") or 
-                                                     transportation.get("service_id", "Unknown")),
-                                        "line": _format_transport_line(transportation),
-                                        "destination": _extract_destination(transportation, stop_event),
-                                        "scheduled_time": planned,
-                                        "estimated_time": departure,
-                                        "delay_minutes": delay_minutes,
-                                        "platform": _extract_platform(stop_event),
-                                        "realtime": stop_event.get("isRealtimeControlled", True)
-                                    }
-                                    arrivals.append(arrival_data)
-                                    
-                                except Exception as parse_error:
-                                    logger.warning(f"Error parsing stop event: {parse_error}")
-                                    continue
-                        
-                        # Get stop information
-                        stop_info = _extract_stop_info(data, stop_id, transport_type)
-                        
-                        return {
-                            "status": "success",
-                            "data": {
-                                "stop_info": stop_info,
-                                "services": arrivals,
-                                "total_services": len(arrivals)
-                            },
-                            "timestamp": datetime.now().isoformat(),
-                            "source": "nsw_transport_api_v2",
-                            "api_cost_usd": get_api_costs().get("nsw_transport", 0.01)
-                        }
-                        
-                    except json.JSONDecodeError as json_error:
-                        logger.error(f"NSW Transport API JSON decode error: {json_error}")
-                        response_text = await response.text()
-                        logger.error(f"Response content: {response_text[:500]}...")
-                        return await _fallback_to_mock_with_error("json_decode_error", stop_id, transport_type, limit)
+        async with client.departure_monitor(params) as response:
+            logger.info(f"NSW Transport API response status: {response.status}")
+            
+            if response.status == 200:
+                try:
+                    data = await response.json()
+                    logger.info(f"NSW Transport API response received for stop: {stop_id}")
                     
-                elif response.status == 401:
-                    logger.error("NSW Transport API: Invalid API key")
-                    return {
-                        "status": "error",
-                        "message": "NSW Transport API authentication failed",
-                        "error_code": "API_AUTH_ERROR",
-                        "timestamp": datetime.now().isoformat()
-                    }
+                    # Parse NSW Transport API response - Handle different response formats
+                    arrivals = []
+                    
+                    # Try different response structure formats
+                    stop_events = None
+                    if "stopEvents" in data:
+                        stop_events = data["stopEvents"]
+                    elif "departureList" in data:
+                        stop_events = data["departureList"]
+                    elif "departures" in data:
+                        stop_events = data["departures"]
+                    
+                    if stop_events and len(stop_events) > 0:
+                        for stop_event in stop_events[:TRANSPORT_BOARD_MAX_DEPARTURES]:
+                            try:
+                                # Extract departure times
+                                departure = (stop_event.get("departureTimeEstimated") or 
+                                           stop_event.get("estimatedTime") or 
+                                           stop_event.get("departureTimePlanned", ""))
+                                planned = (stop_event.get("departureTimePlanned") or 
+                                         stop_event.get("scheduledTime", ""))
+                                
+                                # Calculate delay
+                                delay_minutes = 0
+                                if departure and planned and departure != planned:
+                                    try:
+                                        if 'T' in departure and 'T' in planned:
+                                            dep_time = datetime.fromisoformat(departure.replace('Z', '+00:00'))
+                                            plan_time = datetime.fromisoformat(planned.replace('Z', '+00:00'))
+                                            delay_minutes = int((dep_time - plan_time).total_seconds() / 60)
+                                    except Exception as time_error:
+                                        logger.warning(f"Time parsing error: {time_error}")
+                                        delay_minutes = 0
+                                
+                                # Extract transportation info
+                                transportation = stop_event.get("transportation", {})
+                                if not transportation:
+                                    transportation = stop_event.get("transport", {})
+                                
+                                # Build arrival data
+                                arrival_data = {
+                                    "service_id": (transportation.get("number") or 
+                                                 transportation.get("routeNo") or 
+                                                 transportation.get("service_id", "Unknown")),
+                                    "line": _format_transport_line(transportation),
+                                    "mode": _NSW_PRODUCT_MODES.get((transportation.get("product") or {}).get("class")),
+                                    "destination": _extract_destination(transportation, stop_event),
+                                    "scheduled_time": planned,
+                                    "estimated_time": departure,
+                                    "delay_minutes": delay_minutes,
+                                    "platform": _extract_platform(stop_event),
+                                    "realtime": stop_event.get("isRealtimeControlled", True)
+                                }
+                                arrivals.append(arrival_data)
+                                
+                            except Exception as parse_error:
+                                logger.warning(f"Error parsing stop event: {parse_error}")
+                                continue
+                    
+                    # Get stop information
+                    stop_info = _extract_stop_info(data, stop_id, "all")
                     
-                elif response.status == 429:
-                    logger.error("NSW Transport API: Rate limit exceeded")
                     return {
-                        "status": "error", 
-                        "message": "NSW Transport API rate limit exceeded",
-                        "error_code": "API_RATE_LIMIT",
-                        "timestamp": datetime.now().isoformat()
+                        "status": "success",
+                        "data": {
+                            "stop_info": stop_info,
+                            "services": arrivals,
+                            "total_services": len(arrivals)
+                        },
+                        "timestamp": datetime.now().isoformat(),
+                        "source": "nsw_transport_api_v2",
+                        "api_cost_usd": get_api_costs().get("nsw_transport", 0.01)
                     }
                     
-                else:
-                    logger.error(f"NSW Transport API error: HTTP {response.status}")
-                    error_text = await response.text()
-                    logger.error(f"Response: {error_text}")
-                    
-                    # Fall back to mock data if API fails
-                    logger.info("NSW Transport API failed, falling back to mock data")
-                    return await _get_transport_status_mock_data(stop_id, transport_type, limit)
-        
+                except json.JSONDecodeError as json_error:
+                    logger.error(f"NSW Transport API JSON decode error: {json_error}")
+                    response_text = await response.text()
+                    logger.error(f"Response content: {response_text[:500]}...")
+                    return await _fallback_to_mock_with_error("json_decode_error", stop_id, "all",
+                                                              TRANSPORT_BOARD_MAX_DEPARTURES)
+                
+            elif response.status == 401:
+                logger.error("NSW Transport API: Invalid API key")
+                return {
+                    "status": "error",
+                    "message": "NSW Transport API authentication failed",
+                    "error_code": "API_AUTH_ERROR",
+                    "timestamp": datetime.now().isoformat()
+                }
+                
+            elif response.status == 429:
+                logger.error("NSW Transport API: Rate limit exceeded")
+                return {
+                    "status": "error", 
+                    "message": "NSW Transport API rate limit exceeded",
+                    "error_code": "API_RATE_LIMIT",
+                    "timestamp": datetime.now().isoformat()
+                }
+                
+            else:
+                logger.error(f"NSW Transport API error: HTTP {response.status}")
+                error_text = await response.text()
+                logger.error(f"Response: {error_text}")
+                
+                # Fall back to mock data if API fails
+                logger.info("NSW Transport API failed, falling back to mock data")
+                return await _get_transport_status_mock_data(stop_id, "all", TRANSPORT_BOARD_MAX_DEPARTURES)
+    
     except Exception as error:
         logger.error(f"NSW Transport API error: {str(error)}")
         # Fall back to mock data on exception
-        return await _get_transport_status_mock_data(stop_id, transport_type, limit)
-
-def _calculate_distance(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
-    """Calculate distance using Haversine formula"""
-    lat1_rad = math.radians(lat1)
-    lng1_rad = math.radians(lng1)
-    lat2_rad = math.radians(lat2)
-    lng2_rad = math.radians(lng2)
-    
-    dlat = lat2_rad - lat1_rad
-    dlng = lng2_rad - lng1_rad
-    
-    a = (math.sin(dlat / 2) ** 2 + 
-         math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlng / 2) ** 2)
-    c = 2 * math.asin(math.sqrt(a))
-    
-    earth_radius_km = 6371
-    return earth_radius_km * c
+        return await _get_transport_status_mock_data(stop_id, "all", TRANSPORT_BOARD_MAX_DEPARTURES)
+
+def _departure_board_view(board: Dict[str, Any], transport_type: str, limit: int) -> Dict[str, Any]:
+    """
+    Tum durak tablosundan cagiranin gorunumu - tur filtresi ve limit bellekte
+
+    Paylasilan tablo degistirilmez; turu bilinmeyen kalkislar (mode None)
+    her filtrede listelenir.
+    """
+    if board.get("status") != "success":
+        return board
+    data = board["data"]
+    services = [service for service in data["services"]
+                if transport_type == "all" or service.get("mode") in (None, transport_type)][:limit]
+    view = dict(data, stop_info=dict(data["stop_info"], type=transport_type), services=services,
+                total_services=len(services))
+    return dict(board, data=view)
+
+def _attach_distances(stations: List[Dict[str, Any]], lat: float, lng: float) -> None:
+    """Duraklara arama noktasina olan mesafeyi (km) toplu hesaplayip ekle"""
+    if not stations:
+        return
+    distances = haversine_one_to_many(lat, lng,
+                                      [s["lat"] for s in stations],
+                                      [s["lng"] for s in stations])
+    for station, distance in zip(stations, distances.tolist()):
+        station["distance_km"] = round(distance, 2)
 
 class TransportTool:
     """Transport tool wrapper for backward compatibility"""
@@ -639,10 +910,13 @@ class TransportTool:
     async def plan_route(self, origin_lat: float, origin_lng: float, destination_lat: float, destination_lng: float, travel_modes: List[str] = ["transit", "walking"], departure_time: str = "now") -> Dict[str, Any]:
         return await plan_route(origin_lat, origin_lng, destination_lat, destination_lng, travel_modes, departure_time)
     
-    async def get_transport_status(self, stop_id: str, transport_type: str = "train", limit: int = 5) -> Dict[str, Any]:
+    async def get_transport_status(self, stop_id: str, transport_type: str = "all", limit: int = 5) -> Dict[str, Any]:
         return await get_transport_status(stop_id, transport_type, limit)
 
 # Helper functions for NSW Transport API parsing
+# transportation.product.class -> arac turu (okul ve coach servisleri otobus sayilir)
+_NSW_PRODUCT_MODES = {1: "train", 2: "metro", 4: "light_rail", 5: "bus", 7: "bus", 9: "ferry", 11: "bus"}
+
 def _format_transport_line(transportation: Dict[str, Any]) -> str:
     """Format transport line information"""
     try:
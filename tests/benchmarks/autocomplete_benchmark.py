@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+# Benchmark - Prefix Autocomplete
+# Sirali dizi onek indeksi (soguk/sicak onbellek) ile dogrusal ad taramasini karsilastir
+
+import os
+import random
+import sys
+import time
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from mcp_tools.catalog import CompactPlaceCatalog, normalize_label
+from catalog_memory_benchmark import iter_synthetic_places
+
+CATALOG_SIZES = [10_000, 100_000]
+QUERIES_PER_RUN = 2_000
+TOP_K = 5
+
+def linear_scan(places: list, prefix: str, k: int) -> list:
+    """Eski yontem: her adin kelime baslarini tara, populerlige gore sirala"""
+    normalized = normalize_label(prefix)
+    matches = []
+    for place in places:
+        words = normalize_label(place["name"]).split(" ")
+        # Onek herhangi bir kelime basindan baslayabilir ("place 12" -> "Synthetic Place 12")
+        if any(" ".join(words[start:]).startswith(normalized) for start in range(len(words))):
+            matches.append(place)
+    matches.sort(key=lambda place: -place.get("user_ratings_total", 0))
+    return matches[:k]
+
+def random_prefixes(rng: random.Random, size: int) -> list:
+    """Kullanicinin yazmakta oldugu onekler - kisa onekler daha sik"""
+    prefixes = []
+    for _ in range(QUERIES_PER_RUN):
+        text = rng.choice(["Synthetic Place ", "place "]) + str(rng.randrange(size))
+        prefixes.append(text[:rng.randint(2, len(text))])
+    return prefixes
+
+def run_benchmark():
+    """Her katalog boyutu icin onek sorgu suresini olc"""
+    print("🔤 BENCHMARK: Prefix Autocomplete")
+    print("=" * 72)
+    print(f"{'places':>8} {'build s':>8} {'linear us':>11} {'cold us':>9} {'warm us':>9} {'hit rate':>9}")
+
+    for size in CATALOG_SIZES:
+        rng = random.Random(size)
+        catalog = CompactPlaceCatalog()
+        for place_id, place_data in iter_synthetic_places(size):
+            place_data["user_ratings_total"] = rng.randint(0, 5000)
+            catalog.add_place(place_data, place_id)
+
+        start = time.perf_counter()
+        index = catalog.prefix_index()
+        build_s = time.perf_counter() - start
+
+        prefixes = random_prefixes(rng, size)
+
+        places = list(catalog.iter_places())
+        start = time.perf_counter()
+        for prefix in prefixes[:20]:
+            linear_scan(places, prefix, TOP_K)
+        linear_us = (time.perf_counter() - start) * 1e6 / 20
+
+        start = time.perf_counter()
+        for prefix in prefixes:
+            index.complete(prefix, TOP_K)
+        cold_us = (time.perf_counter() - start) * 1e6 / len(prefixes)
+
+        start = time.perf_counter()
+        for prefix in prefixes:
+            index.complete(prefix, TOP_K)
+        warm_us = (time.perf_counter() - start) * 1e6 / len(prefixes)
+
+        stats = index.cache_stats()
+        hit_rate = stats["hits"] / max(stats["hits"] + stats["misses"], 1)
+        print(f"{size:>8} {build_s:>8.2f} {linear_us:>11.0f} {cold_us:>9.1f} {warm_us:>9.1f} {hit_rate:>8.0%}")
+
+    print("✅ Autocomplete benchmark complete")
+
+if __name__ == "__main__":
+    run_benchmark()
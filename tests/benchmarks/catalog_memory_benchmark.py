@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# Benchmark - Compact Catalog Memory
+# tracemalloc ile fixture sozlukleri, sozluk + kume indeksleri ve CompactPlaceCatalog bellek kullanimini karsilastir, artimli rating sirasini dogrula
+
+import gc
+import math
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from mcp_tools.catalog import CompactPlaceCatalog, SpatialGridIndex, TextIndex, tokenize
+from mcp_tools.geodesy import KM_PER_DEGREE
+
+# Sydney cevresinde sentetik katalog sinirlari
+SYDNEY_BOUNDS = {"min_lat": -34.10, "max_lat": -33.65, "min_lng": 150.90, "max_lng": 151.35}
+CATALOG_SIZES = [10_000, 100_000, 250_000]
+PLACE_TYPES = ["restaurant", "museum", "park", "tourist_attraction", "shopping_mall", "cafe"]
+STREETS = ["George St", "Pitt St", "Oxford St", "King St", "Crown St", "Glebe Point Rd", "Macquarie St"]
+SUBURBS = ["Sydney NSW 2000", "Surry Hills NSW 2010", "Newtown NSW 2042", "Glebe NSW 2037"]
+QUERIES_PER_RUN = 200
+# Artimli guncelleme turu: silinen/guncellenen/eklenen mekan orani
+CHANGED_FRACTION = 0.02
+
+def iter_synthetic_places(count: int, seed: int = 42):
+    """Fixture formatinda sentetik mekanlari tek tek uret"""
+    rng = random.Random(seed)
+    for i in range(count):
+        place_id = f"place_{i:07d}"
+        yield place_id, {
+            "place_id": place_id,
+            "name": f"Synthetic Place {i}",
+            "place_type": rng.choice(PLACE_TYPES),
+            "lat": rng.uniform(SYDNEY_BOUNDS["min_lat"], SYDNEY_BOUNDS["max_lat"]),
+            "lng": rng.uniform(SYDNEY_BOUNDS["min_lng"], SYDNEY_BOUNDS["max_lng"]),
+            "rating": round(rng.uniform(3.0, 5.0), 1),
+            "price_level": rng.randint(1, 4),
+            "description": f"{rng.choice(['Cosy', 'Busy', 'Quiet', 'Historic'])} {rng.choice(PLACE_TYPES)} near the harbour",
+            "address": f"{rng.randint(1, 400)} {rng.choice(STREETS)}, {rng.choice(SUBURBS)}"
+        }
+
+def measure(build):
+    """build() sonucunun tuttugu bellek (MB) ve kurulum suresi (s)"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current / (1024 * 1024), elapsed
+
+def build_fixture_dict(size: int) -> dict:
+    """Mevcut fixture temsili: place_id -> sozluk"""
+    return dict(iter_synthetic_places(size))
+
+def build_dict_catalog(size: int) -> tuple:
+    """
+    Eski sozluk katalogu temsili: fixture sozlukleri + kume/liste indeksleri
+
+    Kelime -> satir kumesi postingleri, sirali kelime listesi ve hucre ->
+    satir listesi grid'i; compact katalogla ayni isi goren es temsil.
+    """
+    places, row_by_id, postings, cells = {}, {}, {}, {}
+    cell_size_deg = 0.5 / KM_PER_DEGREE
+    for row, (place_id, place_data) in enumerate(iter_synthetic_places(size)):
+        places[place_id] = place_data
+        row_by_id[place_id] = row
+        for token in set(tokenize(place_data["name"]) + tokenize(place_data["description"])):
+            postings.setdefault(token, set()).add(row)
+        cell = (math.floor(place_data["lat"] / cell_size_deg), math.floor(place_data["lng"] / cell_size_deg))
+        cells.setdefault(cell, []).append(row)
+    return places, row_by_id, postings, sorted(postings), cells
+
+def build_compact_catalog(size: int) -> CompactPlaceCatalog:
+    """Sutunlar + string tablosu + indeksler (kaynak sozlukler tutulmaz)"""
+    catalog = CompactPlaceCatalog()
+    for place_id, place_data in iter_synthetic_places(size):
+        catalog.add_place(place_data, place_id)
+    catalog.freeze()
+    return catalog
+
+def build_compact_indexes(size: int) -> tuple:
+    """Sadece compact katalogun CSR metin ve grid indeksleri (kelime listesi dahil)"""
+    text_index, spatial_index = TextIndex(), SpatialGridIndex(0.5)
+    for row, (_, place_data) in enumerate(iter_synthetic_places(size)):
+        text_index.add(row, (place_data["name"], place_data["description"]))
+        spatial_index.insert(row, place_data["lat"], place_data["lng"])
+    text_index.freeze()
+    spatial_index.freeze()
+    return text_index, spatial_index
+
+def time_queries(catalog, rng: random.Random) -> float:
+    """Yaricap + metin aramasi ve ilk 10 sonucun sozluk uretimi (ortalama ms)"""
+    start = time.perf_counter()
+    for _ in range(QUERIES_PER_RUN):
+        lat = rng.uniform(SYDNEY_BOUNDS["min_lat"], SYDNEY_BOUNDS["max_lat"])
+        lng = rng.uniform(SYDNEY_BOUNDS["min_lng"], SYDNEY_BOUNDS["max_lng"])
+        matches = catalog.search(lat, lng, 1.0, "harbour", "restaurant")
+        [place_data.copy() for place_data, _ in sorted(matches, key=lambda match: match[1])[:10]]
+    return (time.perf_counter() - start) * 1000 / QUERIES_PER_RUN
+
+def expected_top_rated(places: dict, place_type: str, limit: int) -> list:
+    """Referans: rating azalan, esitlikte ekleme sirasi"""
+    order = [(-place_data["rating"], index, place_id)
+             for index, (place_id, place_data) in enumerate(places.items()) if place_data["place_type"] == place_type]
+    return [place_id for _, _, place_id in sorted(order)[:limit]]
+
+def check_incremental_rating_order(catalog: CompactPlaceCatalog, size: int) -> tuple:
+    """
+    Degisiklik sonrasi top_rated: artimli birlestirme ile bastan kurulan katalog ayni olmali
+
+    Returns:
+        (esit mi, artimli sorgu ms, bastan siralama ms)
+    """
+    rng = random.Random(size + 1)
+    places = dict(iter_synthetic_places(size))
+    catalog.top_rated(None, 10)
+    for place_type in PLACE_TYPES:
+        catalog.top_rated(place_type, 10)
+
+    changed = int(size * CHANGED_FRACTION)
+    for place_id in rng.sample(list(places), changed):
+        if rng.random() < 0.5:
+            catalog.remove_place(place_id)
+            del places[place_id]
+        else:
+            place_data = dict(places.pop(place_id), rating=round(rng.uniform(3.0, 5.0), 1))
+            places[place_id] = place_data
+            catalog.add_place(place_data, place_id)
+    for place_id, place_data in iter_synthetic_places(changed, seed=size):
+        place_id = f"new_{place_id}"
+        places[place_id] = dict(place_data, place_id=place_id)
+        catalog.add_place(places[place_id], place_id)
+
+    # Ilk sorgu biriken degisiklikleri kurulu tum siralara (tum katalog + her tip) uygular
+    start = time.perf_counter()
+    incremental = catalog.top_rated("park", 20)
+    for place_type in [None] + PLACE_TYPES:
+        catalog.top_rated(place_type, 20)
+    incremental_ms = (time.perf_counter() - start) * 1000
+    identical = [place["place_id"] for place in incremental] == expected_top_rated(places, "park", 20)
+    identical &= catalog.count_by_type() == len(places)
+    for place_type in PLACE_TYPES:
+        identical &= [place["place_id"] for place in catalog.top_rated(place_type, 50)] == \
+            expected_top_rated(places, place_type, 50)
+
+    # Eski davranis: degisiklik tum siralari siler, ayni sorgular hepsini bastan siralar
+    rebuilt = CompactPlaceCatalog(places)
+    start = time.perf_counter()
+    rebuilt.top_rated("park", 20)
+    for place_type in [None] + PLACE_TYPES:
+        rebuilt.top_rated(place_type, 20)
+    rebuild_ms = (time.perf_counter() - start) * 1000
+    return identical, incremental_ms, rebuild_ms
+
+def run_benchmark() -> bool:
+    """Her katalog boyutu icin uc temsilin bellek kullanimini olc"""
+    print("🧠 BENCHMARK: Catalog Memory (tracemalloc)")
+    print("=" * 86)
+    all_identical = True
+    all_smaller = True
+    print(f"{'places':>8} {'representation':>22} {'MB':>9} {'bytes/place':>12} {'build s':>8} {'query ms':>9}")
+
+    for size in CATALOG_SIZES:
+        fixture, fixture_mb, fixture_s = measure(lambda: build_fixture_dict(size))
+
+        dict_catalog, dict_mb, dict_s = measure(lambda: build_dict_catalog(size))
+        del dict_catalog
+
+        compact_indexes, index_mb, _ = measure(lambda: build_compact_indexes(size))
+        del compact_indexes
+
+        compact_catalog, compact_mb, compact_s = measure(lambda: build_compact_catalog(size))
+        compact_query_ms = time_queries(compact_catalog, random.Random(size))
+
+        # Katalog fixture kayitlarini ve siralamasini aynen dondurmeli
+        for place_id in (f"place_{i:07d}" for i in range(0, size, max(size // 100, 1))):
+            assert fixture[place_id] == compact_catalog.get_place(place_id), place_id
+        assert [p["place_id"] for p in compact_catalog.top_rated("park", 20)] == \
+            expected_top_rated(fixture, "park", 20)
+        del fixture
+
+        rows = [
+            ("fixture dicts", fixture_mb, fixture_s, None),
+            ("dicts + set indexes", dict_mb, dict_s, None),
+            ("CompactPlaceCatalog", compact_mb, compact_s, compact_query_ms)
+        ]
+        for label, megabytes, build_s, query_ms in rows:
+            query = f"{query_ms:>9.3f}" if query_ms is not None else f"{'-':>9}"
+            print(f"{size:>8} {label:>22} {megabytes:>9.1f} {megabytes * 1024 * 1024 / size:>12.0f} "
+                  f"{build_s:>8.2f} {query}")
+        print(f"{'':>8} {'compact columns only':>22} {compact_catalog.nbytes / (1024 * 1024):>9.1f} "
+              f"{compact_catalog.nbytes / size:>12.0f}")
+        print(f"{'':>8} {'compact indexes':>22} {index_mb:>9.1f} {index_mb * 1024 * 1024 / size:>12.0f} "
+              f"(int32 arrays {compact_catalog.index_nbytes / (1024 * 1024):.1f} MB)")
+        print(f"{'':>8} {'saving vs fixture dicts':>22} {(1 - compact_mb / fixture_mb) * 100:>8.1f}%")
+        print(f"{'':>8} {'saving vs set indexes':>22} {(1 - compact_mb / dict_mb) * 100:>8.1f}%")
+        all_smaller &= compact_mb < fixture_mb
+        identical, incremental_ms, rebuild_ms = check_incremental_rating_order(compact_catalog, size)
+        all_identical &= identical
+        print(f"{'':>8} {'top_rated after changes':>22} {incremental_ms:>8.2f} ms incremental vs "
+              f"{rebuild_ms:.2f} ms full sort ({CHANGED_FRACTION:.0%} changed, identical: {identical})")
+        print("-" * 86)
+
+        del compact_catalog
+
+    if not all_identical:
+        print("❌ Incremental rating order differs from rebuild")
+    elif not all_smaller:
+        print("❌ Compact catalog uses more memory than the fixture dicts")
+    else:
+        print("✅ Compact catalog returned identical places and rankings in less memory than the fixture dicts")
+    return all_identical and all_smaller
+
+if __name__ == "__main__":
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# Load Test - Pooled Async Google Maps Client
+# Yerel sahte Google sunucusuna karsi eszamanli cagricilarla throughput olcumu
+
+import asyncio
+import json
+import statistics
+import sys
+import os
+import threading
+import time
+import urllib.parse
+import urllib.request
+
+from aiohttp import web
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from mcp_tools.clients import GoogleMapsClient
+
+UPSTREAM_LATENCY_SECONDS = 0.05
+CONCURRENT_CALLERS = [1, 10, 50]
+REQUESTS_PER_CALLER = 10
+
+SAMPLE_RESPONSE = {
+    "status": "OK",
+    "results": [
+        {
+            "place_id": "stand_in_001",
+            "name": "Stand-in Vegan Cafe",
+            "geometry": {"location": {"lat": -33.8688, "lng": 151.2093}},
+            "rating": 4.5
+        }
+    ]
+}
+
+def start_stand_in_server() -> tuple:
+    """Sahte Google sunucusunu ayri thread ve event loop'ta baslat"""
+    ready = threading.Event()
+    state = {}
+
+    async def text_search(request: web.Request) -> web.Response:
+        # Google gecikmesini taklit et
+        await asyncio.sleep(UPSTREAM_LATENCY_SECONDS)
+        return web.json_response(SAMPLE_RESPONSE)
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_get("/maps/api/place/textsearch/json", text_search)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        loop.run_until_complete(site.start())
+        state["port"] = site._server.sockets[0].getsockname()[1]
+        state["loop"] = loop
+        ready.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    ready.wait()
+    return f"http://127.0.0.1:{state['port']}", state["loop"]
+
+async def legacy_blocking_search(base_url: str) -> dict:
+    """Eski yontem: async fonksiyon icinde senkron HTTP (googlemaps.Client gibi)"""
+    params = urllib.parse.urlencode({"query": "vegan in Sydney", "key": "test"})
+    with urllib.request.urlopen(f"{base_url}/maps/api/place/textsearch/json?{params}") as response:
+        return json.loads(response.read())
+
+async def pooled_async_search(client: GoogleMapsClient) -> dict:
+    """Yeni yontem: paylasilan havuzlu async istemci"""
+    return await client.places(query="vegan in Sydney")
+
+async def measure_loop_lag(stop: asyncio.Event, samples: list) -> None:
+    """Event loop'un ne kadar bloklandigini olc (10ms tick gecikmesi)"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        samples.append(time.perf_counter() - start - 0.01)
+
+async def run_load(callers: int, call_factory) -> dict:
+    """callers kadar eszamanli cagrici calistir ve sonuclari topla"""
+    latencies = []
+    lag_samples = []
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(measure_loop_lag(stop, lag_samples))
+
+    async def caller():
+        for _ in range(REQUESTS_PER_CALLER):
+            start = time.perf_counter()
+            await call_factory()
+            latencies.append(time.perf_counter() - start)
+            # Diger gorevlere sira ver
+            await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(caller() for _ in range(callers)))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await lag_task
+    latencies.sort()
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "max_loop_lag_ms": max(lag_samples, default=0) * 1000
+    }
+
+async def run_benchmark() -> bool:
+    """Eski ve yeni yontemi ayni sahte sunucuya karsi karsilastir"""
+    base_url, server_loop = start_stand_in_server()
+    print("🚦 LOAD TEST: Pooled Async Google Maps Client")
+    print(f"   Stand-in server: {base_url} (latency {UPSTREAM_LATENCY_SECONDS * 1000:.0f}ms)")
+    print("=" * 78)
+    print(f"{'callers':>8} {'mode':>8} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} {'max loop lag ms':>16}")
+
+    client = GoogleMapsClient(api_key="test", base_url=base_url, max_concurrency=50, max_connections=50)
+    try:
+        for callers in CONCURRENT_CALLERS:
+            legacy = await run_load(callers, lambda: legacy_blocking_search(base_url))
+            pooled = await run_load(callers, lambda: pooled_async_search(client))
+            for mode, result in (("legacy", legacy), ("pooled", pooled)):
+                print(f"{callers:>8} {mode:>8} {result['throughput']:>9.1f} {result['p50_ms']:>9.1f} "
+                      f"{result['p95_ms']:>9.1f} {result['max_loop_lag_ms']:>16.1f}")
+    finally:
+        await client.aclose()
+        server_loop.call_soon_threadsafe(server_loop.stop)
+
+    return True
+
+if __name__ == "__main__":
+    success = asyncio.run(run_benchmark())
+    sys.exit(0 if success else 1)
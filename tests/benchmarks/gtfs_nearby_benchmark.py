@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# Benchmark - GTFS Static Ingestion and Nearby Stops
+# Sentetik GTFS zip'ini ingest edip yakin durak sorgusunu kaba kuvvet taramayla karsilastir
+
+import csv
+import io
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+
+import numpy as np
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from mcp_tools.geodesy import haversine_one_to_many
+from mcp_tools.gtfs import GTFSStore, ingest_gtfs_zip
+
+# Sydney cevresinde sentetik akis sinirlari
+SYDNEY_BOUNDS = {"min_lat": -34.10, "max_lat": -33.65, "min_lng": 150.90, "max_lng": 151.35}
+STATIONS = 600            # her biri iki peronlu (location_type 1 + 2 x 0)
+BUS_STOPS = 25_000        # ust istasyonu olmayan duraklar
+# route_type -> (hat sayisi, hat uzunlugu km, sefer araligi dk)
+ROUTES = {"2": (12, 25.0, 15), "401": (2, 20.0, 10), "900": (3, 8.0, 10), "4": (6, 6.0, 30),
+          "700": (300, 10.0, 20)}
+STOPS_PER_TRIP = 30
+SERVICE_HOURS = (5, 23)
+RADII_KM = [0.5, 1.0, 2.0]
+QUERIES_PER_RUN = 500
+
+def _csv_bytes(header, rows) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(header)
+    writer.writerows(rows)
+    return buffer.getvalue().encode("utf-8")
+
+def _clock(seconds: int) -> str:
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}:{seconds % 60:02d}"
+
+def build_synthetic_feed(path: str, seed: int = 42, sequence_step: int = 1) -> dict:
+    """
+    Sentetik GTFS static zip'i yaz
+
+    Rayli hatlar istasyon peronlarinda, otobus hatlari sokak duraklarinda
+    durur; her hat rastgele yonde duz bir hat boyunca en yakin duraklardan
+    gecer ve gun boyu iki yonde esit aralikli seferlerle calisir.
+    stop_sequence degerleri sequence_step, 2 * sequence_step, ... diye numaralanir.
+    """
+    rng = random.Random(seed)
+
+    def random_point():
+        return (rng.uniform(SYDNEY_BOUNDS["min_lat"], SYDNEY_BOUNDS["max_lat"]),
+                rng.uniform(SYDNEY_BOUNDS["min_lng"], SYDNEY_BOUNDS["max_lng"]))
+
+    stops, platforms, street_stops = [], [], []
+    for index in range(STATIONS):
+        lat, lng = random_point()
+        station_id = f"{2000000 + index}"
+        stops.append([station_id, f"Synthetic Station {index}", f"{lat:.6f}", f"{lng:.6f}", "1", "",
+                      str(rng.choice([0, 1, 2]))])
+        for platform in (1, 2):
+            platform_id = f"{station_id}{platform:02d}"
+            stops.append([platform_id, f"Synthetic Station {index} Platform {platform}",
+                          f"{lat + platform * 1e-4:.6f}", f"{lng:.6f}", "0", station_id, "1"])
+            platforms.append((platform_id, lat, lng))
+    for index in range(BUS_STOPS):
+        lat, lng = random_point()
+        stop_id = f"{200000 + index}"
+        stops.append([stop_id, f"Synthetic Rd opp No. {index}", f"{lat:.6f}", f"{lng:.6f}", "", "",
+                      str(rng.choice([0, 1, 2]))])
+        street_stops.append((stop_id, lat, lng))
+
+    routes, trips, stop_times = [], [], []
+    for route_type, (count, length_km, headway_minutes) in ROUTES.items():
+        pool = street_stops if route_type == "700" else platforms
+        pool_lats = np.array([item[1] for item in pool])
+        pool_lngs = np.array([item[2] for item in pool])
+        for route_number in range(count):
+            route_id = f"R{route_type}_{route_number}"
+            short_name = f"{route_type[0]}{route_number}" if route_type != "700" else str(300 + route_number)
+            routes.append([route_id, short_name, f"Synthetic {route_type} line {route_number}", route_type])
+
+            # Guzergah: duz hat uzerindeki ara noktalara en yakin duraklar
+            start_lat, start_lng = random_point()
+            bearing = rng.uniform(0, 2 * np.pi)
+            waypoints = np.linspace(0.0, 1.0, STOPS_PER_TRIP)
+            waypoint_lats = np.clip(start_lat + np.cos(bearing) * length_km / 111.32 * waypoints,
+                                    SYDNEY_BOUNDS["min_lat"], SYDNEY_BOUNDS["max_lat"])
+            waypoint_lngs = np.clip(start_lng + np.sin(bearing) * length_km / 92.0 * waypoints,
+                                    SYDNEY_BOUNDS["min_lng"], SYDNEY_BOUNDS["max_lng"])
+            route_stops = []
+            for lat, lng in zip(waypoint_lats, waypoint_lngs):
+                stop_id = pool[int(np.argmin(haversine_one_to_many(lat, lng, pool_lats, pool_lngs)))][0]
+                if stop_id not in route_stops:
+                    route_stops.append(stop_id)
+            segment_seconds = max(60, int(length_km / STOPS_PER_TRIP / (40 if route_type != "700" else 20) * 3600))
+
+            for direction, sequence_stops in enumerate((route_stops, route_stops[::-1])):
+                departure = SERVICE_HOURS[0] * 3600 + rng.randrange(headway_minutes * 60)
+                trip_number = 0
+                while departure < SERVICE_HOURS[1] * 3600:
+                    trip_id = f"{route_id}_{direction}_{trip_number}"
+                    trips.append([route_id, "DAILY", trip_id, f"Synthetic terminus {direction}"])
+                    for sequence, stop_id in enumerate(sequence_stops):
+                        clock = _clock(departure + sequence * segment_seconds)
+                        stop_times.append([trip_id, clock, clock, stop_id, str((sequence + 1) * sequence_step)])
+                    departure += headway_minutes * 60
+                    trip_number += 1
+
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("stops.txt", _csv_bytes(
+            ["stop_id", "stop_name", "stop_lat", "stop_lon", "location_type", "parent_station",
+             "wheelchair_boarding"], stops))
+        archive.writestr("routes.txt", _csv_bytes(
+            ["route_id", "route_short_name", "route_long_name", "route_type"], routes))
+        archive.writestr("trips.txt", _csv_bytes(["route_id", "service_id", "trip_id", "trip_headsign"], trips))
+        archive.writestr("stop_times.txt", _csv_bytes(
+            ["trip_id", "arrival_time", "departure_time", "stop_id", "stop_sequence"], stop_times))
+        archive.writestr("calendar.txt", _csv_bytes(
+            ["service_id", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday",
+             "start_date", "end_date"], [["DAILY", 1, 1, 1, 1, 1, 1, 1, "20250101", "20351231"]]))
+    return {"stops": len(stops), "routes": len(routes), "trips": len(trips), "stop_times": len(stop_times)}
+
+def brute_force(store: GTFSStore, lat: float, lng: float, radius_km: float) -> list:
+    """Karsilastirma: tum aranabilir duraklarin mesafesini hesapla"""
+    indexed = np.asarray(store.index_stops)
+    distances = haversine_one_to_many(lat, lng, store.stop_lat[indexed], store.stop_lng[indexed])
+    inside = distances <= radius_km
+    order = np.argsort(distances[inside], kind="stable")
+    return indexed[inside][order].tolist()
+
+def run_benchmark() -> bool:
+    """Ingest suresi, depo boyutu ve yaricap basina sorgu gecikmesi"""
+    print("🚉 BENCHMARK: GTFS Static Ingestion and Nearby Stops")
+    print("=" * 72)
+
+    with tempfile.TemporaryDirectory() as directory:
+        feed_path = os.path.join(directory, "synthetic_gtfs.zip")
+        counts = build_synthetic_feed(feed_path)
+        print(f"   Feed: {counts['stops']} stops, {counts['routes']} routes, {counts['trips']} trips, "
+              f"{counts['stop_times']} stop_times ({os.path.getsize(feed_path) / 1e6:.1f} MB zip)")
+
+        store_dir = os.path.join(directory, "gtfs")
+        meta = ingest_gtfs_zip(feed_path, store_dir)
+        store_bytes = sum(os.path.getsize(os.path.join(store_dir, name)) for name in os.listdir(store_dir))
+        print(f"   Ingest: {meta['ingest_seconds']:.2f}s -> {meta['indexed_stops']} indexed stops, "
+              f"{store_bytes / 1e6:.1f} MB on disk")
+
+        open_start = time.perf_counter()
+        store = GTFSStore(store_dir)
+        print(f"   Open (mmap): {(time.perf_counter() - open_start) * 1000:.2f} ms")
+        print(f"{'radius':>7} {'avg hits':>9} {'brute p50 ms':>13} {'store p50 ms':>13} "
+              f"{'store p95 ms':>13} {'record ms':>10}")
+
+        rng = random.Random(7)
+        all_match = True
+        for radius in RADII_KM:
+            points = [(rng.uniform(SYDNEY_BOUNDS["min_lat"], SYDNEY_BOUNDS["max_lat"]),
+                       rng.uniform(SYDNEY_BOUNDS["min_lng"], SYDNEY_BOUNDS["max_lng"]))
+                      for _ in range(QUERIES_PER_RUN)]
+            brute_times, store_times, record_times, hits = [], [], [], []
+            for lat, lng in points:
+                start = time.perf_counter()
+                expected = brute_force(store, lat, lng, radius)
+                brute_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                stops, distances = store.nearby_stops(lat, lng, radius)
+                store_times.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                for stop, distance in zip(stops[:5].tolist(), distances[:5].tolist()):
+                    store.station_record(stop, distance)
+                record_times.append(time.perf_counter() - start)
+
+                hits.append(len(stops))
+                all_match &= stops.tolist() == expected
+
+            store_times.sort()
+            print(f"{radius:>6.1f}k {statistics.mean(hits):>9.1f} "
+                  f"{statistics.median(brute_times) * 1000:>13.3f} {statistics.median(store_times) * 1000:>13.3f} "
+                  f"{store_times[int(len(store_times) * 0.95) - 1] * 1000:>13.3f} "
+                  f"{statistics.median(record_times) * 1000:>10.3f}")
+
+        print(f"   Results identical to brute force: {all_match}")
+    print("✅ GTFS nearby benchmark complete" if all_match else "❌ GTFS nearby results differ")
+    return all_match
+
+if __name__ == "__main__":
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# Benchmark - GTFS RAPTOR Route Planning
+# Sentetik GTFS tarifesinde RAPTOR sorgu gecikmesi ve baglanti tarama (CSA) referansiyla varis karsilastirmasi
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.append(os.path.dirname(__file__))
+
+from gtfs_nearby_benchmark import SYDNEY_BOUNDS, build_synthetic_feed
+from mcp_tools.catalog.opening_hours import SYDNEY_TIMEZONE
+from mcp_tools.geodesy import haversine_km
+from mcp_tools.gtfs import GTFSStore, RaptorPlanner, ingest_gtfs_zip, walk_seconds
+from mcp_tools.gtfs.raptor import ACCESS_RADIUS_KM
+
+LATENCY_QUERIES = 300
+REFERENCE_QUERIES = 40
+QUERY_DAY = (2026, 10, 19)      # Pazartesi - sentetik akisin DAILY servisi her gun gecerli
+UNREACHED = 1 << 40
+
+def build_connections(store: GTFSStore) -> list:
+    """Tum desen seferlerini kalkis saatine gore sirali (kalkis, varis, durak, sonraki durak, sefer) baglantilarina ac"""
+    connections = []
+    for pattern in range(store.pattern_route.size):
+        stop_start, stop_end = int(store.pattern_stop_offsets[pattern]), int(store.pattern_stop_offsets[pattern + 1])
+        stops = store.pattern_stops[stop_start:stop_end].tolist()
+        trip_count = int(store.pattern_trip_offsets[pattern + 1] - store.pattern_trip_offsets[pattern])
+        time_start = int(store.pattern_time_offsets[pattern])
+        shape = (len(stops), trip_count)
+        departures = store.pattern_departures[time_start:time_start + shape[0] * trip_count].reshape(shape)
+        arrivals = store.pattern_arrivals[time_start:time_start + shape[0] * trip_count].reshape(shape)
+        for column in range(trip_count):
+            trip = (pattern, column)
+            for position in range(len(stops) - 1):
+                connections.append((int(departures[position, column]), int(arrivals[position + 1, column]),
+                                    stops[position], stops[position + 1], trip))
+    connections.sort(key=lambda connection: (connection[0], connection[1]))
+    return connections
+
+def connection_scan(store: GTFSStore, connections: list, origin: tuple, destination: tuple, start: int) -> int:
+    """Referans: en erken varis (Connection Scan Algorithm, ayni erisim/aktarma yurumeleriyle)"""
+    stop_arrival = {}
+    access_stops, access_km = store.nearby_served_stops(*origin, ACCESS_RADIUS_KM)
+    for stop, seconds in zip(access_stops.tolist(), walk_seconds(access_km).tolist()):
+        stop_arrival[stop] = start + seconds
+    egress_stops, egress_km = store.nearby_served_stops(*destination, ACCESS_RADIUS_KM)
+    egress = dict(zip(egress_stops.tolist(), walk_seconds(egress_km).tolist()))
+
+    boarded, best = set(), UNREACHED
+    for departure, arrival, stop, next_stop, trip in connections:
+        if departure < start:
+            continue
+        if departure >= best:
+            break
+        if trip not in boarded and stop_arrival.get(stop, UNREACHED) > departure:
+            continue
+        boarded.add(trip)
+        if arrival >= stop_arrival.get(next_stop, UNREACHED):
+            continue
+        stop_arrival[next_stop] = arrival
+        if next_stop in egress:
+            best = min(best, arrival + egress[next_stop])
+        first, last = int(store.transfer_offsets[next_stop]), int(store.transfer_offsets[next_stop + 1])
+        for target, seconds in zip(store.transfer_targets[first:last].tolist(),
+                                   store.transfer_seconds[first:last].tolist()):
+            if arrival + seconds < stop_arrival.get(target, UNREACHED):
+                stop_arrival[target] = arrival + seconds
+                if target in egress:
+                    best = min(best, arrival + seconds + egress[target])
+    return best
+
+def random_query(rng: random.Random, hours: tuple) -> tuple:
+    origin = (rng.uniform(SYDNEY_BOUNDS["min_lat"], SYDNEY_BOUNDS["max_lat"]),
+              rng.uniform(SYDNEY_BOUNDS["min_lng"], SYDNEY_BOUNDS["max_lng"]))
+    destination = (rng.uniform(SYDNEY_BOUNDS["min_lat"], SYDNEY_BOUNDS["max_lat"]),
+                   rng.uniform(SYDNEY_BOUNDS["min_lng"], SYDNEY_BOUNDS["max_lng"]))
+    departure = datetime(*QUERY_DAY, rng.randrange(*hours), rng.randrange(60), tzinfo=SYDNEY_TIMEZONE)
+    return origin, destination, departure
+
+def run_benchmark() -> bool:
+    """Ingest (tarife dahil), RAPTOR p50/p95, Pareto cephe boyutu ve CSA ile en erken varis esitligi"""
+    print("🚆 BENCHMARK: GTFS RAPTOR Route Planning")
+    print("=" * 72)
+
+    with tempfile.TemporaryDirectory() as directory:
+        feed_path = os.path.join(directory, "synthetic_gtfs.zip")
+        counts = build_synthetic_feed(feed_path)
+        print(f"   Feed: {counts['stops']} stops, {counts['routes']} routes, {counts['trips']} trips, "
+              f"{counts['stop_times']} stop_times")
+
+        store_dir = os.path.join(directory, "gtfs")
+        meta = ingest_gtfs_zip(feed_path, store_dir)
+        print(f"   Ingest: {meta['ingest_seconds']:.2f}s -> {meta['patterns']} patterns, "
+              f"{meta['transfers']} walking transfers")
+
+        store = GTFSStore(store_dir)
+        start = time.perf_counter()
+        planner = RaptorPlanner(store)
+        print(f"   Planner setup: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+        # Gecikme: sabah zirvesinde rastgele nokta ciftleri
+        rng = random.Random(5)
+        latencies, front_sizes, transit_found = [], [], 0
+        for _ in range(LATENCY_QUERIES):
+            origin, destination, departure = random_query(rng, (7, 10))
+            start = time.perf_counter()
+            journeys = planner.plan(*origin, *destination, departure)
+            latencies.append(time.perf_counter() - start)
+            front_sizes.append(len(journeys))
+            transit_found += any(journey["rides"] for journey in journeys)
+        latencies.sort()
+        print(f"   RAPTOR ({LATENCY_QUERIES} queries): p50 {statistics.median(latencies) * 1000:.2f} ms, "
+              f"p95 {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f} ms, max {latencies[-1] * 1000:.2f} ms")
+        print(f"   Transit journey found: {transit_found}/{LATENCY_QUERIES}, "
+              f"avg Pareto options {statistics.mean(front_sizes):.2f}")
+
+        # Dogruluk: sinirsiz binis/ufukla en erken varis CSA referansiyla ayni olmali
+        start = time.perf_counter()
+        connections = build_connections(store)
+        print(f"   CSA reference: {len(connections)} connections sorted in {time.perf_counter() - start:.1f}s")
+        exhaustive = RaptorPlanner(store, max_rides=12, horizon_seconds=20 * 3600)
+        rng = random.Random(3)
+        matches, raptor_times, reference_times = 0, [], []
+        for _ in range(REFERENCE_QUERIES):
+            origin, destination, departure = random_query(rng, (6, 14))
+            start_seconds = departure.hour * 3600 + departure.minute * 60
+            walk_limit = start_seconds + int(walk_seconds(haversine_km(*origin, *destination)))
+
+            start = time.perf_counter()
+            journeys = exhaustive.plan(*origin, *destination, departure)
+            raptor_times.append(time.perf_counter() - start)
+            raptor_arrival = min((journey["arrival_seconds"] for journey in journeys if journey["rides"]),
+                                 default=UNREACHED)
+
+            start = time.perf_counter()
+            reference_arrival = connection_scan(store, connections, origin, destination, start_seconds)
+            reference_times.append(time.perf_counter() - start)
+            # Dogrudan yurume daha erkense iki yontem de transit sonucunu budayabilir
+            matches += min(raptor_arrival, walk_limit) == min(reference_arrival, walk_limit)
+
+        all_match = matches == REFERENCE_QUERIES
+        print(f"   Earliest arrival identical to CSA: {matches}/{REFERENCE_QUERIES} "
+              f"(RAPTOR p50 {statistics.median(raptor_times) * 1000:.1f} ms, "
+              f"CSA p50 {statistics.median(reference_times) * 1000:.1f} ms)")
+        del store, planner, exhaustive, connections
+    print("✅ GTFS RAPTOR benchmark complete" if all_match else "❌ RAPTOR arrivals differ from CSA reference")
+    return all_match
+
+if __name__ == "__main__":
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
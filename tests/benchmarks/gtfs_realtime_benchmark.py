@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+# Benchmark - GTFS-Realtime Trip Update Merge and Departure Boards
+# Sentetik TripUpdate akislarinin artimli birlesimi ve bellekten kalkis tablosu - istek basina akis cozumuyle karsilastirma
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+sys.path.append(os.path.dirname(__file__))
+
+from gtfs_nearby_benchmark import build_synthetic_feed
+from mcp_tools.catalog.opening_hours import SYDNEY_TIMEZONE
+from mcp_tools.gtfs import FileTripUpdateSource, GTFSStore, RealtimeOverlay, departure_board, ingest_gtfs_zip
+from mcp_tools.gtfs.realtime import service_midnight, split_feed
+
+QUERY_MOMENT = datetime(2026, 10, 19, 8, 15, tzinfo=SYDNEY_TIMEZONE)
+LIVE_WINDOW = (7 * 3600, 10 * 3600)   # bu aralikta calisan seferler akista yer alir
+CHANGED_FRACTION = 0.05               # her yeni FULL_DATASET'te degisen sefer orani
+BOARD_QUERIES = 500
+SEQUENCE_STEP = 10                    # sadece stop_sequence tasiyan guncellemeler icin tarife numaralamasi
+
+# --- Minimal protobuf yazici (FeedMessage / TripUpdate alt kumesi) ---
+
+def _varint(value: int) -> bytes:
+    value &= (1 << 64) - 1
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+def _field(number: int, value) -> bytes:
+    if isinstance(value, int):
+        return _varint(number << 3) + _varint(value)
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return _varint(number << 3 | 2) + _varint(len(value)) + value
+
+def encode_entity(entity_id: str, trip_id: str, start_date: str, stop_delays: list, canceled: bool = False,
+                  absolute_midnight: float = 0.0) -> bytes:
+    """TripUpdate entity - stop_delays: (stop_id veya stop_sequence, gecikme sn, planli kalkis sn veya None)"""
+    trip = _field(1, trip_id) + _field(3, start_date) + (_field(4, 3) if canceled else b"")
+    update = _field(1, trip)
+    for stop, delay, scheduled in stop_delays:
+        # Yarisi delay, yarisi mutlak saat (time) ile - iki yol da denenir
+        event = _field(2, int(absolute_midnight + scheduled + delay)) if scheduled is not None else _field(1, delay)
+        # Tamsayi durak stop_sequence (alan 1), metin stop_id (alan 4) olarak yazilir
+        update += _field(2, _field(3, event) + (_field(1, stop) if isinstance(stop, int) else _field(4, stop)))
+    return _field(2, _field(1, entity_id) + _field(3, update))
+
+def encode_feed(entities: list, timestamp: int, differential: bool = False) -> bytes:
+    header = _field(1, "2.0") + _field(2, 1 if differential else 0) + _field(3, timestamp)
+    return _field(1, header) + b"".join(entities)
+
+# --- Senaryo ---
+
+def live_trips(store: GTFSStore) -> list:
+    """Canli pencerede calisan seferler: (sefer, desen duraklari, desen kalkislari)"""
+    trips = []
+    for pattern in range(store.pattern_route.size):
+        stop_start = int(store.pattern_stop_offsets[pattern])
+        stops = store.pattern_stops[stop_start:int(store.pattern_stop_offsets[pattern + 1])].tolist()
+        trip_start = int(store.pattern_trip_offsets[pattern])
+        trip_count = int(store.pattern_trip_offsets[pattern + 1]) - trip_start
+        time_start = int(store.pattern_time_offsets[pattern])
+        for column in range(trip_count):
+            departures = store.pattern_departures[time_start + column:time_start + len(stops) * trip_count:trip_count]
+            if departures[0] <= LIVE_WINDOW[1] and departures[-1] >= LIVE_WINDOW[0]:
+                trips.append((int(store.pattern_trips[trip_start + column]), stops, departures.tolist()))
+    return trips
+
+def make_entity(store: GTFSStore, rng: random.Random, trip: tuple, midnight: float) -> bytes:
+    trip_row, stops, departures = trip
+    if rng.random() < 0.02:
+        return encode_entity(store.trip_ids[trip_row], store.trip_ids[trip_row], "20261019", [], canceled=True)
+    position = rng.randrange(len(stops) - 1)
+    delays = [(store.stop_ids[stops[position]], rng.choice([0, 60, 120, 300, 600, -60]),
+               departures[position] if rng.random() < 0.5 else None)]
+    if rng.random() < 0.5:
+        later = rng.randrange(position + 1, len(stops))
+        delays.append((store.stop_ids[stops[later]], rng.choice([0, 120, 240]), None))
+    return encode_entity(store.trip_ids[trip_row], store.trip_ids[trip_row], "20261019", delays,
+                         absolute_midnight=midnight)
+
+def write_atomic(path: str, payload: bytes) -> None:
+    partial = path + ".partial"
+    with open(partial, "wb") as feed_file:
+        feed_file.write(payload)
+    os.replace(partial, path)
+
+def boards(store: GTFSStore, overlay: RealtimeOverlay, stops: list) -> list:
+    return [departure_board(store, stop, QUERY_MOMENT, overlay) for stop in stops]
+
+def check_sequence_only_updates(directory: str, rng: random.Random) -> bool:
+    """
+    stop_id'siz, sadece stop_sequence tasiyan guncellemeler (10, 20, 30 numarali tarife)
+
+    Ayni gecikmeler bir akista stop_id, digerinde stop_sequence ile yazilir;
+    iki katmanin kalkis tablolari ayni olmali ve canli gecikme tasimali.
+    """
+    feed_path = os.path.join(directory, "synthetic_gtfs_sequence_step.zip")
+    build_synthetic_feed(feed_path, sequence_step=SEQUENCE_STEP)
+    store_dir = os.path.join(directory, "gtfs_sequence_step")
+    ingest_gtfs_zip(feed_path, store_dir)
+    store = GTFSStore(store_dir)
+
+    by_stop_id, by_sequence = [], []
+    midnight = service_midnight(QUERY_MOMENT.date())
+    for trip_row, stops, departures in live_trips(store):
+        position = rng.randrange(len(stops) - 1)
+        later = rng.randrange(position + 1, len(stops))
+        updates = [(position, rng.choice([60, 120, 300, -60]), departures[position] if rng.random() < 0.5 else None),
+                   (later, rng.choice([0, 120, 240]), None)]
+        trip_id = store.trip_ids[trip_row]
+        by_stop_id.append(encode_entity(trip_id, trip_id, "20261019",
+                                        [(store.stop_ids[stops[index]], delay, scheduled)
+                                         for index, delay, scheduled in updates], absolute_midnight=midnight))
+        by_sequence.append(encode_entity(trip_id, trip_id, "20261019",
+                                         [((index + 1) * SEQUENCE_STEP, delay, scheduled)
+                                          for index, delay, scheduled in updates], absolute_midnight=midnight))
+
+    overlays = []
+    for name, entities in (("stop_id", by_stop_id), ("stop_sequence", by_sequence)):
+        realtime_path = os.path.join(directory, f"tripupdates_{name}.pb")
+        write_atomic(realtime_path, encode_feed(entities, int(QUERY_MOMENT.timestamp())))
+        overlay = RealtimeOverlay(store, [FileTripUpdateSource(realtime_path)])
+        overlay.refresh_now()
+        overlays.append(overlay)
+
+    board_stops = rng.sample(store.index_stops.tolist(), BOARD_QUERIES)
+    expected = boards(store, overlays[0], board_stops)
+    identical = expected == boards(store, overlays[1], board_stops)
+    live = sum(departure["realtime"] for board in expected for departure in board)
+    print(f"   stop_sequence-only updates (sequences step {SEQUENCE_STEP}): identical to stop_id updates: "
+          f"{identical} ({live} board departures carry live delays)")
+    del store, overlays
+    return identical and live > 0
+
+def run_benchmark() -> bool:
+    """Ilk/artimli birlesim suresi, yeniden kurulumla esitlik ve tablo gecikmesi"""
+    print("📡 BENCHMARK: GTFS-Realtime Trip Update Merge and Departure Boards")
+    print("=" * 72)
+
+    with tempfile.TemporaryDirectory() as directory:
+        feed_path = os.path.join(directory, "synthetic_gtfs.zip")
+        build_synthetic_feed(feed_path)
+        store_dir = os.path.join(directory, "gtfs")
+        ingest_gtfs_zip(feed_path, store_dir)
+        store = GTFSStore(store_dir)
+        store.trip_index("")  # trip_id sozlugu olcumlerden once kurulur
+        store.stop_index("")
+
+        rng = random.Random(11)
+        midnight = service_midnight(QUERY_MOMENT.date())
+        trips = live_trips(store)
+        entities = [make_entity(store, rng, trip, midnight) for trip in trips]
+        realtime_path = os.path.join(directory, "tripupdates.pb")
+        write_atomic(realtime_path, encode_feed(entities, int(QUERY_MOMENT.timestamp())))
+        print(f"   TripUpdate feed: {len(entities)} trips, {os.path.getsize(realtime_path) / 1e3:.0f} KB protobuf")
+
+        overlay = RealtimeOverlay(store, [FileTripUpdateSource(realtime_path)])
+        start = time.perf_counter()
+        changes = overlay.refresh_now()
+        print(f"   Initial merge: {(time.perf_counter() - start) * 1000:.1f} ms {changes}")
+
+        start = time.perf_counter()
+        changes = overlay.refresh_now()
+        print(f"   Unchanged file: {(time.perf_counter() - start) * 1000:.3f} ms {changes}")
+
+        merge_times = []
+        for round_number in range(5):
+            for index in rng.sample(range(len(entities)), int(len(entities) * CHANGED_FRACTION)):
+                entities[index] = make_entity(store, rng, trips[index], midnight)
+            write_atomic(realtime_path, encode_feed(entities, int(QUERY_MOMENT.timestamp()) + 30 * (round_number + 1)))
+            start = time.perf_counter()
+            changes = overlay.refresh_now()
+            merge_times.append(time.perf_counter() - start)
+        print(f"   Incremental FULL_DATASET ({CHANGED_FRACTION:.0%} changed): "
+              f"p50 {statistics.median(merge_times) * 1000:.1f} ms {changes}")
+
+        # DIFFERENTIAL: birkac sefer silinir, birkaci guncellenir
+        deleted = rng.sample(range(len(entities)), 50)
+        differential = [_field(2, _field(1, store.trip_ids[trips[index][0]]) + _field(2, 1)) for index in deleted]
+        for index in deleted:
+            entities[index] = b""
+        updated = rng.sample([index for index in range(len(entities)) if entities[index]], 50)
+        for index in updated:
+            entities[index] = make_entity(store, rng, trips[index], midnight)
+            differential.append(entities[index])
+        write_atomic(realtime_path, encode_feed(differential, int(QUERY_MOMENT.timestamp()) + 300, differential=True))
+        start = time.perf_counter()
+        changes = overlay.refresh_now()
+        print(f"   DIFFERENTIAL (50 deleted, 50 updated): {(time.perf_counter() - start) * 1000:.1f} ms {changes}")
+
+        # Dogruluk: artimli katman = son durumdan bastan kurulan katman
+        write_atomic(realtime_path, encode_feed([entity for entity in entities if entity],
+                                                int(QUERY_MOMENT.timestamp()) + 300))
+        rebuilt = RealtimeOverlay(store, [FileTripUpdateSource(realtime_path)])
+        rebuilt.refresh_now()
+        board_stops = rng.sample(store.index_stops.tolist(), BOARD_QUERIES)
+        incremental_boards = boards(store, overlay, board_stops)
+        identical = incremental_boards == boards(store, rebuilt, board_stops)
+        live = sum(departure["realtime"] for board in incremental_boards for departure in board)
+        total = sum(len(board) for board in incremental_boards)
+        print(f"   Incremental overlay identical to rebuild: {identical} "
+              f"({live}/{total} board departures carry live delays)")
+
+        # Tablo gecikmesi: bellekten vs istek basina tum akisi cozmek
+        board_times = []
+        for stop in board_stops:
+            start = time.perf_counter()
+            departure_board(store, stop, QUERY_MOMENT, overlay)
+            board_times.append(time.perf_counter() - start)
+        board_times.sort()
+        with open(realtime_path, "rb") as feed_file:
+            payload = feed_file.read()
+        decode_times = []
+        for _ in range(5):
+            start = time.perf_counter()
+            _, parsed = split_feed(payload)
+            for _, parse in parsed:
+                parse()
+            decode_times.append(time.perf_counter() - start)
+        print(f"   Board from memory ({BOARD_QUERIES} stops): p50 {statistics.median(board_times) * 1000:.3f} ms, "
+              f"p95 {board_times[int(len(board_times) * 0.95) - 1] * 1000:.3f} ms")
+        print(f"   Per-request full feed decode (what each call would pay): "
+              f"{statistics.median(decode_times) * 1000:.1f} ms")
+        del store, overlay, rebuilt
+
+        sequence_identical = check_sequence_only_updates(directory, rng)
+    if not identical:
+        print("❌ Incremental overlay differs from rebuild")
+    elif not sequence_identical:
+        print("❌ stop_sequence-only updates differ from stop_id updates")
+    else:
+        print("✅ GTFS realtime benchmark complete")
+    return identical and sequence_identical
+
+if __name__ == "__main__":
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# Benchmark - NSW Transport Session Pool
+# Yerel sahte departure monitor sunucusuna karsi cagri basina yeni oturum ile paylasilan havuzun gecikmesi
+
+import asyncio
+import datetime
+import ipaddress
+import os
+import ssl
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+import aiohttp
+from aiohttp import web
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from mcp_tools.clients import NSWTransportClient
+from mcp_tools.clients.nsw_transport_client import DEPARTURE_MONITOR_PATH
+
+UPSTREAM_LATENCY_SECONDS = 0.02
+# Gercekci cagri hizlari (istek/saniye) - her hizda sabit aralikli acik dongu yuk
+CALL_RATES = [2, 10, 50]
+CALLS_PER_RATE = 40
+
+SAMPLE_RESPONSE = {
+    "stopEvents": [
+        {
+            "departureTimePlanned": "2025-01-10T09:00:00Z",
+            "departureTimeEstimated": "2025-01-10T09:02:00Z",
+            "transportation": {"number": "T1", "destination": {"name": "Hornsby"}}
+        }
+    ]
+}
+
+def make_tls_contexts(directory: str):
+    """Self-signed sertifika ile sunucu/istemci SSL context'leri - cryptography yoksa None"""
+    try:
+        from cryptography import x509
+        from cryptography.hazmat.primitives import hashes, serialization
+        from cryptography.hazmat.primitives.asymmetric import ec
+        from cryptography.x509.oid import NameOID
+    except ImportError:
+        return None
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1)).not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+                       critical=False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = os.path.join(directory, "cert.pem")
+    key_path = os.path.join(directory, "key.pem")
+    with open(cert_path, "wb") as cert_file:
+        cert_file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_path, "wb") as key_file:
+        key_file.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8,
+                                         serialization.NoEncryption()))
+
+    server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_context.load_cert_chain(cert_path, key_path)
+    client_context = ssl.create_default_context(cafile=cert_path)
+    return server_context, client_context
+
+def start_stand_in_server(server_ssl=None) -> tuple:
+    """Sahte departure monitor sunucusunu ayri thread ve event loop'ta baslat"""
+    ready = threading.Event()
+    # Istemci uc noktalari - her yeni baglanti (yeni handshake) farkli kaynak portuyla gelir
+    state = {"peers": set()}
+
+    async def departure_monitor(request: web.Request) -> web.Response:
+        state["peers"].add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(UPSTREAM_LATENCY_SECONDS)
+        return web.json_response(SAMPLE_RESPONSE)
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_get(DEPARTURE_MONITOR_PATH, departure_monitor)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=server_ssl)
+        loop.run_until_complete(site.start())
+        state["port"] = site._server.sockets[0].getsockname()[1]
+        state["loop"] = loop
+        ready.set()
+        loop.run_forever()
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    ready.wait()
+    scheme = "https" if server_ssl else "http"
+    return f"{scheme}://127.0.0.1:{state['port']}", state
+
+async def legacy_call(base_url: str, client_ssl) -> dict:
+    """Eski yontem: her cagrida yeni ClientSession (DNS + TCP + TLS her seferinde)"""
+    connector = aiohttp.TCPConnector(ssl=client_ssl if client_ssl is not None else True)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        async with session.get(base_url + DEPARTURE_MONITOR_PATH, params={"name_dm": "200060"}) as response:
+            return await response.json()
+
+async def pooled_call(client: NSWTransportClient) -> dict:
+    """Yeni yontem: paylasilan keep-alive havuzu"""
+    async with client.departure_monitor({"name_dm": "200060"}) as response:
+        return await response.json()
+
+async def run_rate(rate: float, call_factory) -> dict:
+    """Sabit aralikla (acik dongu) CALLS_PER_RATE cagri baslat, gecikmeleri topla"""
+    latencies = []
+
+    async def timed_call():
+        start = time.perf_counter()
+        await call_factory()
+        latencies.append(time.perf_counter() - start)
+
+    tasks = []
+    for _ in range(CALLS_PER_RATE):
+        tasks.append(asyncio.create_task(timed_call()))
+        await asyncio.sleep(1 / rate)
+    await asyncio.gather(*tasks)
+
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000
+    }
+
+async def run_scheme(base_url: str, state: dict, client_ssl) -> None:
+    """Bir sema (http/https) icin eski ve yeni yontemi her hizda karsilastir"""
+    client = NSWTransportClient(api_key="test", base_url=base_url, ssl_context=client_ssl)
+    try:
+        for rate in CALL_RATES:
+            results = []
+            for mode, factory in (("legacy", lambda: legacy_call(base_url, client_ssl)),
+                                  ("pooled", lambda: pooled_call(client))):
+                state["peers"].clear()
+                result = await run_rate(rate, factory)
+                result["connections"] = len(state["peers"])
+                results.append((mode, result))
+            for mode, result in results:
+                overhead = result["p50_ms"] - UPSTREAM_LATENCY_SECONDS * 1000
+                print(f"{base_url.split(':')[0]:>6} {rate:>6} {mode:>8} {result['p50_ms']:>9.1f} "
+                      f"{result['p95_ms']:>9.1f} {overhead:>12.1f} {result['connections']:>12}")
+    finally:
+        await client.aclose()
+
+async def run_benchmark() -> bool:
+    """HTTP ve (mumkunse) HTTPS sahte sunuculara karsi olcum"""
+    print("🚌 BENCHMARK: NSW Transport Session Pool")
+    print(f"   Stand-in latency {UPSTREAM_LATENCY_SECONDS * 1000:.0f}ms, {CALLS_PER_RATE} calls per rate")
+    print("=" * 72)
+    print(f"{'scheme':>6} {'req/s':>6} {'mode':>8} {'p50 ms':>9} {'p95 ms':>9} {'overhead ms':>12} {'connections':>12}")
+
+    servers = []
+    with tempfile.TemporaryDirectory() as directory:
+        base_url, state = start_stand_in_server()
+        servers.append(state)
+        await run_scheme(base_url, state, None)
+
+        contexts = make_tls_contexts(directory)
+        if contexts is None:
+            print("   (cryptography not installed - TLS handshake comparison skipped)")
+        else:
+            server_ssl, client_ssl = contexts
+            base_url, state = start_stand_in_server(server_ssl)
+            servers.append(state)
+            await run_scheme(base_url, state, client_ssl)
+
+    for state in servers:
+        state["loop"].call_soon_threadsafe(state["loop"].stop)
+    print("✅ Session pool benchmark complete")
+    return True
+
+if __name__ == "__main__":
+    success = asyncio.run(run_benchmark())
+    sys.exit(0 if success else 1)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# Benchmark - Spatial Grid Index vs Linear Scan
+# Yaricap aramasinda grid indeksi ile eski dogrusal taramayi karsilastir
+
+import random
+import sys
+import os
+import time
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+from mcp_tools.catalog import CompactPlaceCatalog
+from mcp_tools.geodesy import haversine_km
+
+# Sydney cevresinde sentetik katalog sinirlari
+SYDNEY_BOUNDS = {"min_lat": -34.10, "max_lat": -33.65, "min_lng": 150.90, "max_lng": 151.35}
+CATALOG_SIZES = [1_000, 10_000, 50_000]
+RADII_KM = [0.5, 1.0, 5.0]
+QUERIES_PER_RUN = 200
+
+def build_synthetic_places(count: int, seed: int = 42) -> dict:
+    """Sentetik mekan katalogu olustur"""
+    rng = random.Random(seed)
+    places = {}
+    for i in range(count):
+        place_id = f"place_{i:06d}"
+        places[place_id] = {
+            "place_id": place_id,
+            "name": f"Synthetic Place {i}",
+            "place_type": rng.choice(["restaurant", "museum", "park", "tourist_attraction"]),
+            "lat": rng.uniform(SYDNEY_BOUNDS["min_lat"], SYDNEY_BOUNDS["max_lat"]),
+            "lng": rng.uniform(SYDNEY_BOUNDS["min_lng"], SYDNEY_BOUNDS["max_lng"]),
+            "rating": round(rng.uniform(3.0, 5.0), 1)
+        }
+    return places
+
+def linear_scan(places: dict, lat: float, lng: float, radius_km: float) -> list:
+    """Eski yontem: her mekan icin haversine hesapla"""
+    matches = []
+    for place_data in places.values():
+        distance = haversine_km(lat, lng, place_data["lat"], place_data["lng"])
+        if distance <= radius_km:
+            matches.append(place_data["place_id"])
+    return matches
+
+def run_benchmark():
+    """Her katalog boyutu ve yaricap icin iki yontemi olc"""
+    print("📐 BENCHMARK: Spatial Grid Index vs Linear Scan")
+    print("=" * 72)
+    print(f"{'places':>8} {'radius':>7} {'avg hits':>9} {'linear ms':>10} {'indexed ms':>11} {'speedup':>8}")
+
+    rng = random.Random(7)
+    for size in CATALOG_SIZES:
+        places = build_synthetic_places(size)
+
+        build_start = time.perf_counter()
+        catalog = CompactPlaceCatalog(places)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        for radius in RADII_KM:
+            queries = [
+                (rng.uniform(-33.95, -33.80), rng.uniform(151.05, 151.25))
+                for _ in range(QUERIES_PER_RUN)
+            ]
+
+            start = time.perf_counter()
+            linear_results = [linear_scan(places, lat, lng, radius) for lat, lng in queries]
+            linear_ms = (time.perf_counter() - start) * 1000 / QUERIES_PER_RUN
+
+            start = time.perf_counter()
+            indexed_results = [catalog.places_within_radius(lat, lng, radius) for lat, lng in queries]
+            indexed_ms = (time.perf_counter() - start) * 1000 / QUERIES_PER_RUN
+
+            # Iki yontem ayni sonuclari vermeli
+            for expected, actual in zip(linear_results, indexed_results):
+                assert sorted(expected) == sorted(p["place_id"] for p, _ in actual)
+
+            avg_hits = sum(len(r) for r in linear_results) / QUERIES_PER_RUN
+            print(f"{size:>8} {radius:>6.1f}k {avg_hits:>9.1f} {linear_ms:>10.3f} "
+                  f"{indexed_ms:>11.3f} {linear_ms / indexed_ms:>7.1f}x")
+
+        print(f"{'':>8} index build: {build_ms:.1f} ms")
+
+    return True
+
+if __name__ == "__main__":
+    success = run_benchmark()
+    sys.exit(0 if success else 1)
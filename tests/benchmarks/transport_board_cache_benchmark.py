@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+# Benchmark - Departure Board Cache
+# Yogun saatte ayni duraklara gelen get_transport_status cagrilari - durak basina onbellek ve birlestirme ile upstream istek sayisi
+
+import asyncio
+import os
+import random
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from aiohttp import web
+
+# Backend dizinini path'e ekle
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'backend'))
+
+UPSTREAM_LATENCY_SECONDS = 0.05
+BOARD_TTL_SECONDS = 1.0
+BUSY_STOPS = ["200060", "200070", "2000338", "10101100", "209926", "2000441"]
+WAVES = 40
+CALLS_PER_WAVE = 60
+WAVE_INTERVAL_SECONDS = 0.1
+TRANSPORT_TYPES = ["all", "train", "bus", "ferry", "light_rail"]
+LIMITS = [3, 5, 10]
+# NSW product.class -> tur (transport_tool ile ayni)
+PRODUCT_CLASSES = {1: "train", 5: "bus", 9: "ferry", 4: "light_rail", 7: "bus"}
+
+def stop_events(stop_id: str) -> list:
+    """Durak basina sabit, farkli turlerden kalkislar"""
+    rng = random.Random(stop_id)
+    events = []
+    for index in range(30):
+        product_class = rng.choice(list(PRODUCT_CLASSES))
+        minute = index
+        events.append({
+            "departureTimePlanned": f"2026-10-19T08:{minute:02d}:00Z",
+            "departureTimeEstimated": f"2026-10-19T08:{minute + rng.choice([0, 0, 1, 3]):02d}:00Z",
+            "location": {"name": f"Platform {rng.randint(1, 8)}"},
+            "transportation": {
+                "number": f"{stop_id}-{index}",
+                "product": {"class": product_class, "name": PRODUCT_CLASSES[product_class].title()},
+                "destination": {"name": f"Destination {index}"}
+            }
+        })
+    return events
+
+def start_stand_in_server(listener: socket.socket, path: str) -> dict:
+    """Sahte departure monitor - durak basina gelen istekleri sayar"""
+    ready = threading.Event()
+    state = {"requests": {}}
+
+    async def departure_monitor(request: web.Request) -> web.Response:
+        stop_id = request.query.get("name_dm", "")
+        state["requests"][stop_id] = state["requests"].get(stop_id, 0) + 1
+        await asyncio.sleep(UPSTREAM_LATENCY_SECONDS)
+        return web.json_response({"locations": [{"name": f"Stop {stop_id}", "coord": [151.2, -33.88]}],
+                                  "stopEvents": stop_events(stop_id)})
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_get(path, departure_monitor)
+        runner = web.AppRunner(app)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.SockSite(runner, listener).start())
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return state
+
+def expected_services(stop_id: str, transport_type: str, limit: int) -> list:
+    """Tum tablodan beklenen gorunum - tur filtresi sonra limit"""
+    services = [event["transportation"]["number"] for event in stop_events(stop_id)
+                if transport_type == "all"
+                or PRODUCT_CLASSES[event["transportation"]["product"]["class"]] == transport_type]
+    return services[:limit]
+
+async def run_load(transport_tool) -> dict:
+    """Dalgalar halinde es zamanli cagrilar - gecikme ve gorunum dogrulugu"""
+    rng = random.Random(7)
+    latencies, mismatches, calls = [], 0, 0
+
+    async def call(stop_id: str, transport_type: str, limit: int):
+        nonlocal mismatches
+        start = time.perf_counter()
+        result = await transport_tool.get_transport_status(stop_id, transport_type, limit)
+        latencies.append(time.perf_counter() - start)
+        services = [service["service_id"] for service in result["data"]["services"]]
+        if result["source"] != "nsw_transport_api_v2" or services != expected_services(stop_id, transport_type, limit):
+            mismatches += 1
+
+    started = time.perf_counter()
+    for _ in range(WAVES):
+        # Yogun duraklar daha sik sorulur
+        wave = [call(rng.choices(BUSY_STOPS, weights=[8, 5, 3, 2, 1, 1])[0], rng.choice(TRANSPORT_TYPES),
+                     rng.choice(LIMITS)) for _ in range(CALLS_PER_WAVE)]
+        calls += len(wave)
+        await asyncio.gather(*wave)
+        await asyncio.sleep(WAVE_INTERVAL_SECONDS)
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "calls": calls,
+        "mismatches": mismatches,
+        "elapsed_seconds": elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000
+    }
+
+def run_benchmark() -> bool:
+    """Upstream istek azalmasi, TTL basina durak basina en fazla bir istek ve gorunum esitligi"""
+    print("🚏 BENCHMARK: Departure Board Cache")
+    print("=" * 72)
+
+    # Sunucu soketi once acilir - ortam degiskenleri mcp_tools yuklenmeden once ayarlanmali
+    listener = socket.socket()
+    listener.bind(("127.0.0.1", 0))
+    with tempfile.TemporaryDirectory() as directory:
+        # Gercek API yolu, sahte sunucu ve GTFS deposu yok
+        os.environ.update({
+            "MOCK_MODE": "false",
+            "NSW_TRANSPORT_API_KEY": "test",
+            "NSW_TRANSPORT_BASE_URL": f"http://127.0.0.1:{listener.getsockname()[1]}",
+            "GTFS_STORE_DIR": os.path.join(directory, "no_gtfs"),
+            "GTFS_STATIC_ZIP": "",
+            "TRANSPORT_BOARD_CACHE_TTL_SECONDS": str(BOARD_TTL_SECONDS)
+        })
+        from mcp_tools import transport_tool
+        from mcp_tools.clients import close_nsw_transport_client
+        from mcp_tools.clients.nsw_transport_client import DEPARTURE_MONITOR_PATH
+        state = start_stand_in_server(listener, DEPARTURE_MONITOR_PATH)
+
+        async def main() -> dict:
+            try:
+                return await run_load(transport_tool)
+            finally:
+                await close_nsw_transport_client()
+
+        result = asyncio.run(main())
+
+    upstream = sum(state["requests"].values())
+    # Her TTL penceresinde durak basina en fazla bir yenileme (+1 pencere siniri payi)
+    refresh_budget = len(BUSY_STOPS) * (int(result["elapsed_seconds"] / BOARD_TTL_SECONDS) + 2)
+    stats = transport_tool.get_transport_cache_stats()
+    print(f"   Load: {result['calls']} calls over {len(BUSY_STOPS)} stops in {result['elapsed_seconds']:.1f}s "
+          f"(TTL {BOARD_TTL_SECONDS:.0f}s, upstream latency {UPSTREAM_LATENCY_SECONDS * 1000:.0f} ms)")
+    print(f"   Upstream requests: {upstream} vs {result['calls']} uncached "
+          f"({result['calls'] / max(upstream, 1):.0f}x fewer, budget {refresh_budget})")
+    print(f"   Per stop: {dict(sorted(state['requests'].items(), key=lambda item: -item[1]))}")
+    print(f"   Cache hit rate {stats['hit_rate']:.1%}, coalesced misses: {stats['single_flight']['shared']} "
+          f"shared / {stats['single_flight']['leaders']} leaders")
+    print(f"   Call latency: p50 {result['p50_ms']:.2f} ms, p95 {result['p95_ms']:.2f} ms")
+    print(f"   Filtered views identical to whole-board filter: {result['calls'] - result['mismatches']}/{result['calls']}")
+
+    success = result["mismatches"] == 0 and upstream <= refresh_budget
+    print("✅ Departure board cache benchmark complete" if success else "❌ Departure board cache check failed")
+    return success
+
+if __name__ == "__main__":
+    success = run_benchmark()
+    sys.exit(0 if success else 1)